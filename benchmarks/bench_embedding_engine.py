@@ -0,0 +1,99 @@
+"""Measure the throughput of the embedding sentiment engine.
+
+Fits a head on stand-in labels, then analyzes synthetic Feddit comments with
+the embedding engine against the in-process OpenAI stand-in and reports
+comments per second, requests sent and the embedding cache hit rate on a
+second pass over the same comments. Only the engine's own work (batching,
+base64 decoding, caching and the NumPy head) is measured beyond the stand-in.
+
+Usage:
+    python benchmarks/bench_embedding_engine.py [--comments 20000] [--batch-size 1000]
+"""
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import time
+from datetime import datetime
+
+import httpx
+import numpy as np
+from openai import AsyncOpenAI
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("PRODUCTION", "true")
+
+from sentiment_analysis.domain.entities.comment import Comment  # noqa: E402
+from sentiment_analysis.fakes.feddit_data import FedditDataset  # noqa: E402
+from sentiment_analysis.fakes.openai_server import create_app, score_text  # noqa: E402
+from sentiment_analysis.infrastructure.engines.embedding_engine import EmbeddingSentimentEngine  # noqa: E402
+from sentiment_analysis.infrastructure.engines.embedding_head import EmbeddingHead  # noqa: E402
+
+
+def make_comments(count):
+    """Create synthetic comments."""
+    dataset = FedditDataset(subfeddits=1, comments_per_subfeddit=count)
+    return [
+        Comment(
+            id=item["id"],
+            subfeddit_id=1,
+            username=item["username"],
+            text=item["text"],
+            created_at=datetime.fromtimestamp(item["created_at"])
+        )
+        for item in dataset.list_comments(1, limit=count, skip=0)
+    ]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--comments", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dimensions", type=int, default=256)
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    app = create_app()
+    client = AsyncOpenAI(
+        api_key="benchmark",
+        base_url="http://openai/v1",
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+    )
+    engine = EmbeddingSentimentEngine(
+        client=client, dimensions=args.dimensions, batch_size=args.batch_size
+    )
+    comments = make_comments(args.comments)
+    train = comments[:2000]
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        embeddings = await engine.embed([comment.text for comment in train])
+    positive = np.array([score_text(comment.text) > 0 for comment in train])
+    engine.set_head(EmbeddingHead.fit(
+        embeddings, positive, model=engine.model, dimensions=engine.dimensions
+    ))
+    engine.cache = type(engine.cache)(engine.cache.max_entries)
+
+    # The engine logs to stdout; keep it out of the report
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        before = app.state.stats["embedding_requests"]
+        started = time.perf_counter()
+        analyses = await engine.analyze(comments)
+        cold = time.perf_counter() - started
+        requests = app.state.stats["embedding_requests"] - before
+        started = time.perf_counter()
+        await engine.analyze(comments)
+        warm = time.perf_counter() - started
+
+    agreement = np.mean([
+        (analysis.sentiment_score > 0) == (score_text(comment.text) > 0)
+        for analysis, comment in zip(analyses, comments)
+    ])
+    print(f"{args.comments} comments, {args.dimensions} dimensions, batches of {args.batch_size}")
+    print(f"cold:  {args.comments / cold:>12,.0f} comments/s ({requests} requests)")
+    print(f"warm:  {args.comments / warm:>12,.0f} comments/s (cache hit rate {engine.cache.stats()['hit_rate']:.0%})")
+    print(f"label agreement with the stand-in scorer: {agreement:.1%}")
+    await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,65 @@
+"""Benchmark the per-page cost of decoding Feddit comment pages.
+
+Compares the standard decoder (``response.json()`` plus one validated ``Comment``
+per item) with the fast decoder (one schema-compiled validation of the raw bytes).
+
+Usage:
+    python benchmarks/bench_feddit_decode.py [--page-size 100] [--pages 2000]
+"""
+import argparse
+import json
+import os
+import random
+import timeit
+
+import httpx
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("PRODUCTION", "true")
+
+from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient  # noqa: E402
+
+
+def make_page(page_size: int, seed: int = 0) -> bytes:
+    """Build a comments response body like the one served by Feddit."""
+    rng = random.Random(seed)
+    comments = [
+        {
+            "id": i + 1,
+            "username": f"user_{rng.randint(1, 1000)}",
+            "text": " ".join(rng.choice(["good", "bad", "pydantic", "upgrade", "works"])
+                             for _ in range(rng.randint(3, 30))),
+            "created_at": 1695757477 + i * 60
+        }
+        for i in range(page_size)
+    ]
+    return json.dumps({
+        "subfeddit_id": 1, "limit": page_size, "skip": 0, "comments": comments
+    }).encode()
+
+
+def main() -> None:
+    """Run the benchmark and print the per-page parse cost of each decoder."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=2000)
+    args = parser.parse_args()
+
+    response = httpx.Response(
+        200,
+        content=make_page(args.page_size),
+        request=httpx.Request("GET", "http://feddit/api/v1/comments/")
+    )
+    results = {}
+    for decoder in ("standard", "fast"):
+        client = FedditClient(base_url="http://feddit", decoder=decoder)
+        parse = lambda: client._parse_comments(response, subfeddit_id=1)  # noqa: E731
+        assert len(parse()) == args.page_size
+        seconds = min(timeit.repeat(parse, number=args.pages, repeat=3))
+        results[decoder] = seconds / args.pages * 1e6
+        print(f"{decoder:>8}: {results[decoder]:8.1f} us/page ({args.page_size} comments)")
+    print(f" speedup: {results['standard'] / results['fast']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
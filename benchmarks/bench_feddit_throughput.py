@@ -0,0 +1,87 @@
+"""Measure FedditClient throughput against the local Feddit stand-in.
+
+Starts the stand-in with uvicorn on a free local port and reads comments through
+the real client stack (HTTP, pooling, decoding), sequentially page by page and with
+concurrent pages.
+
+Usage:
+    python benchmarks/bench_feddit_throughput.py [--comments 20000] [--latency 0.005]
+"""
+import argparse
+import asyncio
+import contextlib
+import os
+import socket
+import threading
+import time
+
+import uvicorn
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("PRODUCTION", "true")
+
+from sentiment_analysis.fakes.feddit_data import FedditDataset  # noqa: E402
+from sentiment_analysis.fakes.feddit_server import FaultConfig, create_app  # noqa: E402
+from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient  # noqa: E402
+
+
+def start_server(app) -> str:
+    """Run the app with uvicorn in a daemon thread and return its base URL."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}"
+
+
+async def run(base_url: str, total: int, concurrency: int) -> list:
+    """Time sequential and concurrent reads of ``total`` comments."""
+    results = []
+    for decoder in ("standard", "fast"):
+        client = FedditClient(base_url=base_url, decoder=decoder, coalesce_requests=False)
+        started = time.perf_counter()
+        count = 0
+        async for _ in client.aiter_comments(subfeddit_id=1, max_comments=total):
+            count += 1
+        sequential = time.perf_counter() - started
+
+        started = time.perf_counter()
+        comments = await client.fetch_comments_range(
+            subfeddit_id=2, total=total, concurrency=concurrency
+        )
+        concurrent = time.perf_counter() - started
+        await client.close()
+
+        assert count == len(comments) == total
+        results.append(
+            f"{decoder:>8}: sequential {total / sequential:9.0f} comments/s, "
+            f"concurrent({concurrency}) {total / concurrent:9.0f} comments/s"
+        )
+    return results
+
+
+def main() -> None:
+    """Start the stand-in and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--comments", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--jitter", type=float, default=0.005)
+    args = parser.parse_args()
+
+    app = create_app(
+        FedditDataset(comments_per_subfeddit=args.comments),
+        FaultConfig(latency=args.latency, jitter=args.jitter)
+    )
+    base_url = start_server(app)
+    # The client logs every page to stdout; keep it out of the report
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results = asyncio.run(run(base_url, args.comments, args.concurrency))
+    print("\n".join(results))
+
+
+if __name__ == "__main__":
+    main()
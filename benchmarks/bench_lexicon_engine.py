@@ -0,0 +1,68 @@
+"""Measure the throughput of the local lexicon sentiment engine.
+
+Scores synthetic Feddit comments in batches on one core and reports comments per
+second for the raw NumPy scorer and for ``analyze`` (which also builds the
+SentimentAnalysis entities).
+
+Usage:
+    python benchmarks/bench_lexicon_engine.py [--comments 50000] [--batch 1000]
+"""
+import argparse
+import asyncio
+import contextlib
+import os
+import time
+from datetime import datetime
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("PRODUCTION", "true")
+
+from sentiment_analysis.domain.entities.comment import Comment  # noqa: E402
+from sentiment_analysis.fakes.feddit_data import FedditDataset  # noqa: E402
+from sentiment_analysis.infrastructure.engines.lexicon_engine import LexiconSentimentEngine  # noqa: E402
+
+
+def make_comments(count):
+    """Create synthetic comments."""
+    dataset = FedditDataset(subfeddits=1, comments_per_subfeddit=count)
+    return [
+        Comment(
+            id=item["id"],
+            subfeddit_id=1,
+            username=item["username"],
+            text=item["text"],
+            created_at=datetime.fromtimestamp(item["created_at"])
+        )
+        for item in dataset.list_comments(1, limit=count, skip=0)
+    ]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--comments", type=int, default=50_000)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+
+    comments = make_comments(args.comments)
+    batches = [comments[i:i + args.batch] for i in range(0, len(comments), args.batch)]
+    engine = LexiconSentimentEngine()
+
+    started = time.perf_counter()
+    for batch in batches:
+        engine.score([comment.text for comment in batch])
+    score_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    # The engine logs every batch to stdout; keep it out of the report
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for batch in batches:
+            await engine.analyze(batch)
+    analyze_elapsed = time.perf_counter() - started
+
+    print(f"{args.comments} comments in batches of {args.batch}")
+    print(f"score:   {args.comments / score_elapsed:>12,.0f} comments/s")
+    print(f"analyze: {args.comments / analyze_elapsed:>12,.0f} comments/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,122 @@
+"""Compare structured-output scoring with single-token logprob scoring.
+
+Scores the same comments in "single" mode (one structured JSON answer per
+comment) and in "logprob" mode (one classification token per comment, scored
+from its log probabilities), and reports the per-comment latency of each mode
+and how much their results agree.
+
+By default both modes run against the local OpenAI stand-in, whose latency grows
+with the number of generated tokens (``--token-latency``). Pass ``--base-url``
+and ``--api-key`` to run against a real OpenAI-compatible endpoint instead.
+
+Usage:
+    python benchmarks/bench_logprob.py [--comments 200] [--token-latency 0.01]
+"""
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+import statistics
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+import uvicorn
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("PRODUCTION", "true")
+
+from sentiment_analysis.domain.entities.comment import Comment  # noqa: E402
+from sentiment_analysis.fakes.feddit_data import FedditDataset  # noqa: E402
+from sentiment_analysis.fakes.openai_server import FaultConfig, create_app  # noqa: E402
+from sentiment_analysis.infrastructure.sentiment_analyzer import SentimentAnalyzer  # noqa: E402
+
+
+def make_comments(count):
+    """Create synthetic comments."""
+    dataset = FedditDataset(subfeddits=1, comments_per_subfeddit=count)
+    return [
+        Comment(
+            id=item["id"],
+            subfeddit_id=1,
+            username=item["username"],
+            text=item["text"],
+            created_at=datetime.fromtimestamp(item["created_at"])
+        )
+        for item in dataset.list_comments(1, limit=count, skip=0)
+    ]
+
+
+def start_fake_server(latency, token_latency):
+    """Serve the OpenAI stand-in on a free local port and return its base URL."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(
+        create_app(faults=FaultConfig(latency=latency, token_latency=token_latency)),
+        host="127.0.0.1",
+        port=port,
+        log_level="warning"
+    ))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}/v1"
+
+
+async def score(mode, comments, args):
+    """Score comments one request at a time and time every request."""
+    analyzer = SentimentAnalyzer(
+        api_key=args.api_key, mode=mode, model=args.model, base_url=args.base_url
+    )
+    latencies = []
+    scores = []
+    # The analyzer logs every request to stdout; keep it out of the report
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for comment in comments:
+            started = time.perf_counter()
+            analysis, = await analyzer.analyze([comment])
+            latencies.append(time.perf_counter() - started)
+            scores.append(analysis.sentiment_score)
+        await analyzer.close()
+    fallbacks = analyzer.stats()["fallbacks"]
+    return np.asarray(latencies), np.asarray(scores), fallbacks
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--comments", type=int, default=200)
+    parser.add_argument("--model", default="gpt-4o-mini")
+    parser.add_argument("--base-url", help="OpenAI-compatible API; the local stand-in if omitted")
+    parser.add_argument("--api-key", default=os.environ["OPENAI_API_KEY"])
+    parser.add_argument("--latency", type=float, default=0.02, help="stand-in base latency (s)")
+    parser.add_argument("--token-latency", type=float, default=0.01, help="stand-in seconds per output token")
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    if args.base_url is None:
+        args.base_url = start_fake_server(args.latency, args.token_latency)
+    comments = make_comments(args.comments)
+
+    results = {}
+    for mode in ("single", "logprob"):
+        latencies, scores, fallbacks = await score(mode, comments, args)
+        results[mode] = scores
+        print(
+            f"{mode:>8}: mean {latencies.mean() * 1000:7.1f} ms"
+            f"  p95 {np.percentile(latencies, 95) * 1000:7.1f} ms"
+            f"  fallbacks {fallbacks}"
+        )
+
+    single, logprob = results["single"], results["logprob"]
+    agreement = np.mean(np.sign(single) == np.sign(logprob))
+    print(f"label agreement:   {agreement:.1%}")
+    if single.std() and logprob.std():
+        print(f"score correlation: {statistics.correlation(single.tolist(), logprob.tolist()):.3f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
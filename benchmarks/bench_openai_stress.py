@@ -0,0 +1,147 @@
+"""Stress the OpenAI analyzer against a slow and faulty OpenAI stand-in.
+
+Serves the OpenAI stand-in over real HTTP with a heavy-tailed lognormal latency,
+a requests-per-minute limit and injected 429, 500 and stalled responses, then
+streams synthetic Feddit comments through ``SentimentAnalyzer`` with its real
+client stack (connection pool, rate limiter, per-comment retries and the request
+deadline). Reports throughput, the time to each result, the failures by type
+and the faults the stand-in injected.
+
+Usage:
+    python benchmarks/bench_openai_stress.py [--comments 2000] [--mode single]
+"""
+import argparse
+import asyncio
+import collections
+import contextlib
+import logging
+import os
+import socket
+import time
+from datetime import datetime
+
+import numpy as np
+import uvicorn
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("PRODUCTION", "true")
+
+from sentiment_analysis.domain.entities.analysis_outcome import AnalysisFailure  # noqa: E402
+from sentiment_analysis.domain.entities.comment import Comment  # noqa: E402
+from sentiment_analysis.fakes.feddit_data import FedditDataset  # noqa: E402
+from sentiment_analysis.fakes.openai_server import FaultConfig, create_app  # noqa: E402
+from sentiment_analysis.infrastructure.deadline import deadline  # noqa: E402
+from sentiment_analysis.infrastructure.rate_limiter import OpenAIRateLimiter  # noqa: E402
+from sentiment_analysis.infrastructure.sentiment_analyzer import SentimentAnalyzer  # noqa: E402
+
+
+def make_comments(count):
+    """Create synthetic comments."""
+    dataset = FedditDataset(subfeddits=1, comments_per_subfeddit=count)
+    return [
+        Comment(
+            id=item["id"],
+            subfeddit_id=1,
+            username=item["username"],
+            text=item["text"],
+            created_at=datetime.fromtimestamp(item["created_at"])
+        )
+        for item in dataset.list_comments(1, limit=count, skip=0)
+    ]
+
+
+async def start_fake_server(faults):
+    """Serve the OpenAI stand-in on a free local port and return it with its base URL.
+
+    The server runs on the benchmark's own event loop: a server thread would
+    contend with the client for the GIL and dominate the measurement.
+    """
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    app = create_app(faults=faults)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="critical"))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    return app, server, task, f"http://127.0.0.1:{port}/v1"
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--comments", type=int, default=2000)
+    parser.add_argument("--mode", choices=("single", "packed", "logprob"), default="single")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05, help="stand-in median latency (s)")
+    parser.add_argument("--latency-spread", type=float, default=0.8, help="lognormal sigma")
+    parser.add_argument("--requests-per-minute", type=float, default=60_000)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.02)
+    parser.add_argument("--timeout-rate", type=float, default=0.002)
+    parser.add_argument("--deadline", type=float, default=30.0, help="request deadline (s)")
+    parser.add_argument("--no-rate-limiter", action="store_true", help="send without the client-side limiter")
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("openai").setLevel(logging.WARNING)
+
+    app, server, serving, base_url = await start_fake_server(FaultConfig(
+        latency=args.latency,
+        latency_distribution="lognormal",
+        latency_spread=args.latency_spread,
+        requests_per_minute=args.requests_per_minute,
+        rate_limit_rate=args.rate_limit_rate,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        timeout_delay=args.deadline * 2,
+        retry_after=0.2
+    ))
+    rate_limiter = None if args.no_rate_limiter else OpenAIRateLimiter(
+        requests_per_minute=args.requests_per_minute, tokens_per_minute=10_000_000
+    )
+    analyzer = SentimentAnalyzer(
+        base_url=base_url,
+        mode=args.mode,
+        concurrency=args.concurrency,
+        max_connections=args.concurrency,
+        max_keepalive_connections=args.concurrency,
+        rate_limiter=rate_limiter
+    )
+    comments = make_comments(args.comments)
+
+    done = []
+    failures = collections.Counter()
+    # The analyzer logs every request to stdout; keep it out of the report
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        started = time.perf_counter()
+        with deadline(args.deadline):
+            async for result in analyzer.analyze_stream(comments):
+                done.append(time.perf_counter() - started)
+                if isinstance(result, AnalysisFailure):
+                    failures[result.error_type] += 1
+        elapsed = time.perf_counter() - started
+        await analyzer.close()
+    server.should_exit = True
+    await serving
+
+    done = np.asarray(done)
+    stats = analyzer.stats()
+    server = app.state.stats
+    print(f"{args.comments} comments in {args.mode} mode, concurrency {args.concurrency}")
+    print(f"throughput: {args.comments / elapsed:>10,.0f} comments/s ({elapsed:.2f} s)")
+    print(
+        f"time to result: p50 {np.percentile(done, 50):.2f} s"
+        f"  p95 {np.percentile(done, 95):.2f} s  p99 {np.percentile(done, 99):.2f} s"
+    )
+    print(f"requests: {server['responses'] + server['chat_completions']} sent, {stats['retries']} analyzer retries")
+    print(
+        f"injected: {server['rate_limited']} 429s, {server['server_errors']} 500s,"
+        f" {server['timeouts']} stalls"
+    )
+    if rate_limiter is not None:
+        limiter = stats["rate_limiter"]
+        print(f"rate limiter: {limiter['waits']} waits ({limiter['wait_time']:.2f} s), {limiter['rejections']} 429s seen")
+    print(f"failed: {sum(failures.values())} {dict(failures)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+"""Compare request count and prompt tokens of single and packed analysis.
+
+Analyzes synthetic comments with both modes against a counting stand-in for the
+OpenAI responses API and reports how many requests and estimated prompt tokens
+(system prompt included) each mode sends.
+
+Usage:
+    python benchmarks/bench_packing.py [--comments 100]
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("PRODUCTION", "true")
+
+from sentiment_analysis.domain.entities.comment import Comment  # noqa: E402
+from sentiment_analysis.fakes.feddit_data import FedditDataset  # noqa: E402
+from sentiment_analysis.infrastructure.prompt_packing import estimate_tokens  # noqa: E402
+from sentiment_analysis.infrastructure.sentiment_analyzer import (  # noqa: E402
+    OutputFormat,
+    PackedOutputFormat,
+    PackedOutputItem,
+    SentimentAnalyzer
+)
+
+
+class CountingResponses:
+    """Answers parse calls with positive results and counts prompt tokens."""
+
+    def __init__(self):
+        self.requests = 0
+        self.prompt_tokens = 0
+
+    async def parse(self, model, input, text_format):
+        self.requests += 1
+        self.prompt_tokens += sum(estimate_tokens(message["content"]) for message in input)
+        if text_format is PackedOutputFormat:
+            return SimpleNamespace(output_parsed=PackedOutputFormat(results=[
+                PackedOutputItem(comment_id=item["comment_id"], sentiment_score=0.5, sentiment_label="positive")
+                for item in json.loads(input[1]["content"])
+            ]))
+        return SimpleNamespace(output_parsed=OutputFormat(sentiment_score=0.5, sentiment_label="positive"))
+
+
+async def measure(mode: str, comments) -> CountingResponses:
+    """Analyze the comments in the given mode and return the counters."""
+    responses = CountingResponses()
+    with patch("sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI") as client:
+        client.return_value.responses = responses
+        analyzer = SentimentAnalyzer(mode=mode)
+    await analyzer.analyze(comments)
+    return responses
+
+
+def main() -> None:
+    """Run the comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--comments", type=int, default=100)
+    args = parser.parse_args()
+
+    comments = [
+        Comment(subfeddit_id=1, created_at=datetime.fromtimestamp(raw.pop("created_at")), **raw)
+        for raw in FedditDataset().list_comments(1, limit=args.comments, skip=0)
+    ]
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results = {mode: asyncio.run(measure(mode, comments)) for mode in ("single", "packed")}
+    for mode, counters in results.items():
+        print(f"{mode:>7}: {counters.requests:5d} requests, {counters.prompt_tokens:7d} prompt tokens")
+    single, packed = results["single"], results["packed"]
+    print(
+        f"reduction: {single.requests / packed.requests:.1f}x requests, "
+        f"{single.prompt_tokens / packed.prompt_tokens:.1f}x prompt tokens"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""Application-wide service container.
+
+Holds the long-lived, pooled clients shared by every request so that connections
+are reused instead of being re-established per request.
+"""
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sentiment_analysis.config import (
+    WARM_UP_CONNECTIONS,
+    SENTIMENT_ANALYSIS_MODE,
+    SENTIMENT_ENGINE,
+    SENTIMENT_LEXICON_PATH,
+    SENTIMENT_CASCADE_THRESHOLD,
+    SENTIMENT_EMBEDDING_HEAD_PATH,
+    SENTIMENT_EMBEDDING_MODEL,
+    SENTIMENT_EMBEDDING_DIMENSIONS,
+    SENTIMENT_CACHE_ENABLED,
+    SENTIMENT_CACHE_MAX_BYTES,
+    SENTIMENT_CACHE_PATH,
+    SENTIMENT_NEAR_DUPLICATES_ENABLED,
+    SENTIMENT_NEAR_DUPLICATE_DISTANCE,
+    SENTIMENT_NEAR_DUPLICATE_MAX_ENTRIES,
+    OPENAI_RATE_LIMIT_ENABLED,
+    OPENAI_REQUESTS_PER_MINUTE,
+    OPENAI_TOKENS_PER_MINUTE,
+    FEDDIT_CACHE_ENABLED,
+    FEDDIT_CACHE_MAX_BYTES,
+    FEDDIT_CACHE_COMMENTS_TTL,
+    FEDDIT_CACHE_SUBFEDDITS_TTL,
+    FEDDIT_DECODER,
+    FEDDIT_TIMEOUT,
+    FEDDIT_RESILIENCE_ENABLED,
+    FEDDIT_MAX_RETRIES,
+    FEDDIT_BACKOFF_BASE,
+    FEDDIT_BACKOFF_CAP,
+    FEDDIT_HEDGE_ENABLED,
+    FEDDIT_HEDGE_DELAY,
+    FEDDIT_HEDGE_QUANTILE,
+    FEDDIT_BREAKER_FAILURE_THRESHOLD,
+    FEDDIT_BREAKER_RESET_TIMEOUT,
+    SUBFEDDIT_CATALOG_TTL,
+    SUBFEDDIT_CATALOG_CASE_INSENSITIVE,
+    SUBFEDDIT_CATALOG_MISS_REFRESH_INTERVAL,
+)
+from sentiment_analysis.domain.services.analyzer_engine import AnalyzerEngine
+from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient
+from sentiment_analysis.infrastructure.clients.comment_time_index import CommentTimeIndex
+from sentiment_analysis.infrastructure.clients.page_cache import PageCache
+from sentiment_analysis.infrastructure.clients.resilience import CircuitBreaker, ResilientExecutor
+from sentiment_analysis.infrastructure.clients.subfeddit_catalog import SubfedditCatalog
+from sentiment_analysis.infrastructure.engines.cascade_engine import CascadeSentimentEngine
+from sentiment_analysis.infrastructure.engines.embedding_engine import EmbeddingSentimentEngine
+from sentiment_analysis.infrastructure.engines.lexicon_engine import LexiconSentimentEngine
+from sentiment_analysis.infrastructure.near_duplicate_index import NearDuplicateIndex
+from sentiment_analysis.infrastructure.rate_limiter import OpenAIRateLimiter
+from sentiment_analysis.infrastructure.result_cache import SentimentResultCache
+from sentiment_analysis.infrastructure.sentiment_analyzer import SentimentAnalyzer
+from sentiment_analysis.infrastructure.repositories.sentiment_analysis_repository import SentimentAnalysisRepository
+from sentiment_analysis.logger import configure_logger
+
+
+# Engine names accepted by SENTIMENT_ENGINE and the analyzer policy each one maps to
+ENGINE_POLICIES = {"lexicon": "fast", "openai": "accurate", "cascade": "cascade", "embedding": "bulk"}
+
+
+class ServiceContainer:
+    """Owns the shared clients and repository for the lifetime of the application."""
+
+    def __init__(
+        self,
+        feddit_client: Optional[FedditClient] = None,
+        sentiment_analyzer: Optional[AnalyzerEngine] = None,
+        sentiment_analysis_repository: Optional[SentimentAnalysisRepository] = None,
+        analyzer_engines: Optional[Dict[str, AnalyzerEngine]] = None
+    ):
+        """Initialize the container.
+
+        Args:
+            feddit_client: Shared Feddit client. Created from config if not provided.
+            sentiment_analyzer: Default sentiment analyzer engine. Taken from the
+                analyzer engines according to config if not provided.
+            sentiment_analysis_repository: Shared repository. Created if not provided.
+            analyzer_engines: Engines selectable per request, keyed by analyzer policy
+                ("fast", "accurate", "cascade", "bulk"). Created from config if neither they
+                nor a sentiment analyzer are provided.
+        """
+        self.feddit_client = feddit_client or FedditClient(
+            page_cache=self._build_page_cache(),
+            decoder=FEDDIT_DECODER,
+            resilience=self._build_resilience()
+        )
+        if analyzer_engines is None:
+            analyzer_engines = {} if sentiment_analyzer else self._build_engines()
+        self.analyzer_engines = analyzer_engines
+        self.sentiment_analyzer = sentiment_analyzer or self.analyzer_engines[
+            ENGINE_POLICIES.get(SENTIMENT_ENGINE, SENTIMENT_ENGINE)
+        ]
+        self.sentiment_analysis_repository = (
+            sentiment_analysis_repository or SentimentAnalysisRepository()
+        )
+        self.comment_time_index = CommentTimeIndex(self.feddit_client)
+        self.subfeddit_catalog = SubfedditCatalog(
+            self.feddit_client,
+            ttl=SUBFEDDIT_CATALOG_TTL,
+            case_insensitive=SUBFEDDIT_CATALOG_CASE_INSENSITIVE,
+            miss_refresh_interval=SUBFEDDIT_CATALOG_MISS_REFRESH_INTERVAL
+        )
+        self.logger = configure_logger().bind(service="service_container")
+
+    @classmethod
+    def _build_engines(cls) -> Dict[str, AnalyzerEngine]:
+        """Build the sentiment analyzer engines keyed by analyzer policy.
+
+        The "bulk" embedding engine is only built when its head file exists.
+
+        Raises:
+            ValueError: If the configured default engine is unknown or unavailable.
+        """
+        policy = ENGINE_POLICIES.get(SENTIMENT_ENGINE, SENTIMENT_ENGINE)
+        if policy not in ENGINE_POLICIES.values():
+            raise ValueError(f"Unknown sentiment engine '{SENTIMENT_ENGINE}'")
+        fast = LexiconSentimentEngine(weights_path=SENTIMENT_LEXICON_PATH or None)
+        accurate = cls.build_accurate_engine()
+        engines: Dict[str, AnalyzerEngine] = {
+            "fast": fast,
+            "accurate": accurate,
+            "cascade": CascadeSentimentEngine(fast, accurate, threshold=SENTIMENT_CASCADE_THRESHOLD)
+        }
+        if SENTIMENT_EMBEDDING_HEAD_PATH and Path(SENTIMENT_EMBEDDING_HEAD_PATH).exists():
+            engines["bulk"] = EmbeddingSentimentEngine(
+                head_path=SENTIMENT_EMBEDDING_HEAD_PATH,
+                model=SENTIMENT_EMBEDDING_MODEL,
+                dimensions=SENTIMENT_EMBEDDING_DIMENSIONS or None
+            )
+        elif policy == "bulk":
+            raise ValueError(f"Embedding head not found at '{SENTIMENT_EMBEDDING_HEAD_PATH}'")
+        return engines
+
+    @classmethod
+    def build_accurate_engine(cls) -> SentimentAnalyzer:
+        """Build the accurate (LLM) engine from config.
+
+        Tools that only need the LLM pass it as the container's sentiment
+        analyzer, which skips building and validating the other engine policies.
+        """
+        return SentimentAnalyzer(
+            mode=SENTIMENT_ANALYSIS_MODE,
+            result_cache=cls._build_result_cache(),
+            rate_limiter=cls._build_rate_limiter(),
+            near_duplicates=cls._build_near_duplicates()
+        )
+
+    def engines(self) -> List[AnalyzerEngine]:
+        """Get every distinct engine owned by the container."""
+        engines: List[AnalyzerEngine] = []
+        for engine in (self.sentiment_analyzer, *self.analyzer_engines.values()):
+            if all(engine is not known for known in engines):
+                engines.append(engine)
+        return engines
+
+    @staticmethod
+    def _build_page_cache() -> Optional[PageCache]:
+        """Build the Feddit page cache from config, if enabled."""
+        if not FEDDIT_CACHE_ENABLED:
+            return None
+        return PageCache(
+            max_bytes=FEDDIT_CACHE_MAX_BYTES,
+            default_ttl=FEDDIT_CACHE_COMMENTS_TTL,
+            endpoint_ttls={
+                "/api/v1/comments/": FEDDIT_CACHE_COMMENTS_TTL,
+                "/api/v1/subfeddits/": FEDDIT_CACHE_SUBFEDDITS_TTL
+            }
+        )
+
+    @staticmethod
+    def _build_result_cache() -> Optional[SentimentResultCache]:
+        """Build the sentiment result cache from config, if enabled."""
+        if not SENTIMENT_CACHE_ENABLED:
+            return None
+        return SentimentResultCache(
+            max_bytes=SENTIMENT_CACHE_MAX_BYTES,
+            path=SENTIMENT_CACHE_PATH or None
+        )
+
+    @staticmethod
+    def _build_near_duplicates() -> Optional[NearDuplicateIndex]:
+        """Build the near-duplicate index of scored texts from config, if enabled."""
+        if not SENTIMENT_NEAR_DUPLICATES_ENABLED:
+            return None
+        return NearDuplicateIndex(
+            max_distance=SENTIMENT_NEAR_DUPLICATE_DISTANCE,
+            max_entries=SENTIMENT_NEAR_DUPLICATE_MAX_ENTRIES
+        )
+
+    @staticmethod
+    def _build_rate_limiter() -> Optional[OpenAIRateLimiter]:
+        """Build the process-wide OpenAI rate limiter from config, if enabled."""
+        if not OPENAI_RATE_LIMIT_ENABLED:
+            return None
+        return OpenAIRateLimiter(
+            requests_per_minute=OPENAI_REQUESTS_PER_MINUTE,
+            tokens_per_minute=OPENAI_TOKENS_PER_MINUTE
+        )
+
+    @staticmethod
+    def _build_resilience() -> Optional[ResilientExecutor]:
+        """Build the Feddit resilience layer from config, if enabled."""
+        if not FEDDIT_RESILIENCE_ENABLED:
+            return None
+        return ResilientExecutor(
+            timeout=FEDDIT_TIMEOUT,
+            max_retries=FEDDIT_MAX_RETRIES,
+            backoff_base=FEDDIT_BACKOFF_BASE,
+            backoff_cap=FEDDIT_BACKOFF_CAP,
+            hedge=FEDDIT_HEDGE_ENABLED,
+            hedge_delay=FEDDIT_HEDGE_DELAY,
+            hedge_quantile=FEDDIT_HEDGE_QUANTILE,
+            breaker=CircuitBreaker(
+                failure_threshold=FEDDIT_BREAKER_FAILURE_THRESHOLD,
+                reset_timeout=FEDDIT_BREAKER_RESET_TIMEOUT
+            )
+        )
+
+    def metrics(self) -> Dict[str, Any]:
+        """Collect the runtime counters of the shared clients.
+
+        Returns:
+            Dictionary of metrics keyed by component.
+        """
+        metrics = {"feddit": self.feddit_client.stats()}
+        for engine in self.engines():
+            metrics[engine.name] = engine.stats()
+        metrics["repository"] = self.sentiment_analysis_repository.stats()
+        return metrics
+
+    async def start(self, warm_up: bool = WARM_UP_CONNECTIONS) -> None:
+        """Start the container, optionally warming the connection pools.
+
+        Args:
+            warm_up: Whether to open connections to the upstream APIs eagerly.
+        """
+        self.logger.info("Starting service container", warm_up=warm_up)
+        if warm_up:
+            await self.feddit_client.warm_up()
+            for engine in self.engines():
+                await engine.warm_up()
+        await self.subfeddit_catalog.start()
+
+    async def close(self) -> None:
+        """Stop background work and close all owned clients."""
+        await self.subfeddit_catalog.close()
+        await self.feddit_client.close()
+        for engine in self.engines():
+            await engine.close()
+        self.logger.info("Service container closed")
+
+
+_container: Optional[ServiceContainer] = None
+
+
+def get_container() -> ServiceContainer:
+    """Get the application-wide container, creating it on first use.
+
+    Returns:
+        The shared ServiceContainer instance.
+    """
+    global _container
+    if _container is None:
+        _container = ServiceContainer()
+    return _container
+
+
+def set_container(container: Optional[ServiceContainer]) -> None:
+    """Install (or clear) the application-wide container.
+
+    Args:
+        container: Container to install, or None to clear it.
+    """
+    global _container
+    _container = container
@@ -1,36 +1,64 @@
 """Dependency injection for FastAPI application."""
 
+from typing import Dict
+
 from fastapi import Depends
 
+from sentiment_analysis.api.container import get_container
 from sentiment_analysis.application.services.sentiment_service import SentimentService
+from sentiment_analysis.config import SENTIMENT_READ_THROUGH_ENABLED
+from sentiment_analysis.domain.services.analyzer_engine import AnalyzerEngine
 from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient
-from sentiment_analysis.infrastructure.sentiment_analyzer import SentimentAnalyzer
+from sentiment_analysis.infrastructure.clients.comment_time_index import CommentTimeIndex
+from sentiment_analysis.infrastructure.clients.subfeddit_catalog import SubfedditCatalog
 from sentiment_analysis.infrastructure.repositories.sentiment_analysis_repository import SentimentAnalysisRepository
 
 
 def get_feddit_client() -> FedditClient:
-    """Get FedditClient instance."""
-    return FedditClient()
+    """Get the shared FedditClient instance."""
+    return get_container().feddit_client
+
 
+def get_sentiment_analyzer() -> AnalyzerEngine:
+    """Get the shared sentiment analyzer engine."""
+    return get_container().sentiment_analyzer
 
-def get_sentiment_analyzer() -> SentimentAnalyzer:
-    """Get SentimentAnalyzer instance."""
-    return SentimentAnalyzer()
+
+def get_analyzer_engines() -> Dict[str, AnalyzerEngine]:
+    """Get the shared analyzer engines keyed by analyzer policy."""
+    return get_container().analyzer_engines
 
 
 def get_sentiment_analysis_repository() -> SentimentAnalysisRepository:
-    """Get SentimentAnalysisRepository instance."""
-    return SentimentAnalysisRepository()
+    """Get the shared SentimentAnalysisRepository instance."""
+    return get_container().sentiment_analysis_repository
+
+
+def get_comment_time_index() -> CommentTimeIndex:
+    """Get the shared CommentTimeIndex instance."""
+    return get_container().comment_time_index
+
+
+def get_subfeddit_catalog() -> SubfedditCatalog:
+    """Get the shared SubfedditCatalog instance."""
+    return get_container().subfeddit_catalog
 
 
 def get_sentiment_service(
     feddit_client: FedditClient = Depends(get_feddit_client),
-    sentiment_analyzer: SentimentAnalyzer = Depends(get_sentiment_analyzer),
-    sentiment_analysis_repository: SentimentAnalysisRepository = Depends(get_sentiment_analysis_repository)
+    sentiment_analyzer: AnalyzerEngine = Depends(get_sentiment_analyzer),
+    sentiment_analysis_repository: SentimentAnalysisRepository = Depends(get_sentiment_analysis_repository),
+    comment_time_index: CommentTimeIndex | None = Depends(get_comment_time_index),
+    subfeddit_catalog: SubfedditCatalog | None = Depends(get_subfeddit_catalog),
+    analyzer_engines: Dict[str, AnalyzerEngine] = Depends(get_analyzer_engines)
 ) -> SentimentService:
     """Get SentimentService instance with dependencies."""
     return SentimentService(
         feddit_client=feddit_client,
         sentiment_analyzer=sentiment_analyzer,
-        sentiment_analysis_repository=sentiment_analysis_repository
+        sentiment_analysis_repository=sentiment_analysis_repository,
+        comment_time_index=comment_time_index,
+        subfeddit_catalog=subfeddit_catalog,
+        analyzer_engines=analyzer_engines,
+        read_through=SENTIMENT_READ_THROUGH_ENABLED
     )
@@ -1,9 +1,10 @@
 """API data transfer objects."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel, Field, field_validator
 
+from sentiment_analysis.domain.entities.analysis_outcome import AnalysisFailure
 from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
 
 
@@ -23,10 +24,27 @@ class SentimentAnalysisResponseDTO(BaseModel):
             }
         ]
     )
+    failures: List[AnalysisFailure] = Field(
+        default_factory=list,
+        description="Comments that could not be analyzed after their retries",
+        example=[
+            {
+                "comment_id": 2,
+                "error_type": "RateLimitError",
+                "message": "Rate limit reached",
+                "attempts": 3,
+                "retryable": True
+            }
+        ]
+    )
+    partial: bool = Field(
+        default=False,
+        description="Whether the deadline expired before every comment was analyzed"
+    )
 
 
-class SentimentAnalysisRequestDTO(BaseModel):
-    """API request DTO for sentiment analysis."""
+class SentimentQueryDTO(BaseModel):
+    """Parameters shared by the sentiment analysis requests."""
     limit: int = Field(
         default=25,
         ge=1,
@@ -41,9 +59,22 @@ class SentimentAnalysisRequestDTO(BaseModel):
         default=None,
         description="Optional end time for filtering comments"
     )
-    sort_by_score: bool = Field(
-        default=False,
-        description="Whether to sort results by sentiment score"
+    engine: Optional[Literal["fast", "accurate", "cascade", "bulk"]] = Field(
+        default=None,
+        description=(
+            "Analyzer policy: 'fast' scores locally, 'accurate' uses the LLM, "
+            "'cascade' sends only uncertain comments to the LLM and 'bulk' scores "
+            "embeddings with a fitted head. Defaults to the configured engine"
+        )
+    )
+    timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Latency budget of the request in seconds, also accepted as the "
+            "X-Request-Timeout header. Defaults to the server budget and is capped "
+            "by the server maximum"
+        )
     )
 
     @field_validator('start_time', 'end_time')
@@ -53,3 +84,40 @@ class SentimentAnalysisRequestDTO(BaseModel):
         if v is not None and v.tzinfo is not None:
             return v.replace(tzinfo=None)
         return v
+
+
+class SentimentAnalysisRequestDTO(SentimentQueryDTO):
+    """API request DTO for sentiment analysis."""
+    sort_by_score: bool = Field(
+        default=False,
+        description="Whether to sort results by sentiment score"
+    )
+    partial: bool = Field(
+        default=False,
+        description=(
+            "Whether to return the analyses completed before the deadline, flagged "
+            "as partial, instead of failing with a 504"
+        )
+    )
+
+
+class SentimentStreamRequestDTO(SentimentQueryDTO):
+    """API request DTO for streamed sentiment analysis."""
+    format: Optional[Literal["ndjson", "sse"]] = Field(
+        default=None,
+        description=(
+            "Stream format: newline-delimited JSON or Server-Sent Events. Defaults "
+            "to Server-Sent Events if the Accept header asks for text/event-stream, "
+            "NDJSON otherwise"
+        )
+    )
+
+
+class SentimentStreamSummaryDTO(BaseModel):
+    """Final record of a sentiment analysis stream."""
+    analysis_count: int = Field(..., description="Number of analyses streamed")
+    failure_count: int = Field(..., description="Number of comments that could not be analyzed")
+    partial: bool = Field(
+        default=False,
+        description="Whether the deadline expired before every comment was analyzed"
+    )
@@ -1,19 +1,40 @@
 """FastAPI application for sentiment analysis."""
 
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from sentiment_analysis.api.container import ServiceContainer, get_container, set_container
 from sentiment_analysis.api.routes import router
 from sentiment_analysis.logger import configure_logger
 from sentiment_analysis.config import FAST_API_PORT
 
 logger = configure_logger().bind(service="api")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the shared service container on startup and close it on shutdown."""
+    container = ServiceContainer()
+    set_container(container)
+    app.state.container = container
+    await container.start()
+    logger.info("Application started")
+    try:
+        yield
+    finally:
+        await container.close()
+        set_container(None)
+        logger.info("Application stopped")
+
+
 app = FastAPI(
     title="Sentiment Analysis API",
     description="API for analyzing sentiment of Feddit comments",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -29,5 +50,11 @@ app.add_middleware(
 app.include_router(router)
 
 
+@app.get("/metrics")
+async def metrics():
+    """Runtime counters of the shared clients (coalescing, caching, resilience)."""
+    return get_container().metrics()
+
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=FAST_API_PORT, reload=True)
@@ -1,56 +1,172 @@
 """API routes for the sentiment analysis microservice."""
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable, Dict, Optional, TypeVar, Union
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from sentiment_analysis.application.services.sentiment_service import SentimentService
-from sentiment_analysis.api.dto import SentimentAnalysisResponseDTO, SentimentAnalysisRequestDTO
+from sentiment_analysis.api.dto import (
+    SentimentAnalysisRequestDTO,
+    SentimentAnalysisResponseDTO,
+    SentimentStreamRequestDTO,
+    SentimentStreamSummaryDTO,
+)
 from sentiment_analysis.api.dependencies import get_sentiment_service
+from sentiment_analysis.config import SENTIMENT_REQUEST_MAX_TIMEOUT, SENTIMENT_REQUEST_TIMEOUT
+from sentiment_analysis.domain.entities.analysis_outcome import AnalysisFailure
+from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
+from sentiment_analysis.domain.services.analyzer_engine import EngineUnavailableError
+from sentiment_analysis.infrastructure.deadline import DeadlineExceeded
 from sentiment_analysis.logger import configure_logger
 
+T = TypeVar("T")
+
 router = APIRouter(prefix="/api/v1/sentiment")
 logger = configure_logger().bind(service="api")
 
+# Non-standard status code (as used by nginx) for requests the client gave up on
+CLIENT_CLOSED_REQUEST = 499
+
+STREAM_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+
+
+class ClientDisconnected(Exception):
+    """Raised when the HTTP client disconnects before the response is ready."""
+
+
+def request_timeout(query: Optional[float], header: Optional[float]) -> float:
+    """Resolve the latency budget of a request.
+
+    Args:
+        query: Budget from the ``timeout`` query parameter.
+        header: Budget from the ``X-Request-Timeout`` header.
+
+    Returns:
+        The requested budget (query parameter first), or the server default,
+        capped by the server maximum.
+    """
+    requested = query or header or SENTIMENT_REQUEST_TIMEOUT
+    return min(requested, SENTIMENT_REQUEST_MAX_TIMEOUT)
+
+
+async def cancel_on_disconnect(http_request: Request, work: Awaitable[T]) -> T:
+    """Await the work of a request, cancelling it if the client disconnects.
+
+    Args:
+        http_request: Incoming request, watched for a disconnect message.
+        work: Work producing the response.
+
+    Returns:
+        The result of the work.
+
+    Raises:
+        ClientDisconnected: If the client disconnected first; the work and every
+            call it has in flight are cancelled.
+    """
+    task = asyncio.ensure_future(work)
+
+    async def disconnected() -> None:
+        while (await http_request.receive())["type"] != "http.disconnect":
+            pass
+
+    watcher = asyncio.ensure_future(disconnected())
+    try:
+        await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+        if not task.done():
+            raise ClientDisconnected("Client disconnected")
+        return task.result()
+    finally:
+        for pending in (task, watcher):
+            if not pending.done():
+                pending.cancel()
+        await asyncio.gather(task, watcher, return_exceptions=True)
+
 
 @router.get("/{subfeddit}", response_model=SentimentAnalysisResponseDTO)
 async def analyze_subfeddit_sentiment(
     subfeddit: str,
+    http_request: Request,
     request: SentimentAnalysisRequestDTO = Depends(),
+    x_request_timeout: Optional[float] = Header(default=None, gt=0),
     sentiment_service: SentimentService = Depends(get_sentiment_service)
 ) -> SentimentAnalysisResponseDTO:
     """
     Analyze sentiment for comments in a subfeddit.
+
+    The request is bounded by a latency budget; the Feddit and OpenAI calls still
+    running when it expires, or when the client disconnects, are cancelled.
     
     Args:
         subfeddit: Name of the subfeddit to analyze
+        http_request: Incoming HTTP request, watched for a client disconnect
         request: Sentiment analysis request parameters
+        x_request_timeout: Optional latency budget in seconds from the
+            X-Request-Timeout header
         sentiment_service: Injected sentiment service
         
     Returns:
-        List of sentiment analyses for the comments
+        Sentiment analyses for the comments, and the comments that could not be
+        analyzed
     """
+    timeout = request_timeout(request.timeout, x_request_timeout)
     try:
         logger.info(
             "Analyzing subfeddit sentiment",
             subfeddit=subfeddit,
-            limit=request.limit
+            limit=request.limit,
+            engine=request.engine,
+            timeout=timeout
         )
         
-        analyses = await sentiment_service.analyze_subfeddit_sentiment(
+        outcome = await cancel_on_disconnect(http_request, sentiment_service.analyze_subfeddit(
             subfeddit=subfeddit,
             limit=request.limit,
             start_time=request.start_time,
-            end_time=request.end_time
-        )
+            end_time=request.end_time,
+            engine=request.engine,
+            timeout=timeout,
+            allow_partial=request.partial
+        ))
         
+        analyses = outcome.analyses
         if request.sort_by_score:
             analyses.sort(key=lambda x: x.sentiment_score, reverse=True)
             
         logger.info(
             "Successfully analyzed subfeddit sentiment",
             subfeddit=subfeddit,
-            analysis_count=len(analyses)
+            analysis_count=len(analyses),
+            failed=len(outcome.failures),
+            partial=outcome.partial
         )
         
-        return SentimentAnalysisResponseDTO(analyses=analyses)
+        return SentimentAnalysisResponseDTO(
+            analyses=analyses, failures=outcome.failures, partial=outcome.partial
+        )
+    except ClientDisconnected as e:
+        logger.warning(
+            "Client disconnected, analysis cancelled",
+            subfeddit=subfeddit,
+            error=str(e)
+        )
+        raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail=str(e))
+    except DeadlineExceeded as e:
+        logger.error(
+            "Request deadline exceeded",
+            subfeddit=subfeddit,
+            timeout=timeout,
+            error=str(e)
+        )
+        raise HTTPException(status_code=504, detail=str(e))
+    except EngineUnavailableError as e:
+        logger.error(
+            "Analyzer engine not available",
+            subfeddit=subfeddit,
+            error=str(e)
+        )
+        raise HTTPException(status_code=503, detail=str(e))
     except ValueError as e:
         logger.error(
             "Invalid input",
@@ -67,6 +183,141 @@ async def analyze_subfeddit_sentiment(
         raise HTTPException(status_code=500, detail=f"Error analyzing sentiment: {str(e)}")
     
 
+@router.get("/{subfeddit}/stream", response_class=StreamingResponse)
+async def stream_subfeddit_sentiment(
+    subfeddit: str,
+    http_request: Request,
+    request: SentimentStreamRequestDTO = Depends(),
+    x_request_timeout: Optional[float] = Header(default=None, gt=0),
+    sentiment_service: SentimentService = Depends(get_sentiment_service)
+) -> StreamingResponse:
+    """
+    Stream the sentiment of comments in a subfeddit as each analysis completes.
+
+    Every record is an ``analysis`` or a ``failure`` of one comment, in completion
+    order, followed by a final ``summary`` (or an ``error`` if the analysis broke
+    off). As NDJSON, each line is ``{"event": ..., "data": ...}``; as Server-Sent
+    Events, the record type is the event name and the data its JSON payload.
+    Comments still pending when the latency budget expires are streamed as
+    failures and the summary is flagged as partial.
+
+    Args:
+        subfeddit: Name of the subfeddit to analyze
+        http_request: Incoming HTTP request, watched for a client disconnect
+        request: Sentiment stream request parameters
+        x_request_timeout: Optional latency budget in seconds from the
+            X-Request-Timeout header
+        sentiment_service: Injected sentiment service
+
+    Returns:
+        Streaming response of NDJSON lines or Server-Sent Events
+    """
+    timeout = request_timeout(request.timeout, x_request_timeout)
+    stream_format = request.format or (
+        "sse" if "text/event-stream" in http_request.headers.get("accept", "") else "ndjson"
+    )
+    try:
+        logger.info(
+            "Streaming subfeddit sentiment",
+            subfeddit=subfeddit,
+            limit=request.limit,
+            engine=request.engine,
+            timeout=timeout,
+            format=stream_format
+        )
+        results = await cancel_on_disconnect(http_request, sentiment_service.stream_subfeddit(
+            subfeddit=subfeddit,
+            limit=request.limit,
+            start_time=request.start_time,
+            end_time=request.end_time,
+            engine=request.engine,
+            timeout=timeout
+        ))
+    except ClientDisconnected as e:
+        logger.warning("Client disconnected, analysis cancelled", subfeddit=subfeddit, error=str(e))
+        raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail=str(e))
+    except DeadlineExceeded as e:
+        logger.error("Request deadline exceeded", subfeddit=subfeddit, timeout=timeout, error=str(e))
+        raise HTTPException(status_code=504, detail=str(e))
+    except EngineUnavailableError as e:
+        logger.error("Analyzer engine not available", subfeddit=subfeddit, error=str(e))
+        raise HTTPException(status_code=503, detail=str(e))
+    except ValueError as e:
+        logger.error("Invalid input", subfeddit=subfeddit, error=str(e))
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error("Failed to analyze subfeddit sentiment", subfeddit=subfeddit, error=str(e))
+        raise HTTPException(status_code=500, detail=f"Error analyzing sentiment: {str(e)}")
+
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return StreamingResponse(
+        encode_stream(results, stream_format, subfeddit),
+        media_type=STREAM_MEDIA_TYPES[stream_format],
+        headers=headers
+    )
+
+
+def stream_record(event: str, data: Dict[str, Any], stream_format: str) -> str:
+    """Encode one record of a sentiment stream.
+
+    Args:
+        event: Record type: "analysis", "failure", "summary" or "error".
+        data: JSON-serializable payload.
+        stream_format: "ndjson" or "sse".
+
+    Returns:
+        An NDJSON line or a Server-Sent Event.
+    """
+    if stream_format == "sse":
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+    return json.dumps({"event": event, "data": data}) + "\n"
+
+
+async def encode_stream(
+    results: AsyncIterator[Union[SentimentAnalysis, AnalysisFailure]],
+    stream_format: str,
+    subfeddit: str
+) -> AsyncIterator[str]:
+    """Encode streamed results as they arrive, then the summary.
+
+    Only counters are kept, never the results themselves.
+
+    Args:
+        results: Analyses and failures of the comments, in completion order.
+        stream_format: "ndjson" or "sse".
+        subfeddit: Name of the analyzed subfeddit, for logging.
+
+    Yields:
+        Encoded records.
+    """
+    summary = SentimentStreamSummaryDTO(analysis_count=0, failure_count=0)
+    try:
+        async for result in results:
+            if isinstance(result, SentimentAnalysis):
+                summary.analysis_count += 1
+                yield stream_record("analysis", result.model_dump(mode="json"), stream_format)
+            else:
+                summary.failure_count += 1
+                summary.partial = summary.partial or result.error_type == DeadlineExceeded.__name__
+                yield stream_record("failure", result.model_dump(mode="json"), stream_format)
+    except DeadlineExceeded:
+        summary.partial = True
+    except Exception as e:
+        logger.error("Sentiment stream failed", subfeddit=subfeddit, error=str(e))
+        yield stream_record("error", {"detail": f"Error analyzing sentiment: {str(e)}"}, stream_format)
+        return
+    finally:
+        await results.aclose()
+    logger.info(
+        "Finished subfeddit sentiment stream",
+        subfeddit=subfeddit,
+        analysis_count=summary.analysis_count,
+        failed=summary.failure_count,
+        partial=summary.partial
+    )
+    yield stream_record("summary", summary.model_dump(mode="json"), stream_format)
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
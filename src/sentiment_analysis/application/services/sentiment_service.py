@@ -1,11 +1,21 @@
 """Service for sentiment analysis operations."""
+import asyncio
 import structlog
-from typing import List
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Union
 from datetime import datetime
+from sentiment_analysis.domain.entities.analysis_outcome import (
+    AnalysisFailure,
+    AnalysisOutcome,
+    PartialAnalysisError,
+)
+from sentiment_analysis.domain.entities.comment import Comment
 from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
 from sentiment_analysis.domain.repositories.sentiment_analysis_repository import SentimentAnalysisRepository
+from sentiment_analysis.domain.services.analyzer_engine import AnalyzerEngine, EngineUnavailableError
 from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient
-from sentiment_analysis.infrastructure.sentiment_analyzer import SentimentAnalyzer
+from sentiment_analysis.infrastructure.clients.comment_time_index import CommentTimeIndex
+from sentiment_analysis.infrastructure.clients.subfeddit_catalog import SubfedditCatalog
+from sentiment_analysis.infrastructure.deadline import DeadlineExceeded, deadline
 from sentiment_analysis.application.use_cases.fetch_subfeddits import FetchSubfedditsUseCase
 from sentiment_analysis.application.use_cases.fetch_comments import FetchCommentsUseCase
 from sentiment_analysis.application.use_cases.analyze_sentiment import AnalyzeSentimentUseCase
@@ -18,15 +28,28 @@ class SentimentService:
     def __init__(
         self,
         feddit_client: FedditClient,
-        sentiment_analyzer: SentimentAnalyzer,
-        sentiment_analysis_repository: SentimentAnalysisRepository
+        sentiment_analyzer: AnalyzerEngine,
+        sentiment_analysis_repository: SentimentAnalysisRepository,
+        comment_time_index: Optional[CommentTimeIndex] = None,
+        subfeddit_catalog: Optional[SubfedditCatalog] = None,
+        analyzer_engines: Optional[Dict[str, AnalyzerEngine]] = None,
+        read_through: bool = True
     ):
         """Initialize the service.
         
         Args:
             feddit_client: Client for interacting with the Feddit API
-            sentiment_analyzer: Analyzer for performing sentiment analysis
+            sentiment_analyzer: Engine for performing sentiment analysis
             sentiment_analysis_repository: Repository for storing sentiment analysis results
+            comment_time_index: Optional offset index used to seek time windows
+                directly instead of filtering the latest comments
+            subfeddit_catalog: Optional cached catalog used to resolve subfeddit
+                titles without listing subfeddits on every request
+            analyzer_engines: Optional engines selectable per request, keyed by
+                analyzer policy ("fast", "accurate", "cascade")
+            read_through: Whether comments with a stored analysis that the selected
+                engine would reuse are answered from the repository instead of
+                being analyzed again
             
         Raises:
             ValueError: If any required dependency is not properly initialized
@@ -41,6 +64,10 @@ class SentimentService:
         self.feddit_client = feddit_client
         self.sentiment_analyzer = sentiment_analyzer
         self.sentiment_analysis_repository = sentiment_analysis_repository
+        self.comment_time_index = comment_time_index
+        self.subfeddit_catalog = subfeddit_catalog
+        self.analyzer_engines = analyzer_engines or {}
+        self.read_through = read_through
         self.logger = structlog.get_logger(__name__)
         
         # Initialize use cases
@@ -56,113 +83,498 @@ class SentimentService:
         subfeddit: str,
         limit: int = 25,
         start_time: datetime | None = None,
-        end_time: datetime | None = None
+        end_time: datetime | None = None,
+        engine: str | None = None
     ) -> List[SentimentAnalysis]:
         """Analyze sentiment of comments in a subfeddit.
+
+        Comments that could not be analyzed are left out; use ``analyze_subfeddit``
+        to get them.
+
+        Args:
+            subfeddit: Name of the subfeddit to analyze
+            limit: Maximum number of comments to analyze (default: 25, min: 1, max: 100)
+            start_time: Optional start time for filtering comments
+            end_time: Optional end time for filtering comments
+            engine: Optional analyzer policy ("fast", "accurate", "cascade", "bulk");
+                the default engine is used if not provided
+
+        Returns:
+            List of sentiment analysis results
+
+        Raises:
+            ValueError: If the subfeddit is not found or if limit is invalid
+            EngineUnavailableError: If the analyzer policy is not available
+            Exception: If every comment failed to be analyzed
+        """
+        outcome = await self.analyze_subfeddit(
+            subfeddit=subfeddit,
+            limit=limit,
+            start_time=start_time,
+            end_time=end_time,
+            engine=engine
+        )
+        return outcome.analyses
+
+    async def analyze_subfeddit(
+        self,
+        subfeddit: str,
+        limit: int = 25,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        engine: str | None = None,
+        timeout: float | None = None,
+        allow_partial: bool = False
+    ) -> AnalysisOutcome:
+        """Analyze sentiment of comments in a subfeddit, reporting failed comments.
+
+        Comments that already have a reusable stored analysis are not analyzed
+        again; the stored and new analyses are returned in the order of the
+        comments. The analyses that succeeded are saved and returned even if some
+        comments failed after their retries. Every Feddit and OpenAI call made for the
+        request is bounded by ``timeout``; calls still running when it expires are
+        cancelled.
         
         Args:
             subfeddit: Name of the subfeddit to analyze
             limit: Maximum number of comments to analyze (default: 25, min: 1, max: 100)
             start_time: Optional start time for filtering comments
             end_time: Optional end time for filtering comments
+            engine: Optional analyzer policy ("fast", "accurate", "cascade", "bulk");
+                the default engine is used if not provided
+            timeout: Optional latency budget of the whole analysis in seconds
+            allow_partial: Whether to return the analyses completed before the
+                deadline, flagged as partial, instead of raising
             
         Returns:
-            List of sentiment analysis results
+            The analyses that succeeded and the comments that failed
             
         Raises:
             ValueError: If the subfeddit is not found or if limit is invalid
-            Exception: If an error occurs during analysis
+            EngineUnavailableError: If the analyzer policy is not available
+            DeadlineExceeded: If the deadline expired before the comments were
+                fetched, before any comment was analyzed or found in the
+                repository, or before every comment was analyzed and
+                allow_partial is False
+            Exception: If every comment failed to be analyzed
         """
         if not 1 <= limit <= 100:
             raise ValueError("Limit must be between 1 and 100")
+        analyzer = self._select_analyzer(engine)
             
         self.logger.info(
             "Starting subfeddit sentiment analysis",
             subfeddit=subfeddit,
             limit=limit,
             start_time=start_time,
-            end_time=end_time
+            end_time=end_time,
+            engine=engine
         )
         
-        try:
-            # Fetch all subfeddits (there are only 3 total according to docs)
-            subfeddits = await self.feddit_client.get_subfeddits(limit=10, skip=0)
-            self.logger.info("Fetched subfeddits", subfeddits=subfeddits)
-            matching_subfeddits = [s for s in subfeddits if s.title == subfeddit]
-            if not matching_subfeddits:
-                raise ValueError(f"Subfeddit '{subfeddit}' not found")
-            
-            subfeddit_id = matching_subfeddits[0].id
-            
-            # Get comments directly using get_comments
-            comments = await self.feddit_client.get_comments(
-                subfeddit_id=subfeddit_id,
-                limit=limit
-            )
-            
-            self.logger.info(
-                "Fetched comments before filtering",
-                comment_count=len(comments),
-                comment_timestamps=[c.created_at for c in comments]
-            )
-            
-            # Filter comments by time range if specified
-            if start_time or end_time:
-                filtered_comments = []
-                for comment in comments:
-                    self.logger.debug(
-                        "Checking comment timestamp",
-                        comment_id=comment.id,
-                        created_at=comment.created_at,
-                        start_time=start_time,
-                        end_time=end_time,
-                        matches_start=not start_time or comment.created_at >= start_time,
-                        matches_end=not end_time or comment.created_at <= end_time
-                    )
-                    if (
-                        (not start_time or comment.created_at >= start_time) and
-                        (not end_time or comment.created_at <= end_time)
-                    ):
-                        filtered_comments.append(comment)
-                comments = filtered_comments
-            
-            self.logger.info(
-                "Comments after filtering",
-                comment_count=len(comments),
-                comment_timestamps=[c.created_at for c in comments]
-            )
-            
-            if not comments:
-                self.logger.info("No comments found in time range")
-                return []
+        with deadline(timeout):
+            try:
+                comments = await self._fetch_comments(subfeddit, limit, start_time, end_time)
+
+                if not comments:
+                    self.logger.info("No comments found in time range")
+                    return AnalysisOutcome()
             
-            # Analyze sentiment
-            analyses = await self.sentiment_analyzer.analyze(comments)
+                stored = await self._find_stored(comments, analyzer)
+                unseen = [comment for comment in comments if comment.id not in stored]
+
+                # Analyze sentiment, keeping what succeeded if some comments failed
+                outcome = AnalysisOutcome()
+                if unseen:
+                    try:
+                        outcome = AnalysisOutcome(analyses=await analyzer.analyze(unseen))
+                    except PartialAnalysisError as e:
+                        outcome = e.outcome
+                    except DeadlineExceeded as e:
+                        # Every unseen comment ran out of time; the stored analyses
+                        # still make a partial answer
+                        if not (allow_partial and stored):
+                            raise
+                        outcome = AnalysisOutcome(failures=[
+                            AnalysisFailure(
+                                comment_id=comment.id,
+                                error_type=DeadlineExceeded.__name__,
+                                message=str(e),
+                                attempts=1,
+                                retryable=True
+                            )
+                            for comment in unseen
+                        ])
             
-            # Save analyses to repository
-            for analysis in analyses:
-                self.sentiment_analysis_repository.save(analysis)
+                # Save analyses to repository
+                for analysis in outcome.analyses:
+                    await self.sentiment_analysis_repository.save(analysis)
+                if stored:
+                    outcome.analyses = self._merge(comments, stored, outcome.analyses)
+
+                late = sum(1 for f in outcome.failures if f.error_type == DeadlineExceeded.__name__)
+                if late:
+                    if not allow_partial:
+                        raise DeadlineExceeded(
+                            f"Request deadline exceeded with {late} of {len(comments)} comments pending"
+                        )
+                    outcome.partial = True
             
-            self.logger.info(
-                "Successfully analyzed subfeddit sentiment",
-                subfeddit=subfeddit,
-                analysis_count=len(analyses)
-            )
+                self.logger.info(
+                    "Successfully analyzed subfeddit sentiment",
+                    subfeddit=subfeddit,
+                    analysis_count=len(outcome.analyses),
+                    reused=len(stored),
+                    failed=len(outcome.failures),
+                    partial=outcome.partial
+                )
             
-            return analyses
-        except ValueError as e:
-            # Re-raise ValueError for subfeddit not found or invalid limit
-            self.logger.error(
-                "Error in sentiment analysis",
-                subfeddit=subfeddit,
-                error=str(e)
-            )
-            raise
+                return outcome
+            except ValueError as e:
+                # Re-raise ValueError for subfeddit not found or invalid limit
+                self.logger.error(
+                    "Error in sentiment analysis",
+                    subfeddit=subfeddit,
+                    error=str(e)
+                )
+                raise
+            except Exception as e:
+                # Log and re-raise other errors
+                self.logger.error(
+                    "Failed to analyze subfeddit sentiment",
+                    error=str(e),
+                    subfeddit=subfeddit
+                )
+                raise
+
+    async def stream_subfeddit(
+        self,
+        subfeddit: str,
+        limit: int = 25,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        engine: str | None = None,
+        timeout: float | None = None
+    ) -> AsyncIterator[Union[SentimentAnalysis, AnalysisFailure]]:
+        """Fetch the comments of a subfeddit and stream their analyses as they complete.
+
+        The comments are fetched before returning, so that errors such as an
+        unknown subfeddit are raised here rather than from the stream. Reusable
+        stored analyses are yielded first, then new analyses are saved as they
+        arrive; nothing else is kept in memory.
+
+        Args:
+            subfeddit: Name of the subfeddit to analyze
+            limit: Maximum number of comments to analyze (default: 25, min: 1, max: 100)
+            start_time: Optional start time for filtering comments
+            end_time: Optional end time for filtering comments
+            engine: Optional analyzer policy ("fast", "accurate", "cascade", "bulk");
+                the default engine is used if not provided
+            timeout: Optional latency budget of the fetch and the whole stream in
+                seconds; comments still pending when it expires are yielded as
+                DeadlineExceeded failures
+
+        Returns:
+            Iterator over the analysis or failure of each comment, in completion
+            order. Closing it cancels the analyses still running.
+
+        Raises:
+            ValueError: If the subfeddit is not found or if limit is invalid
+            EngineUnavailableError: If the analyzer policy is not available
+            DeadlineExceeded: If the deadline expired before the comments were fetched
+        """
+        if not 1 <= limit <= 100:
+            raise ValueError("Limit must be between 1 and 100")
+        analyzer = self._select_analyzer(engine)
+        self.logger.info(
+            "Starting subfeddit sentiment stream",
+            subfeddit=subfeddit,
+            limit=limit,
+            start_time=start_time,
+            end_time=end_time,
+            engine=engine
+        )
+        with deadline(timeout):
+            comments = await self._fetch_comments(subfeddit, limit, start_time, end_time)
+            stored = await self._find_stored(comments, analyzer)
+            # Start analyzing within the deadline; its tasks inherit it
+            results: asyncio.Queue = asyncio.Queue()
+            producer = asyncio.ensure_future(self._produce(
+                analyzer, [comment for comment in comments if comment.id not in stored], results
+            ))
+        reused = [stored[comment.id] for comment in comments if comment.id in stored]
+        return self._consume(producer, results, reused)
+
+    @staticmethod
+    async def _produce(analyzer: AnalyzerEngine, comments: List[Comment], results: asyncio.Queue) -> None:
+        """Put the streamed results of the analyzer into a queue, then the end marker.
+
+        An error of the analyzer is put in place of the remaining results.
+        """
+        if not comments:
+            results.put_nowait(None)
+            return
+        try:
+            async for result in analyzer.analyze_stream(comments):
+                results.put_nowait(result)
         except Exception as e:
-            # Log and re-raise other errors
-            self.logger.error(
-                "Failed to analyze subfeddit sentiment",
-                error=str(e),
-                subfeddit=subfeddit
+            results.put_nowait(e)
+        finally:
+            results.put_nowait(None)
+
+    async def _consume(
+        self,
+        producer: asyncio.Future,
+        results: asyncio.Queue,
+        reused: Sequence[SentimentAnalysis] = ()
+    ) -> AsyncIterator[Union[SentimentAnalysis, AnalysisFailure]]:
+        """Yield the reused analyses, then save and yield queued results until the end marker.
+
+        The producer is cancelled if the iterator is closed early.
+        """
+        try:
+            for analysis in reused:
+                yield analysis
+            while (result := await results.get()) is not None:
+                if isinstance(result, Exception):
+                    raise result
+                if isinstance(result, SentimentAnalysis):
+                    await self.sentiment_analysis_repository.save(result)
+                yield result
+        finally:
+            if not producer.done():
+                producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    async def _find_stored(
+        self, comments: List[Comment], analyzer: AnalyzerEngine
+    ) -> Dict[int, SentimentAnalysis]:
+        """Look up the stored analyses that can stand in for analyzing comments again.
+
+        A stored analysis is reused if it was made for the same comment text and
+        the analyzer accepts its engine.
+
+        Args:
+            comments: Comments to analyze
+            analyzer: Engine selected for the request
+
+        Returns:
+            The reusable analyses keyed by comment ID; empty if read-through is off
+        """
+        if not self.read_through or not comments:
+            return {}
+        stored = await self.sentiment_analysis_repository.get_many_by_comment_ids(
+            [comment.id for comment in comments]
+        )
+        texts = {comment.id: comment.text for comment in comments}
+        return {
+            comment_id: analysis
+            for comment_id, analysis in stored.items()
+            if analysis.comment_text == texts.get(comment_id) and analyzer.reuses(analysis)
+        }
+
+    @staticmethod
+    def _merge(
+        comments: List[Comment],
+        stored: Dict[int, SentimentAnalysis],
+        analyses: List[SentimentAnalysis]
+    ) -> List[SentimentAnalysis]:
+        """Merge stored and new analyses in the order of the comments.
+
+        Comments with neither a stored nor a new analysis are left out.
+        """
+        fresh = {analysis.comment_id: analysis for analysis in analyses}
+        merged = []
+        for comment in comments:
+            analysis = stored.get(comment.id) or fresh.get(comment.id)
+            if analysis is not None:
+                merged.append(analysis)
+        return merged
+
+    def _select_analyzer(self, engine: str | None) -> AnalyzerEngine:
+        """Get the analyzer engine of a policy.
+
+        Args:
+            engine: Analyzer policy, or None for the default engine
+
+        Returns:
+            The analyzer engine
+
+        Raises:
+            EngineUnavailableError: If the policy is not available
+        """
+        if engine is None:
+            return self.sentiment_analyzer
+        if engine not in self.analyzer_engines:
+            raise EngineUnavailableError(f"Analyzer engine '{engine}' is not available")
+        return self.analyzer_engines[engine]
+
+    async def _fetch_comments(
+        self,
+        subfeddit: str,
+        limit: int,
+        start_time: datetime | None,
+        end_time: datetime | None
+    ) -> List[Comment]:
+        """Fetch the comments of a subfeddit to analyze.
+
+        Args:
+            subfeddit: Name of the subfeddit
+            limit: Maximum number of comments
+            start_time: Optional start time for filtering comments
+            end_time: Optional end time for filtering comments
+
+        Returns:
+            Comments within the time range
+
+        Raises:
+            ValueError: If the subfeddit is not found
+        """
+        subfeddit_id = await self._resolve_subfeddit_id(subfeddit)
+
+        if (start_time or end_time) and self.comment_time_index:
+            comments = await self._fetch_comments_in_window(
+                subfeddit_id=subfeddit_id,
+                limit=limit,
+                start_time=start_time,
+                end_time=end_time
+            )
+        else:
+            comments = await self._fetch_latest_comments(
+                subfeddit_id=subfeddit_id,
+                limit=limit,
+                start_time=start_time,
+                end_time=end_time
             )
-            raise
+
+        self.logger.info(
+            "Comments after filtering",
+            comment_count=len(comments),
+            comment_timestamps=[c.created_at for c in comments]
+        )
+        return comments
+
+    async def _resolve_subfeddit_id(self, subfeddit: str) -> int:
+        """Resolve a subfeddit title to its ID.
+
+        Args:
+            subfeddit: Title of the subfeddit
+
+        Returns:
+            ID of the subfeddit
+
+        Raises:
+            ValueError: If the subfeddit is not found
+        """
+        if self.subfeddit_catalog:
+            match = await self.subfeddit_catalog.get_by_title(subfeddit)
+            if match is None:
+                raise ValueError(f"Subfeddit '{subfeddit}' not found")
+            return match.id
+
+        # Fetch all subfeddits (there are only 3 total according to docs)
+        subfeddits = await self.feddit_client.get_subfeddits(limit=10, skip=0)
+        self.logger.info("Fetched subfeddits", subfeddits=subfeddits)
+        matching_subfeddits = [s for s in subfeddits if s.title == subfeddit]
+        if not matching_subfeddits:
+            raise ValueError(f"Subfeddit '{subfeddit}' not found")
+        return matching_subfeddits[0].id
+
+    async def _fetch_latest_comments(
+        self,
+        subfeddit_id: int,
+        limit: int,
+        start_time: datetime | None,
+        end_time: datetime | None
+    ) -> List[Comment]:
+        """Fetch the first `limit` comments and filter them by time range.
+
+        Args:
+            subfeddit_id: ID of the subfeddit
+            limit: Number of comments to fetch
+            start_time: Optional start time for filtering comments
+            end_time: Optional end time for filtering comments
+
+        Returns:
+            Comments within the time range
+        """
+        comments = await self.feddit_client.get_comments(
+            subfeddit_id=subfeddit_id,
+            limit=limit
+        )
+        
+        self.logger.info(
+            "Fetched comments before filtering",
+            comment_count=len(comments),
+            comment_timestamps=[c.created_at for c in comments]
+        )
+        
+        # Filter comments by time range if specified
+        if start_time or end_time:
+            filtered_comments = []
+            for comment in comments:
+                self.logger.debug(
+                    "Checking comment timestamp",
+                    comment_id=comment.id,
+                    created_at=comment.created_at,
+                    start_time=start_time,
+                    end_time=end_time,
+                    matches_start=not start_time or comment.created_at >= start_time,
+                    matches_end=not end_time or comment.created_at <= end_time
+                )
+                if (
+                    (not start_time or comment.created_at >= start_time) and
+                    (not end_time or comment.created_at <= end_time)
+                ):
+                    filtered_comments.append(comment)
+            comments = filtered_comments
+        return comments
+
+    async def _fetch_comments_in_window(
+        self,
+        subfeddit_id: int,
+        limit: int,
+        start_time: datetime | None,
+        end_time: datetime | None
+    ) -> List[Comment]:
+        """Seek to the time window with the offset index and read up to `limit` comments.
+
+        Args:
+            subfeddit_id: ID of the subfeddit
+            limit: Maximum number of comments to return
+            start_time: Optional start time for filtering comments
+            end_time: Optional end time for filtering comments
+
+        Returns:
+            Comments within the time range
+        """
+        skip_start, skip_end = await self.comment_time_index.seek(
+            subfeddit_id=subfeddit_id,
+            start_time=start_time,
+            end_time=end_time
+        )
+        self.logger.info(
+            "Seeking comments in time window",
+            subfeddit_id=subfeddit_id,
+            skip_start=skip_start,
+            skip_end=skip_end
+        )
+        comments = []
+        if skip_end <= skip_start:
+            return comments
+        stream = self.feddit_client.aiter_comments(
+            subfeddit_id=subfeddit_id,
+            start_skip=skip_start,
+            max_comments=skip_end - skip_start
+        )
+        try:
+            async for comment in stream:
+                if (
+                    (not start_time or comment.created_at >= start_time) and
+                    (not end_time or comment.created_at <= end_time)
+                ):
+                    comments.append(comment)
+                    if len(comments) >= limit:
+                        break
+        finally:
+            await stream.aclose()
+        return comments
@@ -4,7 +4,7 @@ from typing import List
 from sentiment_analysis.domain.entities.comment import Comment
 from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
 from sentiment_analysis.domain.repositories.sentiment_analysis_repository import SentimentAnalysisRepository
-from sentiment_analysis.infrastructure.sentiment_analyzer import SentimentAnalyzer
+from sentiment_analysis.domain.services.analyzer_engine import AnalyzerEngine
 from sentiment_analysis.logger import configure_logger
 
 
@@ -17,13 +17,13 @@ class AnalyzeSentimentUseCase:
 
     def __init__(
         self,
-        sentiment_analyzer: SentimentAnalyzer,
+        sentiment_analyzer: AnalyzerEngine,
         sentiment_analysis_repository: SentimentAnalysisRepository
     ):
         """Initialize the use case.
 
         Args:
-            sentiment_analyzer: Analyzer for performing sentiment analysis.
+            sentiment_analyzer: Engine for performing sentiment analysis.
             sentiment_analysis_repository: Repository for storing sentiment analysis results.
         """
         self.sentiment_analyzer = sentiment_analyzer
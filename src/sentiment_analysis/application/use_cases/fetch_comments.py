@@ -1,5 +1,5 @@
 """Use case for fetching comments."""
-from typing import List
+from typing import AsyncIterator, List
 
 from sentiment_analysis.domain.entities.comment import Comment
 from sentiment_analysis.domain.repositories.comment_repository import CommentRepository
@@ -63,3 +63,56 @@ class FetchCommentsUseCase:
                 error=str(e)
             )
             raise
+
+    async def stream(
+        self,
+        subfeddit_id: int,
+        skip: int = 0,
+        page_size: int = 100,
+        prefetch: int = 2,
+        max_comments: int | None = None
+    ) -> AsyncIterator[Comment]:
+        """Stream comments page by page instead of building a full list.
+
+        Args:
+            subfeddit_id: ID of the subfeddit to stream comments for.
+            skip: Number of comments to skip. Defaults to 0.
+            page_size: Number of comments fetched per request. Defaults to 100.
+            prefetch: Maximum number of pages fetched ahead of the consumer. Defaults to 2.
+            max_comments: Optional cap on the number of comments yielded.
+
+        Yields:
+            Comment objects in API order.
+
+        Raises:
+            Exception: If an error occurs while fetching comments.
+        """
+        self.logger.info(
+            "Streaming comments",
+            subfeddit_id=subfeddit_id,
+            skip=skip,
+            page_size=page_size,
+            prefetch=prefetch
+        )
+        count = 0
+        try:
+            async for comment in self.comment_repository.aiter_comments(
+                subfeddit_id=subfeddit_id,
+                start_skip=skip,
+                page_size=page_size,
+                prefetch=prefetch,
+                max_comments=max_comments
+            ):
+                count += 1
+                yield comment
+        except Exception as e:
+            self.logger.error(
+                "Failed to stream comments",
+                error=str(e),
+                count=count
+            )
+            raise
+        self.logger.info(
+            "Finished streaming comments",
+            count=count
+        )
@@ -13,10 +13,102 @@ if not os.getenv("PRODUCTION"):
 
 # API Configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None
 FAST_API_PORT = int(os.getenv("FAST_API_PORT", "8000"))
 FEDDIT_API_URL = os.getenv("FEDDIT_API_URL", "http://localhost:8080")
 SENTIMENT_ANALYSIS_BATCH_SIZE = int(os.getenv("SENTIMENT_ANALYSIS_BATCH_SIZE", "10"))
 
+# Default sentiment engine: "openai" (LLM), "lexicon" (local NumPy scorer, bundled weights unless a path
+# is set), "cascade" (lexicon first, LLM for comments whose lexicon score is below the threshold) or
+# "embedding" (embeddings scored by a fitted head; only available when the head file exists)
+SENTIMENT_ENGINE = os.getenv("SENTIMENT_ENGINE", "openai")
+SENTIMENT_LEXICON_PATH = os.getenv("SENTIMENT_LEXICON_PATH", "")
+SENTIMENT_CASCADE_THRESHOLD = float(os.getenv("SENTIMENT_CASCADE_THRESHOLD", "0.5"))
+
+# Embedding engine: comments are embedded in large batches, cached by text hash and scored by a local
+# linear head fitted with sentiment_analysis.tools.fit_embedding_head. The engine is only built when the
+# head path is set and exists; 0 dimensions keeps the model default
+SENTIMENT_EMBEDDING_HEAD_PATH = os.getenv("SENTIMENT_EMBEDDING_HEAD_PATH", "")
+SENTIMENT_EMBEDDING_MODEL = os.getenv("SENTIMENT_EMBEDDING_MODEL", "text-embedding-3-small")
+SENTIMENT_EMBEDDING_DIMENSIONS = int(os.getenv("SENTIMENT_EMBEDDING_DIMENSIONS", "0"))
+SENTIMENT_EMBEDDING_BATCH_SIZE = int(os.getenv("SENTIMENT_EMBEDDING_BATCH_SIZE", "1000"))
+SENTIMENT_EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("SENTIMENT_EMBEDDING_CACHE_MAX_ENTRIES", "50000"))
+
+# Single mode sends one request per comment; packed mode (opt-in) groups several comments
+# into one request, bounded by an estimated token budget; logprob mode scores each comment
+# from the logprobs of a single classification token
+SENTIMENT_ANALYSIS_MODE = os.getenv("SENTIMENT_ANALYSIS_MODE", "single")
+SENTIMENT_PACK_TOKEN_BUDGET = int(os.getenv("SENTIMENT_PACK_TOKEN_BUDGET", "3000"))
+SENTIMENT_PACK_MAX_ITEMS = int(os.getenv("SENTIMENT_PACK_MAX_ITEMS", "40"))
+
+# Per-comment retries after transient OpenAI errors or invalid outputs; comments that still fail are
+# reported next to the analyses that succeeded
+SENTIMENT_ITEM_MAX_RETRIES = int(os.getenv("SENTIMENT_ITEM_MAX_RETRIES", "2"))
+SENTIMENT_RETRY_BACKOFF_BASE = float(os.getenv("SENTIMENT_RETRY_BACKOFF_BASE", "0.2"))
+SENTIMENT_RETRY_BACKOFF_CAP = float(os.getenv("SENTIMENT_RETRY_BACKOFF_CAP", "5.0"))
+
+# Sentiment result cache; the disk tier is only used when a path is configured
+SENTIMENT_CACHE_ENABLED = os.getenv("SENTIMENT_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+SENTIMENT_CACHE_MAX_BYTES = int(os.getenv("SENTIMENT_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+SENTIMENT_CACHE_PATH = os.getenv("SENTIMENT_CACHE_PATH", "")
+
+# Read-through lookup: comments whose analysis is already stored are not analyzed again
+SENTIMENT_READ_THROUGH_ENABLED = os.getenv("SENTIMENT_READ_THROUGH_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# Offline bulk scoring through the OpenAI Batch API; job state is kept in the work directory for resumption
+OPENAI_BATCH_WORK_DIR = os.getenv("OPENAI_BATCH_WORK_DIR", ".cache/batches")
+OPENAI_BATCH_POLL_INTERVAL = float(os.getenv("OPENAI_BATCH_POLL_INTERVAL", "30.0"))
+OPENAI_BATCH_MAX_REQUESTS = int(os.getenv("OPENAI_BATCH_MAX_REQUESTS", "50000"))
+
+# Near-duplicate reuse: comments within a SimHash Hamming distance of a scored text reuse its result
+SENTIMENT_NEAR_DUPLICATES_ENABLED = os.getenv("SENTIMENT_NEAR_DUPLICATES_ENABLED", "true").lower() in ("1", "true", "yes")
+SENTIMENT_NEAR_DUPLICATE_DISTANCE = int(os.getenv("SENTIMENT_NEAR_DUPLICATE_DISTANCE", "3"))
+SENTIMENT_NEAR_DUPLICATE_MAX_ENTRIES = int(os.getenv("SENTIMENT_NEAR_DUPLICATE_MAX_ENTRIES", "100000"))
+
+# HTTP connection pool configuration (HTTP/2 requires the optional `h2` package)
+FEDDIT_MAX_CONNECTIONS = int(os.getenv("FEDDIT_MAX_CONNECTIONS", "100"))
+FEDDIT_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("FEDDIT_MAX_KEEPALIVE_CONNECTIONS", "20"))
+FEDDIT_KEEPALIVE_EXPIRY = float(os.getenv("FEDDIT_KEEPALIVE_EXPIRY", "30.0"))
+FEDDIT_HTTP2 = os.getenv("FEDDIT_HTTP2", "false").lower() in ("1", "true", "yes")
+FEDDIT_COALESCE_REQUESTS = os.getenv("FEDDIT_COALESCE_REQUESTS", "true").lower() in ("1", "true", "yes")
+FEDDIT_CACHE_ENABLED = os.getenv("FEDDIT_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+FEDDIT_CACHE_MAX_BYTES = int(os.getenv("FEDDIT_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+FEDDIT_CACHE_COMMENTS_TTL = float(os.getenv("FEDDIT_CACHE_COMMENTS_TTL", "30.0"))
+FEDDIT_CACHE_SUBFEDDITS_TTL = float(os.getenv("FEDDIT_CACHE_SUBFEDDITS_TTL", "300.0"))
+FEDDIT_DECODER = os.getenv("FEDDIT_DECODER", "fast")
+
+# Feddit resilience: per-attempt timeout, retries, hedged requests and circuit breaker
+FEDDIT_TIMEOUT = float(os.getenv("FEDDIT_TIMEOUT", "5.0"))
+FEDDIT_RESILIENCE_ENABLED = os.getenv("FEDDIT_RESILIENCE_ENABLED", "true").lower() in ("1", "true", "yes")
+FEDDIT_MAX_RETRIES = int(os.getenv("FEDDIT_MAX_RETRIES", "2"))
+FEDDIT_BACKOFF_BASE = float(os.getenv("FEDDIT_BACKOFF_BASE", "0.05"))
+FEDDIT_BACKOFF_CAP = float(os.getenv("FEDDIT_BACKOFF_CAP", "1.0"))
+FEDDIT_HEDGE_ENABLED = os.getenv("FEDDIT_HEDGE_ENABLED", "false").lower() in ("1", "true", "yes")
+FEDDIT_HEDGE_DELAY = float(os.getenv("FEDDIT_HEDGE_DELAY", "0.05"))
+FEDDIT_HEDGE_QUANTILE = float(os.getenv("FEDDIT_HEDGE_QUANTILE", "0.95"))
+FEDDIT_BREAKER_FAILURE_THRESHOLD = int(os.getenv("FEDDIT_BREAKER_FAILURE_THRESHOLD", "5"))
+FEDDIT_BREAKER_RESET_TIMEOUT = float(os.getenv("FEDDIT_BREAKER_RESET_TIMEOUT", "30.0"))
+
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "100"))
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+OPENAI_KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "30.0"))
+OPENAI_HTTP2 = os.getenv("OPENAI_HTTP2", "false").lower() in ("1", "true", "yes")
+
+# Client-side OpenAI rate limiting; the limits are replaced by the ones reported in response headers
+OPENAI_RATE_LIMIT_ENABLED = os.getenv("OPENAI_RATE_LIMIT_ENABLED", "true").lower() in ("1", "true", "yes")
+OPENAI_REQUESTS_PER_MINUTE = float(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "500"))
+OPENAI_TOKENS_PER_MINUTE = float(os.getenv("OPENAI_TOKENS_PER_MINUTE", "200000"))
+
+# End-to-end latency budget of an API request, overridable per request up to the maximum
+SENTIMENT_REQUEST_TIMEOUT = float(os.getenv("SENTIMENT_REQUEST_TIMEOUT", "30.0"))
+SENTIMENT_REQUEST_MAX_TIMEOUT = float(os.getenv("SENTIMENT_REQUEST_MAX_TIMEOUT", "120.0"))
+
+SUBFEDDIT_CATALOG_TTL = float(os.getenv("SUBFEDDIT_CATALOG_TTL", "300.0"))
+# A title lookup miss refreshes the catalog at once if it is at least this many seconds old
+SUBFEDDIT_CATALOG_MISS_REFRESH_INTERVAL = float(os.getenv("SUBFEDDIT_CATALOG_MISS_REFRESH_INTERVAL", "10.0"))
+SUBFEDDIT_CATALOG_CASE_INSENSITIVE = os.getenv("SUBFEDDIT_CATALOG_CASE_INSENSITIVE", "false").lower() in ("1", "true", "yes")
+WARM_UP_CONNECTIONS = os.getenv("WARM_UP_CONNECTIONS", "true").lower() in ("1", "true", "yes")
+
 # Validate required environment variables
 if not OPENAI_API_KEY:
     raise ValueError("OPENAI_API_KEY environment variable is required")
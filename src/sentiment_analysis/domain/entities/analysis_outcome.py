@@ -0,0 +1,47 @@
+"""Outcome of analyzing a batch of comments, with per-comment failures."""
+
+from typing import List
+from pydantic import BaseModel, Field
+
+from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
+
+
+class AnalysisFailure(BaseModel):
+    """A comment that could not be analyzed."""
+    comment_id: int = Field(gt=0, description="ID of the comment that failed")
+    error_type: str = Field(..., description="Class name of the final error")
+    message: str = Field(..., description="Message of the final error")
+    attempts: int = Field(ge=1, description="Number of attempts made for the comment")
+    retryable: bool = Field(
+        ...,
+        description="Whether the error is transient, i.e. the comment may succeed if analyzed again"
+    )
+
+
+class AnalysisOutcome(BaseModel):
+    """Analyses that succeeded and comments that failed, each in input order."""
+    analyses: List[SentimentAnalysis] = Field(default_factory=list)
+    failures: List[AnalysisFailure] = Field(default_factory=list)
+    partial: bool = Field(
+        default=False,
+        description="Whether the request deadline expired before every comment was analyzed"
+    )
+
+
+class PartialAnalysisError(Exception):
+    """Raised by ``AnalyzerEngine.analyze`` when only some comments could be analyzed.
+
+    Carries the outcome so that callers can keep the analyses that succeeded.
+    """
+
+    def __init__(self, outcome: AnalysisOutcome):
+        """Initialize the error.
+
+        Args:
+            outcome: The analyses that succeeded and the comments that failed
+        """
+        super().__init__(
+            f"{len(outcome.failures)} of "
+            f"{len(outcome.analyses) + len(outcome.failures)} comments could not be analyzed"
+        )
+        self.outcome = outcome
@@ -1,7 +1,7 @@
 """Sentiment analysis entity."""
 
 from datetime import datetime
-from typing import Literal
+from typing import Literal, Optional
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -25,6 +25,10 @@ class SentimentAnalysis(BaseModel):
         ...,
         description="Timestamp when the analysis was created"
     )
+    engine: Optional[str] = Field(
+        default=None,
+        description="Name of the analyzer engine that produced the analysis"
+    )
 
     @field_validator("comment_text")
     def validate_comment_text(cls, v):
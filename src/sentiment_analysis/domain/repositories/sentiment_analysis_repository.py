@@ -1,7 +1,7 @@
 """Repository interface for sentiment analysis."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
@@ -34,6 +34,25 @@ class SentimentAnalysisRepository(ABC):
         """
         pass
 
+    async def get_many_by_comment_ids(self, comment_ids: List[int]) -> Dict[int, SentimentAnalysis]:
+        """Get the sentiment analyses of several comments at once.
+
+        Implementations should override this with a bulk read; the default
+        looks the comments up one by one.
+
+        Args:
+            comment_ids: IDs of the comments
+
+        Returns:
+            The stored analysis of each comment that has one, keyed by comment ID
+        """
+        found = {}
+        for comment_id in dict.fromkeys(comment_ids):
+            analysis = await self.get_by_comment_id(comment_id)
+            if analysis is not None:
+                found[comment_id] = analysis
+        return found
+
     @abstractmethod
     async def get_by_subfeddit(
         self,
@@ -69,3 +88,15 @@ class SentimentAnalysisRepository(ABC):
             analysis: The sentiment analysis result to save
         """
         pass
+
+    async def save_many(self, analyses: List[SentimentAnalysis]) -> None:
+        """Save several sentiment analysis results.
+
+        Implementations should override this with a bulk write; the default
+        saves the analyses one by one.
+
+        Args:
+            analyses: The sentiment analysis results to save
+        """
+        for analysis in analyses:
+            await self.save(analysis)
@@ -0,0 +1,118 @@
+"""Sentiment analyzer engine interface."""
+
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, List, Union
+
+from sentiment_analysis.domain.entities.analysis_outcome import (
+    AnalysisFailure,
+    AnalysisOutcome,
+    PartialAnalysisError,
+)
+from sentiment_analysis.domain.entities.comment import Comment
+from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
+
+
+class EngineUnavailableError(Exception):
+    """Raised when a request asks for an analyzer engine this server has not configured."""
+
+
+class AnalyzerEngine(ABC):
+    """Interface for engines that score the sentiment of comments.
+
+    Every engine returns one SentimentAnalysis per comment, in the order of the
+    comments, with a non-zero ``sentiment_score`` in [-1.0, 1.0] and the matching
+    ``sentiment_label``.
+    """
+
+    # Short identifier of the engine, used for configuration and metrics
+    name: str = "engine"
+
+    @abstractmethod
+    async def analyze(self, comments: List[Comment]) -> List[SentimentAnalysis]:
+        """Analyze sentiment for a list of comments.
+
+        Args:
+            comments: List of comments to analyze
+
+        Returns:
+            List of SentimentAnalysis entities in the order of the comments
+
+        Raises:
+            PartialAnalysisError: If only some of the comments could be analyzed
+        """
+        pass
+
+    async def analyze_outcome(self, comments: List[Comment]) -> AnalysisOutcome:
+        """Analyze sentiment for a list of comments, reporting failures per comment.
+
+        Engines report partial failures of ``analyze`` with ``PartialAnalysisError``;
+        any other error fails every comment.
+
+        Args:
+            comments: List of comments to analyze
+
+        Returns:
+            The analyses that succeeded and the comments that failed
+        """
+        try:
+            return AnalysisOutcome(analyses=await self.analyze(comments))
+        except PartialAnalysisError as e:
+            return e.outcome
+        except Exception as e:
+            return AnalysisOutcome(failures=[
+                AnalysisFailure(
+                    comment_id=comment.id,
+                    error_type=type(e).__name__,
+                    message=str(e),
+                    attempts=1,
+                    retryable=False
+                )
+                for comment in comments
+            ])
+
+    async def analyze_stream(
+        self, comments: List[Comment]
+    ) -> AsyncIterator[Union[SentimentAnalysis, AnalysisFailure]]:
+        """Analyze sentiment for a list of comments, yielding results as they complete.
+
+        Engines that score comments independently should override this; by
+        default every result is yielded once the whole list is analyzed.
+
+        Args:
+            comments: List of comments to analyze
+
+        Yields:
+            The analysis or the failure of each comment
+        """
+        outcome = await self.analyze_outcome(comments)
+        for analysis in outcome.analyses:
+            yield analysis
+        for failure in outcome.failures:
+            yield failure
+
+    def reuses(self, analysis: SentimentAnalysis) -> bool:
+        """Tell whether a stored analysis can stand in for analyzing its comment again.
+
+        By default only analyses produced by an engine of the same name are reused.
+
+        Args:
+            analysis: Stored analysis of a comment
+
+        Returns:
+            True if the analysis is as good as a new answer of this engine
+        """
+        return analysis.engine == self.name
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the runtime counters of the engine.
+
+        Returns:
+            Dictionary of counters; empty by default
+        """
+        return {}
+
+    async def warm_up(self) -> None:
+        """Prepare the engine ahead of the first request; no-op by default."""
+
+    async def close(self) -> None:
+        """Release the resources of the engine; no-op by default."""
@@ -0,0 +1,2 @@
+"""In-process stand-ins for the upstream services.
+Used to exercise the client, service and benchmarks offline."""
@@ -0,0 +1,145 @@
+"""Seeded synthetic Feddit data.
+
+Comments are derived on demand from ``(seed, subfeddit_id, index)`` with a
+counter-based hash, so a dataset of millions of comments costs no memory and any
+page can be produced in O(page size) regardless of its offset.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+_MASK = (1 << 64) - 1
+
+_POSITIVE = (
+    "great", "love", "awesome", "helpful", "excellent", "works", "thanks", "nice",
+    "clean", "fast", "happy", "brilliant", "solid", "recommend", "enjoy"
+)
+_NEGATIVE = (
+    "broken", "hate", "terrible", "slow", "bug", "crash", "awful", "useless",
+    "confusing", "regression", "annoying", "worse", "fails", "painful", "disappointed"
+)
+_NEUTRAL = (
+    "the", "upgrade", "pydantic", "version", "model", "after", "with", "release",
+    "migration", "code", "project", "today", "this", "config", "field", "and", "it", "is"
+)
+
+
+def _mix(value: int) -> int:
+    """SplitMix64 finalizer: a fast, well-distributed 64-bit hash."""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK
+    return value ^ (value >> 31)
+
+
+@dataclass(frozen=True)
+class FedditDataset:
+    """Deterministic synthetic dataset of subfeddits and their comments.
+
+    Comment ``index`` 0 is the oldest comment of a subfeddit and timestamps grow
+    with the index, ``interval`` seconds apart on average. Each comment leans
+    positive, negative or neutral so that sentiment results are not uniform.
+
+    Attributes:
+        seed: Seed of the generator; equal seeds produce identical data.
+        subfeddits: Number of subfeddits.
+        comments_per_subfeddit: Number of comments in each subfeddit.
+        start_time: Unix timestamp of the oldest comment.
+        interval: Average number of seconds between consecutive comments.
+    """
+    seed: int = 0
+    subfeddits: int = 3
+    comments_per_subfeddit: int = 25_000
+    start_time: int = 1_695_757_477
+    interval: int = 60
+
+    def __post_init__(self):
+        """Validate the dataset dimensions."""
+        if self.subfeddits < 1:
+            raise ValueError("At least one subfeddit is required")
+        if self.comments_per_subfeddit < 0:
+            raise ValueError("Comments per subfeddit must not be negative")
+        if self.interval < 1:
+            raise ValueError("Interval must be at least 1 second")
+
+    def has_subfeddit(self, subfeddit_id: int) -> bool:
+        """Check whether a subfeddit exists.
+
+        Args:
+            subfeddit_id: ID of the subfeddit.
+
+        Returns:
+            True if the subfeddit exists.
+        """
+        return 1 <= subfeddit_id <= self.subfeddits
+
+    def subfeddit(self, subfeddit_id: int) -> Dict[str, Any]:
+        """Build a subfeddit in the Feddit API schema.
+
+        Args:
+            subfeddit_id: ID of the subfeddit.
+
+        Returns:
+            Subfeddit dictionary.
+        """
+        return {
+            "id": subfeddit_id,
+            "username": f"admin_{subfeddit_id}",
+            "title": f"Dummy Topic {subfeddit_id}",
+            "description": f"Dummy Topic {subfeddit_id}"
+        }
+
+    def list_subfeddits(self, limit: int, skip: int) -> List[Dict[str, Any]]:
+        """Get a page of subfeddits.
+
+        Args:
+            limit: Maximum number of subfeddits to return.
+            skip: Number of subfeddits to skip.
+
+        Returns:
+            List of subfeddit dictionaries.
+        """
+        first = skip + 1
+        last = min(self.subfeddits, skip + limit)
+        return [self.subfeddit(subfeddit_id) for subfeddit_id in range(first, last + 1)]
+
+    def comment(self, subfeddit_id: int, index: int) -> Dict[str, Any]:
+        """Build a single comment in the Feddit API schema.
+
+        Args:
+            subfeddit_id: ID of the subfeddit.
+            index: Position of the comment, 0 being the oldest.
+
+        Returns:
+            Comment dictionary.
+        """
+        state = _mix(self.seed ^ _mix(subfeddit_id) ^ _mix(index + 1))
+        mood = state % 3
+        lexicon = (_NEUTRAL, _POSITIVE, _NEGATIVE)[mood]
+        length = 4 + (state >> 2) % 21
+        words = []
+        for _ in range(length):
+            state = _mix(state)
+            # Two thirds filler words, one third words carrying the comment's mood
+            pool = lexicon if state % 3 == 0 else _NEUTRAL
+            words.append(pool[(state >> 2) % len(pool)])
+        state = _mix(state)
+        return {
+            "id": (subfeddit_id - 1) * self.comments_per_subfeddit + index + 1,
+            "username": f"user_{(state >> 8) % 5000}",
+            "text": " ".join(words),
+            "created_at": self.start_time + index * self.interval + state % self.interval
+        }
+
+    def list_comments(self, subfeddit_id: int, limit: int, skip: int) -> List[Dict[str, Any]]:
+        """Get a page of comments, oldest first.
+
+        Args:
+            subfeddit_id: ID of the subfeddit.
+            limit: Maximum number of comments to return.
+            skip: Number of comments to skip.
+
+        Returns:
+            List of comment dictionaries.
+        """
+        stop = min(self.comments_per_subfeddit, skip + limit)
+        return [self.comment(subfeddit_id, index) for index in range(skip, stop)]
@@ -0,0 +1,182 @@
+"""Local stand-in for the Feddit API.
+
+Serves ``/api/v1/subfeddits/``, ``/api/v1/subfeddit/`` and ``/api/v1/comments/``
+with the schemas documented in docs/feddit_api.md from a seeded synthetic dataset,
+and can inject latency, jitter and errors.
+
+Run it with::
+
+    python -m sentiment_analysis.fakes.feddit_server --port 8080 --comments 1000000
+"""
+import argparse
+import asyncio
+import hashlib
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import uvicorn
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse
+
+from sentiment_analysis.fakes.feddit_data import FedditDataset
+
+
+@dataclass
+class FaultConfig:
+    """Latency and error injection settings.
+
+    Attributes:
+        latency: Base delay added to every response in seconds.
+        jitter: Maximum extra random delay in seconds.
+        error_rate: Probability (0-1) that a request fails.
+        error_status: Status code returned for injected failures.
+        seed: Seed of the fault injection random generator.
+    """
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    seed: int = 0
+
+    def __post_init__(self):
+        """Validate the settings."""
+        if self.latency < 0 or self.jitter < 0:
+            raise ValueError("Latency and jitter must not be negative")
+        if not 0 <= self.error_rate <= 1:
+            raise ValueError("Error rate must be between 0 and 1")
+
+
+def create_app(
+    dataset: Optional[FedditDataset] = None,
+    faults: Optional[FaultConfig] = None,
+    etags: bool = True
+) -> FastAPI:
+    """Create the Feddit stand-in application.
+
+    Args:
+        dataset: Data to serve. Defaults to 3 subfeddits of 25,000 comments.
+        faults: Latency and error injection settings. Defaults to none.
+        etags: Whether responses carry an ``ETag`` and honour ``If-None-Match``.
+
+    Returns:
+        The FastAPI application. Request counters are available on
+        ``app.state.stats``.
+    """
+    dataset = dataset or FedditDataset()
+    faults = faults or FaultConfig()
+    rng = random.Random(faults.seed)
+    app = FastAPI(title="Feddit stand-in")
+    app.state.dataset = dataset
+    app.state.faults = faults
+    app.state.stats = {"requests": 0, "errors": 0, "not_modified": 0}
+
+    async def respond(request: Request, body: Dict[str, Any]) -> Response:
+        """Apply the injected faults and serialize the body."""
+        app.state.stats["requests"] += 1
+        delay = faults.latency + rng.random() * faults.jitter
+        if delay:
+            await asyncio.sleep(delay)
+        if faults.error_rate and rng.random() < faults.error_rate:
+            app.state.stats["errors"] += 1
+            raise HTTPException(status_code=faults.error_status, detail="Injected failure")
+        if not etags:
+            return JSONResponse(body)
+        # The data is a pure function of the seed and the query, so is the ETag
+        etag = '"{}"'.format(hashlib.blake2b(
+            f"{dataset}|{request.url.path}|{sorted(request.query_params.items())}".encode(),
+            digest_size=12
+        ).hexdigest())
+        if request.headers.get("if-none-match") == etag:
+            app.state.stats["not_modified"] += 1
+            return Response(status_code=304, headers={"ETag": etag})
+        return JSONResponse(body, headers={"ETag": etag})
+
+    def check_subfeddit(subfeddit_id: int) -> None:
+        """Reject unknown subfeddits."""
+        if not dataset.has_subfeddit(subfeddit_id):
+            raise HTTPException(status_code=404, detail="Subfeddit not found")
+
+    @app.get("/api/v1/subfeddits/")
+    async def list_subfeddits(
+        request: Request,
+        limit: int = Query(10, ge=0),
+        skip: int = Query(0, ge=0)
+    ):
+        """List subfeddits."""
+        return await respond(request, {
+            "limit": limit,
+            "skip": skip,
+            "subfeddits": dataset.list_subfeddits(limit, skip)
+        })
+
+    @app.get("/api/v1/subfeddit/")
+    async def get_subfeddit(
+        request: Request,
+        subfeddit_id: int,
+        limit: int = Query(10, ge=0),
+        skip: int = Query(0, ge=0)
+    ):
+        """Get a subfeddit with a page of its comments."""
+        check_subfeddit(subfeddit_id)
+        return await respond(request, {
+            **dataset.subfeddit(subfeddit_id),
+            "limit": limit,
+            "skip": skip,
+            "comments": dataset.list_comments(subfeddit_id, limit, skip)
+        })
+
+    @app.get("/api/v1/comments/")
+    async def list_comments(
+        request: Request,
+        subfeddit_id: int,
+        limit: int = Query(10, ge=0),
+        skip: int = Query(0, ge=0)
+    ):
+        """Get a page of comments of a subfeddit."""
+        check_subfeddit(subfeddit_id)
+        return await respond(request, {
+            "subfeddit_id": subfeddit_id,
+            "limit": limit,
+            "skip": skip,
+            "comments": dataset.list_comments(subfeddit_id, limit, skip)
+        })
+
+    return app
+
+
+def main() -> None:
+    """Run the stand-in server from the command line."""
+    parser = argparse.ArgumentParser(description="Local Feddit API stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--subfeddits", type=int, default=3)
+    parser.add_argument("--comments", type=int, default=25_000, help="Comments per subfeddit")
+    parser.add_argument("--latency", type=float, default=0.0, help="Base latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Max extra latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--no-etags", action="store_true")
+    args = parser.parse_args()
+
+    app = create_app(
+        FedditDataset(
+            seed=args.seed,
+            subfeddits=args.subfeddits,
+            comments_per_subfeddit=args.comments
+        ),
+        FaultConfig(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            seed=args.seed
+        ),
+        etags=not args.no_etags
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,668 @@
+"""Local stand-in for the OpenAI API.
+
+Serves ``/v1/responses``, ``/v1/chat/completions``, ``/v1/embeddings``,
+``/v1/files``, ``/v1/files/{id}/content`` and ``/v1/batches`` closely enough for
+the official ``openai`` client. Sentiment requests are answered from a
+deterministic keyword scorer: structured outputs for responses, and a one-token
+classification with logprobs for chat completions. Embeddings are deterministic
+bag-of-words vectors, so a linear head can be fitted on them.
+
+Online requests can be slowed down with a fixed, uniform or heavy-tailed
+lognormal latency plus a delay per output token, limited per minute with
+``x-ratelimit-*`` headers and 429 responses, and failed with injected 429, 500
+and stalled (timed out) responses, so the analyzer's real client stack can be
+benchmarked and stress-tested offline.
+
+Run it with::
+
+    python -m sentiment_analysis.fakes.openai_server --port 8081 \
+        --latency 0.2 --latency-distribution lognormal --latency-spread 0.8 \
+        --requests-per-minute 3000 --error-rate 0.01
+
+and point the client at ``http://127.0.0.1:8081/v1``.
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import itertools
+import json
+import math
+import random
+import re
+import time
+from dataclasses import dataclass
+from email.parser import BytesParser
+from email.policy import HTTP
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import uvicorn
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
+
+# Same vocabulary as the synthetic Feddit comments, so their lean is recovered
+from sentiment_analysis.fakes.feddit_data import _NEGATIVE, _POSITIVE
+
+_WORD = re.compile(r"[a-z]+")
+_POSITIVE_WORDS = frozenset(_POSITIVE)
+_NEGATIVE_WORDS = frozenset(_NEGATIVE)
+
+TERMINAL_BATCH_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+# Size of the fake embeddings when the request does not ask for a dimension
+DEFAULT_EMBEDDING_DIMENSIONS = 256
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+
+
+@dataclass
+class FaultConfig:
+    """Latency, rate limit and error injection settings of online requests.
+
+    Attributes:
+        latency: Base delay of every request in seconds: the delay itself for the
+            ``fixed`` distribution, the lower bound for ``uniform`` and the
+            median for ``lognormal``.
+        latency_distribution: ``fixed``, ``uniform`` or ``lognormal``.
+        latency_spread: Width of the ``uniform`` distribution in seconds, or
+            sigma of the ``lognormal`` one; a sigma of 1 puts the p99 at about 10x
+            the median.
+        max_latency: Cap on a drawn delay in seconds, or None.
+        token_latency: Extra delay per generated output token in seconds.
+        requests_per_minute: Requests allowed per minute before answering 429,
+            or None for no limit. Every response reports the limit state in
+            ``x-ratelimit-*`` headers.
+        tokens_per_minute: Estimated tokens allowed per minute, or None.
+        rate_limit_rate: Probability (0-1) of an injected 429 response.
+        error_rate: Probability (0-1) of an injected 500 response.
+        timeout_rate: Probability (0-1) that a request stalls, so that the
+            client times out.
+        timeout_delay: Time a stalled request hangs before it is answered.
+        retry_after: ``retry-after`` of injected 429 responses in seconds.
+        seed: Seed of the latency and fault random generator.
+    """
+    latency: float = 0.0
+    latency_distribution: str = "fixed"
+    latency_spread: float = 0.0
+    max_latency: Optional[float] = None
+    token_latency: float = 0.0
+    requests_per_minute: Optional[float] = None
+    tokens_per_minute: Optional[float] = None
+    rate_limit_rate: float = 0.0
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    timeout_delay: float = 600.0
+    retry_after: float = 1.0
+    seed: int = 0
+
+    def __post_init__(self):
+        """Validate the settings."""
+        if self.latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Latency distribution must be one of {', '.join(LATENCY_DISTRIBUTIONS)}")
+        if min(self.latency, self.latency_spread, self.token_latency, self.timeout_delay, self.retry_after) < 0:
+            raise ValueError("Latencies must not be negative")
+        if self.latency_distribution == "lognormal" and self.latency <= 0:
+            raise ValueError("The lognormal distribution needs a positive median latency")
+        if not all(0 <= rate <= 1 for rate in (self.rate_limit_rate, self.error_rate, self.timeout_rate)):
+            raise ValueError("Fault rates must be between 0 and 1")
+        if any(limit is not None and limit <= 0 for limit in (self.requests_per_minute, self.tokens_per_minute)):
+            raise ValueError("Rate limits must be positive")
+
+    def draw_latency(self, rng: random.Random, output_tokens: int = 0) -> float:
+        """Draw the delay of a request.
+
+        Args:
+            rng: Random generator to draw from.
+            output_tokens: Number of output tokens the request generates.
+
+        Returns:
+            Delay in seconds.
+        """
+        if self.latency_distribution == "uniform":
+            delay = self.latency + rng.random() * self.latency_spread
+        elif self.latency_distribution == "lognormal":
+            delay = rng.lognormvariate(math.log(self.latency), self.latency_spread)
+        else:
+            delay = self.latency
+        if self.max_latency is not None:
+            delay = min(delay, self.max_latency)
+        return delay + output_tokens * self.token_latency
+
+
+class _Window:
+    """Per-minute allowance refilled continuously, as the OpenAI limits are."""
+
+    def __init__(self, per_minute: Optional[float]):
+        """Initialize a full window; without a limit the window never runs out."""
+        self.limit = per_minute
+        self.level = per_minute or 0.0
+        self._updated = time.monotonic()
+
+    def take(self, amount: float) -> bool:
+        """Consume ``amount`` if it is available."""
+        if self.limit is None:
+            return True
+        now = time.monotonic()
+        self.level = min(self.limit, self.level + (now - self._updated) * self.limit / 60.0)
+        self._updated = now
+        if self.level < amount:
+            return False
+        self.level -= amount
+        return True
+
+    def reset(self, amount: float = 1.0) -> float:
+        """Seconds until ``amount`` is available again."""
+        if self.limit is None:
+            return 0.0
+        return max(0.0, (min(amount, self.limit) - self.level) * 60.0 / self.limit)
+
+    def headers(self, kind: str) -> Dict[str, str]:
+        """``x-ratelimit-*`` headers describing the window."""
+        if self.limit is None:
+            return {}
+        return {
+            f"x-ratelimit-limit-{kind}": str(int(self.limit)),
+            f"x-ratelimit-remaining-{kind}": str(int(self.level)),
+            # Time until the allowance is full again, as OpenAI reports it
+            f"x-ratelimit-reset-{kind}": f"{(self.limit - self.level) * 60.0 / self.limit:.3f}s"
+        }
+
+
+def score_text(text: str) -> float:
+    """Score a text deterministically from its positive and negative keywords.
+
+    Args:
+        text: Text to score.
+
+    Returns:
+        Score in [-1.0, 1.0], never exactly 0.0. Texts without a lean get a small
+        score whose sign is derived from a hash of the text.
+    """
+    words = _WORD.findall(text.lower())
+    positive = sum(1 for word in words if word in _POSITIVE_WORDS)
+    negative = sum(1 for word in words if word in _NEGATIVE_WORDS)
+    if positive == negative:
+        return 0.1 if hashlib.blake2b(text.encode(), digest_size=1).digest()[0] & 1 else -0.1
+    return round((positive - negative) / (positive + negative + 1), 4)
+
+
+def _sentiment(text: str) -> Dict[str, Any]:
+    """Structured sentiment of a text."""
+    score = score_text(text)
+    return {"sentiment_score": score, "sentiment_label": "positive" if score > 0 else "negative"}
+
+
+def _packed_comments(text: str) -> Optional[List[Dict[str, Any]]]:
+    """Parse the comments of a packed request, or None for a single comment."""
+    if not text.lstrip().startswith("["):
+        return None
+    try:
+        comments = json.loads(text)
+    except ValueError:
+        return None
+    if not all(isinstance(item, dict) and "comment_id" in item and "text" in item for item in comments):
+        return None
+    return comments
+
+
+def sentiment_response(body: Dict[str, Any], ids: "itertools.count") -> Dict[str, Any]:
+    """Build the ``/v1/responses`` result of a sentiment request.
+
+    Args:
+        body: Request body; the last input message is scored. A JSON list of
+            ``{"comment_id", "text"}`` objects is a packed request, answered with
+            one result per comment.
+        ids: Counter used for object ids.
+
+    Returns:
+        Response object with the structured output as its output text.
+    """
+    text = body["input"][-1]["content"]
+    comments = _packed_comments(text)
+    if comments is None:
+        output = json.dumps(_sentiment(text))
+    else:
+        output = json.dumps({"results": [
+            {"comment_id": comment["comment_id"], **_sentiment(comment["text"])}
+            for comment in comments
+        ]})
+    return {
+        "id": f"resp_{next(ids)}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "status": "completed",
+        "model": body.get("model"),
+        "output": [{
+            "type": "message",
+            "id": f"msg_{next(ids)}",
+            "role": "assistant",
+            "status": "completed",
+            "content": [{"type": "output_text", "text": output, "annotations": []}]
+        }],
+        "usage": {
+            "input_tokens": len(text) // 4 + 60,
+            "output_tokens": len(output) // 4,
+            "total_tokens": (len(text) + len(output)) // 4 + 60
+        }
+    }
+
+
+def classification_completion(body: Dict[str, Any], ids: "itertools.count") -> Dict[str, Any]:
+    """Build the ``/v1/chat/completions`` result of a one-token classification.
+
+    The probabilities of the "positive" and "negative" tokens follow the keyword
+    score of the last message, so P(positive) - P(negative) recovers it.
+
+    Args:
+        body: Request body; the last message is scored.
+        ids: Counter used for object ids.
+
+    Returns:
+        Chat completion with the logprobs of the classification token.
+    """
+    text = body["messages"][-1]["content"]
+    score = score_text(text)
+    probabilities = {
+        "positive": 0.98 * (1 + score) / 2,
+        "negative": 0.98 * (1 - score) / 2,
+        "neutral": 0.02
+    }
+    alternatives = sorted(probabilities.items(), key=lambda item: item[1], reverse=True)
+    alternatives = alternatives[:max(1, body.get("top_logprobs") or 1)]
+    token = alternatives[0][0]
+    return {
+        "id": f"chatcmpl-{next(ids)}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": token},
+            "logprobs": {"content": [{
+                "token": token,
+                "logprob": math.log(alternatives[0][1]),
+                "bytes": None,
+                "top_logprobs": [
+                    {"token": alt, "logprob": math.log(max(p, 1e-12)), "bytes": None}
+                    for alt, p in alternatives
+                ]
+            }]} if body.get("logprobs") else None,
+            "finish_reason": "length"
+        }],
+        "usage": {
+            "prompt_tokens": len(text) // 4 + 30,
+            "completion_tokens": 1,
+            "total_tokens": len(text) // 4 + 31
+        }
+    }
+
+
+def embed_text(text: str, dimensions: int = DEFAULT_EMBEDDING_DIMENSIONS) -> np.ndarray:
+    """Embed a text deterministically as the normalized sum of its word vectors.
+
+    Every word maps to a fixed pseudo-random vector seeded by its hash, so texts
+    sharing words get similar embeddings.
+
+    Args:
+        text: Text to embed.
+        dimensions: Size of the embedding.
+
+    Returns:
+        Unit-length float32 vector.
+    """
+    vector = np.zeros(dimensions)
+    for word in _WORD.findall(text.lower()) or [""]:
+        seed = int.from_bytes(hashlib.blake2b(word.encode(), digest_size=8).digest(), "little")
+        vector += np.random.default_rng(seed).standard_normal(dimensions)
+    return (vector / np.linalg.norm(vector)).astype(np.float32)
+
+
+def embeddings_response(body: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the ``/v1/embeddings`` result of a request.
+
+    Args:
+        body: Request body with a string or a list of strings as input.
+
+    Returns:
+        List object with one embedding per input, as floats or base64 float32.
+    """
+    inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+    dimensions = body.get("dimensions") or DEFAULT_EMBEDDING_DIMENSIONS
+    as_base64 = body.get("encoding_format") == "base64"
+    data = []
+    for index, text in enumerate(inputs):
+        vector = embed_text(text, dimensions)
+        data.append({
+            "object": "embedding",
+            "index": index,
+            "embedding": (
+                base64.b64encode(vector.astype("<f4").tobytes()).decode()
+                if as_base64 else vector.tolist()
+            )
+        })
+    tokens = sum(len(text) // 4 + 1 for text in inputs)
+    return {
+        "object": "list",
+        "data": data,
+        "model": body.get("model"),
+        "usage": {"prompt_tokens": tokens, "total_tokens": tokens}
+    }
+
+
+def create_app(
+    batch_polls: int = 1,
+    batch_error_rate: float = 0.0,
+    seed: int = 0,
+    faults: Optional[FaultConfig] = None
+) -> FastAPI:
+    """Create the OpenAI stand-in application.
+
+    Args:
+        batch_polls: Number of status reads a batch stays ``in_progress`` before
+            it completes.
+        batch_error_rate: Probability (0-1) that a batched request fails and is
+            written to the error file instead of the output file.
+        seed: Seed of the batch error injection random generator.
+        faults: Latency, rate limit and error injection settings of the online
+            endpoints. Defaults to none.
+
+    Returns:
+        The FastAPI application. Uploaded files, batches and request counters are
+        available on ``app.state``.
+    """
+    if not 0 <= batch_error_rate <= 1:
+        raise ValueError("Batch error rate must be between 0 and 1")
+    faults = faults or FaultConfig()
+    rng = random.Random(seed)
+    fault_rng = random.Random(faults.seed)
+    request_window = _Window(faults.requests_per_minute)
+    token_window = _Window(faults.tokens_per_minute)
+    ids = itertools.count(1)
+    app = FastAPI(title="OpenAI stand-in")
+    app.state.files = {}
+    app.state.batches = {}
+    app.state.faults = faults
+    app.state.stats = {
+        "files": 0, "batches": 0, "batch_requests": 0, "responses": 0, "chat_completions": 0,
+        "embedding_requests": 0, "embedded_inputs": 0, "rate_limited": 0, "server_errors": 0,
+        "timeouts": 0
+    }
+
+    def rate_limit_headers() -> Dict[str, str]:
+        """Current state of the request and token limits."""
+        return {**request_window.headers("requests"), **token_window.headers("tokens")}
+
+    def admit(body: bytes) -> Optional[JSONResponse]:
+        """Apply the rate limits and injected errors to an online request.
+
+        Returns:
+            The error response to send instead of an answer, or None.
+        """
+        tokens = len(body) / 4
+        limited: Optional[Tuple[str, float]] = None
+        if not request_window.take(1):
+            limited = ("requests", request_window.reset())
+        elif not token_window.take(tokens):
+            limited = ("tokens", token_window.reset(tokens))
+        elif faults.rate_limit_rate and fault_rng.random() < faults.rate_limit_rate:
+            limited = ("requests", faults.retry_after)
+        if limited is not None:
+            app.state.stats["rate_limited"] += 1
+            kind, wait = limited
+            return JSONResponse(
+                {"error": {
+                    "message": f"Rate limit reached for {kind}",
+                    "type": kind,
+                    "param": None,
+                    "code": "rate_limit_exceeded"
+                }},
+                status_code=429,
+                headers={**rate_limit_headers(), "retry-after": f"{max(wait, 0.001):.3f}"}
+            )
+        if faults.error_rate and fault_rng.random() < faults.error_rate:
+            app.state.stats["server_errors"] += 1
+            return JSONResponse(
+                {"error": {
+                    "message": "Injected failure",
+                    "type": "server_error",
+                    "param": None,
+                    "code": None
+                }},
+                status_code=500,
+                headers=rate_limit_headers()
+            )
+        return None
+
+    async def respond(answer: Dict[str, Any], output_tokens: int) -> JSONResponse:
+        """Simulate the time taken to produce an answer and send it."""
+        delay = faults.draw_latency(fault_rng, output_tokens)
+        if faults.timeout_rate and fault_rng.random() < faults.timeout_rate:
+            app.state.stats["timeouts"] += 1
+            delay = faults.timeout_delay
+        if delay:
+            await asyncio.sleep(delay)
+        return JSONResponse(answer, headers=rate_limit_headers())
+
+    def store_file(filename: str, purpose: str, content: bytes) -> Dict[str, Any]:
+        """Store a file and return its metadata."""
+        file = {
+            "id": f"file-{next(ids)}",
+            "object": "file",
+            "bytes": len(content),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": purpose,
+            "status": "processed"
+        }
+        app.state.files[file["id"]] = {**file, "content": content}
+        app.state.stats["files"] += 1
+        return file
+
+    def public(file: Dict[str, Any]) -> Dict[str, Any]:
+        """File metadata without its content."""
+        return {key: value for key, value in file.items() if key != "content"}
+
+    def run_batch(batch: Dict[str, Any]) -> None:
+        """Answer every request of a batch and write the output and error files."""
+        content = app.state.files[batch["input_file_id"]]["content"]
+        outputs: List[str] = []
+        errors: List[str] = []
+        for line in content.decode().splitlines():
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            app.state.stats["batch_requests"] += 1
+            result = {"id": f"batch_req_{next(ids)}", "custom_id": request["custom_id"], "error": None}
+            if batch_error_rate and rng.random() < batch_error_rate:
+                result["response"] = {
+                    "status_code": 500,
+                    "request_id": f"req_{next(ids)}",
+                    "body": {"error": {"message": "Injected failure", "type": "server_error"}}
+                }
+                errors.append(json.dumps(result))
+                continue
+            result["response"] = {
+                "status_code": 200,
+                "request_id": f"req_{next(ids)}",
+                "body": sentiment_response(request["body"], ids)
+            }
+            outputs.append(json.dumps(result))
+        if outputs:
+            batch["output_file_id"] = store_file(
+                f"{batch['id']}_output.jsonl", "batch_output", "\n".join(outputs).encode() + b"\n"
+            )["id"]
+        if errors:
+            batch["error_file_id"] = store_file(
+                f"{batch['id']}_error.jsonl", "batch_output", "\n".join(errors).encode() + b"\n"
+            )["id"]
+        batch["request_counts"] = {
+            "total": len(outputs) + len(errors),
+            "completed": len(outputs),
+            "failed": len(errors)
+        }
+        batch["status"] = "completed"
+        batch["completed_at"] = int(time.time())
+
+    @app.post("/v1/responses")
+    async def create_response(request: Request):
+        """Answer a sentiment request with a structured output."""
+        app.state.stats["responses"] += 1
+        raw = await request.body()
+        rejection = admit(raw)
+        if rejection is not None:
+            return rejection
+        body = sentiment_response(json.loads(raw), ids)
+        return await respond(body, body["usage"]["output_tokens"])
+
+    @app.post("/v1/chat/completions")
+    async def create_chat_completion(request: Request):
+        """Answer a one-token sentiment classification with logprobs."""
+        app.state.stats["chat_completions"] += 1
+        raw = await request.body()
+        rejection = admit(raw)
+        if rejection is not None:
+            return rejection
+        body = classification_completion(json.loads(raw), ids)
+        return await respond(body, body["usage"]["completion_tokens"])
+
+    @app.post("/v1/embeddings")
+    async def create_embeddings(request: Request):
+        """Embed a batch of inputs."""
+        raw = await request.body()
+        rejection = admit(raw)
+        if rejection is not None:
+            return rejection
+        body = embeddings_response(json.loads(raw))
+        app.state.stats["embedding_requests"] += 1
+        app.state.stats["embedded_inputs"] += len(body["data"])
+        return await respond(body, 0)
+
+    @app.post("/v1/files")
+    async def upload_file(request: Request):
+        """Upload a file (multipart form with ``file`` and ``purpose``)."""
+        header = f"Content-Type: {request.headers.get('content-type', '')}\r\n\r\n".encode()
+        form = BytesParser(policy=HTTP).parsebytes(header + await request.body())
+        if not form.is_multipart():
+            raise HTTPException(status_code=400, detail="Expected a multipart form")
+        fields = {part.get_param("name", header="content-disposition"): part for part in form.iter_parts()}
+        if "file" not in fields:
+            raise HTTPException(status_code=400, detail="Missing file")
+        purpose = fields["purpose"].get_content().strip() if "purpose" in fields else "batch"
+        file = store_file(
+            fields["file"].get_filename() or "upload.jsonl",
+            purpose,
+            fields["file"].get_payload(decode=True)
+        )
+        return JSONResponse(file)
+
+    @app.get("/v1/files/{file_id}")
+    async def get_file(file_id: str):
+        """Get the metadata of a file."""
+        if file_id not in app.state.files:
+            raise HTTPException(status_code=404, detail="File not found")
+        return JSONResponse(public(app.state.files[file_id]))
+
+    @app.get("/v1/files/{file_id}/content")
+    async def get_file_content(file_id: str):
+        """Download the content of a file."""
+        if file_id not in app.state.files:
+            raise HTTPException(status_code=404, detail="File not found")
+        return Response(app.state.files[file_id]["content"], media_type="application/octet-stream")
+
+    @app.post("/v1/batches")
+    async def create_batch(request: Request):
+        """Create a batch from an uploaded JSONL file."""
+        body = await request.json()
+        if body.get("input_file_id") not in app.state.files:
+            raise HTTPException(status_code=404, detail="Input file not found")
+        batch = {
+            "id": f"batch_{next(ids)}",
+            "object": "batch",
+            "endpoint": body.get("endpoint", "/v1/responses"),
+            "input_file_id": body["input_file_id"],
+            "completion_window": body.get("completion_window", "24h"),
+            "status": "validating",
+            "created_at": int(time.time()),
+            "output_file_id": None,
+            "error_file_id": None,
+            "request_counts": {"total": 0, "completed": 0, "failed": 0},
+            "metadata": body.get("metadata"),
+            "polls": 0
+        }
+        app.state.batches[batch["id"]] = batch
+        app.state.stats["batches"] += 1
+        return JSONResponse({k: v for k, v in batch.items() if k != "polls"})
+
+    @app.get("/v1/batches/{batch_id}")
+    async def get_batch(batch_id: str):
+        """Get a batch, advancing it towards completion on every read."""
+        batch: Optional[Dict[str, Any]] = app.state.batches.get(batch_id)
+        if batch is None:
+            raise HTTPException(status_code=404, detail="Batch not found")
+        if batch["status"] not in TERMINAL_BATCH_STATUSES:
+            batch["polls"] += 1
+            if batch["polls"] > batch_polls:
+                run_batch(batch)
+            else:
+                batch["status"] = "in_progress"
+        return JSONResponse({k: v for k, v in batch.items() if k != "polls"})
+
+    @app.post("/v1/batches/{batch_id}/cancel")
+    async def cancel_batch(batch_id: str):
+        """Cancel a batch that has not finished yet."""
+        batch = app.state.batches.get(batch_id)
+        if batch is None:
+            raise HTTPException(status_code=404, detail="Batch not found")
+        if batch["status"] not in TERMINAL_BATCH_STATUSES:
+            batch["status"] = "cancelled"
+        return JSONResponse({k: v for k, v in batch.items() if k != "polls"})
+
+    return app
+
+
+def main() -> None:
+    """Run the stand-in server from the command line."""
+    parser = argparse.ArgumentParser(description="Local OpenAI API stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch-polls", type=int, default=1)
+    parser.add_argument("--batch-error-rate", type=float, default=0.0)
+    parser.add_argument("--latency", type=float, default=0.0, help="Base (or median) latency in seconds")
+    parser.add_argument("--latency-distribution", choices=LATENCY_DISTRIBUTIONS, default="fixed")
+    parser.add_argument("--latency-spread", type=float, default=0.0, help="Uniform width or lognormal sigma")
+    parser.add_argument("--max-latency", type=float, help="Cap on a drawn latency in seconds")
+    parser.add_argument("--token-latency", type=float, default=0.0, help="Latency per output token in seconds")
+    parser.add_argument("--requests-per-minute", type=float)
+    parser.add_argument("--tokens-per-minute", type=float)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Probability of an injected 429")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of an injected 500")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Probability of a stalled request")
+    parser.add_argument("--timeout-delay", type=float, default=600.0, help="Duration of a stall in seconds")
+    args = parser.parse_args()
+
+    app = create_app(
+        batch_polls=args.batch_polls,
+        batch_error_rate=args.batch_error_rate,
+        seed=args.seed,
+        faults=FaultConfig(
+            latency=args.latency,
+            latency_distribution=args.latency_distribution,
+            latency_spread=args.latency_spread,
+            max_latency=args.max_latency,
+            token_latency=args.token_latency,
+            requests_per_minute=args.requests_per_minute,
+            tokens_per_minute=args.tokens_per_minute,
+            rate_limit_rate=args.rate_limit_rate,
+            error_rate=args.error_rate,
+            timeout_rate=args.timeout_rate,
+            timeout_delay=args.timeout_delay,
+            seed=args.seed
+        )
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+"""Offline bulk scoring of comments through the OpenAI Batch API."""
+import asyncio
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from openai import AsyncOpenAI
+from pydantic import ValidationError
+
+from sentiment_analysis.config import (
+    OPENAI_BATCH_MAX_REQUESTS,
+    OPENAI_BATCH_POLL_INTERVAL,
+    OPENAI_BATCH_WORK_DIR,
+)
+from sentiment_analysis.domain.entities.comment import Comment
+from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
+from sentiment_analysis.domain.repositories.sentiment_analysis_repository import SentimentAnalysisRepository
+from sentiment_analysis.infrastructure.sentiment_analyzer import (
+    PROMPT_VERSION,
+    SYSTEM_PROMPT,
+    OutputFormat,
+    SentimentAnalyzer,
+)
+from sentiment_analysis.logger import configure_logger
+
+TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+# Strict structured-output schema of a batched request, equivalent to text_format=OutputFormat
+_OUTPUT_SCHEMA = {**OutputFormat.model_json_schema(), "additionalProperties": False}
+
+
+class BatchJobError(Exception):
+    """Raised when the Batch API rejects a batch as a whole."""
+
+
+@dataclass
+class BatchJobResult:
+    """Outcome of a bulk scoring job.
+
+    Attributes:
+        batch_ids: Ids of the batches the comments were submitted in.
+        saved: Number of analyses written to the repository by this run.
+        failed_comment_ids: Comments without a valid result, to be retried with
+            the online analyzer or in a later job.
+    """
+    batch_ids: List[str] = field(default_factory=list)
+    saved: int = 0
+    failed_comment_ids: List[int] = field(default_factory=list)
+
+
+class BatchSentimentJob:
+    """Scores large sets of comments with the OpenAI Batch API.
+
+    Comments are written to a JSONL file of ``/v1/responses`` requests (split
+    into several batches above ``max_requests``), uploaded and submitted. The job
+    then polls until each batch is done, stream-parses the output file line by
+    line and writes the analyses to the repository in bulk.
+
+    Progress is checkpointed in a state file per batch under ``work_dir``, keyed
+    by the content of its comments. Running the job again with the same comments
+    after a crash resumes the submitted batches instead of paying for them twice,
+    and skips the results that were already written. Writes are at least once:
+    a crash between a bulk write and its checkpoint repeats that write.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        repository: SentimentAnalysisRepository,
+        work_dir: str = OPENAI_BATCH_WORK_DIR,
+        model: str = "gpt-4o-mini",
+        poll_interval: float = OPENAI_BATCH_POLL_INTERVAL,
+        max_requests: int = OPENAI_BATCH_MAX_REQUESTS,
+        write_batch_size: int = 1000
+    ):
+        """Initialize the job.
+
+        Args:
+            client: OpenAI client.
+            repository: Repository the analyses are written to.
+            work_dir: Directory of the request files and checkpoints.
+            model: OpenAI model used for the analysis.
+            poll_interval: Seconds between two batch status checks.
+            max_requests: Maximum number of requests per batch.
+            write_batch_size: Number of analyses per bulk repository write.
+
+        Raises:
+            ValueError: If max_requests or write_batch_size is less than 1.
+        """
+        if max_requests < 1 or write_batch_size < 1:
+            raise ValueError("Max requests and write batch size must be at least 1")
+        self.client = client
+        self.repository = repository
+        self.work_dir = Path(work_dir)
+        self.model = model
+        self.poll_interval = poll_interval
+        self.max_requests = max_requests
+        self.write_batch_size = write_batch_size
+        self.logger = configure_logger().bind(service="batch_sentiment_job")
+
+    async def run(self, comments: List[Comment]) -> BatchJobResult:
+        """Score comments with the Batch API and save the analyses.
+
+        Args:
+            comments: Comments to score.
+
+        Returns:
+            The batches used, the number of saved analyses and the failed comments.
+
+        Raises:
+            BatchJobError: If a batch fails validation as a whole.
+        """
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        chunks = [
+            comments[i:i + self.max_requests]
+            for i in range(0, len(comments), self.max_requests)
+        ]
+        jobs = []
+        for chunk in chunks:
+            key = self._chunk_key(chunk)
+            state = self._load_state(key)
+            if state is None:
+                state = await self._submit(chunk, key)
+            else:
+                self.logger.info("Resuming batch", batch_id=state["batch_id"], comment_count=len(chunk))
+            jobs.append((chunk, key, state))
+
+        result = BatchJobResult(batch_ids=[state["batch_id"] for _, _, state in jobs])
+        for chunk, key, state in jobs:
+            batch = await self._wait(state["batch_id"])
+            if batch.status == "failed":
+                self._cleanup(key)
+                raise BatchJobError(f"Batch {batch.id} failed: {batch.errors}")
+            saved, failed = await self._ingest(batch, chunk, key, state)
+            result.saved += saved
+            result.failed_comment_ids.extend(failed)
+            self._cleanup(key)
+
+        self.logger.info(
+            "Bulk scoring finished",
+            batch_count=len(jobs),
+            saved=result.saved,
+            failed=len(result.failed_comment_ids)
+        )
+        return result
+
+    async def _submit(self, comments: List[Comment], key: str) -> Dict[str, Any]:
+        """Write, upload and submit the batch of a chunk of comments.
+
+        Args:
+            comments: Comments of the batch.
+            key: Content key of the chunk.
+
+        Returns:
+            The checkpoint state of the new batch.
+        """
+        path = self.work_dir / f"{key}.jsonl"
+        with path.open("w", encoding="utf-8") as file:
+            for comment in comments:
+                file.write(json.dumps(self._request(comment), ensure_ascii=False))
+                file.write("\n")
+        with path.open("rb") as file:
+            uploaded = await self.client.files.create(file=(path.name, file), purpose="batch")
+        batch = await self.client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint="/v1/responses",
+            completion_window="24h",
+            metadata={"job": "sentiment_rescoring", "chunk": key}
+        )
+        state = {"batch_id": batch.id, "input_file_id": uploaded.id, "ingested_lines": 0}
+        self._save_state(key, state)
+        self.logger.info("Submitted batch", batch_id=batch.id, comment_count=len(comments))
+        return state
+
+    async def _wait(self, batch_id: str) -> Any:
+        """Poll a batch until it reaches a terminal status.
+
+        Args:
+            batch_id: Id of the batch.
+
+        Returns:
+            The finished batch.
+        """
+        while True:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status in TERMINAL_STATUSES:
+                self.logger.info(
+                    "Batch finished",
+                    batch_id=batch_id,
+                    status=batch.status,
+                    request_counts=batch.request_counts.model_dump() if batch.request_counts else None
+                )
+                return batch
+            await asyncio.sleep(self.poll_interval)
+
+    async def _ingest(
+        self,
+        batch: Any,
+        comments: List[Comment],
+        key: str,
+        state: Dict[str, Any]
+    ) -> Tuple[int, List[int]]:
+        """Stream-parse the output file of a batch into the repository.
+
+        Lines up to the checkpoint were written by an earlier run; they are only
+        parsed to know which comments succeeded.
+
+        Args:
+            batch: The finished batch.
+            comments: Comments of the batch.
+            key: Content key of the chunk.
+            state: Checkpoint state of the batch.
+
+        Returns:
+            Number of analyses saved and ids of the comments without a result.
+        """
+        by_custom_id = {self._custom_id(comment): comment for comment in comments}
+        succeeded: Set[int] = set()
+        saved = 0
+        if batch.output_file_id:
+            pending: List[SentimentAnalysis] = []
+            line_number = 0
+            async with self.client.files.with_streaming_response.content(batch.output_file_id) as response:
+                async for line in response.iter_lines():
+                    if not line.strip():
+                        continue
+                    line_number += 1
+                    analysis = self._parse_line(line, by_custom_id)
+                    if analysis is None or analysis.comment_id in succeeded:
+                        continue
+                    succeeded.add(analysis.comment_id)
+                    if line_number <= state["ingested_lines"]:
+                        continue
+                    pending.append(analysis)
+                    if len(pending) >= self.write_batch_size:
+                        saved += await self._write(pending, key, state, line_number)
+                        pending = []
+            if pending or line_number > state["ingested_lines"]:
+                saved += await self._write(pending, key, state, line_number)
+
+        failed = [comment.id for comment in comments if comment.id not in succeeded]
+        if failed:
+            self.logger.warning(
+                "Comments without a batch result",
+                batch_id=batch.id,
+                status=batch.status,
+                failed_count=len(failed)
+            )
+        return saved, failed
+
+    async def _write(
+        self,
+        analyses: List[SentimentAnalysis],
+        key: str,
+        state: Dict[str, Any],
+        line_number: int
+    ) -> int:
+        """Bulk-write analyses and checkpoint the output line they end at."""
+        if analyses:
+            await self.repository.save_many(analyses)
+        state["ingested_lines"] = line_number
+        self._save_state(key, state)
+        return len(analyses)
+
+    def _parse_line(
+        self,
+        line: str,
+        by_custom_id: Dict[str, Comment]
+    ) -> Optional[SentimentAnalysis]:
+        """Turn one line of a batch output file into an analysis.
+
+        Args:
+            line: JSON line of the output file.
+            by_custom_id: Comments of the batch by custom id.
+
+        Returns:
+            The analysis, or None if the request failed or its output is invalid.
+        """
+        try:
+            record = json.loads(line)
+            comment = by_custom_id.get(record.get("custom_id"))
+            response = record.get("response") or {}
+            if comment is None or response.get("status_code") != 200:
+                return None
+            text = next(
+                content["text"]
+                for item in response["body"]["output"] if item.get("type") == "message"
+                for content in item.get("content", []) if content.get("type") == "output_text"
+            )
+            output = OutputFormat.model_validate_json(text)
+            return SentimentAnalyzer._build_analysis(
+                comment, output.sentiment_score, output.sentiment_label
+            )
+        except (ValueError, KeyError, TypeError, StopIteration, ValidationError) as e:
+            self.logger.warning("Invalid batch result", error=str(e))
+            return None
+
+    def _request(self, comment: Comment) -> Dict[str, Any]:
+        """Build the batch request line of a comment."""
+        return {
+            "custom_id": self._custom_id(comment),
+            "method": "POST",
+            "url": "/v1/responses",
+            "body": {
+                "model": self.model,
+                "input": [
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": comment.text},
+                ],
+                "text": {
+                    "format": {
+                        "type": "json_schema",
+                        "name": OutputFormat.__name__,
+                        "schema": _OUTPUT_SCHEMA,
+                        "strict": True
+                    }
+                }
+            }
+        }
+
+    @staticmethod
+    def _custom_id(comment: Comment) -> str:
+        """Custom id that maps a batch result back to its comment."""
+        return f"comment-{comment.id}"
+
+    def _chunk_key(self, comments: List[Comment]) -> str:
+        """Content key of a chunk: equal comments, model and prompt give equal keys."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.model}\0{PROMPT_VERSION}".encode())
+        for comment in comments:
+            digest.update(f"\0{comment.id}\0{comment.text}".encode())
+        return digest.hexdigest()
+
+    def _load_state(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read the checkpoint of a chunk, if any."""
+        path = self.work_dir / f"{key}.state.json"
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())
+
+    def _save_state(self, key: str, state: Dict[str, Any]) -> None:
+        """Atomically replace the checkpoint of a chunk."""
+        path = self.work_dir / f"{key}.state.json"
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(state))
+        os.replace(temporary, path)
+
+    def _cleanup(self, key: str) -> None:
+        """Remove the request file and checkpoint of a finished chunk."""
+        for suffix in (".jsonl", ".state.json"):
+            (self.work_dir / f"{key}{suffix}").unlink(missing_ok=True)
@@ -0,0 +1,287 @@
+"""Sparse skip -> created_at index for seeking Feddit comments by time."""
+import asyncio
+import bisect
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient
+from sentiment_analysis.logger import configure_logger
+
+
+@dataclass
+class _SparseIndex:
+    """Sampled ``created_at`` timestamps for one subfeddit, keyed by ``skip``."""
+    total: int = 0
+    ascending: bool = True
+    built_at: float = 0.0
+    skips: List[int] = field(default_factory=list)
+    times: Dict[int, float] = field(default_factory=dict)
+
+    def record(self, skip: int, timestamp: float) -> None:
+        """Record the timestamp of the comment at ``skip``."""
+        if skip not in self.times:
+            bisect.insort(self.skips, skip)
+        self.times[skip] = timestamp
+
+    def key(self, timestamp: float) -> float:
+        """Map a timestamp to a value that is non-decreasing in ``skip``."""
+        return timestamp if self.ascending else -timestamp
+
+    def bracket(self, target: float, inclusive: bool) -> Tuple[int, int]:
+        """Return the tightest sampled ``(lo, hi)`` around the first key >= target.
+
+        With ``inclusive=False`` the search is for the first key > target instead.
+        ``lo`` is -1 and ``hi`` is ``total`` when no sample bounds that side.
+        """
+        search = bisect.bisect_left if inclusive else bisect.bisect_right
+        position = search(self.skips, target, key=lambda s: self.key(self.times[s]))
+        lo = self.skips[position - 1] if position > 0 else -1
+        hi = self.skips[position] if position < len(self.skips) else self.total
+        return lo, hi
+
+
+class CommentTimeIndex:
+    """Sparse, cached index from comment offsets to creation times.
+
+    Feddit only exposes ``skip``/``limit`` pagination, so finding the comments of a
+    time window normally means scanning pages. This index samples ``created_at`` at
+    individual offsets with ``limit=1`` probes: the comment count is found by
+    exponential probing followed by binary search, and time windows are resolved by
+    binary search over ``skip``. Every probe is cached, so later seeks reuse earlier
+    samples, and the index is extended incrementally when new comments arrive.
+    """
+
+    def __init__(
+        self,
+        feddit_client: FedditClient,
+        resolution: int = 100,
+        refresh_interval: float = 60.0,
+        max_skip: int = 1 << 24
+    ):
+        """Initialize the index.
+
+        Args:
+            feddit_client: Client used to probe the Feddit comments endpoint.
+            resolution: Width of the skip range a seek narrows down to. Defaults to 100.
+            refresh_interval: Seconds after which an index is checked for new comments.
+            max_skip: Upper bound on the number of comments probed per subfeddit.
+        """
+        if resolution < 1:
+            raise ValueError("Resolution must be at least 1")
+        self._feddit_client = feddit_client
+        self._resolution = resolution
+        self._refresh_interval = refresh_interval
+        self._max_skip = max_skip
+        self._indexes: Dict[int, _SparseIndex] = {}
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self.probe_count = 0
+        self.logger = configure_logger().bind(service="comment_time_index")
+
+    async def count(self, subfeddit_id: int) -> int:
+        """Get the number of comments in a subfeddit.
+
+        Args:
+            subfeddit_id: ID of the subfeddit.
+
+        Returns:
+            Number of comments, as of the last build or refresh.
+        """
+        index = await self._get_index(subfeddit_id)
+        return index.total
+
+    async def seek(
+        self,
+        subfeddit_id: int,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> Tuple[int, int]:
+        """Find the skip range holding the comments created in a time window.
+
+        The returned range is conservative: it contains every comment in
+        ``[start_time, end_time]`` plus at most ``resolution`` extra comments on each
+        side, so callers still filter the fetched comments by time.
+
+        Args:
+            subfeddit_id: ID of the subfeddit.
+            start_time: Optional inclusive lower bound on ``created_at``.
+            end_time: Optional inclusive upper bound on ``created_at``.
+
+        Returns:
+            Tuple ``(skip_start, skip_end)`` with ``skip_end`` exclusive.
+        """
+        index = await self._get_index(subfeddit_id)
+        if index.total == 0:
+            return 0, 0
+
+        lo_time = start_time.timestamp() if start_time else None
+        hi_time = end_time.timestamp() if end_time else None
+        if not index.ascending:
+            lo_time, hi_time = hi_time, lo_time
+
+        skip_start = 0
+        skip_end = index.total
+        if lo_time is not None:
+            lo, _ = await self._narrow(subfeddit_id, index, index.key(lo_time), inclusive=True)
+            skip_start = lo + 1
+        if hi_time is not None:
+            _, hi = await self._narrow(subfeddit_id, index, index.key(hi_time), inclusive=False)
+            skip_end = hi
+
+        self.logger.debug(
+            "Resolved time window",
+            subfeddit_id=subfeddit_id,
+            start_time=start_time,
+            end_time=end_time,
+            skip_start=skip_start,
+            skip_end=skip_end
+        )
+        return skip_start, max(skip_start, skip_end)
+
+    async def refresh(self, subfeddit_id: int) -> None:
+        """Extend the index of a subfeddit with comments added since it was built.
+
+        Args:
+            subfeddit_id: ID of the subfeddit.
+        """
+        async with self._lock(subfeddit_id):
+            index = self._indexes.get(subfeddit_id)
+            if index is None:
+                self._indexes[subfeddit_id] = await self._build(subfeddit_id)
+            else:
+                await self._extend(subfeddit_id, index)
+
+    def invalidate(self, subfeddit_id: Optional[int] = None) -> None:
+        """Drop cached samples for one subfeddit, or for all of them.
+
+        Args:
+            subfeddit_id: ID of the subfeddit, or None to drop every index.
+        """
+        if subfeddit_id is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop(subfeddit_id, None)
+
+    async def _get_index(self, subfeddit_id: int) -> _SparseIndex:
+        """Get the index for a subfeddit, building or refreshing it as needed."""
+        index = self._indexes.get(subfeddit_id)
+        if index is None or time.monotonic() - index.built_at > self._refresh_interval:
+            await self.refresh(subfeddit_id)
+            index = self._indexes[subfeddit_id]
+        return index
+
+    def _lock(self, subfeddit_id: int) -> asyncio.Lock:
+        """Get the lock serializing builds of one subfeddit's index."""
+        return self._locks.setdefault(subfeddit_id, asyncio.Lock())
+
+    async def _probe(self, subfeddit_id: int, skip: int) -> Optional[float]:
+        """Fetch the creation time of the comment at ``skip``, if it exists."""
+        self.probe_count += 1
+        comments = await self._feddit_client.get_comments(
+            subfeddit_id=subfeddit_id,
+            limit=1,
+            skip=skip
+        )
+        if not comments:
+            return None
+        return comments[0].created_at.timestamp()
+
+    async def _probe_and_record(
+        self, subfeddit_id: int, index: _SparseIndex, skip: int
+    ) -> Optional[float]:
+        """Probe ``skip`` and record the result in ``index``."""
+        timestamp = await self._probe(subfeddit_id, skip)
+        if timestamp is not None:
+            index.record(skip, timestamp)
+        return timestamp
+
+    async def _find_end(
+        self, subfeddit_id: int, index: _SparseIndex, known: int
+    ) -> int:
+        """Find the comment count given that the comment at ``known`` exists.
+
+        Gallops forward in doubling steps until a probe misses, then binary searches
+        the last gap.
+        """
+        lo, step = known, 1
+        hi = known + step
+        while hi < self._max_skip:
+            if await self._probe_and_record(subfeddit_id, index, hi) is None:
+                break
+            lo, step = hi, step * 2
+            hi = lo + step
+        else:
+            return self._max_skip
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if await self._probe_and_record(subfeddit_id, index, mid) is None:
+                hi = mid
+            else:
+                lo = mid
+        return lo + 1
+
+    async def _build(self, subfeddit_id: int) -> _SparseIndex:
+        """Build a fresh index for a subfeddit."""
+        index = _SparseIndex(built_at=time.monotonic())
+        if await self._probe_and_record(subfeddit_id, index, 0) is None:
+            return index
+        index.total = await self._find_end(subfeddit_id, index, 0)
+        last = index.total - 1
+        if last not in index.times:
+            await self._probe_and_record(subfeddit_id, index, last)
+        index.ascending = index.times[last] >= index.times[0]
+        self.logger.info(
+            "Built comment time index",
+            subfeddit_id=subfeddit_id,
+            total=index.total,
+            ascending=index.ascending,
+            samples=len(index.skips)
+        )
+        return index
+
+    async def _extend(self, subfeddit_id: int, index: _SparseIndex) -> None:
+        """Incrementally account for comments added since the last refresh."""
+        index.built_at = time.monotonic()
+        if index.total == 0 or await self._probe(subfeddit_id, index.total) is None:
+            return
+        fresh = _SparseIndex(total=index.total, ascending=index.ascending)
+        new_total = await self._find_end(subfeddit_id, fresh, index.total)
+        added = new_total - index.total
+        if not index.ascending:
+            # Newest comments come first, so existing samples moved back by `added`
+            shifted = {skip + added: timestamp for skip, timestamp in index.times.items()}
+            index.skips = sorted(shifted)
+            index.times = shifted
+            await self._probe_and_record(subfeddit_id, index, 0)
+        for skip in fresh.skips:
+            index.record(skip, fresh.times[skip])
+        index.total = new_total
+        self.logger.info(
+            "Extended comment time index",
+            subfeddit_id=subfeddit_id,
+            added=added,
+            total=index.total
+        )
+
+    async def _narrow(
+        self,
+        subfeddit_id: int,
+        index: _SparseIndex,
+        target: float,
+        inclusive: bool
+    ) -> Tuple[int, int]:
+        """Binary search ``skip`` until the boundary is within ``resolution``."""
+        lo, hi = index.bracket(target, inclusive)
+        while hi - lo > self._resolution:
+            mid = (lo + hi) // 2
+            timestamp = await self._probe_and_record(subfeddit_id, index, mid)
+            if timestamp is None:
+                hi = mid
+                continue
+            key = index.key(timestamp)
+            if key < target or (not inclusive and key == target):
+                lo = mid
+            else:
+                hi = mid
+        return lo, hi
@@ -1,12 +1,29 @@
 """Client for interacting with the Feddit API."""
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, AsyncIterator, Awaitable, Callable, TypeVar
+import asyncio
+import contextlib
 import httpx
 from datetime import datetime
 
 from sentiment_analysis.logger import configure_logger
 from sentiment_analysis.domain.entities.comment import Comment
 from sentiment_analysis.domain.entities.subfeddit import Subfeddit
-from sentiment_analysis.config import FEDDIT_API_URL
+from sentiment_analysis.infrastructure.clients.feddit_decoder import decode_comments, decode_subfeddits
+from sentiment_analysis.infrastructure.clients.page_cache import PageCache
+from sentiment_analysis.infrastructure.clients.resilience import ResilientExecutor
+from sentiment_analysis.infrastructure.clients.singleflight import SingleFlight
+from sentiment_analysis.infrastructure.deadline import within_deadline
+from sentiment_analysis.config import (
+    FEDDIT_API_URL,
+    FEDDIT_MAX_CONNECTIONS,
+    FEDDIT_MAX_KEEPALIVE_CONNECTIONS,
+    FEDDIT_KEEPALIVE_EXPIRY,
+    FEDDIT_HTTP2,
+    FEDDIT_COALESCE_REQUESTS,
+    FEDDIT_TIMEOUT,
+)
+
+T = TypeVar("T")
 
 
 class FedditClient:
@@ -15,22 +32,69 @@ class FedditClient:
     This client provides methods to fetch subfeddits and comments from the Feddit API.
     """
 
-    def __init__(self, base_url: str = FEDDIT_API_URL):
+    def __init__(
+        self,
+        base_url: str = FEDDIT_API_URL,
+        max_connections: int = FEDDIT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = FEDDIT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = FEDDIT_KEEPALIVE_EXPIRY,
+        http2: bool = FEDDIT_HTTP2,
+        http_client: Optional[httpx.AsyncClient] = None,
+        coalesce_requests: bool = FEDDIT_COALESCE_REQUESTS,
+        page_cache: Optional[PageCache] = None,
+        decoder: str = "standard",
+        timeout: float = FEDDIT_TIMEOUT,
+        resilience: Optional[ResilientExecutor] = None
+    ):
         """Initialize the Feddit client.
 
         Args:
             base_url: Base URL of the Feddit API. Defaults to FEDDIT_API_URL from config.
+            max_connections: Maximum number of concurrent connections in the pool.
+            max_keepalive_connections: Maximum number of idle connections kept alive.
+            keepalive_expiry: Seconds an idle connection is kept before being closed.
+            http2: Whether to negotiate HTTP/2 (requires the `h2` package).
+            http_client: Optional pre-configured httpx client to use instead of
+                building a new pooled one.
+            coalesce_requests: Whether identical concurrent GETs share one request.
+            page_cache: Optional cache of parsed pages keyed by endpoint and params.
+            decoder: How responses are decoded into entities: "standard" builds each
+                entity from ``response.json()``, "fast" validates the whole page from
+                the raw bytes in one schema-compiled call.
+            timeout: Default httpx timeout in seconds for the built client.
+            resilience: Optional executor adding per-attempt timeouts, retries,
+                hedged requests and a circuit breaker to every GET.
+
+        Raises:
+            ValueError: If the decoder is unknown.
         """
+        if decoder not in ("standard", "fast"):
+            raise ValueError(f"Unknown decoder '{decoder}'")
         self.base_url = base_url
-        self.client = httpx.AsyncClient(base_url=base_url)
+        self.client = http_client or httpx.AsyncClient(
+            base_url=base_url,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            ),
+            http2=http2,
+            timeout=httpx.Timeout(timeout)
+        )
+        self.resilience = resilience
+        self.singleflight = SingleFlight() if coalesce_requests else None
+        self.page_cache = page_cache
+        self.decoder = decoder
         self.logger = configure_logger().bind(service="feddit_client")
 
-    async def get_subfeddits(self, limit: int = 10, skip: int = 0) -> List[Subfeddit]:
+    async def get_subfeddits(self, limit: int = 10, skip: int = 0, revalidate: bool = False) -> List[Subfeddit]:
         """Get a list of subfeddits.
         
         Args:
             limit: Maximum number of subfeddits to return. Defaults to 10.
             skip: Number of subfeddits to skip. Defaults to 0.
+            revalidate: Whether to ask the API even if the page cache holds a
+                fresh copy of the page. Defaults to False.
             
         Returns:
             List of Subfeddit objects.
@@ -44,35 +108,22 @@ class FedditClient:
             skip=skip
         )
         try:
-            response = await self.client.get(
+            subfeddits = await self._get(
                 "/api/v1/subfeddits/",
                 params={
                     "limit": limit,
                     "skip": skip
-                }
+                },
+                parse=self._parse_subfeddits,
+                revalidate=revalidate
             )
-            self.logger.info("Fetched response get_subfeddits", response=response)
-            response.raise_for_status()
-            data = response.json()
-            self.logger.info("Fetched data get_subfeddits", data=data)
-            
-            # Convert API response to domain entities
-            subfeddits = []
-            for subfeddit_data in data["subfeddits"]:  # Access the subfeddits key
-                subfeddit = Subfeddit(
-                    id=subfeddit_data["id"],
-                    username=subfeddit_data["username"],
-                    title=subfeddit_data["title"],
-                    description=subfeddit_data["description"]
-                )
-                subfeddits.append(subfeddit)
             
             self.logger.info(
                 "Successfully fetched subfeddits",
                 count=len(subfeddits)
             )
             
-            return subfeddits
+            return list(subfeddits)
         except httpx.HTTPError as e:
             self.logger.error(
                 "Failed to fetch subfeddits",
@@ -104,14 +155,14 @@ class FedditClient:
             skip=skip
         )
         try:
-            response = await self.client.get(
+            response = await within_deadline(self._send(lambda: self.client.get(
                 "/api/v1/subfeddit/",
                 params={
                     "subfeddit_id": subfeddit_id,
                     "limit": limit,
                     "skip": skip
                 }
-            )
+            )))
             response.raise_for_status()
             data = response.json()
             
@@ -183,34 +234,15 @@ class FedditClient:
             skip=skip
         )
         try:
-            response = await self.client.get(
+            comments = await self._get(
                 "/api/v1/comments/",
                 params={
                     "subfeddit_id": subfeddit_id,
                     "limit": limit,
                     "skip": skip
-                }
+                },
+                parse=lambda response: self._parse_comments(response, subfeddit_id)
             )
-            response.raise_for_status()
-            data = response.json()
-            self.logger.debug("Fetched data get_comments", data=data)
-            
-            # Convert API response to domain entities
-            comments = []
-            # Check if data is a list or a dictionary with comments key
-            comment_data_list = data if isinstance(data, list) else data.get("comments", [])
-            
-            for comment_data in comment_data_list:
-                # Convert Unix timestamp to naive datetime
-                created_at = datetime.fromtimestamp(comment_data["created_at"])
-                comment = Comment(
-                    id=comment_data["id"],
-                    subfeddit_id=subfeddit_id,
-                    username=comment_data["username"],
-                    text=comment_data["text"],
-                    created_at=created_at
-                )
-                comments.append(comment)
             
             self.logger.info(
                 "Successfully fetched comments",
@@ -218,7 +250,7 @@ class FedditClient:
                 comment_count=len(comments)
             )
             
-            return comments
+            return list(comments)
         except httpx.HTTPError as e:
             self.logger.error(
                 "Failed to fetch comments",
@@ -227,6 +259,313 @@ class FedditClient:
             )
             raise
 
+    async def _get(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        parse: Callable[[httpx.Response], T],
+        revalidate: bool = False
+    ) -> T:
+        """Issue a GET request and parse the response.
+
+        Fresh pages are served from the page cache when one is configured; expired
+        pages, and every page when ``revalidate`` is set, are revalidated with
+        conditional headers. Concurrent calls with
+        identical parameters share a single in-flight request and its parsed result
+        when request coalescing is enabled.
+
+        Args:
+            path: Endpoint path.
+            params: Query parameters.
+            parse: Function converting the response into the returned value.
+            revalidate: Whether to skip serving a fresh cached page.
+
+        Returns:
+            The parsed response.
+
+        Raises:
+            httpx.HTTPError: If the API request fails.
+        """
+        key = (path, tuple(sorted(params.items())))
+        cached = self.page_cache.lookup(key) if self.page_cache else None
+        if cached is not None and cached.fresh and not revalidate:
+            return cached.value
+
+        async def request() -> T:
+            if cached is not None and cached.conditional_headers():
+                response = await self._send(lambda: self.client.get(
+                    path, params=params, headers=cached.conditional_headers()
+                ))
+                if response.status_code == 304:
+                    entry = self.page_cache.revalidated(key, path)
+                    if entry is not None:
+                        return entry.value
+                    response = await self._send(lambda: self.client.get(path, params=params))
+            else:
+                response = await self._send(lambda: self.client.get(path, params=params))
+            response.raise_for_status()
+            value = parse(response)
+            if self.page_cache:
+                self.page_cache.store(
+                    key,
+                    path,
+                    value,
+                    size=len(response.content),
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified")
+                )
+            return value
+
+        # The deadline of the caller only bounds its own wait, not a coalesced call
+        if self.singleflight is None:
+            return await within_deadline(request())
+        return await within_deadline(self.singleflight.do(key, request))
+
+    async def _send(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Issue a request, through the resilience layer when one is configured."""
+        if self.resilience is None:
+            return await send()
+        return await self.resilience.call(send)
+
+    def _parse_subfeddits(self, response: httpx.Response) -> List[Subfeddit]:
+        """Convert a subfeddits response into domain entities."""
+        if self.decoder == "fast":
+            return decode_subfeddits(response.content)
+
+        data = response.json()
+        
+        # Convert API response to domain entities
+        subfeddits = []
+        for subfeddit_data in data["subfeddits"]:  # Access the subfeddits key
+            subfeddit = Subfeddit(
+                id=subfeddit_data["id"],
+                username=subfeddit_data["username"],
+                title=subfeddit_data["title"],
+                description=subfeddit_data["description"]
+            )
+            subfeddits.append(subfeddit)
+        return subfeddits
+
+    def _parse_comments(self, response: httpx.Response, subfeddit_id: int) -> List[Comment]:
+        """Convert a comments response into domain entities."""
+        if self.decoder == "fast":
+            return decode_comments(response.content, subfeddit_id)
+
+        data = response.json()
+        
+        # Convert API response to domain entities
+        comments = []
+        # Check if data is a list or a dictionary with comments key
+        comment_data_list = data if isinstance(data, list) else data.get("comments", [])
+        
+        for comment_data in comment_data_list:
+            # Convert Unix timestamp to naive datetime
+            created_at = datetime.fromtimestamp(comment_data["created_at"])
+            comment = Comment(
+                id=comment_data["id"],
+                subfeddit_id=subfeddit_id,
+                username=comment_data["username"],
+                text=comment_data["text"],
+                created_at=created_at
+            )
+            comments.append(comment)
+        return comments
+
+    async def fetch_comments_range(
+        self,
+        subfeddit_id: int,
+        total: int,
+        page_size: int = 100,
+        concurrency: int = 8,
+        skip: int = 0
+    ) -> List[Comment]:
+        """Fetch a large range of comments by splitting it into concurrent pages.
+
+        The range ``[skip, skip + total)`` is split into ``skip``/``limit`` pages that
+        are fetched concurrently, with at most ``concurrency`` requests in flight.
+        Results keep the API order and duplicate comment ids (which can appear when
+        new comments shift the pages while they are being fetched) are dropped.
+
+        Args:
+            subfeddit_id: ID of the subfeddit.
+            total: Total number of comments to fetch.
+            page_size: Number of comments per request (1-100). Defaults to 100.
+            concurrency: Maximum number of requests in flight. Defaults to 8.
+            skip: Offset of the first comment to fetch. Defaults to 0.
+
+        Returns:
+            List of Comment objects in API order, without duplicates.
+
+        Raises:
+            httpx.HTTPError: If any page request fails.
+            ValueError: If total, page_size, concurrency or skip are out of range.
+        """
+        if total < 0:
+            raise ValueError("Total must be non-negative")
+        if not 1 <= page_size <= 100:
+            raise ValueError("Page size must be between 1 and 100")
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        if skip < 0:
+            raise ValueError("Skip must be non-negative")
+
+        self.logger.info(
+            "Fetching comment range",
+            subfeddit_id=subfeddit_id,
+            total=total,
+            page_size=page_size,
+            concurrency=concurrency,
+            skip=skip
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(page_skip: int, page_limit: int) -> List[Comment]:
+            async with semaphore:
+                return await self.get_comments(
+                    subfeddit_id=subfeddit_id,
+                    limit=page_limit,
+                    skip=page_skip
+                )
+
+        pages = [
+            (page_skip, min(page_size, skip + total - page_skip))
+            for page_skip in range(skip, skip + total, page_size)
+        ]
+        results = await asyncio.gather(
+            *(fetch_page(page_skip, page_limit) for page_skip, page_limit in pages)
+        )
+
+        comments = []
+        seen_ids = set()
+        for page in results:
+            for comment in page:
+                if comment.id in seen_ids:
+                    continue
+                seen_ids.add(comment.id)
+                comments.append(comment)
+
+        self.logger.info(
+            "Successfully fetched comment range",
+            subfeddit_id=subfeddit_id,
+            page_count=len(pages),
+            comment_count=len(comments),
+            duplicates_dropped=sum(len(page) for page in results) - len(comments)
+        )
+        return comments
+
+    async def aiter_comments(
+        self,
+        subfeddit_id: int,
+        start_skip: int = 0,
+        page_size: int = 100,
+        prefetch: int = 2,
+        max_comments: Optional[int] = None
+    ) -> AsyncIterator[Comment]:
+        """Stream comments page by page with bounded read-ahead.
+
+        A background task fetches pages sequentially while the caller consumes
+        them, holding at most ``prefetch`` pages that have not been consumed yet.
+        Memory therefore stays constant regardless of how many comments are read,
+        and fetching overlaps with whatever the caller does with each comment.
+        The stream ends when the API returns a short page or ``max_comments``
+        have been yielded.
+
+        Args:
+            subfeddit_id: ID of the subfeddit.
+            start_skip: Offset of the first comment to read. Defaults to 0.
+            page_size: Number of comments per request (1-100). Defaults to 100.
+            prefetch: Maximum number of pages fetched ahead of the consumer. Defaults to 2.
+            max_comments: Optional cap on the number of comments yielded.
+
+        Yields:
+            Comment objects in API order.
+
+        Raises:
+            httpx.HTTPError: If a page request fails.
+            ValueError: If page_size, prefetch, start_skip or max_comments are out of range.
+        """
+        if not 1 <= page_size <= 100:
+            raise ValueError("Page size must be between 1 and 100")
+        if prefetch < 1:
+            raise ValueError("Prefetch must be at least 1")
+        if start_skip < 0:
+            raise ValueError("Skip must be non-negative")
+        if max_comments is not None and max_comments < 0:
+            raise ValueError("Max comments must be non-negative")
+
+        pages: asyncio.Queue = asyncio.Queue()
+        slots = asyncio.Semaphore(prefetch)
+
+        async def produce() -> None:
+            skip = start_skip
+            remaining = max_comments
+            try:
+                while remaining is None or remaining > 0:
+                    await slots.acquire()
+                    limit = page_size if remaining is None else min(page_size, remaining)
+                    page = await self.get_comments(
+                        subfeddit_id=subfeddit_id,
+                        limit=limit,
+                        skip=skip
+                    )
+                    await pages.put(page)
+                    if len(page) < limit:
+                        break
+                    skip += limit
+                    if remaining is not None:
+                        remaining -= len(page)
+            except Exception as e:
+                await pages.put(e)
+                return
+            await pages.put(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                page = await pages.get()
+                if page is None:
+                    break
+                if isinstance(page, Exception):
+                    raise page
+                for comment in page:
+                    yield comment
+                slots.release()
+        finally:
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
+
+    async def warm_up(self) -> None:
+        """Open a pooled connection to the Feddit API ahead of the first request.
+
+        Failures are logged and swallowed so that an unavailable Feddit API does not
+        prevent the application from starting.
+        """
+        try:
+            response = await self.client.get(
+                "/api/v1/subfeddits/",
+                params={"limit": 1, "skip": 0}
+            )
+            response.raise_for_status()
+            self.logger.info("Feddit client warmed up")
+        except httpx.HTTPError as e:
+            self.logger.warning("Failed to warm up Feddit client", error=str(e))
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the counters of the configured coalescing, caching and resilience layers.
+
+        Returns:
+            Dictionary keyed by layer name with that layer's counters.
+        """
+        stats = {}
+        if self.singleflight:
+            stats["coalescing"] = self.singleflight.stats()
+        if self.page_cache:
+            stats["page_cache"] = self.page_cache.stats()
+        if self.resilience:
+            stats["resilience"] = self.resilience.stats()
+        return stats
+
     async def close(self):
         """Close the HTTP client."""
         await self.client.aclose()
@@ -0,0 +1,95 @@
+"""Schema-compiled decoding of Feddit responses into domain entities."""
+from datetime import datetime
+from typing import Annotated, List, TypedDict, Union
+
+from pydantic import Field, StringConstraints, TypeAdapter
+
+from sentiment_analysis.domain.entities.comment import Comment
+from sentiment_analysis.domain.entities.subfeddit import Subfeddit
+
+PositiveInt = Annotated[int, Field(gt=0)]
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+
+class _RawComment(TypedDict):
+    """Comment as returned by the Feddit API."""
+    id: PositiveInt
+    username: NonEmptyStr
+    text: NonEmptyStr
+    created_at: int
+
+
+class _CommentsPage(TypedDict):
+    """Response body of ``/api/v1/comments/``."""
+    comments: List[_RawComment]
+
+
+class _RawSubfeddit(TypedDict):
+    """Subfeddit as returned by the Feddit API."""
+    id: PositiveInt
+    username: NonEmptyStr
+    title: NonEmptyStr
+    description: str
+
+
+class _SubfedditsPage(TypedDict):
+    """Response body of ``/api/v1/subfeddits/``."""
+    subfeddits: List[_RawSubfeddit]
+
+
+_comments_adapter = TypeAdapter(Union[_CommentsPage, List[_RawComment]])
+_subfeddits_adapter = TypeAdapter(_SubfedditsPage)
+
+
+def decode_comments(content: bytes, subfeddit_id: int) -> List[Comment]:
+    """Decode a comments response body into Comment entities.
+
+    The whole page is parsed and validated from bytes in a single schema-compiled
+    call, enforcing the same constraints as ``Comment`` (positive ids, stripped
+    non-empty strings), so malformed pages fail before any entity is built.
+    Timestamps are converted per comment with ``datetime.fromtimestamp``.
+
+    Args:
+        content: Raw response body.
+        subfeddit_id: ID of the subfeddit the comments belong to.
+
+    Returns:
+        List of Comment objects.
+
+    Raises:
+        pydantic.ValidationError: If the body does not match the expected schema.
+    """
+    if subfeddit_id <= 0:
+        raise ValueError("subfeddit_id must be a positive integer")
+    data = _comments_adapter.validate_json(content)
+    raw_comments = data if isinstance(data, list) else data["comments"]
+    return [
+        Comment(
+            id=raw["id"],
+            subfeddit_id=subfeddit_id,
+            username=raw["username"],
+            text=raw["text"],
+            # Naive local datetime, matching the standard path
+            created_at=datetime.fromtimestamp(raw["created_at"])
+        )
+        for raw in raw_comments
+    ]
+
+
+def decode_subfeddits(content: bytes) -> List[Subfeddit]:
+    """Decode a subfeddits response body into Subfeddit entities.
+
+    Args:
+        content: Raw response body.
+
+    Returns:
+        List of Subfeddit objects.
+
+    Raises:
+        pydantic.ValidationError: If the body does not match the expected schema.
+    """
+    data = _subfeddits_adapter.validate_json(content)
+    return [
+        Subfeddit(**raw)
+        for raw in data["subfeddits"]
+    ]
@@ -0,0 +1,172 @@
+"""Bounded LRU + TTL cache for parsed Feddit API pages."""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional
+
+
+@dataclass
+class CacheEntry:
+    """A cached, already parsed response page."""
+    value: Any
+    size: int
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry can be served without revalidation."""
+        return time.monotonic() < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers used to revalidate the entry with the server."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """Byte-size bounded LRU cache of parsed pages with per-endpoint TTLs.
+
+    Entries are keyed by ``(endpoint, params)`` and hold the parsed value, so a hit
+    skips both the network hop and entity construction. Expired entries are kept
+    until evicted so that they can be revalidated with ``ETag``/``Last-Modified``
+    when the server supports conditional requests.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 32 * 1024 * 1024,
+        default_ttl: float = 30.0,
+        endpoint_ttls: Optional[Dict[str, float]] = None
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Maximum total size of cached response bodies in bytes.
+            default_ttl: TTL in seconds for endpoints without a specific TTL.
+            endpoint_ttls: Optional mapping of endpoint path to TTL in seconds.
+        """
+        if max_bytes < 1:
+            raise ValueError("Max bytes must be at least 1")
+        self._max_bytes = max_bytes
+        self._default_ttl = default_ttl
+        self._endpoint_ttls = endpoint_ttls or {}
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Get the TTL for an endpoint.
+
+        Args:
+            endpoint: Endpoint path.
+
+        Returns:
+            TTL in seconds.
+        """
+        return self._endpoint_ttls.get(endpoint, self._default_ttl)
+
+    def lookup(self, key: Hashable) -> Optional[CacheEntry]:
+        """Look up an entry, counting a hit only when it is fresh.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The entry (fresh or expired) if present, None otherwise.
+        """
+        entry = self._entries.get(key)
+        if entry is None or not entry.fresh:
+            self.misses += 1
+            return entry
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def store(
+        self,
+        key: Hashable,
+        endpoint: str,
+        value: Any,
+        size: int,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """Store a parsed page.
+
+        Args:
+            key: Cache key.
+            endpoint: Endpoint path, used to pick the TTL.
+            value: Parsed value to cache.
+            size: Size of the response body in bytes.
+            etag: Optional ``ETag`` response header.
+            last_modified: Optional ``Last-Modified`` response header.
+        """
+        if size > self._max_bytes:
+            return
+        self._discard(key)
+        self._entries[key] = CacheEntry(
+            value=value,
+            size=size,
+            expires_at=time.monotonic() + self.ttl_for(endpoint),
+            etag=etag,
+            last_modified=last_modified
+        )
+        self._bytes += size
+        while self._bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.evictions += 1
+
+    def revalidated(self, key: Hashable, endpoint: str) -> Optional[CacheEntry]:
+        """Mark an entry as still valid after a ``304 Not Modified`` response.
+
+        Args:
+            key: Cache key.
+            endpoint: Endpoint path, used to pick the TTL.
+
+        Returns:
+            The refreshed entry, or None if it was evicted meanwhile.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        entry.expires_at = time.monotonic() + self.ttl_for(endpoint)
+        self._entries.move_to_end(key)
+        self.revalidations += 1
+        return entry
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit, miss, revalidation and eviction counters and the
+            current number of entries and bytes.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes
+        }
+
+    def _discard(self, key: Hashable) -> None:
+        """Remove an entry if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
@@ -0,0 +1,299 @@
+"""Timeouts, retries, hedging and circuit breaking for idempotent HTTP calls."""
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Awaitable, Callable, Dict, Iterable, Optional
+
+import httpx
+
+from sentiment_analysis.logger import configure_logger
+
+Send = Callable[[], Awaitable[httpx.Response]]
+
+
+class CircuitOpenError(httpx.HTTPError):
+    """Raised when a call is rejected because the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Fails fast while an upstream service keeps failing.
+
+    The breaker is ``closed`` while calls succeed. After ``failure_threshold``
+    consecutive failures it opens and rejects calls for ``reset_timeout`` seconds,
+    then lets a single probe call through (``half_open``): a success closes the
+    breaker again, a failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker.
+            reset_timeout: Seconds the breaker stays open before a probe is allowed.
+        """
+        if failure_threshold < 1:
+            raise ValueError("Failure threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.rejections = 0
+        self.opens = 0
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the timeout elapsed."""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probing = False
+        return self._state
+
+    def before_call(self) -> None:
+        """Check whether a call may proceed.
+
+        Raises:
+            CircuitOpenError: If the breaker is open or a half-open probe is running.
+        """
+        state = self.state
+        if state == self.OPEN or (state == self.HALF_OPEN and self._probing):
+            self.rejections += 1
+            raise CircuitOpenError("Circuit breaker is open, upstream is unhealthy")
+        if state == self.HALF_OPEN:
+            self._probing = True
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the breaker."""
+        self._state = self.CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def release_probe(self) -> None:
+        """Allow a new half-open probe after the current one ended without outcome."""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker when the threshold is reached."""
+        self._failures += 1
+        self._probing = False
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != self.OPEN:
+                self.opens += 1
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+
+
+class ResilientExecutor:
+    """Runs idempotent requests with timeouts, retries, hedging and a circuit breaker.
+
+    Every attempt is bounded by ``timeout``. Transport errors, timeouts and
+    retryable status codes are retried up to ``max_retries`` times with
+    decorrelated jitter backoff. When hedging is enabled, a duplicate request is
+    sent if the first one has not answered after the observed latency quantile
+    (``hedge_quantile``, p95 by default) and the first response wins. Each logical
+    call is reported once to the circuit breaker.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        max_retries: int = 2,
+        backoff_base: float = 0.05,
+        backoff_cap: float = 1.0,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        hedge: bool = False,
+        hedge_delay: float = 0.05,
+        hedge_quantile: float = 0.95,
+        latency_window: int = 200,
+        min_latency_samples: int = 20,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        """Initialize the executor.
+
+        Args:
+            timeout: Seconds each attempt may take.
+            max_retries: Retries after the first attempt.
+            backoff_base: Minimum backoff between retries in seconds.
+            backoff_cap: Maximum backoff between retries in seconds.
+            retry_statuses: Response status codes that are retried.
+            hedge: Whether to send a hedged duplicate for slow attempts.
+            hedge_delay: Hedge delay used until enough latencies were observed.
+            hedge_quantile: Latency quantile used as the hedge delay.
+            latency_window: Number of recent latencies kept for the quantile.
+            min_latency_samples: Latencies needed before the quantile is used.
+            breaker: Optional circuit breaker.
+        """
+        if max_retries < 0:
+            raise ValueError("Max retries must not be negative")
+        if not 0 < hedge_quantile < 1:
+            raise ValueError("Hedge quantile must be between 0 and 1")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.retry_statuses = frozenset(retry_statuses)
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay
+        self.hedge_quantile = hedge_quantile
+        self.min_latency_samples = min_latency_samples
+        self.breaker = breaker
+        self._latencies: deque = deque(maxlen=latency_window)
+        self.calls = 0
+        self.attempts = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.failures = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.logger = configure_logger().bind(service="resilient_executor")
+
+    async def call(self, send: Send) -> httpx.Response:
+        """Send a request through the resilience layer.
+
+        Args:
+            send: Zero-argument coroutine function issuing the request.
+
+        Returns:
+            The response of the first successful attempt, or the last response with
+            a retryable status once retries are exhausted.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker rejects the call.
+            httpx.HTTPError: If the last attempt failed with a transport error or
+                timed out.
+        """
+        if self.breaker:
+            self.breaker.before_call()
+        self.calls += 1
+        try:
+            return await self._retrying(send)
+        except BaseException:
+            # Cancelled or unexpected errors leave no outcome; free a half-open probe
+            if self.breaker:
+                self.breaker.release_probe()
+            raise
+
+    def current_hedge_delay(self) -> float:
+        """Get the delay after which a hedged request is sent.
+
+        Returns:
+            The configured latency quantile of recent attempts, or the fallback
+            delay until enough latencies were observed.
+        """
+        if len(self._latencies) < self.min_latency_samples:
+            return self.hedge_delay
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(self.hedge_quantile * len(ordered)))]
+
+    def stats(self) -> Dict[str, object]:
+        """Get the resilience counters.
+
+        Returns:
+            Dictionary with call, attempt, retry, timeout, failure and hedge counters,
+            the current hedge delay and the circuit breaker state.
+        """
+        stats = {
+            "calls": self.calls,
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "hedge_delay": self.current_hedge_delay()
+        }
+        if self.breaker:
+            stats.update(
+                breaker_state=self.breaker.state,
+                breaker_opens=self.breaker.opens,
+                breaker_rejections=self.breaker.rejections
+            )
+        return stats
+
+    async def _retrying(self, send: Send) -> httpx.Response:
+        """Run attempts until one succeeds or the retries are exhausted."""
+        delay = self.backoff_base
+        attempt = 0
+        while True:
+            last_attempt = attempt == self.max_retries
+            try:
+                response = await self._hedged(send)
+            except httpx.TransportError as e:
+                if last_attempt:
+                    self._record(success=False)
+                    raise
+                self.logger.warning("Retrying failed request", attempt=attempt + 1, error=str(e))
+            else:
+                if response.status_code not in self.retry_statuses:
+                    self._record(success=True)
+                    return response
+                if last_attempt:
+                    self._record(success=False)
+                    return response
+                self.logger.warning(
+                    "Retrying request", attempt=attempt + 1, status_code=response.status_code
+                )
+            attempt += 1
+            self.retries += 1
+            # Decorrelated jitter: sleep = min(cap, uniform(base, 3 * previous sleep))
+            delay = min(self.backoff_cap, random.uniform(self.backoff_base, delay * 3))
+            await asyncio.sleep(delay)
+
+    def _record(self, success: bool) -> None:
+        """Report the outcome of a logical call to the breaker."""
+        if not success:
+            self.failures += 1
+        if self.breaker:
+            if success:
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure()
+
+    async def _hedged(self, send: Send) -> httpx.Response:
+        """Run one attempt, sending a hedged duplicate if it is slow."""
+        if not self.hedge:
+            return await self._timed(send)
+
+        primary = asyncio.ensure_future(self._timed(send))
+        tasks = [primary]
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.current_hedge_delay())
+            if not done:
+                self.hedges += 1
+                tasks.append(asyncio.ensure_future(self._timed(send)))
+                pending.add(tasks[-1])
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            # Wait for the losers to unwind so that their connections are released
+            # and their errors are retrieved
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _timed(self, send: Send) -> httpx.Response:
+        """Run a single request bounded by the timeout, recording its latency."""
+        self.attempts += 1
+        started = time.monotonic()
+        try:
+            response = await asyncio.wait_for(send(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise httpx.TimeoutException(f"Request timed out after {self.timeout}s")
+        self._latencies.append(time.monotonic() - started)
+        return response
@@ -0,0 +1,77 @@
+"""Request coalescing for identical concurrent calls."""
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into a single execution.
+
+    The first caller for a key starts the call; callers arriving while it is still
+    in flight wait for the same result (or exception) instead of issuing their own.
+    A waiter that is cancelled only stops waiting: the shared call keeps running
+    for the remaining waiters and is cancelled once nobody is waiting for it.
+    """
+
+    def __init__(self):
+        """Initialize the coalescing group."""
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        self.issued = 0
+        self.coalesced = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get the coalescing counters.
+
+        Returns:
+            Dictionary with the number of issued and coalesced calls and the
+            number of calls currently in flight.
+        """
+        return {
+            "issued": self.issued,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls)
+        }
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` unless a call with the same key is already in flight.
+
+        Args:
+            key: Key identifying identical calls.
+            fn: Zero-argument coroutine function performing the call.
+
+        Returns:
+            The result of the shared call.
+
+        Raises:
+            Exception: Whatever the shared call raised.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda _: self._forget(key, task))
+            self.issued += 1
+        else:
+            self.coalesced += 1
+
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done() and self._calls.get(key) is task:
+                self._waiters[key] -= 1
+                if self._waiters[key] == 0:
+                    task.cancel()
+            raise
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        """Remove a finished call so that later calls start a fresh one."""
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every waiter was cancelled
+            task.exception()
+        if self._calls.get(key) is task:
+            del self._calls[key]
+            del self._waiters[key]
@@ -0,0 +1,181 @@
+"""In-memory catalog of Feddit subfeddits indexed by title."""
+import asyncio
+import contextlib
+import time
+from typing import Dict, List, Optional
+
+from sentiment_analysis.domain.entities.subfeddit import Subfeddit
+from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient
+from sentiment_analysis.logger import configure_logger
+
+
+class SubfedditCatalog:
+    """TTL-cached catalog of every subfeddit with O(1) lookups by title and ID.
+
+    The whole subfeddit list is paged through once and kept in dict indexes. Once
+    loaded, lookups never touch the network: the catalog is refreshed in the
+    background, either by the periodic task started with :meth:`start` or, when a
+    lookup finds the data older than the TTL, by a one-off background refresh while
+    the current data keeps being served. A title that is not in the catalog triggers
+    one immediate refresh, at most every ``miss_refresh_interval`` seconds, so that
+    subfeddits created since the last refresh are found. Refreshes always revalidate
+    the pages with the API instead of reading them from the page cache.
+    """
+
+    def __init__(
+        self,
+        feddit_client: FedditClient,
+        ttl: float = 300.0,
+        page_size: int = 100,
+        case_insensitive: bool = False,
+        miss_refresh_interval: float = 10.0
+    ):
+        """Initialize the catalog.
+
+        Args:
+            feddit_client: Client used to list subfeddits.
+            ttl: Seconds after which the catalog is refreshed. Defaults to 300.
+            page_size: Number of subfeddits requested per page. Defaults to 100.
+            case_insensitive: Whether title lookups ignore case. Defaults to False.
+            miss_refresh_interval: Minimum age in seconds of the catalog before a
+                title lookup miss refreshes it. Defaults to 10.
+        """
+        self._feddit_client = feddit_client
+        self._ttl = ttl
+        self._page_size = page_size
+        self._case_insensitive = case_insensitive
+        self._miss_refresh_interval = miss_refresh_interval
+        self._by_title: Dict[str, Subfeddit] = {}
+        self._by_id: Dict[int, Subfeddit] = {}
+        self._loaded_at: Optional[float] = None
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._periodic_task: Optional[asyncio.Task] = None
+        self.logger = configure_logger().bind(service="subfeddit_catalog")
+
+    async def start(self) -> None:
+        """Load the catalog and keep it refreshed every TTL in the background.
+
+        A failed initial load is logged; the catalog is then loaded on first lookup.
+        """
+        await self._refresh_quietly()
+        if self._periodic_task is None:
+            self._periodic_task = asyncio.create_task(self._refresh_periodically())
+
+    async def close(self) -> None:
+        """Stop any background refresh."""
+        for task in (self._periodic_task, self._refresh_task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._periodic_task = None
+        self._refresh_task = None
+
+    async def refresh(self) -> None:
+        """Page through every subfeddit and rebuild the indexes.
+
+        Raises:
+            httpx.HTTPError: If a page request fails. The previous data is kept.
+        """
+        async with self._refresh_lock:
+            await self._load()
+
+    async def _load(self) -> None:
+        """Page through every subfeddit and rebuild the indexes; the caller holds the lock."""
+        subfeddits: List[Subfeddit] = []
+        skip = 0
+        while True:
+            page = await self._feddit_client.get_subfeddits(
+                limit=self._page_size,
+                skip=skip,
+                revalidate=True
+            )
+            subfeddits.extend(page)
+            if len(page) < self._page_size:
+                break
+            skip += self._page_size
+
+        self._by_title = {self._key(s.title): s for s in subfeddits}
+        self._by_id = {s.id: s for s in subfeddits}
+        self._loaded_at = time.monotonic()
+        self.logger.info("Refreshed subfeddit catalog", count=len(subfeddits))
+
+    async def get_by_title(self, title: str) -> Optional[Subfeddit]:
+        """Look up a subfeddit by title.
+
+        Args:
+            title: Title of the subfeddit.
+
+        Returns:
+            Subfeddit entity if found, None otherwise.
+
+        Raises:
+            httpx.HTTPError: If the catalog has never been loaded and loading fails.
+        """
+        await self._ensure_fresh()
+        key = self._key(title)
+        subfeddit = self._by_title.get(key)
+        if subfeddit is None and self._may_refresh_on_miss():
+            await self._refresh_on_miss()
+            subfeddit = self._by_title.get(key)
+        return subfeddit
+
+    async def get_by_id(self, subfeddit_id: int) -> Optional[Subfeddit]:
+        """Look up a subfeddit by ID.
+
+        Args:
+            subfeddit_id: ID of the subfeddit.
+
+        Returns:
+            Subfeddit entity if found, None otherwise.
+
+        Raises:
+            httpx.HTTPError: If the catalog has never been loaded and loading fails.
+        """
+        await self._ensure_fresh()
+        return self._by_id.get(subfeddit_id)
+
+    def _key(self, title: str) -> str:
+        """Normalize a title into an index key."""
+        return title.casefold() if self._case_insensitive else title
+
+    async def _ensure_fresh(self) -> None:
+        """Load the catalog on first use and schedule a refresh once it is stale."""
+        if self._loaded_at is None:
+            await self.refresh()
+            return
+        stale = time.monotonic() - self._loaded_at > self._ttl
+        if stale and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(self._refresh_quietly())
+
+    def _may_refresh_on_miss(self) -> bool:
+        """Tell whether the catalog is old enough for a lookup miss to refresh it."""
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at >= self._miss_refresh_interval
+        )
+
+    async def _refresh_on_miss(self) -> None:
+        """Refresh the catalog after a lookup miss, logging instead of raising on failure."""
+        async with self._refresh_lock:
+            # Lookups that missed together wait here; the first one refreshes
+            if not self._may_refresh_on_miss():
+                return
+            try:
+                await self._load()
+            except Exception as e:
+                self.logger.warning("Failed to refresh subfeddit catalog", error=str(e))
+
+    async def _refresh_quietly(self) -> None:
+        """Refresh the catalog, logging instead of raising on failure."""
+        try:
+            await self.refresh()
+        except Exception as e:
+            self.logger.warning("Failed to refresh subfeddit catalog", error=str(e))
+
+    async def _refresh_periodically(self) -> None:
+        """Refresh the catalog every TTL until cancelled."""
+        while True:
+            await asyncio.sleep(self._ttl)
+            await self._refresh_quietly()
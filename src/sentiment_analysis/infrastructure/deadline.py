@@ -0,0 +1,88 @@
+"""Request-scoped deadlines shared by every call made on behalf of a request."""
+import asyncio
+import contextlib
+import time
+from contextvars import ContextVar
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Monotonic time at which the current request gives up; tasks inherit it from
+# the context they were created in
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """Raised when the latency budget of a request is spent."""
+
+
+@contextlib.contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """Bound the calls made within the block by a latency budget.
+
+    A nested deadline can only shorten the budget of the enclosing one.
+
+    Args:
+        seconds: Budget in seconds, or None for no additional bound.
+
+    Raises:
+        ValueError: If the budget is not positive.
+    """
+    if seconds is None:
+        yield
+        return
+    if seconds <= 0:
+        raise ValueError("Deadline must be positive")
+    expires = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(expires if current is None else min(current, expires))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Get the seconds left until the current deadline.
+
+    Returns:
+        The remaining budget (0.0 once expired), or None without a deadline.
+    """
+    expires = _deadline.get()
+    if expires is None:
+        return None
+    return max(0.0, expires - time.monotonic())
+
+
+def expired() -> bool:
+    """Tell whether the current deadline has passed."""
+    return remaining() == 0.0
+
+
+async def within_deadline(awaitable: Awaitable[T]) -> T:
+    """Await a call, cancelling it when the current deadline expires.
+
+    Args:
+        awaitable: Call to bound.
+
+    Returns:
+        The result of the call.
+
+    Raises:
+        DeadlineExceeded: If the deadline expired first; the call is cancelled.
+    """
+    budget = remaining()
+    if budget is None:
+        return await awaitable
+    if budget == 0.0:
+        # Close the coroutine so that it does not warn about never being awaited
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceeded("Request deadline exceeded")
+    try:
+        return await asyncio.wait_for(awaitable, timeout=budget)
+    except asyncio.TimeoutError:
+        if not expired():
+            # The call timed out on its own
+            raise
+        raise DeadlineExceeded("Request deadline exceeded") from None
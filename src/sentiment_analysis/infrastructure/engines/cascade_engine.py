@@ -0,0 +1,186 @@
+"""Confidence-based cascade of a fast local engine and an accurate LLM engine."""
+from typing import Any, AsyncIterator, Dict, List, Tuple, Union
+
+from sentiment_analysis.domain.entities.analysis_outcome import (
+    AnalysisFailure,
+    AnalysisOutcome,
+    PartialAnalysisError,
+)
+from sentiment_analysis.domain.entities.comment import Comment
+from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
+from sentiment_analysis.domain.services.analyzer_engine import AnalyzerEngine
+from sentiment_analysis.infrastructure.sentiment_analyzer import is_retryable
+from sentiment_analysis.logger import configure_logger
+
+
+class CascadeSentimentEngine(AnalyzerEngine):
+    """Answers confident comments with a fast engine and escalates the rest.
+
+    Every comment is scored by the fast engine first; the magnitude of its score
+    is used as its confidence. Comments below ``threshold`` are analyzed again by
+    the accurate engine in a single call, and the results are merged back in the
+    order of the comments. The ``engine`` field of each analysis records which
+    tier answered it.
+
+    The cascade does not own its engines: warming them up and closing them is
+    left to whoever created them.
+    """
+
+    name = "cascade"
+
+    def __init__(self, fast: AnalyzerEngine, accurate: AnalyzerEngine, threshold: float = 0.5):
+        """Initialize the cascade.
+
+        Args:
+            fast: Cheap engine that scores every comment.
+            accurate: Expensive engine for the comments the fast engine is unsure of.
+            threshold: Minimum absolute fast score (0-1) for the fast answer to be kept.
+
+        Raises:
+            ValueError: If the threshold is outside [0, 1].
+        """
+        if not 0 <= threshold <= 1:
+            raise ValueError("Threshold must be between 0 and 1")
+        self.fast = fast
+        self.accurate = accurate
+        self.threshold = threshold
+        self.comments = 0
+        self.escalated = 0
+        self.logger = configure_logger().bind(service="cascade_engine")
+
+    async def analyze(self, comments: List[Comment]) -> List[SentimentAnalysis]:
+        """Analyze sentiment for a list of comments.
+
+        Args:
+            comments: List of comments to analyze.
+
+        Returns:
+            List of SentimentAnalysis objects in the order of the comments.
+
+        Raises:
+            PartialAnalysisError: If the accurate engine failed some or all of the
+                escalated comments; it carries every other analysis.
+            Exception: If the accurate engine fails and every comment was escalated.
+        """
+        analyses, uncertain = await self._triage(comments)
+        if not uncertain:
+            return analyses
+        try:
+            escalated = await self.accurate.analyze([comments[index] for index in uncertain])
+        except PartialAnalysisError as e:
+            # Keep the fast answers and the escalations that succeeded
+            answered = {analysis.comment_id: analysis for analysis in e.outcome.analyses}
+            failed = {failure.comment_id for failure in e.outcome.failures}
+            raise PartialAnalysisError(AnalysisOutcome(
+                analyses=[
+                    answered.get(analysis.comment_id, analysis)
+                    for analysis in analyses
+                    if analysis.comment_id not in failed
+                ],
+                failures=e.outcome.failures
+            )) from e
+        except Exception as e:
+            # The accurate engine failed outright or ran out of time: the
+            # confident fast answers still stand
+            if len(uncertain) == len(comments):
+                raise
+            self.logger.warning(
+                "Accurate engine failed, keeping confident fast answers",
+                escalated=len(uncertain),
+                error=str(e)
+            )
+            escalated_indexes = set(uncertain)
+            raise PartialAnalysisError(AnalysisOutcome(
+                analyses=[
+                    analysis for index, analysis in enumerate(analyses)
+                    if index not in escalated_indexes
+                ],
+                failures=[
+                    AnalysisFailure(
+                        comment_id=comments[index].id,
+                        error_type=type(e).__name__,
+                        message=str(e),
+                        attempts=1,
+                        retryable=is_retryable(e)
+                    )
+                    for index in uncertain
+                ]
+            )) from e
+        for index, analysis in zip(uncertain, escalated):
+            analyses[index] = analysis
+        return analyses
+
+    async def analyze_stream(
+        self, comments: List[Comment]
+    ) -> AsyncIterator[Union[SentimentAnalysis, AnalysisFailure]]:
+        """Analyze sentiment for a list of comments, yielding results as they complete.
+
+        Confident fast answers are yielded right away, before the escalated
+        comments are streamed from the accurate engine.
+
+        Args:
+            comments: List of comments to analyze.
+
+        Yields:
+            The analysis or the failure of each comment.
+        """
+        analyses, uncertain = await self._triage(comments)
+        escalated = set(uncertain)
+        for index, analysis in enumerate(analyses):
+            if index not in escalated:
+                yield analysis
+        if uncertain:
+            async for result in self.accurate.analyze_stream([comments[index] for index in uncertain]):
+                yield result
+
+    def reuses(self, analysis: SentimentAnalysis) -> bool:
+        """Tell whether a stored analysis can stand in for analyzing its comment again.
+
+        Answers of the accurate engine are reused, and so are answers of the fast
+        engine that are confident enough not to have been escalated.
+
+        Args:
+            analysis: Stored analysis of a comment.
+
+        Returns:
+            True if the cascade would have kept the analysis.
+        """
+        if self.accurate.reuses(analysis):
+            return True
+        return self.fast.reuses(analysis) and abs(analysis.sentiment_score) >= self.threshold
+
+    async def _triage(self, comments: List[Comment]) -> Tuple[List[SentimentAnalysis], List[int]]:
+        """Score comments with the fast engine and find the uncertain ones.
+
+        Returns:
+            The fast analyses, and the indexes of the comments to escalate.
+        """
+        analyses = await self.fast.analyze(comments)
+        uncertain = [
+            index for index, analysis in enumerate(analyses)
+            if abs(analysis.sentiment_score) < self.threshold
+        ]
+        self.comments += len(comments)
+        self.escalated += len(uncertain)
+        self.logger.info(
+            "Cascade scored comments",
+            total_comments=len(comments),
+            escalated=len(uncertain),
+            threshold=self.threshold
+        )
+        return analyses, uncertain
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the cascade counters.
+
+        Returns:
+            Dictionary with the threshold, the number of comments, how many were
+            answered by each tier and the escalation rate.
+        """
+        return {
+            "threshold": self.threshold,
+            "comments": self.comments,
+            "fast_answered": self.comments - self.escalated,
+            "escalated": self.escalated,
+            "escalation_rate": self.escalated / self.comments if self.comments else 0.0
+        }
@@ -0,0 +1,290 @@
+"""Sentiment engine scoring comment embeddings with a local NumPy head."""
+import asyncio
+import base64
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from openai import AsyncOpenAI, OpenAIError
+
+from sentiment_analysis.config import (
+    OPENAI_API_KEY,
+    OPENAI_BASE_URL,
+    SENTIMENT_EMBEDDING_BATCH_SIZE,
+    SENTIMENT_EMBEDDING_CACHE_MAX_ENTRIES,
+    SENTIMENT_EMBEDDING_MODEL,
+)
+from sentiment_analysis.domain.entities.comment import Comment
+from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
+from sentiment_analysis.domain.services.analyzer_engine import AnalyzerEngine
+from sentiment_analysis.infrastructure.deadline import within_deadline
+from sentiment_analysis.infrastructure.engines.embedding_head import EmbeddingHead
+from sentiment_analysis.infrastructure.result_cache import result_key
+from sentiment_analysis.logger import configure_logger
+
+# Maximum number of inputs the embeddings endpoint accepts per request
+MAX_BATCH_SIZE = 2048
+
+
+class EmbeddingCache:
+    """LRU cache of embeddings keyed by the content address of their text."""
+
+    def __init__(self, max_entries: int = 50_000):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached embeddings.
+
+        Raises:
+            ValueError: If max_entries is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("Max entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Look up the embedding of a key."""
+        vector = self._entries.get(key)
+        if vector is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return vector
+
+    def put(self, key: str, vector: np.ndarray) -> None:
+        """Store an embedding, evicting the least recently used ones."""
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, float]:
+        """Get the hit, miss and eviction counters and the number of entries."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries)
+        }
+
+
+class EmbeddingSentimentEngine(AnalyzerEngine):
+    """Scores comments by embedding them and applying a fitted linear head.
+
+    Texts missing from the embedding cache are deduplicated and sent to the
+    embeddings endpoint in requests of up to ``batch_size`` inputs, a few requests
+    at a time. Embeddings are requested as base64 and decoded straight into a
+    float32 matrix, which the head scores with a single matrix-vector product.
+    One embedding request replaces hundreds of chat requests, at a fraction of
+    their cost.
+    """
+
+    name = "embedding"
+
+    def __init__(
+        self,
+        head: Optional[EmbeddingHead] = None,
+        head_path: Optional[str] = None,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = OPENAI_BASE_URL,
+        model: str = SENTIMENT_EMBEDDING_MODEL,
+        dimensions: Optional[int] = None,
+        batch_size: int = SENTIMENT_EMBEDDING_BATCH_SIZE,
+        concurrency: int = 4,
+        cache: Optional[EmbeddingCache] = None,
+        client: Optional[AsyncOpenAI] = None
+    ):
+        """Initialize the engine.
+
+        Args:
+            head: Fitted head. Loaded from head_path if not provided; without a
+                head the engine can embed but not analyze.
+            head_path: ``.npz`` file written by ``EmbeddingHead.save``.
+            api_key: OpenAI API key. If not provided, will be loaded from environment.
+            base_url: Optional OpenAI-compatible endpoint, e.g. a local stand-in.
+            model: Embedding model.
+            dimensions: Embedding size to request, or None for the model default.
+            batch_size: Maximum number of inputs per embeddings request.
+            concurrency: Maximum number of embeddings requests in flight.
+            cache: Embedding cache. A default-sized one is created if not provided.
+            client: OpenAI client to use instead of creating one; it is not closed
+                by the engine.
+
+        Raises:
+            ValueError: If the batch size or concurrency is out of range, if the
+                head was fitted on another model, or if no API key is available.
+        """
+        if not 1 <= batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"Batch size must be between 1 and {MAX_BATCH_SIZE}")
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        self.model = model
+        self.dimensions = dimensions
+        self.batch_size = batch_size
+        self.cache = cache or EmbeddingCache(SENTIMENT_EMBEDDING_CACHE_MAX_ENTRIES)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.head: Optional[EmbeddingHead] = None
+        if head is None and head_path:
+            head = EmbeddingHead.load(head_path)
+        if head is not None:
+            self.set_head(head)
+        self._owns_client = client is None
+        if client is None:
+            try:
+                client = AsyncOpenAI(api_key=api_key or OPENAI_API_KEY, base_url=base_url)
+            except OpenAIError as e:
+                raise ValueError("API key is required") from e
+        self.client = client
+        self.comments = 0
+        self.requests = 0
+        self.embedded = 0
+        self.logger = configure_logger().bind(service="embedding_engine")
+
+    def set_head(self, head: EmbeddingHead) -> None:
+        """Install a head, e.g. after fitting a new one.
+
+        Args:
+            head: Fitted head.
+
+        Raises:
+            ValueError: If the head was fitted on embeddings of another model or size.
+        """
+        if head.model != self.model or head.dimensions != self.dimensions:
+            raise ValueError(
+                f"Head was fitted on {head.model} ({head.dimensions or 'default'} dimensions), "
+                f"the engine uses {self.model} ({self.dimensions or 'default'} dimensions)"
+            )
+        self.head = head
+
+    async def analyze(self, comments: List[Comment]) -> List[SentimentAnalysis]:
+        """Analyze sentiment for a list of comments.
+
+        Args:
+            comments: List of comments to analyze.
+
+        Returns:
+            List of SentimentAnalysis objects in the order of the comments.
+
+        Raises:
+            RuntimeError: If no head is installed.
+            OpenAIError: If an embeddings request fails.
+        """
+        if self.head is None:
+            raise RuntimeError("No embedding head is installed")
+        if not comments:
+            return []
+        embeddings = await self.embed([comment.text for comment in comments])
+        scores = self.head.predict(embeddings)
+        self.comments += len(comments)
+        return [
+            SentimentAnalysis(
+                id=comment.id,
+                comment_id=comment.id,
+                comment_text=comment.text,
+                subfeddit_id=comment.subfeddit_id,
+                sentiment_score=score,
+                sentiment_label="positive" if score > 0 else "negative",
+                created_at=comment.created_at,
+                engine=self.name
+            )
+            for comment, score in zip(comments, scores.tolist())
+        ]
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts, from the cache where possible.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            Float32 matrix with one embedding per text, in order.
+
+        Raises:
+            OpenAIError: If an embeddings request fails.
+            DeadlineExceeded: If the request deadline expires first.
+        """
+        namespace = f"embedding-{self.dimensions or 'default'}"
+        keys = [result_key(text, self.model, namespace) for text in texts]
+        vectors: Dict[str, np.ndarray] = {}
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key in vectors or key in missing:
+                continue
+            vector = self.cache.get(key)
+            if vector is None:
+                missing[key] = text
+            else:
+                vectors[key] = vector
+
+        if missing:
+            pending = list(missing.items())
+            batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+            embedded = await asyncio.gather(*(
+                self._embed_batch([text for _, text in batch]) for batch in batches
+            ))
+            for batch, matrix in zip(batches, embedded):
+                for (key, _), vector in zip(batch, matrix):
+                    # Copy the row so an evicted entry does not pin its whole batch
+                    vectors[key] = vector.copy()
+                    self.cache.put(key, vectors[key])
+            self.logger.debug(
+                "Embedded texts",
+                text_count=len(texts),
+                embedded=len(missing),
+                requests=len(batches)
+            )
+
+        if not keys:
+            return np.empty((0, self.head.weights.size if self.head else 0), dtype=np.float32)
+        return np.stack([vectors[key] for key in keys])
+
+    async def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Embed one batch of texts with a single request.
+
+        The response is read raw so that the base64 payloads are decoded directly
+        into NumPy, without building Python lists of floats.
+        """
+        async with self._semaphore:
+            response = await within_deadline(self.client.embeddings.with_raw_response.create(
+                model=self.model,
+                input=texts,
+                encoding_format="base64",
+                **({"dimensions": self.dimensions} if self.dimensions else {})
+            ))
+        self.requests += 1
+        self.embedded += len(texts)
+        data = sorted(response.http_response.json()["data"], key=lambda item: item["index"])
+        return np.stack([
+            np.frombuffer(base64.b64decode(item["embedding"]), dtype="<f4") for item in data
+        ])
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the engine counters.
+
+        Returns:
+            Dictionary with the model, the head version, the number of analyzed
+            comments, embeddings requests and embedded texts, and the cache
+            statistics.
+        """
+        return {
+            "model": self.model,
+            "head_version": self.head.version if self.head else None,
+            "comments": self.comments,
+            "requests": self.requests,
+            "embedded": self.embedded,
+            "cache": self.cache.stats()
+        }
+
+    async def close(self) -> None:
+        """Close the OpenAI client if the engine created it."""
+        if self._owns_client:
+            await self.client.close()
+        self.logger.info("Embedding engine closed")
@@ -0,0 +1,220 @@
+"""Linear classification head over comment embeddings, and its fitting."""
+import hashlib
+import io
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Collection, Dict, List, Optional
+
+import numpy as np
+
+from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
+from sentiment_analysis.domain.repositories.sentiment_analysis_repository import SentimentAnalysisRepository
+from sentiment_analysis.logger import configure_logger
+
+if TYPE_CHECKING:
+    from sentiment_analysis.infrastructure.engines.embedding_engine import EmbeddingSentimentEngine
+
+# Magnitude given to embeddings exactly on the decision boundary
+MIN_SCORE = 0.001
+
+
+class EmbeddingHead:
+    """Logistic regression head mapping embeddings to sentiment scores.
+
+    The score of an embedding ``x`` is ``2 * sigmoid(w.x + b) - 1``, i.e.
+    ``tanh((w.x + b) / 2)``: the probability of the positive class rescaled to
+    [-1, 1]. A whole batch is scored with one matrix-vector product.
+    """
+
+    def __init__(self, weights: np.ndarray, bias: float, model: str, dimensions: Optional[int] = None):
+        """Initialize the head.
+
+        Args:
+            weights: Weight vector, one weight per embedding dimension.
+            bias: Intercept.
+            model: Embedding model the head was fitted on.
+            dimensions: Embedding size requested from the model, if not its default.
+
+        Raises:
+            ValueError: If the weights are not a non-empty vector.
+        """
+        weights = np.asarray(weights, dtype=np.float32)
+        if weights.ndim != 1 or not weights.size:
+            raise ValueError("Head weights must be a non-empty vector")
+        self.weights = weights
+        self.bias = float(bias)
+        self.model = model
+        self.dimensions = dimensions
+        self.version = hashlib.blake2b(
+            weights.tobytes() + np.float64(self.bias).tobytes(), digest_size=6
+        ).hexdigest()
+
+    def predict(self, embeddings: np.ndarray) -> np.ndarray:
+        """Score a batch of embeddings.
+
+        Args:
+            embeddings: Matrix with one embedding per row.
+
+        Returns:
+            Array of non-zero scores in [-1.0, 1.0], one per row.
+
+        Raises:
+            ValueError: If the embedding size does not match the head.
+        """
+        if embeddings.shape[1] != self.weights.size:
+            raise ValueError(
+                f"Embeddings have {embeddings.shape[1]} dimensions, the head expects {self.weights.size}"
+            )
+        scores = np.tanh((embeddings @ self.weights + self.bias) / 2).astype(np.float64)
+        return np.where(scores == 0, MIN_SCORE, np.copysign(np.maximum(np.abs(scores), MIN_SCORE), scores))
+
+    @classmethod
+    def fit(
+        cls,
+        embeddings: np.ndarray,
+        positive: np.ndarray,
+        model: str,
+        dimensions: Optional[int] = None,
+        l2: float = 1.0,
+        max_iterations: int = 25,
+        tolerance: float = 1e-6
+    ) -> "EmbeddingHead":
+        """Fit a head with L2-regularized logistic regression (Newton's method).
+
+        Each iteration solves one (d + 1) x (d + 1) linear system, so fitting is
+        quadratic in the embedding size but converges in a handful of iterations.
+
+        Args:
+            embeddings: Matrix with one embedding per row.
+            positive: Boolean array, True for positive comments.
+            model: Embedding model the embeddings come from.
+            dimensions: Embedding size requested from the model, if not its default.
+            l2: Regularization strength of the weights (not of the bias).
+            max_iterations: Maximum number of Newton steps.
+            tolerance: Stop when no parameter moves by more than this.
+
+        Returns:
+            The fitted head.
+
+        Raises:
+            ValueError: If the samples do not contain both classes.
+        """
+        targets = np.asarray(positive, dtype=np.float64)
+        if targets.size != len(embeddings) or np.unique(targets).size < 2:
+            raise ValueError("Fitting a head needs positive and negative samples")
+        features = np.hstack([np.asarray(embeddings, dtype=np.float64), np.ones((len(targets), 1))])
+        penalty = np.full(features.shape[1], l2)
+        penalty[-1] = 1e-9
+        parameters = np.zeros(features.shape[1])
+        for _ in range(max_iterations):
+            probabilities = 1 / (1 + np.exp(-(features @ parameters)))
+            gradient = features.T @ (probabilities - targets) + penalty * parameters
+            curvature = probabilities * (1 - probabilities)
+            hessian = (features.T * curvature) @ features
+            hessian[np.diag_indices_from(hessian)] += penalty
+            step = np.linalg.solve(hessian, gradient)
+            parameters -= step
+            if np.abs(step).max() < tolerance:
+                break
+        return cls(parameters[:-1], parameters[-1], model=model, dimensions=dimensions)
+
+    def save(self, path: str) -> None:
+        """Atomically write the head to a ``.npz`` file.
+
+        Args:
+            path: Destination file.
+        """
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            weights=self.weights,
+            bias=np.float64(self.bias),
+            model=np.str_(self.model),
+            dimensions=np.int64(self.dimensions or 0)
+        )
+        temporary = target.with_name(target.name + ".tmp")
+        temporary.write_bytes(buffer.getvalue())
+        os.replace(temporary, target)
+
+    @classmethod
+    def load(cls, path: str) -> "EmbeddingHead":
+        """Read a head written by :meth:`save`.
+
+        Args:
+            path: Head file.
+
+        Returns:
+            The head.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                data["weights"],
+                float(data["bias"]),
+                model=str(data["model"]),
+                dimensions=int(data["dimensions"]) or None
+            )
+
+
+async def fit_head_from_repository(
+    engine: "EmbeddingSentimentEngine",
+    repository: SentimentAnalysisRepository,
+    subfeddit_ids: Collection[int],
+    sources: Optional[Collection[str]] = ("openai",),
+    l2: float = 1.0,
+    page_size: int = 1000
+) -> EmbeddingHead:
+    """Fit a head on the analyses stored in a repository.
+
+    The stored labels are used as targets and the comment texts are embedded with
+    the engine, so the head distills the engine that produced the labels. Analyses
+    produced by the embedding engine itself are never used.
+
+    Args:
+        engine: Embedding engine providing the embeddings.
+        repository: Repository holding the labelled analyses.
+        subfeddit_ids: Subfeddits whose analyses are used.
+        sources: Engines whose analyses are trusted as labels; any engine if None.
+        l2: Regularization strength of the head.
+        page_size: Number of analyses read from the repository at a time.
+
+    Returns:
+        The fitted head; it is not installed on the engine.
+
+    Raises:
+        ValueError: If the selected analyses do not contain both labels.
+    """
+    logger = configure_logger().bind(service="embedding_head")
+    analyses: Dict[int, SentimentAnalysis] = {}
+    for subfeddit_id in subfeddit_ids:
+        skip = 0
+        while True:
+            page: List[SentimentAnalysis] = await repository.get_by_subfeddit(
+                subfeddit_id, limit=page_size, skip=skip
+            )
+            for analysis in page:
+                if analysis.engine == engine.name:
+                    continue
+                if sources is not None and analysis.engine not in sources:
+                    continue
+                analyses.setdefault(analysis.comment_id, analysis)
+            if len(page) < page_size:
+                break
+            skip += page_size
+
+    samples = list(analyses.values())
+    embeddings = await engine.embed([analysis.comment_text for analysis in samples])
+    positive = np.array([analysis.sentiment_label == "positive" for analysis in samples])
+    head = EmbeddingHead.fit(
+        embeddings, positive, model=engine.model, dimensions=engine.dimensions, l2=l2
+    )
+    accuracy = float(np.mean((head.predict(embeddings) > 0) == positive))
+    logger.info(
+        "Fitted embedding head",
+        samples=len(samples),
+        positive=int(positive.sum()),
+        training_accuracy=round(accuracy, 4),
+        version=head.version
+    )
+    return head
@@ -0,0 +1,151 @@
+"""Local sentiment engine scoring comments with a weighted lexicon and NumPy."""
+import asyncio
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from sentiment_analysis.domain.entities.comment import Comment
+from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
+from sentiment_analysis.domain.services.analyzer_engine import AnalyzerEngine
+from sentiment_analysis.logger import configure_logger
+
+DEFAULT_WEIGHTS_PATH = Path(__file__).parent / "data" / "lexicon_weights.json"
+
+# Magnitude given to comments without any lexicon hit, whose sign follows the bias
+MIN_SCORE = 0.001
+
+# Batches above this size are scored in a worker thread to keep the event loop free
+THREAD_THRESHOLD = 2000
+
+_TOKEN = re.compile(r"[a-z]+(?:'[a-z]+)?")
+
+
+class LexiconSentimentEngine(AnalyzerEngine):
+    """Scores comments with a linear model over lexicon words, without any I/O.
+
+    A batch is tokenized once into a sparse (comment, word, sign) triplet list;
+    the scores are then a single sparse matrix-vector product with the weight
+    vector, computed with ``np.bincount``. Words within ``negation_window`` tokens
+    after a negator count with the opposite sign. Raw sums are squashed into
+    (-1, 1) with ``x / sqrt(x^2 + alpha)``.
+    """
+
+    name = "lexicon"
+
+    def __init__(self, weights_path: Optional[str] = None):
+        """Initialize the engine.
+
+        Args:
+            weights_path: JSON file with ``weights``, ``negators``,
+                ``negation_window``, ``alpha`` and an optional ``bias``. The
+                bundled lexicon is used if not provided.
+
+        Raises:
+            ValueError: If the weights file has no weights.
+        """
+        path = Path(weights_path) if weights_path else DEFAULT_WEIGHTS_PATH
+        data = json.loads(path.read_text(encoding="utf-8"))
+        weights: Dict[str, float] = data.get("weights") or {}
+        if not weights:
+            raise ValueError(f"No lexicon weights in {path}")
+        self.version = str(data.get("version", "1"))
+        self.vocabulary = {word: index for index, word in enumerate(weights)}
+        self.weights = np.fromiter(weights.values(), dtype=np.float64, count=len(weights))
+        self.negators = frozenset(data.get("negators", ()))
+        self.negation_window = int(data.get("negation_window", 3))
+        self.alpha = float(data.get("alpha", 15.0))
+        self.bias = float(data.get("bias", 0.0))
+        self.comments = 0
+        self.batches = 0
+        self.score_time = 0.0
+        self.logger = configure_logger().bind(service="lexicon_engine")
+
+    def score(self, texts: Sequence[str]) -> np.ndarray:
+        """Score a batch of texts.
+
+        Args:
+            texts: Texts to score.
+
+        Returns:
+            Array of non-zero scores in [-1.0, 1.0], one per text.
+        """
+        started = time.perf_counter()
+        rows: List[int] = []
+        columns: List[int] = []
+        signs: List[float] = []
+        vocabulary = self.vocabulary
+        negators = self.negators
+        for row, text in enumerate(texts):
+            negated_until = -1
+            for position, token in enumerate(_TOKEN.findall(text.lower())):
+                if token in negators:
+                    negated_until = position + self.negation_window
+                    continue
+                column = vocabulary.get(token)
+                if column is not None:
+                    rows.append(row)
+                    columns.append(column)
+                    signs.append(-1.0 if position <= negated_until else 1.0)
+
+        raw = np.full(len(texts), self.bias)
+        if rows:
+            contributions = self.weights[np.asarray(columns)] * np.asarray(signs)
+            raw += np.bincount(np.asarray(rows), weights=contributions, minlength=len(texts))
+        scores = raw / np.sqrt(raw * raw + self.alpha)
+        # Binary classification: texts without a lean still need a sign
+        fallback = MIN_SCORE if self.bias >= 0 else -MIN_SCORE
+        scores = np.where(
+            scores == 0, fallback, np.copysign(np.maximum(np.abs(scores), MIN_SCORE), scores)
+        )
+        self.score_time += time.perf_counter() - started
+        return scores
+
+    async def analyze(self, comments: List[Comment]) -> List[SentimentAnalysis]:
+        """Analyze sentiment for a list of comments.
+
+        Args:
+            comments: List of comments to analyze.
+
+        Returns:
+            List of SentimentAnalysis objects in the order of the comments.
+        """
+        texts = [comment.text for comment in comments]
+        if len(texts) > THREAD_THRESHOLD:
+            scores = await asyncio.to_thread(self.score, texts)
+        else:
+            scores = self.score(texts)
+        self.comments += len(comments)
+        self.batches += 1
+        self.logger.debug("Scored comments with the lexicon", comment_count=len(comments))
+        return [
+            SentimentAnalysis(
+                id=comment.id,
+                comment_id=comment.id,
+                comment_text=comment.text,
+                subfeddit_id=comment.subfeddit_id,
+                sentiment_score=score,
+                sentiment_label="positive" if score > 0 else "negative",
+                created_at=comment.created_at,
+                engine=self.name
+            )
+            for comment, score in zip(comments, scores.tolist())
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the engine counters.
+
+        Returns:
+            Dictionary with the lexicon version and size, the number of scored
+            comments and batches, and the total scoring time in seconds.
+        """
+        return {
+            "version": self.version,
+            "vocabulary_size": len(self.vocabulary),
+            "comments": self.comments,
+            "batches": self.batches,
+            "score_time": self.score_time
+        }
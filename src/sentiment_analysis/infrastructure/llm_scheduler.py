@@ -0,0 +1,116 @@
+"""Sliding-window scheduling of concurrent LLM calls."""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class SlidingWindowScheduler:
+    """Keeps up to ``concurrency`` calls in flight at all times.
+
+    Unlike lockstep batches, a new call starts as soon as any running call
+    finishes, so one slow call never stalls the others. The window is shared by
+    every caller of the scheduler, which makes ``concurrency`` a global budget;
+    waiting calls are started in FIFO order. Queue wait (time before a slot is
+    free) and service time (time spent in the call) are recorded separately.
+    """
+
+    def __init__(self, concurrency: int = 10):
+        """Initialize the scheduler.
+
+        Args:
+            concurrency: Maximum number of calls in flight.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.queue_wait = 0.0
+        self.service_time = 0.0
+
+    async def run(self, fn: Callable[..., Awaitable[R]], *args: Any) -> R:
+        """Run a call once a slot of the window is free.
+
+        Args:
+            fn: Coroutine function to call.
+            *args: Arguments of the call.
+
+        Returns:
+            The result of the call.
+        """
+        queued = time.monotonic()
+        async with self._semaphore:
+            started = time.monotonic()
+            self.queue_wait += started - queued
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                result = await fn(*args)
+            except BaseException:
+                self.failed += 1
+                raise
+            finally:
+                self.in_flight -= 1
+                self.service_time += time.monotonic() - started
+            self.completed += 1
+            return result
+
+    async def map(
+        self,
+        fn: Callable[[T], Awaitable[R]],
+        items: Sequence[T],
+        return_exceptions: bool = False
+    ) -> List[R]:
+        """Run ``fn`` for every item through the window.
+
+        Args:
+            fn: Coroutine function called with each item.
+            items: Items to process.
+            return_exceptions: Whether failures are returned in place of results
+                instead of raising.
+
+        Returns:
+            Results in the order of the items.
+
+        Raises:
+            Exception: The first failure when return_exceptions is False; calls
+                that have not finished yet are cancelled.
+        """
+        tasks = [asyncio.ensure_future(self.run(fn, item)) for item in items]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                # Collect the outcome of cancelled calls so that none goes unretrieved
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def stats(self) -> Dict[str, float]:
+        """Get the scheduling statistics.
+
+        Returns:
+            Dictionary with the window size, current and peak calls in flight,
+            completed and failed calls, and the mean queue wait and service time
+            in seconds.
+        """
+        finished = self.completed + self.failed
+        return {
+            "concurrency": self.concurrency,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "mean_queue_wait": self.queue_wait / finished if finished else 0.0,
+            "mean_service_time": self.service_time / finished if finished else 0.0
+        }
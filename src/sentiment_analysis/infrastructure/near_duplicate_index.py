@@ -0,0 +1,197 @@
+"""SimHash index of scored comment texts for reusing near-duplicate results."""
+import hashlib
+import re
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from sentiment_analysis.logger import configure_logger
+
+# (sentiment_score, sentiment_label)
+NearDuplicateResult = Tuple[float, str]
+
+FINGERPRINT_BITS = 64
+
+_NON_WORD = re.compile(r"[\W_]+")
+_NEGATORS = frozenset(("not", "no", "never", "nor", "neither", "nothing", "without", "dont", "isnt", "wasnt", "cant", "wont", "doesnt", "didnt"))
+
+
+def normalize_for_fingerprint(text: str) -> str:
+    """Reduce a text to lowercase words, dropping punctuation, symbols and emoji.
+
+    Args:
+        text: Comment text.
+
+    Returns:
+        Space separated words.
+    """
+    return _NON_WORD.sub(" ", text.replace("'", "").lower()).strip()
+
+
+def fingerprint(text: str) -> Optional[int]:
+    """Compute the 64-bit SimHash of a text over its character trigrams.
+
+    Each trigram of the normalized text is hashed to 64 bits; every bit of the
+    fingerprint is the majority vote of that bit over all trigrams. Texts that
+    share most of their trigrams get fingerprints with a small Hamming distance.
+
+    Args:
+        text: Comment text.
+
+    Returns:
+        The fingerprint, or None if the text has no words.
+    """
+    normalized = normalize_for_fingerprint(text)
+    if not normalized:
+        return None
+    padded = f" {normalized} "
+    shingles = {padded[i:i + 3] for i in range(len(padded) - 2)}
+    hashes = np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "little")
+            for shingle in shingles
+        ),
+        dtype=np.uint64,
+        count=len(shingles)
+    )
+    bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    majority = bits.sum(axis=0) * 2 > len(shingles)
+    return int(np.packbits(majority, bitorder="little").view("<u8")[0])
+
+
+def negation_parity(text: str) -> int:
+    """Parity of the negation words of a text.
+
+    A single "not" barely moves a SimHash but flips the sentiment, so texts are
+    only matched with texts of the same parity.
+    """
+    return sum(1 for word in normalize_for_fingerprint(text).split() if word in _NEGATORS) % 2
+
+
+class NearDuplicateIndex:
+    """Bounded index of scored texts, searchable by SimHash Hamming distance.
+
+    Fingerprints are split into ``max_distance + 1`` bands; by the pigeonhole
+    principle two fingerprints within ``max_distance`` bits agree exactly on at
+    least one band, so only texts sharing a band bucket are compared. The index
+    keeps at most ``max_entries`` fingerprints and evicts the least recently
+    used ones.
+    """
+
+    def __init__(self, max_distance: int = 3, max_entries: int = 100_000):
+        """Initialize the index.
+
+        Args:
+            max_distance: Maximum Hamming distance of a near-duplicate.
+            max_entries: Maximum number of indexed fingerprints.
+
+        Raises:
+            ValueError: If max_distance is not in [0, 15] or max_entries < 1.
+        """
+        if not 0 <= max_distance <= 15:
+            raise ValueError("Max distance must be between 0 and 15")
+        if max_entries < 1:
+            raise ValueError("Max entries must be at least 1")
+        self.max_distance = max_distance
+        self.max_entries = max_entries
+        self._bands = max_distance + 1
+        self._band_width = FINGERPRINT_BITS // self._bands
+        self._entries: "OrderedDict[Tuple[int, int], NearDuplicateResult]" = OrderedDict()
+        self._buckets: List[Dict[int, Set[Tuple[int, int]]]] = [{} for _ in range(self._bands)]
+        self.lookups = 0
+        self.hits = 0
+        self.evictions = 0
+        self.logger = configure_logger().bind(service="near_duplicate_index")
+
+    def lookup(self, text: str) -> Optional[NearDuplicateResult]:
+        """Find the result of the closest indexed near-duplicate of a text.
+
+        Args:
+            text: Comment text.
+
+        Returns:
+            The result of the closest near-duplicate, or None.
+        """
+        self.lookups += 1
+        key = self._key(text)
+        if key is None:
+            return None
+        best: Optional[Tuple[int, int]] = None
+        best_distance = self.max_distance + 1
+        for candidate in self._candidates(key):
+            distance = (candidate[0] ^ key[0]).bit_count()
+            if distance < best_distance:
+                best, best_distance = candidate, distance
+        if best is None:
+            return None
+        self.hits += 1
+        self._entries.move_to_end(best)
+        return self._entries[best]
+
+    def add(self, text: str, result: NearDuplicateResult) -> None:
+        """Index the result of a scored text.
+
+        Args:
+            text: Comment text.
+            result: Score and label of the text.
+        """
+        key = self._key(text)
+        if key is None:
+            return
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        else:
+            for band, bucket in zip(self._band_values(key[0]), self._buckets):
+                bucket.setdefault(band, set()).add(key)
+        self._entries[key] = result
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._unlink(evicted)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, float]:
+        """Get the index statistics.
+
+        Returns:
+            Dictionary with the lookups, the hits (LLM calls saved), the hit rate,
+            the evictions and the number of indexed fingerprints.
+        """
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.lookups if self.lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries)
+        }
+
+    @staticmethod
+    def _key(text: str) -> Optional[Tuple[int, int]]:
+        """Index key of a text: its fingerprint and negation parity."""
+        value = fingerprint(text)
+        if value is None:
+            return None
+        return value, negation_parity(text)
+
+    def _band_values(self, value: int) -> List[int]:
+        """Split a fingerprint into its bands; the last band takes the spare bits."""
+        mask = (1 << self._band_width) - 1
+        bands = [(value >> (i * self._band_width)) & mask for i in range(self._bands - 1)]
+        bands.append(value >> ((self._bands - 1) * self._band_width))
+        return bands
+
+    def _candidates(self, key: Tuple[int, int]) -> Set[Tuple[int, int]]:
+        """Indexed keys of the same parity that share a band with a key."""
+        candidates: Set[Tuple[int, int]] = set()
+        for band, bucket in zip(self._band_values(key[0]), self._buckets):
+            candidates.update(k for k in bucket.get(band, ()) if k[1] == key[1])
+        return candidates
+
+    def _unlink(self, key: Tuple[int, int]) -> None:
+        """Remove a key from its band buckets."""
+        for band, bucket in zip(self._band_values(key[0]), self._buckets):
+            members = bucket.get(band)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del bucket[band]
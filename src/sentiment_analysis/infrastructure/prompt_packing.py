@@ -0,0 +1,62 @@
+"""Token estimation and bin packing of items into size-bounded prompts."""
+from typing import Callable, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Average number of characters per token for English text with OpenAI tokenizers
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens of a text without a tokenizer.
+
+    Args:
+        text: Text to estimate.
+
+    Returns:
+        Estimated token count, at least 1.
+    """
+    return max(1, -(-len(text) // CHARS_PER_TOKEN))
+
+
+def pack(
+    items: Sequence[T],
+    cost: Callable[[T], int],
+    budget: int,
+    max_items: int
+) -> List[List[T]]:
+    """Group items into bins bounded by a token budget using first-fit decreasing.
+
+    Items are placed from largest to smallest into the first bin that still has
+    room, which keeps the number of bins close to the optimum. An item larger than
+    the whole budget gets a bin of its own. Within each bin, items keep their
+    original relative order.
+
+    Args:
+        items: Items to pack.
+        cost: Function returning the token cost of an item.
+        budget: Maximum total cost of a bin.
+        max_items: Maximum number of items in a bin.
+
+    Returns:
+        List of bins.
+
+    Raises:
+        ValueError: If budget or max_items is less than 1.
+    """
+    if budget < 1 or max_items < 1:
+        raise ValueError("Budget and max items must be at least 1")
+    costs = [cost(item) for item in items]
+    order = sorted(range(len(items)), key=lambda i: costs[i], reverse=True)
+    bins: List[List[int]] = []
+    remaining: List[int] = []
+    for index in order:
+        for b, room in enumerate(remaining):
+            if costs[index] <= room and len(bins[b]) < max_items:
+                bins[b].append(index)
+                remaining[b] -= costs[index]
+                break
+        else:
+            bins.append([index])
+            remaining.append(budget - costs[index])
+    return [[items[i] for i in sorted(indexes)] for indexes in bins]
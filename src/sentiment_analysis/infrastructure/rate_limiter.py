@@ -0,0 +1,198 @@
+"""Client-side rate limiting of OpenAI requests with token buckets."""
+import asyncio
+import re
+import time
+from typing import Dict, Mapping, Optional
+
+import httpx
+
+from sentiment_analysis.logger import configure_logger
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    """Parse an OpenAI ``x-ratelimit-reset-*`` duration such as ``"1m30.5s"``.
+
+    Args:
+        value: Header value.
+
+    Returns:
+        Duration in seconds, or None if the value is missing or malformed.
+    """
+    if not value:
+        return None
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(number + unit for number, unit in parts) != value.strip():
+        return None
+    return sum(float(number) * _UNIT_SECONDS[unit] for number, unit in parts)
+
+
+class TokenBucket:
+    """Bucket refilled continuously up to a per-minute limit."""
+
+    def __init__(self, per_minute: float):
+        """Initialize a full bucket.
+
+        Args:
+            per_minute: Capacity of the bucket and amount refilled per minute.
+        """
+        if per_minute <= 0:
+            raise ValueError("Limit must be positive")
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self._updated = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        """Refill rate per second."""
+        return self.capacity / 60.0
+
+    def refill(self) -> None:
+        """Add the amount accrued since the last update."""
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` is available (capped at a full bucket)."""
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing / self.rate)
+
+    def sync(self, limit: Optional[float], remaining: Optional[float]) -> None:
+        """Align the bucket with the state reported by the server.
+
+        Args:
+            limit: Limit per minute reported by the server.
+            remaining: Remaining amount reported by the server.
+        """
+        self.refill()
+        if limit:
+            self.capacity = float(limit)
+        level = self.level if remaining is None else min(self.level, float(remaining))
+        # Requests sent after this response was produced are already deducted
+        # locally, so the server's figure can only lower the estimate
+        self.level = min(self.capacity, level)
+
+
+class OpenAIRateLimiter:
+    """Process-wide requests-per-minute and tokens-per-minute limiter.
+
+    Callers :meth:`acquire` the estimated cost of a request before sending it and
+    wait in FIFO order until both buckets can cover it, so requests that are
+    certain to be rejected are never sent. The buckets are resynchronised from the
+    ``x-ratelimit-*`` headers of every OpenAI response (install :meth:`on_response`
+    as an httpx response hook), and a 429 pauses all callers until the reported
+    reset.
+    """
+
+    def __init__(self, requests_per_minute: float = 500, tokens_per_minute: float = 200_000):
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Initial request limit, replaced by the server's.
+            tokens_per_minute: Initial token limit, replaced by the server's.
+        """
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self._lock = asyncio.Lock()
+        self._blocked_until = 0.0
+        self.acquired = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.rejections = 0
+        self.resyncs = 0
+        self.logger = configure_logger().bind(service="openai_rate_limiter")
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until a request of the given cost can be sent, then reserve it.
+
+        Args:
+            tokens: Estimated total tokens of the request (prompt and output).
+        """
+        queued = time.monotonic()
+        async with self._lock:
+            while True:
+                self.requests.refill()
+                self.tokens.refill()
+                delay = max(
+                    self._blocked_until - time.monotonic(),
+                    self.requests.wait_time(1),
+                    self.tokens.wait_time(tokens)
+                )
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+            self.requests.level -= 1
+            self.tokens.level -= min(tokens, self.tokens.capacity)
+        waited = time.monotonic() - queued
+        self.acquired += 1
+        if waited > 0.001:
+            self.waits += 1
+            self.wait_time += waited
+
+    async def on_response(self, response: httpx.Response) -> None:
+        """Resync the buckets from an OpenAI response (httpx response hook).
+
+        Args:
+            response: Response of the OpenAI API.
+        """
+        self.update(response.status_code, response.headers)
+
+    def update(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Resync the buckets from response headers.
+
+        Args:
+            status_code: HTTP status of the response.
+            headers: Response headers.
+        """
+        if "x-ratelimit-remaining-requests" in headers or "x-ratelimit-remaining-tokens" in headers:
+            self.resyncs += 1
+            self.requests.sync(
+                self._number(headers.get("x-ratelimit-limit-requests")),
+                self._number(headers.get("x-ratelimit-remaining-requests"))
+            )
+            self.tokens.sync(
+                self._number(headers.get("x-ratelimit-limit-tokens")),
+                self._number(headers.get("x-ratelimit-remaining-tokens"))
+            )
+        if status_code == 429:
+            self.rejections += 1
+            resets = [
+                parse_reset(headers.get("x-ratelimit-reset-requests")),
+                parse_reset(headers.get("x-ratelimit-reset-tokens")),
+                self._number(headers.get("retry-after"))
+            ]
+            pause = max((r for r in resets if r), default=1.0)
+            self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+            self.logger.warning("OpenAI rate limit hit, pausing requests", pause=pause)
+
+    def stats(self) -> Dict[str, float]:
+        """Get the limiter statistics.
+
+        Returns:
+            Dictionary with acquisition, wait, 429 and resync counters and the
+            current limits and bucket levels.
+        """
+        self.requests.refill()
+        self.tokens.refill()
+        return {
+            "acquired": self.acquired,
+            "waits": self.waits,
+            "wait_time": self.wait_time,
+            "rejections": self.rejections,
+            "resyncs": self.resyncs,
+            "requests_per_minute": self.requests.capacity,
+            "tokens_per_minute": self.tokens.capacity,
+            "requests_available": self.requests.level,
+            "tokens_available": self.tokens.level
+        }
+
+    @staticmethod
+    def _number(value: Optional[str]) -> Optional[float]:
+        """Parse a numeric header value."""
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
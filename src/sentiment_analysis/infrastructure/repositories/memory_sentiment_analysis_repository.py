@@ -1,6 +1,6 @@
 """In-memory implementation of the sentiment analysis repository."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
@@ -36,6 +36,17 @@ class MemorySentimentAnalysisRepository(SentimentAnalysisRepository):
         """
         return await super().get_by_comment_id(comment_id)
 
+    async def get_many_by_comment_ids(self, comment_ids: List[int]) -> Dict[int, SentimentAnalysis]:
+        """Get the sentiment analyses of several comments at once.
+
+        Args:
+            comment_ids: IDs of the comments
+
+        Returns:
+            The stored analysis of each comment that has one, keyed by comment ID
+        """
+        return await super().get_many_by_comment_ids(comment_ids)
+
     async def get_by_subfeddit(
         self,
         subfeddit_id: int,
@@ -77,3 +88,11 @@ class MemorySentimentAnalysisRepository(SentimentAnalysisRepository):
             analysis: The sentiment analysis result to save
         """
         await super().save(analysis)
+
+    async def save_many(self, analyses: List[SentimentAnalysis]) -> None:
+        """Save several sentiment analysis results at once.
+
+        Args:
+            analyses: The sentiment analysis results to save
+        """
+        await super().save_many(analyses)
@@ -1,17 +1,29 @@
 """Implementation of the sentiment analysis repository."""
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
 from sentiment_analysis.domain.repositories.sentiment_analysis_repository import SentimentAnalysisRepository as SentimentAnalysisRepositoryInterface
 
 
 class SentimentAnalysisRepository(SentimentAnalysisRepositoryInterface):
-    """Implementation of the sentiment analysis repository."""
+    """Implementation of the sentiment analysis repository.
+
+    Analyses are indexed by comment ID, the latest saved one winning.
+    """
 
     def __init__(self):
         """Initialize the repository."""
         self._analyses: List[SentimentAnalysis] = []
+        self._by_comment_id: Dict[int, SentimentAnalysis] = {}
+        self.lookups = 0
+        self.hits = 0
+
+    def _store(self, analyses: List[SentimentAnalysis]) -> None:
+        """Append analyses and index them by comment ID."""
+        self._analyses.extend(analyses)
+        for analysis in analyses:
+            self._by_comment_id[analysis.comment_id] = analysis
 
     async def create(self, sentiment_analysis: SentimentAnalysis) -> SentimentAnalysis:
         """Create a new sentiment analysis.
@@ -24,7 +36,7 @@ class SentimentAnalysisRepository(SentimentAnalysisRepositoryInterface):
         """
         if not sentiment_analysis.comment_text:
             raise ValueError("Comment text is required for sentiment analysis")
-        self._analyses.append(sentiment_analysis)
+        self._store([sentiment_analysis])
         return sentiment_analysis
 
     async def get_by_comment_id(self, comment_id: int) -> Optional[SentimentAnalysis]:
@@ -34,12 +46,27 @@ class SentimentAnalysisRepository(SentimentAnalysisRepositoryInterface):
             comment_id: ID of the comment
             
         Returns:
-            SentimentAnalysis entity if found, None otherwise
+            The latest saved SentimentAnalysis of the comment if found, None otherwise
         """
-        for analysis in self._analyses:
-            if analysis.comment_id == comment_id:
-                return analysis
-        return None
+        return self._by_comment_id.get(comment_id)
+
+    async def get_many_by_comment_ids(self, comment_ids: List[int]) -> Dict[int, SentimentAnalysis]:
+        """Get the sentiment analyses of several comments at once.
+
+        Args:
+            comment_ids: IDs of the comments
+
+        Returns:
+            The latest saved analysis of each comment that has one, keyed by comment ID
+        """
+        found = {}
+        for comment_id in dict.fromkeys(comment_ids):
+            self.lookups += 1
+            analysis = self._by_comment_id.get(comment_id)
+            if analysis is not None:
+                self.hits += 1
+                found[comment_id] = analysis
+        return found
 
     async def get_by_subfeddit(
         self,
@@ -89,4 +116,30 @@ class SentimentAnalysisRepository(SentimentAnalysisRepositoryInterface):
         """
         if not analysis.comment_text:
             raise ValueError("Comment text is required for sentiment analysis")
-        self._analyses.append(analysis)
+        self._store([analysis])
+
+    async def save_many(self, analyses: List[SentimentAnalysis]) -> None:
+        """Save several sentiment analysis results at once.
+
+        Args:
+            analyses: The sentiment analysis results to save
+
+        Raises:
+            ValueError: If any analysis has no comment text; nothing is saved then.
+        """
+        if any(not analysis.comment_text for analysis in analyses):
+            raise ValueError("Comment text is required for sentiment analysis")
+        self._store(analyses)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the lookup counters.
+
+        Returns:
+            Dictionary with the number of stored analyses, the comment IDs looked
+            up in bulk and how many of them were found
+        """
+        return {
+            "analyses": len(self._analyses),
+            "lookups": self.lookups,
+            "hits": self.hits
+        }
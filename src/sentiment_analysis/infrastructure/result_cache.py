@@ -0,0 +1,211 @@
+"""Content-addressed cache of sentiment results with memory and disk tiers."""
+import asyncio
+import hashlib
+import re
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from sentiment_analysis.logger import configure_logger
+
+# (sentiment_score, sentiment_label)
+CachedSentiment = Tuple[float, str]
+
+# Approximate per-entry overhead of the key, tuple and dict slot in bytes
+_ENTRY_OVERHEAD_BYTES = 200
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize a comment text so that trivially different copies share a key.
+
+    Applies Unicode NFKC normalization, collapses runs of whitespace and strips
+    the ends. Case and punctuation are kept since they can carry sentiment.
+
+    Args:
+        text: Comment text.
+
+    Returns:
+        Normalized text.
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def result_key(text: str, model: str, prompt_version: str) -> str:
+    """Build the content address of a sentiment result.
+
+    Args:
+        text: Comment text.
+        model: Model that scores the text.
+        prompt_version: Version of the prompt used to score the text.
+
+    Returns:
+        Hex digest identifying the result.
+    """
+    payload = "\0".join((model, prompt_version, normalize_text(text)))
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class SentimentResultCache:
+    """Two-tier cache of sentiment results keyed by :func:`result_key`.
+
+    The memory tier is an LRU bounded by an approximate byte budget. The optional
+    disk tier is a SQLite file that survives restarts; entries found there are
+    promoted to memory. Disk access runs in a worker thread so that the event loop
+    is never blocked on I/O.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024, path: Optional[str] = None):
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Approximate byte budget of the memory tier.
+            path: Optional SQLite file of the disk tier. Memory only if not set.
+        """
+        if max_bytes < 1:
+            raise ValueError("Max bytes must be at least 1")
+        self._max_bytes = max_bytes
+        self._path = path
+        self._entries: "OrderedDict[str, CachedSentiment]" = OrderedDict()
+        self._bytes = 0
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.deduplicated = 0
+        self.logger = configure_logger().bind(service="sentiment_result_cache")
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, CachedSentiment]:
+        """Look up several results, memory first and then disk.
+
+        Args:
+            keys: Result keys.
+
+        Returns:
+            Mapping of the keys that were found to their results.
+        """
+        found: Dict[str, CachedSentiment] = {}
+        missing = []
+        for key in keys:
+            value = self._entries.get(key)
+            if value is None:
+                missing.append(key)
+                continue
+            self._entries.move_to_end(key)
+            found[key] = value
+            self.memory_hits += 1
+        if missing and self._path:
+            from_disk = await asyncio.to_thread(self._disk_get, missing)
+            self.disk_hits += len(from_disk)
+            for key, value in from_disk.items():
+                self._remember(key, value)
+            found.update(from_disk)
+        self.misses += sum(1 for key in missing if key not in found)
+        return found
+
+    async def put_many(self, items: Dict[str, CachedSentiment]) -> None:
+        """Store several results in both tiers.
+
+        Args:
+            items: Mapping of result keys to results.
+        """
+        for key, value in items.items():
+            self._remember(key, value)
+        if items and self._path:
+            await asyncio.to_thread(self._disk_put, items)
+
+    def record_deduplicated(self, count: int) -> None:
+        """Count texts that were scored once for several comments of a batch.
+
+        Args:
+            count: Number of comments that reused another comment's result.
+        """
+        self.deduplicated += count
+
+    def stats(self) -> Dict[str, float]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit, miss, eviction and in-batch deduplication counters,
+            the hit rate and the size of the memory tier.
+        """
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "deduplicated": self.deduplicated,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes
+        }
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: str, value: CachedSentiment) -> None:
+        """Insert an entry in the memory tier, evicting the least recently used."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self._entries[key] = value
+            return
+        self._entries[key] = value
+        self._bytes += self._entry_size(key, value)
+        while self._bytes > self._max_bytes and len(self._entries) > 1:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._bytes -= self._entry_size(evicted_key, evicted)
+            self.evictions += 1
+
+    @staticmethod
+    def _entry_size(key: str, value: CachedSentiment) -> int:
+        """Approximate memory footprint of an entry."""
+        return len(key) + len(value[1]) + _ENTRY_OVERHEAD_BYTES
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the disk tier on first use. Must be called with the lock held."""
+        if self._db is None:
+            Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self._path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS sentiment_results ("
+                "key TEXT PRIMARY KEY, score REAL NOT NULL, label TEXT NOT NULL)"
+            )
+        return self._db
+
+    def _disk_get(self, keys: list) -> Dict[str, CachedSentiment]:
+        """Read results from the disk tier."""
+        found = {}
+        with self._db_lock:
+            db = self._connection()
+            # Stay well below SQLite's bound parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = db.execute(
+                    "SELECT key, score, label FROM sentiment_results WHERE key IN "
+                    f"({','.join('?' * len(chunk))})",
+                    chunk
+                )
+                found.update((key, (score, label)) for key, score, label in rows)
+        return found
+
+    def _disk_put(self, items: Dict[str, CachedSentiment]) -> None:
+        """Write results to the disk tier."""
+        with self._db_lock:
+            db = self._connection()
+            with db:
+                db.executemany(
+                    "INSERT OR REPLACE INTO sentiment_results (key, score, label) VALUES (?, ?, ?)",
+                    [(key, score, label) for key, (score, label) in items.items()]
+                )
@@ -1,15 +1,102 @@
 """Sentiment analyzer using OpenAI's API."""
-from typing import List, Optional
-from openai import AsyncOpenAI, OpenAIError
+import json
+import math
+import random
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+import httpx
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    InternalServerError,
+    OpenAIError,
+    RateLimitError,
+)
 from pydantic import BaseModel, Field
+from sentiment_analysis.domain.entities.analysis_outcome import (
+    AnalysisFailure,
+    AnalysisOutcome,
+    PartialAnalysisError,
+)
 from sentiment_analysis.domain.entities.comment import Comment
 from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
+from sentiment_analysis.domain.services.analyzer_engine import AnalyzerEngine
+from sentiment_analysis.infrastructure.deadline import DeadlineExceeded, expired, remaining, within_deadline
+from sentiment_analysis.infrastructure.llm_scheduler import SlidingWindowScheduler
+from sentiment_analysis.infrastructure.near_duplicate_index import NearDuplicateIndex
+from sentiment_analysis.infrastructure.prompt_packing import estimate_tokens, pack
+from sentiment_analysis.infrastructure.rate_limiter import OpenAIRateLimiter
+from sentiment_analysis.infrastructure.result_cache import SentimentResultCache, result_key
 from sentiment_analysis.logger import configure_logger
-from sentiment_analysis.config import OPENAI_API_KEY, SENTIMENT_ANALYSIS_BATCH_SIZE
+from sentiment_analysis.config import (
+    OPENAI_API_KEY,
+    OPENAI_BASE_URL,
+    SENTIMENT_ANALYSIS_BATCH_SIZE,
+    OPENAI_MAX_CONNECTIONS,
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+    OPENAI_KEEPALIVE_EXPIRY,
+    OPENAI_HTTP2,
+    SENTIMENT_PACK_TOKEN_BUDGET,
+    SENTIMENT_PACK_MAX_ITEMS,
+    SENTIMENT_ITEM_MAX_RETRIES,
+    SENTIMENT_RETRY_BACKOFF_BASE,
+    SENTIMENT_RETRY_BACKOFF_CAP,
+)
 import asyncio
 
+T = TypeVar("T")
+
 logger = configure_logger().bind(service="sentiment_analyzer")
 
+SYSTEM_PROMPT = "You are a sentiment analyst professional. Analyze the following text and return a sentiment score between -1.0 and 1.0, where -1.0 is extremely negative and 1.0 is extremely positive. The score cannot be exactly 0.0 as we use binary classification: positive (>0.0) or negative (<0.0)."
+
+PACKED_SYSTEM_PROMPT = "You are a sentiment analyst professional. You receive a JSON list of comments, each with a comment_id and a text. Analyze every comment independently and return one result per comment with its comment_id and a sentiment score between -1.0 and 1.0, where -1.0 is extremely negative and 1.0 is extremely positive. The score cannot be exactly 0.0 as we use binary classification: positive (>0.0) or negative (<0.0)."
+
+LOGPROB_SYSTEM_PROMPT = "You are a sentiment analyst professional. Classify the sentiment of the user's text. Answer with exactly one word: positive or negative."
+
+# Alternatives returned for the classification token in logprob mode
+LOGPROB_TOP_ALTERNATIVES = 5
+
+# Bump whenever the prompts change so that cached results of old prompts are not reused
+PROMPT_VERSION = "1"
+
+# Output tokens reserved per scored comment when estimating a request's cost
+OUTPUT_TOKENS_PER_RESULT = 25
+
+# Prompt tokens added per packed comment for its JSON framing and id
+PACKED_ITEM_OVERHEAD_TOKENS = 8
+
+# Magnitude given to a score of exactly 0.0, in the direction of the returned label
+ZERO_SCORE_NUDGE = 0.001
+
+# Errors that may go away when a comment is analyzed again: transport failures, rate
+# limiting and server errors that outlived the client's own retries, invalid model
+# outputs (a new sample usually is valid) and calls cut short by a request deadline
+RETRYABLE_ERRORS = (APIConnectionError, RateLimitError, InternalServerError, ValueError, DeadlineExceeded)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Tell whether analyzing a comment again may succeed after an error.
+
+    Args:
+        error: Error of a failed attempt.
+
+    Returns:
+        True for transient API errors and invalid model outputs.
+    """
+    return isinstance(error, RETRYABLE_ERRORS)
+
+
+@dataclass
+class _Failed:
+    """Final error of a comment or pack, in place of its result."""
+    error: Exception
+    attempts: int
+
+
+# Per-comment result of the analysis pipeline
+_Result = Union[SentimentAnalysis, _Failed]
+
 
 class OutputFormat(BaseModel):
     """Output format for the sentiment analysis."""
@@ -17,25 +104,159 @@ class OutputFormat(BaseModel):
     sentiment_label: str = Field(description="The sentiment label of the comment, either 'positive' or 'negative'")
 
 
-class SentimentAnalyzer:
+class PackedOutputItem(OutputFormat):
+    """Sentiment of one comment of a packed request."""
+    comment_id: int = Field(description="The comment_id of the analyzed comment")
+
+
+class PackedOutputFormat(BaseModel):
+    """Output format for the sentiment analysis of several comments."""
+    results: List[PackedOutputItem] = Field(description="One result for every comment, in any order")
+
+
+class SentimentAnalyzer(AnalyzerEngine):
     """Analyzes sentiment of comments using OpenAI's API."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    name = "openai"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_connections: int = OPENAI_MAX_CONNECTIONS,
+        max_keepalive_connections: int = OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = OPENAI_KEEPALIVE_EXPIRY,
+        http2: bool = OPENAI_HTTP2,
+        mode: str = "single",
+        pack_token_budget: int = SENTIMENT_PACK_TOKEN_BUDGET,
+        pack_max_items: int = SENTIMENT_PACK_MAX_ITEMS,
+        model: str = "gpt-4o-mini",
+        result_cache: Optional[SentimentResultCache] = None,
+        concurrency: int = SENTIMENT_ANALYSIS_BATCH_SIZE,
+        rate_limiter: Optional[OpenAIRateLimiter] = None,
+        near_duplicates: Optional[NearDuplicateIndex] = None,
+        base_url: Optional[str] = OPENAI_BASE_URL,
+        max_retries: int = SENTIMENT_ITEM_MAX_RETRIES,
+        retry_backoff_base: float = SENTIMENT_RETRY_BACKOFF_BASE,
+        retry_backoff_cap: float = SENTIMENT_RETRY_BACKOFF_CAP
+    ):
         """Initialize the sentiment analyzer.
         
         Args:
             api_key: OpenAI API key. If not provided, will be loaded from environment.
+            max_connections: Maximum number of concurrent connections to the OpenAI API.
+            max_keepalive_connections: Maximum number of idle connections kept alive.
+            keepalive_expiry: Seconds an idle connection is kept before being closed.
+            http2: Whether to negotiate HTTP/2 (requires the `h2` package).
+            mode: "single" sends one request per comment, "packed" groups comments
+                into multi-comment requests filled up to the token budget, and
+                "logprob" asks for a single classification token per comment and
+                scores it as P(positive) - P(negative) from its logprobs.
+            pack_token_budget: Estimated prompt tokens of comments per packed request.
+            pack_max_items: Maximum number of comments per packed request.
+            model: OpenAI model used for the analysis.
+            result_cache: Optional cache of results keyed by normalized text, model
+                and prompt version. When set, identical texts within a call are
+                also scored only once.
+            concurrency: Number of OpenAI requests kept in flight by the
+                sliding-window scheduler, shared by all concurrent analyses.
+            rate_limiter: Optional process-wide limiter that every request waits on
+                before being sent; it is resynchronised from the rate-limit headers
+                of the OpenAI responses.
+            near_duplicates: Optional SimHash index of scored texts; comments that
+                are near-duplicates of a scored text reuse its result instead of
+                calling the API.
+            base_url: Optional OpenAI-compatible endpoint, e.g. a local stand-in.
+            max_retries: Retries of a comment (or pack) after a retryable error, on
+                top of the client's own retries of transport and server errors.
+            retry_backoff_base: Minimum delay before a retry in seconds.
+            retry_backoff_cap: Maximum delay before a retry in seconds.
 
         Raises:
-            ValueError: If no API key is provided and OPENAI_API_KEY is not set.
+            ValueError: If no API key is provided and OPENAI_API_KEY is not set, if
+                the mode is unknown or if the retry settings are negative.
         """
+        if mode not in ("single", "packed", "logprob"):
+            raise ValueError(f"Unknown analysis mode '{mode}'")
+        if max_retries < 0 or retry_backoff_base < 0 or retry_backoff_cap < 0:
+            raise ValueError("Retry settings must not be negative")
+        self.mode = mode
+        # Logprob scores are on a different scale, so they must not share cache entries
+        self.prompt_version = f"{PROMPT_VERSION}-logprob" if mode == "logprob" else PROMPT_VERSION
+        self.pack_token_budget = pack_token_budget
+        self.pack_max_items = pack_max_items
+        self.requests = 0
+        self.packed_requests = 0
+        self.fallbacks = 0
+        self.retries = 0
+        self.failed_comments = 0
+        self.max_retries = max_retries
+        self.retry_backoff_base = retry_backoff_base
+        self.retry_backoff_cap = retry_backoff_cap
+        self.model = model
+        self.result_cache = result_cache
+        self.scheduler = SlidingWindowScheduler(concurrency)
+        self.rate_limiter = rate_limiter
+        self.near_duplicates = near_duplicates
         self.api_key = api_key or OPENAI_API_KEY
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            ),
+            http2=http2,
+            event_hooks={"response": [rate_limiter.on_response]} if rate_limiter else None
+        )
         try:
-            self.client = AsyncOpenAI(api_key=self.api_key)
+            self.client = AsyncOpenAI(api_key=self.api_key, base_url=base_url, http_client=http_client)
         except OpenAIError as e:
             raise ValueError("API key is required") from e
         self.logger = configure_logger().bind(service="sentiment_analyzer")
 
+    async def warm_up(self) -> None:
+        """Open a pooled connection to the OpenAI API ahead of the first request.
+
+        Failures are logged and swallowed so that startup is never blocked on OpenAI.
+        """
+        try:
+            await self.client.models.list()
+            self.logger.info("OpenAI client warmed up")
+        except Exception as e:
+            self.logger.warning("Failed to warm up OpenAI client", error=str(e))
+
+    def stats(self) -> Dict[str, int]:
+        """Get the request counters.
+
+        Returns:
+            Dictionary with the number of API requests, how many of them were
+            packed, how many comments fell back to single-comment requests, how
+            many retries were made and how many comments failed for good, the
+            scheduler statistics and the statistics of the result cache, rate
+            limiter and near-duplicate index when they are configured.
+        """
+        stats = {
+            "requests": self.requests,
+            "packed_requests": self.packed_requests,
+            "fallbacks": self.fallbacks,
+            "retries": self.retries,
+            "failed_comments": self.failed_comments,
+            "scheduler": self.scheduler.stats()
+        }
+        if self.result_cache is not None:
+            stats["result_cache"] = self.result_cache.stats()
+        if self.rate_limiter is not None:
+            stats["rate_limiter"] = self.rate_limiter.stats()
+        if self.near_duplicates is not None:
+            stats["near_duplicates"] = self.near_duplicates.stats()
+        return stats
+
+    async def close(self) -> None:
+        """Close the underlying OpenAI HTTP client and the result cache."""
+        await self.client.close()
+        if self.result_cache is not None:
+            self.result_cache.close()
+        self.logger.info("Sentiment analyzer closed")
+
     async def analyze(self, comments: List[Comment]) -> List[SentimentAnalysis]:
         """Analyze sentiment for a list of comments.
 
@@ -46,62 +267,269 @@ class SentimentAnalyzer:
             List of SentimentAnalysis objects.
 
         Raises:
-            Exception: If sentiment analysis fails.
-            ValueError: If the API response is invalid.
+            PartialAnalysisError: If some comments failed after their retries; it
+                carries the analyses that succeeded.
+            Exception: The final error of the first comment if every comment failed.
         """
-        batch_size = SENTIMENT_ANALYSIS_BATCH_SIZE
-        self.logger.info(
-            "Starting batch processing of comments",
-            total_comments=len(comments),
-            batch_size=batch_size
+        results = await self._analyze_results(comments)
+        failed = [result for result in results if isinstance(result, _Failed)]
+        if not failed:
+            return results
+        if len(failed) == len(results):
+            raise failed[0].error
+        raise PartialAnalysisError(self._outcome(comments, results)) from failed[0].error
+
+    async def analyze_outcome(self, comments: List[Comment]) -> AnalysisOutcome:
+        """Analyze sentiment for a list of comments, reporting failures per comment.
+
+        Every comment (or pack) is retried with backoff after a retryable error.
+        Comments that still fail are reported instead of discarding the analyses
+        that succeeded.
+
+        Args:
+            comments: List of comments to analyze.
+
+        Returns:
+            The analyses that succeeded and the comments that failed, in input order.
+        """
+        return self._outcome(comments, await self._analyze_results(comments))
+
+    async def analyze_stream(
+        self, comments: List[Comment]
+    ) -> AsyncIterator[Union[SentimentAnalysis, AnalysisFailure]]:
+        """Analyze sentiment for a list of comments, yielding results as they complete.
+
+        Comments with the same text are analyzed together and, in packed mode,
+        grouped into the packs they would have been sent in; every group or pack
+        is analyzed on its own, so cached results come first and a slow request
+        only delays its own comments. Analyses still running when the iteration
+        stops are cancelled.
+
+        Args:
+            comments: List of comments to analyze.
+
+        Yields:
+            The analysis or the failure of each comment, in completion order.
+        """
+        groups: Dict[str, List[Comment]] = {}
+        for comment in comments:
+            groups.setdefault(result_key(comment.text, self.model, self.prompt_version), []).append(comment)
+        units = list(groups.values())
+        if self.mode == "packed":
+            units = [
+                [comment for group in packed for comment in group]
+                for packed in pack(
+                    units,
+                    cost=lambda group: estimate_tokens(group[0].text) + PACKED_ITEM_OVERHEAD_TOKENS,
+                    budget=self.pack_token_budget,
+                    max_items=self.pack_max_items
+                )
+            ]
+
+        async def analyze_unit(unit: List[Comment]) -> Tuple[List[Comment], List[_Result]]:
+            return unit, await self._analyze_results(unit)
+
+        tasks = [asyncio.ensure_future(analyze_unit(unit)) for unit in units]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                unit, results = await next_done
+                for comment, result in zip(unit, results):
+                    yield self._failure(comment, result) if isinstance(result, _Failed) else result
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    @staticmethod
+    def _failure(comment: Comment, failed: _Failed) -> AnalysisFailure:
+        """Report the final error of a comment."""
+        return AnalysisFailure(
+            comment_id=comment.id,
+            error_type=type(failed.error).__name__,
+            message=str(failed.error),
+            attempts=failed.attempts,
+            retryable=is_retryable(failed.error)
         )
-        
-        if SENTIMENT_ANALYSIS_BATCH_SIZE > len(comments):
+
+    def _outcome(self, comments: List[Comment], results: List[_Result]) -> AnalysisOutcome:
+        """Split the results of comments into analyses and reported failures."""
+        outcome = AnalysisOutcome()
+        for comment, result in zip(comments, results):
+            if isinstance(result, _Failed):
+                outcome.failures.append(self._failure(comment, result))
+            else:
+                outcome.analyses.append(result)
+        if outcome.failures:
             self.logger.warning(
-                "Batch size is greater than the number of comments",
-                batch_size=batch_size,
-                comment_count=len(comments)
+                "Some comments could not be analyzed",
+                total_comments=len(comments),
+                failed=len(outcome.failures)
             )
-            batch_size = len(comments)
+        return outcome
 
-        all_analyses = []
-        
-        # Process comments in batches
-        for i in range(0, len(comments), SENTIMENT_ANALYSIS_BATCH_SIZE):
-            batch = comments[i:i + SENTIMENT_ANALYSIS_BATCH_SIZE]
-            self.logger.info(
-                "Processing batch",
-                batch_number=i // SENTIMENT_ANALYSIS_BATCH_SIZE + 1,
-                batch_size=len(batch)
-            )
-            
-            # Create tasks for this batch
-            batch_tasks = [
-                self._analyze_single_comment(comment)
-                for comment in batch
-            ]
-            
-            # Process this batch in parallel
-            batch_analyses = await asyncio.gather(*batch_tasks, return_exceptions=True)
-            
-            # Handle results from this batch
-            for analysis, comment in zip(batch_analyses, batch):
-                if isinstance(analysis, Exception):
-                    # Re-raise the first exception we encounter
-                    raise analysis
-                all_analyses.append(analysis)
-                    
-            self.logger.info(
-                "Processed batch of comments",
-                batch_size=len(batch),
-                successful_analyses=len(batch)
-            )
-        
+    async def _analyze_results(self, comments: List[Comment]) -> List[_Result]:
+        """Analyze comments, returning the analysis or the final error of each one."""
+        if self.result_cache is not None:
+            results = await self._analyze_cached(comments)
+        else:
+            results, _ = await self._analyze_fresh(comments)
+        self.failed_comments += sum(1 for result in results if isinstance(result, _Failed))
+        return results
+
+    async def _analyze_cached(self, comments: List[Comment]) -> List[_Result]:
+        """Analyze comments, scoring each distinct uncached text only once.
+
+        Only successful results of texts that were actually scored are cached;
+        near-duplicate reuses are not, so that an approximate match never
+        becomes an exact-text cache entry.
+
+        Args:
+            comments: List of comments to analyze.
+
+        Returns:
+            The analysis or final error of each comment, in the order of the comments.
+        """
+        keys = [result_key(comment.text, self.model, self.prompt_version) for comment in comments]
+        results: Dict[str, Any] = await self.result_cache.get_many(set(keys))
+
+        # One representative comment per distinct text that is not cached yet
+        pending: Dict[str, Comment] = {}
+        for key, comment in zip(keys, comments):
+            if key not in results and key not in pending:
+                pending[key] = comment
+        uncached = sum(1 for key in keys if key not in results)
+        self.result_cache.record_deduplicated(uncached - len(pending))
         self.logger.info(
-            "Successfully analyzed all comments",
-            total_analyses=len(all_analyses)
+            "Checked sentiment result cache",
+            total_comments=len(comments),
+            cached=len(comments) - uncached,
+            to_analyze=len(pending)
+        )
+
+        if pending:
+            fresh, reused = await self._analyze_fresh(list(pending.values()))
+            scored = {
+                key: (analysis.sentiment_score, analysis.sentiment_label)
+                for key, analysis in zip(pending, fresh)
+                if not isinstance(analysis, _Failed)
+            }
+            await self.result_cache.put_many({
+                key: scored[key] for key, was_reused in zip(pending, reused)
+                if key in scored and not was_reused
+            })
+            # Failed texts keep their error so that every comment sharing them fails
+            results.update((key, result) for key, result in zip(pending, fresh) if isinstance(result, _Failed))
+            results.update(scored)
+        return [
+            results[key] if isinstance(results[key], _Failed)
+            else self._build_analysis(comment, *results[key])
+            for key, comment in zip(keys, comments)
+        ]
+
+    async def _analyze_fresh(self, comments: List[Comment]) -> Tuple[List[_Result], List[bool]]:
+        """Analyze comments without a cached result, reusing near-duplicate results.
+
+        Args:
+            comments: List of comments to analyze.
+
+        Returns:
+            The analysis or final error of each comment, in the order of the
+            comments, and whether each one reused a near-duplicate's result
+            instead of being scored.
+        """
+        if self.near_duplicates is None:
+            return await self._analyze_uncached(comments), [False] * len(comments)
+
+        matches = [self.near_duplicates.lookup(comment.text) for comment in comments]
+        misses = [comment for comment, match in zip(comments, matches) if match is None]
+        self.logger.info(
+            "Checked near-duplicate index",
+            total_comments=len(comments),
+            near_duplicates=len(comments) - len(misses)
         )
-        return all_analyses
+        scored = await self._analyze_uncached(misses) if misses else []
+        for analysis in scored:
+            if not isinstance(analysis, _Failed):
+                self.near_duplicates.add(
+                    analysis.comment_text, (analysis.sentiment_score, analysis.sentiment_label)
+                )
+        scored_iter = iter(scored)
+        results = [
+            self._build_analysis(comment, *match) if match else next(scored_iter)
+            for comment, match in zip(comments, matches)
+        ]
+        return results, [match is not None for match in matches]
+
+    async def _analyze_uncached(self, comments: List[Comment]) -> List[_Result]:
+        """Analyze comments with the OpenAI API in the configured mode.
+
+        Args:
+            comments: List of comments to analyze.
+
+        Returns:
+            The analysis or final error of each comment, in the order of the comments.
+        """
+        if self.mode == "packed":
+            return await self._analyze_packed(comments)
+
+        self.logger.info(
+            "Starting processing of comments",
+            total_comments=len(comments),
+            concurrency=self.scheduler.concurrency
+        )
+        analyze_comment = (
+            self._analyze_logprob_comment if self.mode == "logprob" else self._analyze_single_comment
+        )
+        results = await asyncio.gather(*(
+            self._retrying(analyze_comment, comment) for comment in comments
+        ))
+        self.logger.info(
+            "Finished analyzing comments",
+            total_analyses=len(results),
+            failed=sum(1 for result in results if isinstance(result, _Failed))
+        )
+        return results
+
+    async def _retrying(
+        self,
+        fn: Callable[[T], Awaitable[Any]],
+        item: T,
+        scheduled: bool = True
+    ) -> Any:
+        """Call ``fn`` on a comment or pack until it succeeds or may not be retried.
+
+        Each attempt takes its own slot of the scheduler, so backoff sleeps do
+        not hold a slot. Delays use decorrelated jitter between the base and the
+        cap. Attempts are bounded by the request deadline, if any, and no retry
+        is started that could not begin before it.
+
+        Args:
+            fn: Coroutine function analyzing the item.
+            item: Comment or pack of comments.
+            scheduled: Whether attempts go through the scheduler; calls already
+                running within a slot must not wait for another one.
+
+        Returns:
+            The result of ``fn``, or the final error wrapped in ``_Failed``.
+        """
+        delay = self.retry_backoff_base
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await within_deadline(self.scheduler.run(fn, item) if scheduled else fn(item))
+            except Exception as e:
+                if attempt > self.max_retries or not is_retryable(e) or expired():
+                    return _Failed(e, attempt)
+                delay = min(self.retry_backoff_cap, random.uniform(self.retry_backoff_base, delay * 3))
+                budget = remaining()
+                if budget is not None and budget <= delay:
+                    return _Failed(DeadlineExceeded(f"Request deadline leaves no time to retry: {e}"), attempt)
+                self.retries += 1
+                self.logger.warning("Retrying analysis", attempt=attempt, error=str(e))
+                await asyncio.sleep(delay)
 
     async def _analyze_single_comment(self, comment: Comment) -> SentimentAnalysis:
         """Analyze a single comment.
@@ -117,12 +545,14 @@ class SentimentAnalyzer:
             ValueError: If the API response is invalid.
         """
         try:
+            await self._acquire(SYSTEM_PROMPT + comment.text, results=1)
+            self.requests += 1
             response = await self.client.responses.parse(
-                model="gpt-4o-mini",
+                model=self.model,
                 input=[
                     {
                         "role": "system",
-                        "content": "You are a sentiment analyst professional. Analyze the following text and return a sentiment score between -1.0 and 1.0, where -1.0 is extremely negative and 1.0 is extremely positive. The score cannot be exactly 0.0 as we use binary classification: positive (>0.0) or negative (<0.0).",
+                        "content": SYSTEM_PROMPT,
                     },
                     {"role": "user", "content": comment.text},
                 ],
@@ -131,16 +561,7 @@ class SentimentAnalyzer:
             output = response.output_parsed
             self.logger.debug("Response from OpenAI", parsed_response=output)
 
-            # Create sentiment analysis using the comment's original timestamp
-            analysis = SentimentAnalysis(
-                id=comment.id,  # Use comment ID as analysis ID
-                comment_id=comment.id,
-                comment_text=comment.text,
-                subfeddit_id=comment.subfeddit_id,
-                sentiment_score=output.sentiment_score,
-                sentiment_label=output.sentiment_label,
-                created_at=comment.created_at  # Use the comment's original timestamp
-            )
+            analysis = self._build_analysis(comment, output.sentiment_score, output.sentiment_label)
             
             self.logger.debug(
                 "Successfully analyzed comment",
@@ -157,3 +578,240 @@ class SentimentAnalyzer:
                 comment_id=comment.id
             )
             raise
+
+    async def _analyze_logprob_comment(self, comment: Comment) -> SentimentAnalysis:
+        """Analyze a single comment from the logprobs of one classification token.
+
+        The score is P(positive) - P(negative) over the alternatives of the token,
+        which is continuous and only zero if the model is undecided. Comments
+        whose token carries no usable probabilities fall back to a structured
+        single-comment request.
+
+        Args:
+            comment: The comment to analyze.
+
+        Returns:
+            SentimentAnalysis object.
+
+        Raises:
+            Exception: If sentiment analysis fails.
+        """
+        try:
+            await self._acquire(LOGPROB_SYSTEM_PROMPT + comment.text, results=0)
+            self.requests += 1
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": LOGPROB_SYSTEM_PROMPT},
+                    {"role": "user", "content": comment.text},
+                ],
+                max_completion_tokens=1,
+                logprobs=True,
+                top_logprobs=LOGPROB_TOP_ALTERNATIVES,
+                temperature=0
+            )
+        except Exception as e:
+            self.logger.error(
+                "Failed to analyze comment",
+                error=str(e),
+                comment_id=comment.id
+            )
+            raise
+
+        score = self._logprob_score(response)
+        if score is None:
+            self.fallbacks += 1
+            self.logger.warning(
+                "No usable logprobs for the classification token, falling back to a structured request",
+                comment_id=comment.id
+            )
+            return await self._analyze_single_comment(comment)
+        return self._build_analysis(comment, score, "positive" if score > 0 else "negative")
+
+    @staticmethod
+    def _logprob_score(response) -> Optional[float]:
+        """Compute P(positive) - P(negative) from a one-token chat completion.
+
+        Args:
+            response: Chat completion created with logprobs.
+
+        Returns:
+            The score, or None if the token has no positive or negative
+            alternative or if both are equally likely.
+        """
+        try:
+            alternatives = response.choices[0].logprobs.content[0].top_logprobs
+        except (AttributeError, IndexError, TypeError):
+            return None
+        positive = negative = 0.0
+        for alternative in alternatives:
+            token = alternative.token.strip().lower()
+            if len(token) >= 3 and "positive".startswith(token):
+                positive += math.exp(alternative.logprob)
+            elif len(token) >= 3 and "negative".startswith(token):
+                negative += math.exp(alternative.logprob)
+        score = positive - negative
+        if score == 0.0:
+            return None
+        return max(-1.0, min(1.0, score))
+
+    async def _analyze_packed(self, comments: List[Comment]) -> List[_Result]:
+        """Analyze comments with multi-comment requests.
+
+        Comments are bin-packed into requests bounded by the token budget, which
+        are run through the sliding-window scheduler. A pack whose request keeps
+        failing fails all of its comments.
+
+        Args:
+            comments: List of comments to analyze.
+
+        Returns:
+            The analysis or final error of each comment, in the order of the comments.
+        """
+        packs = pack(
+            comments,
+            cost=lambda comment: estimate_tokens(comment.text) + PACKED_ITEM_OVERHEAD_TOKENS,
+            budget=self.pack_token_budget,
+            max_items=self.pack_max_items
+        )
+        self.logger.info(
+            "Starting packed processing of comments",
+            total_comments=len(comments),
+            request_count=len(packs)
+        )
+        results = await asyncio.gather(*(self._retrying(self._analyze_pack, p) for p in packs))
+        results_by_id: Dict[int, _Result] = {}
+        for comments_of_pack, result in zip(packs, results):
+            if isinstance(result, _Failed):
+                results_by_id.update((comment.id, result) for comment in comments_of_pack)
+            else:
+                results_by_id.update(zip((comment.id for comment in comments_of_pack), result))
+
+        self.logger.info(
+            "Finished packed analysis of comments",
+            total_analyses=len(comments),
+            request_count=len(packs),
+            failed=sum(1 for result in results_by_id.values() if isinstance(result, _Failed))
+        )
+        return [results_by_id[comment.id] for comment in comments]
+
+    async def _analyze_pack(self, comments: List[Comment]) -> List[_Result]:
+        """Analyze a pack of comments with a single structured-output request.
+
+        Every comment id must come back exactly once with a valid score and label;
+        comments that are missing or invalid in the response are analyzed again
+        with single-comment requests, each retried on its own.
+
+        Args:
+            comments: Comments of the pack.
+
+        Returns:
+            The analysis or final error of each comment, in the order of the comments.
+
+        Raises:
+            Exception: If the packed request fails.
+        """
+        if len(comments) == 1:
+            return [await self._analyze_single_comment(comments[0])]
+
+        payload = json.dumps(
+            [{"comment_id": comment.id, "text": comment.text} for comment in comments],
+            ensure_ascii=False
+        )
+        self.requests += 1
+        self.packed_requests += 1
+        try:
+            await self._acquire(PACKED_SYSTEM_PROMPT + payload, results=len(comments))
+            response = await self.client.responses.parse(
+                model=self.model,
+                input=[
+                    {"role": "system", "content": PACKED_SYSTEM_PROMPT},
+                    {"role": "user", "content": payload},
+                ],
+                text_format=PackedOutputFormat
+            )
+        except Exception as e:
+            self.logger.error(
+                "Failed to analyze comment pack",
+                error=str(e),
+                comment_count=len(comments)
+            )
+            raise
+
+        expected = {comment.id: comment for comment in comments}
+        analyses: Dict[int, _Result] = {}
+        output = response.output_parsed
+        for item in output.results if output else []:
+            comment = expected.get(item.comment_id)
+            if comment is None or comment.id in analyses:
+                continue
+            try:
+                analyses[comment.id] = self._build_analysis(
+                    comment, item.sentiment_score, item.sentiment_label
+                )
+            except ValueError as e:
+                self.logger.warning(
+                    "Invalid result in packed response",
+                    comment_id=comment.id,
+                    error=str(e)
+                )
+
+        missing = [comment for comment in comments if comment.id not in analyses]
+        if missing:
+            self.fallbacks += len(missing)
+            self.logger.warning(
+                "Packed response is missing comments, falling back to single requests",
+                missing_count=len(missing),
+                comment_count=len(comments)
+            )
+            # Runs within the pack's scheduler slot; waiting for new slots here
+            # could deadlock once every slot is held by a pack
+            fallback = await asyncio.gather(*(
+                self._retrying(self._analyze_single_comment, comment, scheduled=False)
+                for comment in missing
+            ))
+            analyses.update(zip((comment.id for comment in missing), fallback))
+        return [analyses[comment.id] for comment in comments]
+
+    async def _acquire(self, prompt: str, results: int) -> None:
+        """Wait for the rate limiter to admit a request, if one is configured.
+
+        Args:
+            prompt: Full prompt text of the request.
+            results: Number of comments scored by the request.
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(
+                estimate_tokens(prompt) + results * OUTPUT_TOKENS_PER_RESULT
+            )
+
+    @staticmethod
+    def _build_analysis(comment: Comment, score: float, label: str) -> SentimentAnalysis:
+        """Create the sentiment analysis of a comment.
+
+        Args:
+            comment: The analyzed comment.
+            score: Sentiment score returned by the model. A score of exactly 0.0
+                is moved by ZERO_SCORE_NUDGE towards the label.
+            label: Sentiment label returned by the model.
+
+        Returns:
+            SentimentAnalysis object.
+
+        Raises:
+            ValueError: If the score or label is invalid.
+        """
+        if score == 0.0 and label in ("positive", "negative"):
+            # An undecided score still comes with a label: keep the paid result
+            score = ZERO_SCORE_NUDGE if label == "positive" else -ZERO_SCORE_NUDGE
+        # Create sentiment analysis using the comment's original timestamp
+        return SentimentAnalysis(
+            id=comment.id,  # Use comment ID as analysis ID
+            comment_id=comment.id,
+            comment_text=comment.text,
+            subfeddit_id=comment.subfeddit_id,
+            sentiment_score=score,
+            sentiment_label=label,
+            created_at=comment.created_at,  # Use the comment's original timestamp
+            engine=SentimentAnalyzer.name
+        )
@@ -0,0 +1 @@
+"""Command-line tools for maintaining the analyzer engines."""
@@ -0,0 +1,89 @@
+"""Fit the classification head of the embedding engine.
+
+Labels the latest comments of the given subfeddits with the accurate (LLM)
+engine, stores the analyses in the sentiment analysis repository, then fits a
+logistic regression head on the embeddings of the stored comments and writes it
+where the embedding engine loads it from.
+
+Run it with::
+
+    python -m sentiment_analysis.tools.fit_embedding_head --subfeddit "Dummy Topic 1" --label 2000
+
+Set ``OPENAI_BASE_URL`` to a local stand-in to fit a head offline.
+"""
+import argparse
+import asyncio
+from typing import List
+
+from sentiment_analysis.api.container import ServiceContainer
+from sentiment_analysis.config import (
+    SENTIMENT_EMBEDDING_DIMENSIONS,
+    SENTIMENT_EMBEDDING_HEAD_PATH,
+    SENTIMENT_EMBEDDING_MODEL,
+)
+from sentiment_analysis.infrastructure.engines.embedding_engine import EmbeddingSentimentEngine
+from sentiment_analysis.infrastructure.engines.embedding_head import fit_head_from_repository
+from sentiment_analysis.logger import configure_logger
+
+logger = configure_logger().bind(service="fit_embedding_head")
+
+
+async def fit(titles: List[str], label: int, output: str, l2: float) -> None:
+    """Label comments, fit a head on the repository and save it.
+
+    Args:
+        titles: Titles of the subfeddits to learn from.
+        label: Number of latest comments per subfeddit to label with the LLM.
+        output: Destination of the head file.
+        l2: Regularization strength of the head.
+
+    Raises:
+        ValueError: If a subfeddit does not exist.
+    """
+    # Only the accurate engine is needed; the configured default engine may be
+    # the embedding engine whose head this tool is about to create
+    container = ServiceContainer(sentiment_analyzer=ServiceContainer.build_accurate_engine())
+    embedder = EmbeddingSentimentEngine(
+        model=SENTIMENT_EMBEDDING_MODEL,
+        dimensions=SENTIMENT_EMBEDDING_DIMENSIONS or None
+    )
+    try:
+        repository = container.sentiment_analysis_repository
+        subfeddit_ids = []
+        for title in titles:
+            subfeddit = await container.subfeddit_catalog.get_by_title(title)
+            if subfeddit is None:
+                raise ValueError(f"Subfeddit '{title}' not found")
+            subfeddit_ids.append(subfeddit.id)
+            if label:
+                comments = await container.feddit_client.fetch_comments_range(subfeddit.id, total=label)
+                outcome = await container.sentiment_analyzer.analyze_outcome(comments)
+                await repository.save_many(outcome.analyses)
+                logger.info(
+                    "Labelled comments",
+                    subfeddit=title,
+                    comment_count=len(outcome.analyses),
+                    failed=len(outcome.failures)
+                )
+
+        head = await fit_head_from_repository(embedder, repository, subfeddit_ids, l2=l2)
+        head.save(output)
+        logger.info("Saved embedding head", path=output, version=head.version)
+    finally:
+        await embedder.close()
+        await container.close()
+
+
+def main() -> None:
+    """Run the tool from the command line."""
+    parser = argparse.ArgumentParser(description="Fit the embedding engine head")
+    parser.add_argument("--subfeddit", action="append", required=True, help="Subfeddit title; repeatable")
+    parser.add_argument("--label", type=int, default=1000, help="Comments per subfeddit to label with the LLM")
+    parser.add_argument("--output", default=SENTIMENT_EMBEDDING_HEAD_PATH or ".cache/embedding_head.npz")
+    parser.add_argument("--l2", type=float, default=1.0)
+    args = parser.parse_args()
+    asyncio.run(fit(args.subfeddit, args.label, args.output, args.l2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Re-score the latest comments of subfeddits with the OpenAI Batch API.
+
+Fetches the latest comments of the given subfeddits, submits them to the Batch
+API with ``BatchSentimentJob`` and writes the analyses to the sentiment analysis
+repository. Progress is checkpointed in the work directory: running the tool
+again with the same arguments after a crash resumes the submitted batches.
+
+Run it nightly with::
+
+    python -m sentiment_analysis.tools.rescore_batch --subfeddit "Dummy Topic 1" --comments 10000
+
+Set ``OPENAI_BASE_URL`` to a local stand-in to run it offline.
+"""
+import argparse
+import asyncio
+from typing import List
+
+from sentiment_analysis.api.container import ServiceContainer
+from sentiment_analysis.config import OPENAI_BATCH_MAX_REQUESTS, OPENAI_BATCH_POLL_INTERVAL, OPENAI_BATCH_WORK_DIR
+from sentiment_analysis.infrastructure.batch_sentiment_job import BatchJobResult, BatchSentimentJob
+from sentiment_analysis.logger import configure_logger
+
+logger = configure_logger().bind(service="rescore_batch")
+
+
+async def rescore(
+    titles: List[str],
+    comments: int,
+    work_dir: str = OPENAI_BATCH_WORK_DIR,
+    poll_interval: float = OPENAI_BATCH_POLL_INTERVAL,
+    max_requests: int = OPENAI_BATCH_MAX_REQUESTS
+) -> BatchJobResult:
+    """Fetch the latest comments of subfeddits and score them in batches.
+
+    Args:
+        titles: Titles of the subfeddits to re-score.
+        comments: Number of latest comments per subfeddit.
+        work_dir: Directory of the request files and checkpoints.
+        poll_interval: Seconds between two batch status checks.
+        max_requests: Maximum number of requests per batch.
+
+    Returns:
+        The batches used, the number of saved analyses and the failed comments.
+
+    Raises:
+        ValueError: If a subfeddit does not exist.
+        BatchJobError: If a batch fails validation as a whole.
+    """
+    # The configured OpenAI client and model are the accurate engine's; the
+    # other engine policies are not needed
+    container = ServiceContainer(sentiment_analyzer=ServiceContainer.build_accurate_engine())
+    try:
+        selected = []
+        for title in titles:
+            subfeddit = await container.subfeddit_catalog.get_by_title(title)
+            if subfeddit is None:
+                raise ValueError(f"Subfeddit '{title}' not found")
+            fetched = await container.feddit_client.fetch_comments_range(subfeddit.id, total=comments)
+            logger.info("Fetched comments", subfeddit=title, comment_count=len(fetched))
+            selected.extend(fetched)
+
+        analyzer = container.sentiment_analyzer
+        job = BatchSentimentJob(
+            analyzer.client,
+            container.sentiment_analysis_repository,
+            work_dir=work_dir,
+            model=analyzer.model,
+            poll_interval=poll_interval,
+            max_requests=max_requests
+        )
+        return await job.run(selected)
+    finally:
+        await container.close()
+
+
+def main() -> None:
+    """Run the tool from the command line."""
+    parser = argparse.ArgumentParser(description="Re-score subfeddit comments with the OpenAI Batch API")
+    parser.add_argument("--subfeddit", action="append", required=True, help="Subfeddit title; repeatable")
+    parser.add_argument("--comments", type=int, default=1000, help="Latest comments per subfeddit to re-score")
+    parser.add_argument("--work-dir", default=OPENAI_BATCH_WORK_DIR, help="Directory of the checkpoints")
+    parser.add_argument("--poll-interval", type=float, default=OPENAI_BATCH_POLL_INTERVAL)
+    args = parser.parse_args()
+    result = asyncio.run(rescore(args.subfeddit, args.comments, args.work_dir, args.poll_interval))
+    logger.info(
+        "Re-scoring finished",
+        batch_ids=result.batch_ids,
+        saved=result.saved,
+        failed=len(result.failed_comment_ids)
+    )
+
+
+if __name__ == "__main__":
+    main()
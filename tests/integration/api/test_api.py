@@ -1,5 +1,6 @@
 """Integration tests for API endpoints."""
 
+import json
 import os
 import pytest
 from datetime import datetime
@@ -7,12 +8,19 @@ from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, patch
 import httpx
 
+from sentiment_analysis.api.container import set_container
 from sentiment_analysis.api.main import app
+from sentiment_analysis.domain.entities.analysis_outcome import (
+    AnalysisFailure,
+    AnalysisOutcome,
+    PartialAnalysisError,
+)
 from sentiment_analysis.domain.entities.comment import Comment
 from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
 from sentiment_analysis.domain.entities.subfeddit import Subfeddit
 from sentiment_analysis.application.services.sentiment_service import SentimentService
 from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient
+from sentiment_analysis.infrastructure.deadline import DeadlineExceeded
 from sentiment_analysis.infrastructure.sentiment_analyzer import SentimentAnalyzer
 from sentiment_analysis.domain.repositories.sentiment_analysis_repository import SentimentAnalysisRepository
 
@@ -24,6 +32,14 @@ def mock_openai_api_key():
         yield
 
 
+@pytest.fixture(autouse=True)
+def reset_container():
+    """Give every test a fresh application-wide container."""
+    set_container(None)
+    yield
+    set_container(None)
+
+
 @pytest.fixture
 def client():
     """Create a test client for the FastAPI application."""
@@ -302,7 +318,9 @@ async def test_analyze_subfeddit_sentiment_time_range(
     
     assert response.status_code == 200
     mock_dependencies['get_subfeddits'].assert_called_once()
-    mock_dependencies['get_comments'].assert_called_once()
+    # Time windows are resolved through the offset index, which probes with limit=1
+    mock_dependencies['get_comments'].assert_any_call(subfeddit_id=1, limit=1, skip=0)
+    assert len(response.json()["analyses"]) == 1
 
 
 @pytest.mark.asyncio
@@ -350,3 +368,145 @@ async def test_analyze_subfeddit_sentiment_includes_comment_text(
     data = response.json()
     assert len(data["analyses"]) == 1
     assert data["analyses"][0]["comment_text"] == "Test comment"
+
+
+@pytest.mark.asyncio
+async def test_analyze_subfeddit_sentiment_engine_policy(
+    client,
+    mock_dependencies
+):
+    """Test that the engine parameter selects the analyzer policy."""
+    response = client.get(
+        "/api/v1/sentiment/test_subfeddit",
+        params={"engine": "fast"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["analyses"][0]["engine"] == "lexicon"
+    mock_dependencies['analyze'].assert_not_called()
+
+    response = client.get(
+        "/api/v1/sentiment/test_subfeddit",
+        params={"engine": "magic"}
+    )
+    assert response.status_code == 422
+
+    # No embedding head is configured, so the bulk policy is not available
+    response = client.get(
+        "/api/v1/sentiment/test_subfeddit",
+        params={"engine": "bulk"}
+    )
+    assert response.status_code == 503
+    assert "not available" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_analyze_subfeddit_sentiment_partial_failure(
+    client,
+    mock_dependencies
+):
+    """Test that failed comments are reported next to the analyses that succeeded."""
+    analyses = mock_dependencies['analyze'].return_value
+    mock_dependencies['analyze'].side_effect = PartialAnalysisError(AnalysisOutcome(
+        analyses=analyses,
+        failures=[AnalysisFailure(
+            comment_id=2,
+            error_type="RateLimitError",
+            message="Rate limit reached",
+            attempts=3,
+            retryable=True
+        )]
+    ))
+
+    response = client.get("/api/v1/sentiment/test_subfeddit")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [a["comment_id"] for a in data["analyses"]] == [1]
+    assert data["failures"] == [{
+        "comment_id": 2,
+        "error_type": "RateLimitError",
+        "message": "Rate limit reached",
+        "attempts": 3,
+        "retryable": True
+    }]
+
+
+@pytest.mark.asyncio
+async def test_analyze_subfeddit_sentiment_deadline_exceeded(
+    client,
+    mock_dependencies
+):
+    """Test that a request running out of its latency budget returns 504."""
+    mock_dependencies['analyze'].side_effect = DeadlineExceeded("Request deadline exceeded")
+
+    response = client.get(
+        "/api/v1/sentiment/test_subfeddit",
+        headers={"X-Request-Timeout": "0.5"}
+    )
+
+    assert response.status_code == 504
+    assert response.json()["detail"] == "Request deadline exceeded"
+
+
+@pytest.mark.asyncio
+async def test_analyze_subfeddit_sentiment_rejects_invalid_timeout(
+    client,
+    mock_dependencies
+):
+    """Test that a non-positive latency budget is rejected."""
+    response = client.get("/api/v1/sentiment/test_subfeddit", params={"timeout": 0})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_stream_subfeddit_sentiment_ndjson(
+    client,
+    mock_dependencies
+):
+    """Test that analyses are streamed as NDJSON records followed by a summary."""
+    response = client.get(
+        "/api/v1/sentiment/test_subfeddit/stream",
+        params={"engine": "fast"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [record["event"] for record in records] == ["analysis", "summary"]
+    assert records[0]["data"]["comment_id"] == 1
+    assert records[0]["data"]["engine"] == "lexicon"
+    assert records[1]["data"] == {"analysis_count": 1, "failure_count": 0, "partial": False}
+
+
+@pytest.mark.asyncio
+async def test_stream_subfeddit_sentiment_sse(
+    client,
+    mock_dependencies
+):
+    """Test that Server-Sent Events are negotiated from the Accept header."""
+    response = client.get(
+        "/api/v1/sentiment/test_subfeddit/stream",
+        params={"engine": "fast"},
+        headers={"Accept": "text/event-stream"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [block.split("\n") for block in response.text.strip().split("\n\n")]
+    assert [event[0] for event in events] == ["event: analysis", "event: summary"]
+    assert json.loads(events[0][1].removeprefix("data: "))["comment_id"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_subfeddit_sentiment_not_found(
+    client,
+    mock_dependencies
+):
+    """Test that an unknown subfeddit fails before the stream starts."""
+    mock_dependencies['get_subfeddits'].return_value = []
+
+    response = client.get("/api/v1/sentiment/missing/stream")
+
+    assert response.status_code == 404
@@ -0,0 +1,168 @@
+"""Tests for the application-wide service container."""
+
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+
+from sentiment_analysis.api.container import ServiceContainer, get_container, set_container
+from sentiment_analysis.api.dependencies import (
+    get_feddit_client,
+    get_sentiment_analyzer,
+    get_sentiment_analysis_repository
+)
+from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient
+from sentiment_analysis.infrastructure.engines.embedding_engine import EmbeddingSentimentEngine
+from sentiment_analysis.infrastructure.engines.embedding_head import EmbeddingHead
+from sentiment_analysis.infrastructure.engines.lexicon_engine import LexiconSentimentEngine
+from sentiment_analysis.infrastructure.sentiment_analyzer import SentimentAnalyzer
+from sentiment_analysis.infrastructure.repositories.sentiment_analysis_repository import SentimentAnalysisRepository
+
+
+@pytest.fixture
+def container():
+    """Create a container with mocked clients and install it globally."""
+    container = ServiceContainer(
+        feddit_client=AsyncMock(spec=FedditClient),
+        sentiment_analyzer=AsyncMock(spec=SentimentAnalyzer),
+        sentiment_analysis_repository=SentimentAnalysisRepository()
+    )
+    set_container(container)
+    yield container
+    set_container(None)
+
+
+class TestServiceContainer:
+    """Test cases for ServiceContainer."""
+
+    def test_dependencies_return_shared_instances(self, container):
+        """Test that every dependency call hands out the same instances."""
+        assert get_feddit_client() is container.feddit_client
+        assert get_feddit_client() is get_feddit_client()
+        assert get_sentiment_analyzer() is container.sentiment_analyzer
+        assert get_sentiment_analysis_repository() is container.sentiment_analysis_repository
+
+    def test_get_container_creates_default_container(self):
+        """Test that a container is lazily created when none is installed."""
+        set_container(None)
+        try:
+            container = get_container()
+            assert isinstance(container.feddit_client, FedditClient)
+            assert get_container() is container
+        finally:
+            set_container(None)
+
+    @pytest.mark.asyncio
+    async def test_start_warms_up_clients(self, container):
+        """Test that start warms up connections when requested."""
+        await container.start(warm_up=True)
+        container.feddit_client.warm_up.assert_awaited_once()
+        container.sentiment_analyzer.warm_up.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_start_without_warm_up(self, container):
+        """Test that warm-up can be disabled."""
+        await container.start(warm_up=False)
+        container.feddit_client.warm_up.assert_not_called()
+        container.sentiment_analyzer.warm_up.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_close_closes_clients(self, container):
+        """Test that close releases both clients."""
+        await container.close()
+        container.feddit_client.close.assert_awaited_once()
+        container.sentiment_analyzer.close.assert_awaited_once()
+
+    def test_lifespan_manages_container(self):
+        """Test that the FastAPI lifespan starts and closes the container."""
+        from sentiment_analysis.api.main import app
+
+        with patch.object(ServiceContainer, "start", AsyncMock()) as mock_start, \
+             patch.object(ServiceContainer, "close", AsyncMock()) as mock_close:
+            with TestClient(app):
+                assert isinstance(app.state.container, ServiceContainer)
+                assert get_container() is app.state.container
+                mock_start.assert_awaited_once()
+            mock_close.assert_awaited_once()
+
+
+def test_feddit_client_uses_pool_limits():
+    """Test that FedditClient configures its connection pool."""
+    with patch("httpx.AsyncClient") as mock_async_client:
+        FedditClient(base_url="http://test.com", max_connections=7, max_keepalive_connections=3)
+        limits = mock_async_client.call_args.kwargs["limits"]
+        assert limits.max_connections == 7
+        assert limits.max_keepalive_connections == 3
+
+
+def test_metrics_endpoint_reports_client_counters():
+    """Test that /metrics exposes the Feddit and OpenAI client counters."""
+    from sentiment_analysis.api.main import app
+
+    with patch("sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI"):
+        set_container(ServiceContainer(sentiment_analysis_repository=SentimentAnalysisRepository()))
+    try:
+        response = TestClient(app).get("/metrics")
+    finally:
+        set_container(None)
+
+    assert response.status_code == 200
+    feddit = response.json()["feddit"]
+    assert feddit["resilience"]["breaker_state"] == "closed"
+    assert feddit["page_cache"]["hits"] == 0
+    assert response.json()["openai"]["requests"] == 0
+
+
+def test_lexicon_engine_is_selected_from_config():
+    """Test that SENTIMENT_ENGINE=lexicon builds the local engine."""
+    with patch("sentiment_analysis.api.container.SENTIMENT_ENGINE", "lexicon"):
+        container = ServiceContainer(sentiment_analysis_repository=SentimentAnalysisRepository())
+
+    assert isinstance(container.sentiment_analyzer, LexiconSentimentEngine)
+    assert container.metrics()["lexicon"]["comments"] == 0
+
+
+def test_unknown_engine_is_rejected():
+    """Test that an unknown SENTIMENT_ENGINE fails fast."""
+    with patch("sentiment_analysis.api.container.SENTIMENT_ENGINE", "magic"):
+        with pytest.raises(ValueError, match="Unknown sentiment engine"):
+            ServiceContainer(sentiment_analysis_repository=SentimentAnalysisRepository())
+
+
+def test_container_builds_engines_per_policy():
+    """Test that every analyzer policy gets an engine and is reported in metrics."""
+    with patch("sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI"), \
+            patch("sentiment_analysis.api.container.SENTIMENT_ENGINE", "cascade"):
+        container = ServiceContainer(sentiment_analysis_repository=SentimentAnalysisRepository())
+
+    engines = container.analyzer_engines
+    assert set(engines) == {"fast", "accurate", "cascade"}
+    assert container.sentiment_analyzer is engines["cascade"]
+    assert engines["cascade"].fast is engines["fast"]
+    assert engines["cascade"].accurate is engines["accurate"]
+    assert set(container.metrics()) == {"feddit", "lexicon", "openai", "cascade", "repository"}
+
+
+def test_embedding_engine_is_built_when_head_exists(tmp_path):
+    """Test that a fitted head file enables the bulk policy."""
+    path = tmp_path / "head.npz"
+    EmbeddingHead(np.ones(8), 0.0, model="text-embedding-3-small", dimensions=8).save(str(path))
+    with patch("sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI"), \
+            patch("sentiment_analysis.api.container.SENTIMENT_ENGINE", "embedding"), \
+            patch("sentiment_analysis.api.container.SENTIMENT_EMBEDDING_HEAD_PATH", str(path)), \
+            patch("sentiment_analysis.api.container.SENTIMENT_EMBEDDING_DIMENSIONS", 8):
+        container = ServiceContainer(sentiment_analysis_repository=SentimentAnalysisRepository())
+
+    assert isinstance(container.analyzer_engines["bulk"], EmbeddingSentimentEngine)
+    assert container.sentiment_analyzer is container.analyzer_engines["bulk"]
+    assert container.metrics()["embedding"]["head_version"] == container.sentiment_analyzer.head.version
+
+
+def test_embedding_engine_without_head_is_rejected(tmp_path):
+    """Test that SENTIMENT_ENGINE=embedding fails fast without a head file."""
+    with patch("sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI"), \
+            patch("sentiment_analysis.api.container.SENTIMENT_ENGINE", "embedding"), \
+            patch("sentiment_analysis.api.container.SENTIMENT_EMBEDDING_HEAD_PATH", str(tmp_path / "missing.npz")):
+        with pytest.raises(ValueError, match="Embedding head not found"):
+            ServiceContainer(sentiment_analysis_repository=SentimentAnalysisRepository())
@@ -0,0 +1,64 @@
+"""Tests for the helpers of the API routes."""
+
+import asyncio
+
+import pytest
+
+from sentiment_analysis.api.routes import ClientDisconnected, cancel_on_disconnect, request_timeout
+from sentiment_analysis.config import SENTIMENT_REQUEST_MAX_TIMEOUT, SENTIMENT_REQUEST_TIMEOUT
+
+
+class FakeRequest:
+    """Request whose client disconnects once ``disconnect`` is set."""
+
+    def __init__(self):
+        self.disconnect = asyncio.Event()
+        self.messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive(self):
+        if self.messages:
+            return self.messages.pop(0)
+        await self.disconnect.wait()
+        return {"type": "http.disconnect"}
+
+
+class TestCancelOnDisconnect:
+    """Test cases for cancel_on_disconnect."""
+
+    @pytest.mark.asyncio
+    async def test_returns_result_of_work(self):
+        """Test that the work result is returned while the client is connected."""
+        assert await cancel_on_disconnect(FakeRequest(), asyncio.sleep(0.01, result="done")) == "done"
+
+    @pytest.mark.asyncio
+    async def test_cancels_work_on_disconnect(self):
+        """Test that the work is cancelled as soon as the client goes away."""
+        request = FakeRequest()
+        cancelled = asyncio.Event()
+
+        async def work():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        asyncio.get_running_loop().call_later(0.02, request.disconnect.set)
+        with pytest.raises(ClientDisconnected):
+            await cancel_on_disconnect(request, work())
+
+        assert cancelled.is_set()
+
+
+class TestRequestTimeout:
+    """Test cases for request_timeout."""
+
+    def test_resolution_order(self):
+        """Test that the query parameter wins over the header and the default."""
+        assert request_timeout(2.0, 3.0) == 2.0
+        assert request_timeout(None, 3.0) == 3.0
+        assert request_timeout(None, None) == min(SENTIMENT_REQUEST_TIMEOUT, SENTIMENT_REQUEST_MAX_TIMEOUT)
+
+    def test_capped_by_server_maximum(self):
+        """Test that clients cannot ask for more than the server maximum."""
+        assert request_timeout(SENTIMENT_REQUEST_MAX_TIMEOUT * 10, None) == SENTIMENT_REQUEST_MAX_TIMEOUT
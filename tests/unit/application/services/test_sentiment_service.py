@@ -2,14 +2,24 @@
 
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 from sentiment_analysis.application.services.sentiment_service import SentimentService
+from sentiment_analysis.domain.entities.analysis_outcome import (
+    AnalysisFailure,
+    AnalysisOutcome,
+    PartialAnalysisError,
+)
 from sentiment_analysis.domain.entities.comment import Comment
 from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
 from sentiment_analysis.domain.entities.subfeddit import Subfeddit
 from sentiment_analysis.domain.repositories.sentiment_analysis_repository import SentimentAnalysisRepository
+from sentiment_analysis.domain.services.analyzer_engine import EngineUnavailableError
 from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient
+from sentiment_analysis.infrastructure.deadline import DeadlineExceeded
+from sentiment_analysis.infrastructure.repositories.sentiment_analysis_repository import (
+    SentimentAnalysisRepository as InMemorySentimentAnalysisRepository,
+)
 from sentiment_analysis.infrastructure.sentiment_analyzer import SentimentAnalyzer
 
 
@@ -31,9 +41,44 @@ def mock_sentiment_analyzer():
 def mock_repository():
     """Create a mock SentimentAnalysisRepository."""
     repository = AsyncMock(spec=SentimentAnalysisRepository)
+    repository.get_many_by_comment_ids.return_value = {}
     return repository
 
 
+def openai_analysis(comment, text=None, score=0.5):
+    """Analysis the OpenAI engine would make of a comment."""
+    return SentimentAnalysis(
+        id=comment.id,
+        comment_id=comment.id,
+        comment_text=text or comment.text,
+        subfeddit_id=comment.subfeddit_id,
+        sentiment_score=score,
+        sentiment_label="positive" if score > 0 else "negative",
+        created_at=comment.created_at,
+        engine="openai"
+    )
+
+
+@pytest.fixture
+def read_through_service(mock_feddit_client, mock_sentiment_analyzer):
+    """Create a SentimentService over an in-memory repository with three comments to analyze."""
+    comments = [
+        Comment(id=i, subfeddit_id=1, username="user", text=f"Comment {i}", created_at=datetime(2024, 1, 1))
+        for i in (1, 2, 3)
+    ]
+    mock_feddit_client.get_subfeddits.return_value = [
+        Subfeddit(id=1, username="user", title="test", description="Test")
+    ]
+    mock_feddit_client.get_comments.return_value = comments
+    mock_sentiment_analyzer.reuses = MagicMock(side_effect=lambda analysis: analysis.engine == "openai")
+    mock_sentiment_analyzer.analyze.side_effect = lambda batch: [openai_analysis(c, score=-0.2) for c in batch]
+    return SentimentService(
+        feddit_client=mock_feddit_client,
+        sentiment_analyzer=mock_sentiment_analyzer,
+        sentiment_analysis_repository=InMemorySentimentAnalysisRepository()
+    ), comments
+
+
 @pytest.fixture
 def sentiment_service(mock_feddit_client, mock_sentiment_analyzer, mock_repository):
     """Create a SentimentService with mocked dependencies."""
@@ -187,3 +232,336 @@ class TestSentimentService:
         mock_feddit_client.get_comments.assert_not_called()
         mock_sentiment_analyzer.analyze.assert_not_called()
         mock_repository.save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_analyze_subfeddit_sentiment_seeks_time_window(
+        self,
+        mock_feddit_client,
+        mock_sentiment_analyzer,
+        mock_repository
+    ):
+        """Test that a time window is read from the range resolved by the offset index."""
+        # Arrange
+        mock_feddit_client.get_subfeddits.return_value = [
+            Subfeddit(id=1, username="test_user", title="test_subfeddit", description="")
+        ]
+        comments = [
+            Comment(
+                id=i,
+                subfeddit_id=1,
+                username="user1",
+                text=f"Comment {i}",
+                created_at=datetime(2024, 1, i)
+            )
+            for i in range(1, 6)
+        ]
+
+        async def aiter_comments(subfeddit_id, start_skip, max_comments):
+            for comment in comments[start_skip:start_skip + max_comments]:
+                yield comment
+
+        mock_feddit_client.aiter_comments = aiter_comments
+        time_index = AsyncMock()
+        time_index.seek.return_value = (1, 4)
+        mock_sentiment_analyzer.analyze.side_effect = lambda batch: [
+            SentimentAnalysis(
+                id=c.id,
+                comment_id=c.id,
+                comment_text=c.text,
+                subfeddit_id=1,
+                sentiment_score=0.5,
+                sentiment_label="positive",
+                created_at=c.created_at
+            )
+            for c in batch
+        ]
+        service = SentimentService(
+            feddit_client=mock_feddit_client,
+            sentiment_analyzer=mock_sentiment_analyzer,
+            sentiment_analysis_repository=mock_repository,
+            comment_time_index=time_index
+        )
+
+        # Act
+        result = await service.analyze_subfeddit_sentiment(
+            subfeddit="test_subfeddit",
+            limit=2,
+            start_time=datetime(2024, 1, 3),
+            end_time=datetime(2024, 1, 5)
+        )
+
+        # Assert
+        assert [a.comment_id for a in result] == [3, 4]
+        time_index.seek.assert_awaited_once_with(
+            subfeddit_id=1,
+            start_time=datetime(2024, 1, 3),
+            end_time=datetime(2024, 1, 5)
+        )
+        mock_feddit_client.get_comments.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_analyze_subfeddit_sentiment_uses_catalog(
+        self,
+        mock_feddit_client,
+        mock_sentiment_analyzer,
+        mock_repository
+    ):
+        """Test that subfeddit titles are resolved through the catalog when available."""
+        catalog = AsyncMock()
+        catalog.get_by_title.return_value = None
+        service = SentimentService(
+            feddit_client=mock_feddit_client,
+            sentiment_analyzer=mock_sentiment_analyzer,
+            sentiment_analysis_repository=mock_repository,
+            subfeddit_catalog=catalog
+        )
+
+        with pytest.raises(ValueError, match="Subfeddit 'missing' not found"):
+            await service.analyze_subfeddit_sentiment(subfeddit="missing")
+
+        catalog.get_by_title.assert_awaited_once_with("missing")
+        mock_feddit_client.get_subfeddits.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_analyze_subfeddit_sentiment_selects_engine(
+        self,
+        mock_feddit_client,
+        mock_sentiment_analyzer,
+        mock_repository
+    ):
+        """Test that the analyzer policy of a request selects its engine."""
+        fast_engine = AsyncMock(spec=SentimentAnalyzer)
+        fast_engine.analyze.return_value = []
+        service = SentimentService(
+            feddit_client=mock_feddit_client,
+            sentiment_analyzer=mock_sentiment_analyzer,
+            sentiment_analysis_repository=mock_repository,
+            analyzer_engines={"fast": fast_engine}
+        )
+        mock_feddit_client.get_subfeddits.return_value = [
+            Subfeddit(id=1, username="user", title="test", description="Test")
+        ]
+        mock_feddit_client.get_comments.return_value = [
+            Comment(id=1, subfeddit_id=1, username="user1", text="Nice", created_at=datetime(2024, 1, 1))
+        ]
+
+        await service.analyze_subfeddit_sentiment(subfeddit="test", engine="fast")
+
+        fast_engine.analyze.assert_awaited_once()
+        mock_sentiment_analyzer.analyze.assert_not_called()
+        with pytest.raises(EngineUnavailableError, match="Analyzer engine 'cascade' is not available"):
+            await service.analyze_subfeddit_sentiment(subfeddit="test", engine="cascade")
+
+    @pytest.mark.asyncio
+    async def test_analyze_subfeddit_saves_partial_results(
+        self,
+        sentiment_service,
+        mock_feddit_client,
+        mock_sentiment_analyzer,
+        mock_repository
+    ):
+        """Test that analyses that succeeded are saved when other comments failed."""
+        created_at = datetime(2024, 1, 1)
+        mock_feddit_client.get_subfeddits.return_value = [
+            Subfeddit(id=1, username="user", title="test", description="Test")
+        ]
+        mock_feddit_client.get_comments.return_value = [
+            Comment(id=i, subfeddit_id=1, username="user", text=f"Comment {i}", created_at=created_at)
+            for i in (1, 2)
+        ]
+        analysis = SentimentAnalysis(
+            id=1,
+            comment_id=1,
+            comment_text="Comment 1",
+            subfeddit_id=1,
+            sentiment_score=0.5,
+            sentiment_label="positive",
+            created_at=created_at
+        )
+        failure = AnalysisFailure(
+            comment_id=2, error_type="RateLimitError", message="Rate limit reached", attempts=3, retryable=True
+        )
+        mock_sentiment_analyzer.analyze.side_effect = PartialAnalysisError(
+            AnalysisOutcome(analyses=[analysis], failures=[failure])
+        )
+
+        outcome = await sentiment_service.analyze_subfeddit(subfeddit="test")
+
+        assert outcome.analyses == [analysis]
+        assert outcome.failures == [failure]
+        mock_repository.save.assert_awaited_once_with(analysis)
+
+    @pytest.mark.asyncio
+    async def test_analyze_subfeddit_deadline(
+        self,
+        sentiment_service,
+        mock_feddit_client,
+        mock_sentiment_analyzer,
+        mock_repository
+    ):
+        """Test that comments cut by the deadline fail the request unless partial results are allowed."""
+        created_at = datetime(2024, 1, 1)
+        mock_feddit_client.get_subfeddits.return_value = [
+            Subfeddit(id=1, username="user", title="test", description="Test")
+        ]
+        mock_feddit_client.get_comments.return_value = [
+            Comment(id=i, subfeddit_id=1, username="user", text=f"Comment {i}", created_at=created_at)
+            for i in (1, 2)
+        ]
+        analysis = SentimentAnalysis(
+            id=1,
+            comment_id=1,
+            comment_text="Comment 1",
+            subfeddit_id=1,
+            sentiment_score=0.5,
+            sentiment_label="positive",
+            created_at=created_at
+        )
+        late = AnalysisFailure(
+            comment_id=2,
+            error_type="DeadlineExceeded",
+            message="Request deadline exceeded",
+            attempts=1,
+            retryable=True
+        )
+
+        def partial(comments):
+            raise PartialAnalysisError(AnalysisOutcome(analyses=[analysis], failures=[late]))
+        mock_sentiment_analyzer.analyze.side_effect = partial
+
+        with pytest.raises(DeadlineExceeded):
+            await sentiment_service.analyze_subfeddit(subfeddit="test", timeout=1.0)
+        outcome = await sentiment_service.analyze_subfeddit(subfeddit="test", timeout=1.0, allow_partial=True)
+
+        assert outcome.partial
+        assert outcome.analyses == [analysis]
+        # Completed analyses are kept either way
+        assert mock_repository.save.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_subfeddit_saves_as_it_yields(
+        self,
+        sentiment_service,
+        mock_feddit_client,
+        mock_sentiment_analyzer,
+        mock_repository
+    ):
+        """Test that streamed analyses are saved one by one and failures passed through."""
+        created_at = datetime(2024, 1, 1)
+        mock_feddit_client.get_subfeddits.return_value = [
+            Subfeddit(id=1, username="user", title="test", description="Test")
+        ]
+        mock_feddit_client.get_comments.return_value = [
+            Comment(id=i, subfeddit_id=1, username="user", text=f"Comment {i}", created_at=created_at)
+            for i in (1, 2)
+        ]
+        analysis = SentimentAnalysis(
+            id=1,
+            comment_id=1,
+            comment_text="Comment 1",
+            subfeddit_id=1,
+            sentiment_score=0.5,
+            sentiment_label="positive",
+            created_at=created_at
+        )
+        failure = AnalysisFailure(
+            comment_id=2, error_type="OpenAIError", message="Invalid request", attempts=1, retryable=False
+        )
+
+        async def analyze_stream(comments):
+            yield failure
+            yield analysis
+        mock_sentiment_analyzer.analyze_stream = analyze_stream
+
+        results = await sentiment_service.stream_subfeddit(subfeddit="test", timeout=1.0)
+
+        assert [result async for result in results] == [failure, analysis]
+        mock_repository.save.assert_awaited_once_with(analysis)
+
+    @pytest.mark.asyncio
+    async def test_stream_subfeddit_not_found(self, sentiment_service, mock_feddit_client):
+        """Test that an unknown subfeddit is reported before streaming."""
+        mock_feddit_client.get_subfeddits.return_value = []
+
+        with pytest.raises(ValueError, match="not found"):
+            await sentiment_service.stream_subfeddit(subfeddit="missing")
+
+
+class TestReadThrough:
+    """Test cases for answering comments from stored analyses."""
+
+    @pytest.mark.asyncio
+    async def test_analyzes_only_unseen_comments(self, read_through_service, mock_sentiment_analyzer):
+        """Test that reusable stored analyses skip the analyzer and keep the comment order."""
+        service, comments = read_through_service
+        repository = service.sentiment_analysis_repository
+        stored = openai_analysis(comments[0])
+        await repository.save_many([
+            stored,
+            # Made by another engine, or for a text that has since changed
+            openai_analysis(comments[1]).model_copy(update={"engine": "lexicon"}),
+            openai_analysis(comments[2], text="Old text")
+        ])
+
+        outcome = await service.analyze_subfeddit(subfeddit="test")
+
+        assert [a.comment_id for a in outcome.analyses] == [1, 2, 3]
+        assert outcome.analyses[0] == stored
+        mock_sentiment_analyzer.analyze.assert_awaited_once_with(comments[1:])
+
+        # Everything is stored now, so a repeat request does not analyze anything
+        repeat = await service.analyze_subfeddit(subfeddit="test")
+
+        assert repeat.analyses == outcome.analyses
+        assert mock_sentiment_analyzer.analyze.await_count == 1
+        assert repository.stats()["hits"] == 6
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_stored_analyses_first(self, read_through_service, mock_sentiment_analyzer):
+        """Test that the stream yields reused analyses before the new ones and saves only the new ones."""
+        service, comments = read_through_service
+        repository = service.sentiment_analysis_repository
+        stored = openai_analysis(comments[1])
+        await repository.save(stored)
+        streamed = []
+
+        async def analyze_stream(batch):
+            streamed.extend(batch)
+            for comment in batch:
+                yield openai_analysis(comment, score=-0.2)
+        mock_sentiment_analyzer.analyze_stream = analyze_stream
+
+        results = await service.stream_subfeddit(subfeddit="test")
+
+        assert [result.comment_id async for result in results] == [2, 1, 3]
+        assert streamed == [comments[0], comments[2]]
+        assert repository.stats()["analyses"] == 3
+
+    @pytest.mark.asyncio
+    async def test_stored_analyses_survive_deadline(self, read_through_service, mock_sentiment_analyzer):
+        """Test that stored analyses are returned as partial when every unseen comment times out."""
+        service, comments = read_through_service
+        stored = openai_analysis(comments[0])
+        await service.sentiment_analysis_repository.save(stored)
+        mock_sentiment_analyzer.analyze.side_effect = DeadlineExceeded("Request deadline exceeded")
+
+        outcome = await service.analyze_subfeddit(subfeddit="test", timeout=1.0, allow_partial=True)
+
+        assert outcome.partial
+        assert outcome.analyses == [stored]
+        assert [f.comment_id for f in outcome.failures] == [2, 3]
+        assert all(f.error_type == "DeadlineExceeded" for f in outcome.failures)
+        with pytest.raises(DeadlineExceeded):
+            await service.analyze_subfeddit(subfeddit="test", timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_can_be_disabled(self, read_through_service, mock_sentiment_analyzer):
+        """Test that every comment is analyzed when read-through is off."""
+        service, comments = read_through_service
+        service.read_through = False
+        await service.sentiment_analysis_repository.save(openai_analysis(comments[0]))
+
+        outcome = await service.analyze_subfeddit(subfeddit="test")
+
+        mock_sentiment_analyzer.analyze.assert_awaited_once_with(comments)
+        assert outcome.analyses[0].sentiment_score == -0.2
@@ -67,3 +67,23 @@ class TestFetchCommentsUseCase:
 
         assert str(exc_info.value) == "Test error"
         mock_repository.get_comments.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stream(self, use_case, mock_repository):
+        """Test that stream yields comments from the repository iterator."""
+        comment = Comment(
+            id=1,
+            subfeddit_id=2,
+            username="test_user",
+            text="Test comment",
+            created_at=datetime.now()
+        )
+
+        async def aiter_comments(**kwargs):
+            yield comment
+
+        mock_repository.aiter_comments = aiter_comments
+
+        result = [c async for c in use_case.stream(subfeddit_id=2, page_size=10)]
+
+        assert result == [comment]
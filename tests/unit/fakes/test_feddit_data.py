@@ -0,0 +1,48 @@
+"""Tests for the synthetic Feddit dataset."""
+
+import pytest
+
+from sentiment_analysis.fakes.feddit_data import FedditDataset
+
+
+class TestFedditDataset:
+    """Test cases for FedditDataset."""
+
+    def test_is_deterministic(self):
+        """Test that equal seeds produce equal data and other seeds differ."""
+        assert FedditDataset(seed=1).comment(1, 42) == FedditDataset(seed=1).comment(1, 42)
+        assert FedditDataset(seed=1).comment(1, 42) != FedditDataset(seed=2).comment(1, 42)
+
+    def test_comment_schema(self):
+        """Test that comments follow the Feddit API schema."""
+        comment = FedditDataset().comment(2, 0)
+
+        assert set(comment) == {"id", "username", "text", "created_at"}
+        assert comment["id"] == 25_001
+        assert comment["text"].strip()
+
+    def test_pages_cover_large_offsets(self):
+        """Test that pages can be produced at any offset without materializing data."""
+        dataset = FedditDataset(comments_per_subfeddit=5_000_000)
+
+        page = dataset.list_comments(1, limit=100, skip=4_999_950)
+
+        assert len(page) == 50
+        assert page[-1]["id"] == 5_000_000
+
+    def test_timestamps_increase(self):
+        """Test that comments are ordered oldest first."""
+        page = FedditDataset(interval=30).list_comments(1, limit=100, skip=0)
+        timestamps = [c["created_at"] for c in page]
+        assert timestamps == sorted(set(timestamps))
+
+    def test_list_subfeddits(self):
+        """Test subfeddit pagination."""
+        dataset = FedditDataset(subfeddits=3)
+        assert [s["id"] for s in dataset.list_subfeddits(limit=10, skip=1)] == [2, 3]
+        assert dataset.list_subfeddits(limit=10, skip=3) == []
+
+    def test_rejects_invalid_dimensions(self):
+        """Test that an empty dataset is rejected."""
+        with pytest.raises(ValueError):
+            FedditDataset(subfeddits=0)
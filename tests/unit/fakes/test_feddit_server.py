@@ -0,0 +1,89 @@
+"""Tests for the local Feddit stand-in server."""
+
+import httpx
+import pytest
+
+from sentiment_analysis.fakes.feddit_data import FedditDataset
+from sentiment_analysis.fakes.feddit_server import FaultConfig, create_app
+from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient
+
+
+def make_client(app):
+    """Create an httpx client routed to the ASGI app."""
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://feddit")
+
+
+@pytest.fixture
+def app():
+    """Create a small stand-in app."""
+    return create_app(FedditDataset(subfeddits=2, comments_per_subfeddit=250))
+
+
+class TestFedditServer:
+    """Test cases for the Feddit stand-in endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_comments_endpoint(self, app):
+        """Test the comments endpoint schema and pagination."""
+        async with make_client(app) as client:
+            response = await client.get(
+                "/api/v1/comments/", params={"subfeddit_id": 1, "limit": 100, "skip": 200}
+            )
+
+        body = response.json()
+        assert response.status_code == 200
+        assert (body["subfeddit_id"], body["limit"], body["skip"]) == (1, 100, 200)
+        assert len(body["comments"]) == 50
+
+    @pytest.mark.asyncio
+    async def test_subfeddit_endpoint(self, app):
+        """Test the subfeddit details endpoint."""
+        async with make_client(app) as client:
+            response = await client.get("/api/v1/subfeddit/", params={"subfeddit_id": 2, "limit": 5})
+
+        body = response.json()
+        assert body["title"] == "Dummy Topic 2"
+        assert len(body["comments"]) == 5
+
+    @pytest.mark.asyncio
+    async def test_unknown_subfeddit(self, app):
+        """Test that unknown subfeddits return 404."""
+        async with make_client(app) as client:
+            response = await client.get("/api/v1/comments/", params={"subfeddit_id": 9})
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_etag_revalidation(self, app):
+        """Test that a matching If-None-Match returns 304."""
+        async with make_client(app) as client:
+            first = await client.get("/api/v1/subfeddits/")
+            second = await client.get(
+                "/api/v1/subfeddits/", headers={"If-None-Match": first.headers["ETag"]}
+            )
+
+        assert second.status_code == 304
+        assert app.state.stats["not_modified"] == 1
+
+    @pytest.mark.asyncio
+    async def test_injected_errors(self):
+        """Test that the configured error rate fails requests."""
+        app = create_app(faults=FaultConfig(error_rate=1.0, error_status=502))
+        async with make_client(app) as client:
+            response = await client.get("/api/v1/subfeddits/")
+
+        assert response.status_code == 502
+        assert app.state.stats["errors"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("decoder", ["standard", "fast"])
+async def test_feddit_client_against_stand_in(app, decoder):
+    """Test that FedditClient reads every comment from the stand-in."""
+    async with make_client(app) as http_client:
+        client = FedditClient(base_url="http://feddit", http_client=http_client, decoder=decoder)
+
+        subfeddits = await client.get_subfeddits()
+        comments = [c async for c in client.aiter_comments(subfeddit_id=1)]
+
+    assert [s.title for s in subfeddits] == ["Dummy Topic 1", "Dummy Topic 2"]
+    assert [c.id for c in comments] == list(range(1, 251))
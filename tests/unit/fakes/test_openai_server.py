@@ -0,0 +1,280 @@
+"""Tests for the local OpenAI stand-in server."""
+
+import asyncio
+import json
+import math
+import random
+import statistics
+from datetime import datetime
+
+import httpx
+import pytest
+from openai import AsyncOpenAI, InternalServerError, RateLimitError
+
+from sentiment_analysis.domain.entities.comment import Comment
+from sentiment_analysis.fakes.openai_server import FaultConfig, create_app, score_text
+
+
+def make_client(app, max_retries=2):
+    """Create an OpenAI client routed to the stand-in app."""
+    return AsyncOpenAI(
+        api_key="test-key",
+        base_url="http://openai/v1",
+        max_retries=max_retries,
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+    )
+
+
+def sentiment_request(text):
+    """Build the body of a single-comment sentiment request."""
+    return {"model": "gpt-4o-mini", "input": [{"role": "user", "content": text}]}
+
+
+def batch_line(custom_id, text):
+    """Build one batched sentiment request."""
+    return json.dumps({
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/responses",
+        "body": {"model": "gpt-4o-mini", "input": [{"role": "user", "content": text}]}
+    })
+
+
+class TestScoreText:
+    """Test cases for the deterministic scorer."""
+
+    def test_follows_keywords(self):
+        """Test that positive and negative words decide the sign."""
+        assert score_text("great release, love it") > 0
+        assert score_text("broken and slow") < 0
+
+    def test_is_never_zero(self):
+        """Test that texts without a lean still get a non-zero score."""
+        assert score_text("the config field") in (0.1, -0.1)
+
+
+class TestFaultConfig:
+    """Test cases for the latency and fault settings."""
+
+    def test_rejects_invalid_settings(self):
+        """Test that unknown distributions, negative latencies and bad rates are rejected."""
+        with pytest.raises(ValueError, match="distribution"):
+            FaultConfig(latency_distribution="pareto")
+        with pytest.raises(ValueError, match="negative"):
+            FaultConfig(latency=-1)
+        with pytest.raises(ValueError, match="median"):
+            FaultConfig(latency_distribution="lognormal")
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            FaultConfig(error_rate=1.5)
+
+    def test_uniform_latency_stays_in_range(self):
+        """Test that uniform delays fall between the base latency and base plus spread."""
+        faults = FaultConfig(latency=0.1, latency_distribution="uniform", latency_spread=0.05)
+        rng = random.Random(0)
+
+        delays = [faults.draw_latency(rng) for _ in range(1000)]
+
+        assert 0.1 <= min(delays) and max(delays) <= 0.15
+
+    def test_lognormal_latency_has_heavy_tail(self):
+        """Test that lognormal delays keep their median and have a long p99 tail."""
+        faults = FaultConfig(latency=0.1, latency_distribution="lognormal", latency_spread=1.0)
+        rng = random.Random(0)
+
+        delays = sorted(faults.draw_latency(rng) for _ in range(20000))
+
+        assert statistics.median(delays) == pytest.approx(0.1, rel=0.05)
+        assert delays[int(len(delays) * 0.99)] > 8 * statistics.median(delays)
+
+    def test_max_latency_and_token_latency(self):
+        """Test that drawn delays are capped before the per-token delay is added."""
+        faults = FaultConfig(
+            latency=1.0, latency_distribution="lognormal", latency_spread=2.0,
+            max_latency=1.5, token_latency=0.01
+        )
+        rng = random.Random(0)
+
+        assert max(faults.draw_latency(rng, output_tokens=10) for _ in range(1000)) == pytest.approx(1.6)
+
+
+class TestOpenAIServer:
+    """Test cases for the Files and Batch endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_batch_lifecycle(self):
+        """Test uploading, polling and downloading a batch with the openai client."""
+        app = create_app(batch_polls=1)
+        client = make_client(app)
+        content = "\n".join([batch_line("a", "love it"), batch_line("b", "terrible bug")]).encode()
+
+        uploaded = await client.files.create(file=("in.jsonl", content), purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=uploaded.id, endpoint="/v1/responses", completion_window="24h"
+        )
+        assert batch.status == "validating"
+        assert (await client.batches.retrieve(batch.id)).status == "in_progress"
+        batch = await client.batches.retrieve(batch.id)
+        assert batch.status == "completed"
+        assert batch.request_counts.completed == 2
+
+        output = (await client.files.content(batch.output_file_id)).text
+        results = {r["custom_id"]: r for r in map(json.loads, output.splitlines())}
+        text = results["b"]["response"]["body"]["output"][0]["content"][0]["text"]
+        assert json.loads(text)["sentiment_label"] == "negative"
+
+    @pytest.mark.asyncio
+    async def test_injected_errors_go_to_error_file(self):
+        """Test that failed requests are written to the error file."""
+        app = create_app(batch_polls=0, batch_error_rate=1.0)
+        client = make_client(app)
+        uploaded = await client.files.create(file=("in.jsonl", batch_line("a", "x").encode()), purpose="batch")
+
+        batch = await client.batches.create(
+            input_file_id=uploaded.id, endpoint="/v1/responses", completion_window="24h"
+        )
+        batch = await client.batches.retrieve(batch.id)
+
+        assert batch.output_file_id is None
+        assert batch.request_counts.failed == 1
+        error = json.loads((await client.files.content(batch.error_file_id)).text)
+        assert error["response"]["status_code"] == 500
+
+    @pytest.mark.asyncio
+    async def test_chat_completion_logprobs(self):
+        """Test that the classification token probabilities follow the keyword score."""
+        client = make_client(create_app())
+
+        completion = await client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": "love it, great work"}],
+            max_completion_tokens=1,
+            logprobs=True,
+            top_logprobs=5
+        )
+
+        choice = completion.choices[0]
+        assert choice.message.content == "positive"
+        probabilities = {a.token: math.exp(a.logprob) for a in choice.logprobs.content[0].top_logprobs}
+        assert probabilities["positive"] - probabilities["negative"] == pytest.approx(
+            0.98 * score_text("love it, great work")
+        )
+
+    @pytest.mark.asyncio
+    async def test_structured_response(self):
+        """Test that responses.parse gets a structured sentiment output."""
+        from sentiment_analysis.infrastructure.sentiment_analyzer import OutputFormat
+
+        client = make_client(create_app())
+
+        response = await client.responses.parse(
+            model="gpt-4o-mini",
+            input=[{"role": "user", "content": "terrible regression"}],
+            text_format=OutputFormat
+        )
+
+        assert response.output_parsed.sentiment_label == "negative"
+        assert response.output_parsed.sentiment_score == score_text("terrible regression")
+
+    @pytest.mark.asyncio
+    async def test_embeddings(self):
+        """Test that embeddings are deterministic unit vectors of the requested size."""
+        client = make_client(create_app())
+
+        response = await client.embeddings.create(
+            model="text-embedding-3-small",
+            input=["great release", "great release", "broken build"],
+            dimensions=32,
+            encoding_format="float"
+        )
+
+        first, second, third = (item.embedding for item in response.data)
+        assert len(first) == 32
+        assert first == second and first != third
+        assert sum(value * value for value in first) == pytest.approx(1.0, abs=1e-5)
+
+    @pytest.mark.asyncio
+    async def test_packed_response(self):
+        """Test that a packed request gets one structured result per comment."""
+        from sentiment_analysis.infrastructure.sentiment_analyzer import PackedOutputFormat
+
+        client = make_client(create_app())
+        payload = json.dumps([
+            {"comment_id": 7, "text": "love it"},
+            {"comment_id": 9, "text": "broken again"}
+        ])
+
+        response = await client.responses.parse(
+            model="gpt-4o-mini",
+            input=[{"role": "user", "content": payload}],
+            text_format=PackedOutputFormat
+        )
+
+        results = {item.comment_id: item for item in response.output_parsed.results}
+        assert results[7].sentiment_label == "positive"
+        assert results[9].sentiment_score == score_text("broken again")
+
+
+class TestFaultInjection:
+    """Test cases for the latency, rate limit and error injection of online requests."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_headers_and_429(self):
+        """Test that the request limit is reported in headers and enforced with 429."""
+        app = create_app(faults=FaultConfig(requests_per_minute=2, tokens_per_minute=100000))
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://openai") as http:
+            first = await http.post("/v1/responses", json=sentiment_request("love it"))
+            await http.post("/v1/responses", json=sentiment_request("love it"))
+            rejected = await http.post("/v1/responses", json=sentiment_request("love it"))
+
+        assert first.status_code == 200
+        assert first.headers["x-ratelimit-limit-requests"] == "2"
+        assert first.headers["x-ratelimit-remaining-requests"] == "1"
+        assert first.headers["x-ratelimit-reset-requests"].endswith("s")
+        assert int(first.headers["x-ratelimit-remaining-tokens"]) < 100000
+        assert rejected.status_code == 429
+        assert rejected.json()["error"]["code"] == "rate_limit_exceeded"
+        assert 0 < float(rejected.headers["retry-after"]) <= 30
+        assert app.state.stats["rate_limited"] == 1
+
+    @pytest.mark.asyncio
+    async def test_injected_errors_reach_the_client(self):
+        """Test that injected 429 and 500 responses raise the openai client's errors."""
+        limited = make_client(create_app(faults=FaultConfig(rate_limit_rate=1.0)), max_retries=0)
+        failing = make_client(create_app(faults=FaultConfig(error_rate=1.0)), max_retries=0)
+
+        with pytest.raises(RateLimitError):
+            await limited.responses.create(**sentiment_request("love it"))
+        with pytest.raises(InternalServerError):
+            await failing.embeddings.create(model="text-embedding-3-small", input=["love it"])
+
+    @pytest.mark.asyncio
+    async def test_stalled_requests_time_out(self):
+        """Test that a stalled request hangs past the client's patience."""
+        app = create_app(faults=FaultConfig(timeout_rate=1.0, timeout_delay=30.0))
+        client = make_client(app, max_retries=0)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.responses.create(**sentiment_request("love it")), timeout=0.1)
+        assert app.state.stats["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_analyzer_recovers_from_injected_faults(self):
+        """Test that the analyzer's retries get every comment through a faulty stand-in."""
+        from sentiment_analysis.infrastructure.sentiment_analyzer import SentimentAnalyzer
+
+        app = create_app(faults=FaultConfig(
+            latency=0.001, latency_distribution="lognormal", latency_spread=1.0,
+            max_latency=0.05, error_rate=0.2, rate_limit_rate=0.1, retry_after=0.0, seed=3
+        ))
+        analyzer = SentimentAnalyzer(api_key="test-key", max_retries=10, retry_backoff_base=0.0, retry_backoff_cap=0.0)
+        analyzer.client = make_client(app, max_retries=0)
+        comments = [
+            Comment(id=i, subfeddit_id=1, username="user", text=text, created_at=datetime.now())
+            for i, text in enumerate(["love it", "broken build", "great docs", "slow and buggy"] * 5, start=1)
+        ]
+
+        analyses = await analyzer.analyze(comments)
+
+        assert [a.sentiment_score for a in analyses] == [score_text(c.text) for c in comments]
+        assert app.state.stats["server_errors"] + app.state.stats["rate_limited"] > 0
+        assert analyzer.stats()["retries"] > 0
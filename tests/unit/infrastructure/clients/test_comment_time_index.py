@@ -0,0 +1,124 @@
+"""Tests for CommentTimeIndex."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from sentiment_analysis.domain.entities.comment import Comment
+from sentiment_analysis.infrastructure.clients.comment_time_index import CommentTimeIndex
+
+BASE_TIME = datetime(2024, 1, 1)
+
+
+class FakeFedditClient:
+    """Serves comments from an in-memory list, one minute apart."""
+
+    def __init__(self, count: int, newest_first: bool = False):
+        self.newest_first = newest_first
+        self.comments = []
+        self.add(count)
+
+    def add(self, count: int):
+        start = len(self.comments)
+        new = [
+            Comment(
+                id=i + 1,
+                subfeddit_id=1,
+                username="user",
+                text=f"Comment {i + 1}",
+                created_at=BASE_TIME + timedelta(minutes=i)
+            )
+            for i in range(start, start + count)
+        ]
+        self.comments.extend(new)
+
+    def ordered(self):
+        return list(reversed(self.comments)) if self.newest_first else self.comments
+
+    async def get_comments(self, subfeddit_id, limit=25, skip=0):
+        return self.ordered()[skip:skip + limit]
+
+
+def in_window(client, skip_start, skip_end, start_time, end_time):
+    """Return ids in the seek range that fall within the window."""
+    return {
+        c.id for c in client.ordered()[skip_start:skip_end]
+        if start_time <= c.created_at <= end_time
+    }
+
+
+def expected_ids(client, start_time, end_time):
+    """Return ids of every comment within the window."""
+    return {c.id for c in client.comments if start_time <= c.created_at <= end_time}
+
+
+class TestCommentTimeIndex:
+    """Test cases for CommentTimeIndex."""
+
+    @pytest.mark.asyncio
+    async def test_count_uses_logarithmic_probes(self):
+        """Test that the comment count is found with a handful of probes."""
+        client = FakeFedditClient(20_000)
+        index = CommentTimeIndex(client)
+
+        assert await index.count(1) == 20_000
+        assert index.probe_count < 40
+
+    @pytest.mark.asyncio
+    async def test_count_empty_subfeddit(self):
+        """Test that an empty subfeddit has no comments and an empty seek range."""
+        index = CommentTimeIndex(FakeFedditClient(0))
+
+        assert await index.count(1) == 0
+        assert await index.seek(1, start_time=BASE_TIME) == (0, 0)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("newest_first", [False, True])
+    async def test_seek_brackets_window(self, newest_first):
+        """Test that the seek range contains the whole window and little else."""
+        client = FakeFedditClient(20_000, newest_first=newest_first)
+        index = CommentTimeIndex(client, resolution=50)
+        start_time = BASE_TIME + timedelta(minutes=7_000)
+        end_time = BASE_TIME + timedelta(minutes=7_300)
+
+        skip_start, skip_end = await index.seek(1, start_time, end_time)
+
+        assert in_window(client, skip_start, skip_end, start_time, end_time) == \
+            expected_ids(client, start_time, end_time)
+        assert skip_end - skip_start <= 301 + 2 * 50
+
+    @pytest.mark.asyncio
+    async def test_seek_reuses_cached_samples(self):
+        """Test that repeated seeks do not probe again."""
+        client = FakeFedditClient(5_000)
+        index = CommentTimeIndex(client)
+        start_time = BASE_TIME + timedelta(minutes=1_000)
+
+        await index.seek(1, start_time=start_time)
+        probes = index.probe_count
+        await index.seek(1, start_time=start_time)
+
+        assert index.probe_count == probes
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("newest_first", [False, True])
+    async def test_refresh_extends_index(self, newest_first):
+        """Test that new comments are picked up incrementally."""
+        client = FakeFedditClient(1_000, newest_first=newest_first)
+        index = CommentTimeIndex(client, resolution=10)
+        await index.count(1)
+
+        client.add(300)
+        await index.refresh(1)
+
+        assert await index.count(1) == 1_300
+        start_time = BASE_TIME + timedelta(minutes=1_100)
+        end_time = BASE_TIME + timedelta(minutes=1_200)
+        skip_start, skip_end = await index.seek(1, start_time, end_time)
+        assert in_window(client, skip_start, skip_end, start_time, end_time) == \
+            expected_ids(client, start_time, end_time)
+
+    def test_invalid_resolution(self):
+        """Test that the resolution must be positive."""
+        with pytest.raises(ValueError, match="Resolution must be at least 1"):
+            CommentTimeIndex(FakeFedditClient(0), resolution=0)
@@ -1,10 +1,13 @@
 """Tests for FedditClient."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch
 from datetime import datetime
 
 from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient
+from sentiment_analysis.infrastructure.deadline import DeadlineExceeded, deadline
 from sentiment_analysis.domain.entities.comment import Comment
 
 
@@ -83,6 +86,17 @@ class TestFedditClient:
             }
         )
 
+    @pytest.mark.asyncio
+    async def test_get_comments_deadline(self, feddit_client, mock_httpx_client):
+        """Test that a fetch still running at the request deadline is cancelled."""
+        async def get(*args, **kwargs):
+            await asyncio.sleep(10)
+        mock_httpx_client.get = AsyncMock(side_effect=get)
+
+        with deadline(0.05):
+            with pytest.raises(DeadlineExceeded):
+                await feddit_client.get_comments(subfeddit_id=1, limit=10)
+
     @pytest.mark.asyncio
     async def test_get_comments_error(self, feddit_client, mock_httpx_client):
         """Test error handling in get_comments."""
@@ -97,3 +111,147 @@ class TestFedditClient:
             )
         
         assert str(exc_info.value) == "API Error"
+
+
+def make_comment(comment_id: int, subfeddit_id: int = 1) -> Comment:
+    """Create a comment with the given ID."""
+    return Comment(
+        id=comment_id,
+        subfeddit_id=subfeddit_id,
+        username="test_user",
+        text=f"Comment {comment_id}",
+        created_at=datetime.fromtimestamp(1609459200 + comment_id)
+    )
+
+
+class TestFetchCommentsRange:
+    """Test cases for FedditClient.fetch_comments_range."""
+
+    @pytest.mark.asyncio
+    async def test_splits_range_into_pages(self, feddit_client):
+        """Test that the range is split into skip/limit pages in order."""
+        async def get_comments(subfeddit_id, limit, skip):
+            return [make_comment(i + 1, subfeddit_id) for i in range(skip, skip + limit)]
+
+        feddit_client.get_comments = AsyncMock(side_effect=get_comments)
+
+        comments = await feddit_client.fetch_comments_range(
+            subfeddit_id=1, total=250, page_size=100, concurrency=2
+        )
+
+        assert [c.id for c in comments] == list(range(1, 251))
+        calls = [call.kwargs for call in feddit_client.get_comments.call_args_list]
+        assert calls == [
+            {"subfeddit_id": 1, "limit": 100, "skip": 0},
+            {"subfeddit_id": 1, "limit": 100, "skip": 100},
+            {"subfeddit_id": 1, "limit": 50, "skip": 200},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency(self, feddit_client):
+        """Test that no more than `concurrency` pages are in flight."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_comments(subfeddit_id, limit, skip):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [make_comment(skip + 1)]
+
+        feddit_client.get_comments = AsyncMock(side_effect=get_comments)
+
+        await feddit_client.fetch_comments_range(
+            subfeddit_id=1, total=100, page_size=10, concurrency=3
+        )
+
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_drops_duplicate_ids(self, feddit_client):
+        """Test that comments shifted across page boundaries are deduplicated."""
+        pages = {
+            0: [make_comment(1), make_comment(2)],
+            2: [make_comment(2), make_comment(3)],
+        }
+        feddit_client.get_comments = AsyncMock(
+            side_effect=lambda subfeddit_id, limit, skip: pages[skip]
+        )
+
+        comments = await feddit_client.fetch_comments_range(
+            subfeddit_id=1, total=4, page_size=2
+        )
+
+        assert [c.id for c in comments] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments(self, feddit_client):
+        """Test argument validation."""
+        with pytest.raises(ValueError, match="Page size must be between 1 and 100"):
+            await feddit_client.fetch_comments_range(subfeddit_id=1, total=10, page_size=101)
+        with pytest.raises(ValueError, match="Concurrency must be at least 1"):
+            await feddit_client.fetch_comments_range(subfeddit_id=1, total=10, concurrency=0)
+        with pytest.raises(ValueError, match="Total must be non-negative"):
+            await feddit_client.fetch_comments_range(subfeddit_id=1, total=-1)
+
+
+class TestAiterComments:
+    """Test cases for FedditClient.aiter_comments."""
+
+    @pytest.mark.asyncio
+    async def test_streams_all_pages(self, feddit_client):
+        """Test that pages are streamed until a short page is returned."""
+        async def get_comments(subfeddit_id, limit, skip):
+            end = min(skip + limit, 25)
+            return [make_comment(i + 1) for i in range(skip, end)]
+
+        feddit_client.get_comments = AsyncMock(side_effect=get_comments)
+
+        ids = [c.id async for c in feddit_client.aiter_comments(subfeddit_id=1, page_size=10)]
+
+        assert ids == list(range(1, 26))
+        assert feddit_client.get_comments.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_prefetch_bounds_read_ahead(self, feddit_client):
+        """Test that no more than `prefetch` unconsumed pages are fetched."""
+        async def get_comments(subfeddit_id, limit, skip):
+            return [make_comment(i + 1) for i in range(skip, skip + limit)]
+
+        feddit_client.get_comments = AsyncMock(side_effect=get_comments)
+        stream = feddit_client.aiter_comments(subfeddit_id=1, page_size=5, prefetch=2)
+
+        first = await stream.__anext__()
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert first.id == 1
+        assert feddit_client.get_comments.await_count == 2
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_max_comments(self, feddit_client):
+        """Test that the stream stops after max_comments."""
+        async def get_comments(subfeddit_id, limit, skip):
+            return [make_comment(i + 1) for i in range(skip, skip + limit)]
+
+        feddit_client.get_comments = AsyncMock(side_effect=get_comments)
+
+        ids = [
+            c.id async for c in feddit_client.aiter_comments(
+                subfeddit_id=1, start_skip=5, page_size=4, max_comments=6
+            )
+        ]
+
+        assert ids == [6, 7, 8, 9, 10, 11]
+
+    @pytest.mark.asyncio
+    async def test_propagates_errors(self, feddit_client):
+        """Test that fetch errors are raised to the consumer."""
+        feddit_client.get_comments = AsyncMock(side_effect=Exception("API Error"))
+
+        with pytest.raises(Exception, match="API Error"):
+            async for _ in feddit_client.aiter_comments(subfeddit_id=1):
+                pass
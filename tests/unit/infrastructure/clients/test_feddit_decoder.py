@@ -0,0 +1,114 @@
+"""Tests for the schema-compiled Feddit decoder."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient
+from sentiment_analysis.infrastructure.clients.feddit_decoder import (
+    decode_comments,
+    decode_subfeddits
+)
+
+COMMENTS_PAGE = {
+    "subfeddit_id": 1,
+    "limit": 2,
+    "skip": 0,
+    "comments": [
+        {"id": 1, "username": " user_1 ", "text": "Great!", "created_at": 1609459200},
+        {"id": 2, "username": "user_2", "text": " Bad ", "created_at": 1609459260}
+    ]
+}
+
+SUBFEDDITS_PAGE = {
+    "limit": 1,
+    "skip": 0,
+    "subfeddits": [
+        {"id": 1, "username": "admin", "title": "Dummy Topic 1", "description": "Dummy"}
+    ]
+}
+
+
+def make_response(json_data):
+    """Create a real httpx response bound to a request."""
+    return httpx.Response(
+        200,
+        json=json_data,
+        request=httpx.Request("GET", "http://test.com/api/v1/comments/")
+    )
+
+
+class TestDecodeComments:
+    """Test cases for decode_comments."""
+
+    def test_matches_standard_decoder(self):
+        """Test that the fast and standard decoders build equal entities."""
+        response = make_response(COMMENTS_PAGE)
+        standard = FedditClient(base_url="http://test.com", decoder="standard")
+
+        expected = standard._parse_comments(response, subfeddit_id=1)
+        comments = decode_comments(response.content, subfeddit_id=1)
+
+        assert comments == expected
+        assert comments[0].username == "user_1"
+        assert comments[1].text == "Bad"
+        assert [c.model_dump() for c in comments] == [c.model_dump() for c in expected]
+
+    def test_accepts_list_payload(self):
+        """Test that a bare list of comments is accepted."""
+        content = json.dumps(COMMENTS_PAGE["comments"]).encode()
+        assert [c.id for c in decode_comments(content, subfeddit_id=1)] == [1, 2]
+
+    @pytest.mark.parametrize("field, value", [
+        ("id", 0),
+        ("username", "   "),
+        ("text", ""),
+        ("created_at", "yesterday")
+    ])
+    def test_rejects_invalid_comments(self, field, value):
+        """Test that the schema enforces the Comment constraints."""
+        comment = {**COMMENTS_PAGE["comments"][0], field: value}
+        content = json.dumps({"comments": [comment]}).encode()
+
+        with pytest.raises(ValidationError):
+            decode_comments(content, subfeddit_id=1)
+
+    def test_rejects_invalid_subfeddit_id(self):
+        """Test that a non-positive subfeddit id is rejected."""
+        with pytest.raises(ValueError):
+            decode_comments(b'{"comments": []}', subfeddit_id=0)
+
+
+def test_decode_subfeddits():
+    """Test that subfeddits are decoded into equal entities."""
+    content = json.dumps(SUBFEDDITS_PAGE).encode()
+    standard = FedditClient(base_url="http://test.com", decoder="standard")
+
+    subfeddits = decode_subfeddits(content)
+
+    assert subfeddits == standard._parse_subfeddits(make_response(SUBFEDDITS_PAGE))
+    assert subfeddits[0].title == "Dummy Topic 1"
+
+
+class TestFedditClientDecoder:
+    """Test cases for the FedditClient decoder option."""
+
+    @pytest.mark.asyncio
+    async def test_fast_decoder(self):
+        """Test that get_comments decodes response bytes with the fast decoder."""
+        http_client = MagicMock()
+        http_client.get = AsyncMock(return_value=make_response(COMMENTS_PAGE))
+        client = FedditClient(base_url="http://test.com", http_client=http_client, decoder="fast")
+
+        comments = await client.get_comments(subfeddit_id=1, limit=2)
+
+        assert [c.id for c in comments] == [1, 2]
+        assert comments[0].created_at.timestamp() == 1609459200
+
+    def test_unknown_decoder(self):
+        """Test that an unknown decoder name is rejected."""
+        with pytest.raises(ValueError):
+            FedditClient(base_url="http://test.com", decoder="simdjson")
@@ -0,0 +1,142 @@
+"""Tests for PageCache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient
+from sentiment_analysis.infrastructure.clients.page_cache import PageCache
+
+COMMENTS_PAGE = {"comments": [{
+    "id": 1,
+    "username": "test_user",
+    "text": "Test comment",
+    "created_at": 1609459200
+}]}
+
+
+def make_response(status_code=200, json=None, headers=None):
+    """Create a real httpx response bound to a request."""
+    return httpx.Response(
+        status_code=status_code,
+        json=json,
+        headers=headers,
+        request=httpx.Request("GET", "http://test.com/api/v1/comments/")
+    )
+
+
+class TestPageCache:
+    """Test cases for PageCache."""
+
+    def test_hit_and_miss(self):
+        """Test that fresh entries are hits and unknown keys are misses."""
+        cache = PageCache()
+        assert cache.lookup("a") is None
+
+        cache.store("a", "/x", value=[1], size=10)
+
+        assert cache.lookup("a").value == [1]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_expired_entry_is_returned_for_revalidation(self):
+        """Test that an expired entry is a miss but is still returned."""
+        cache = PageCache(default_ttl=0.0)
+        cache.store("a", "/x", value=[1], size=10, etag='"v1"')
+
+        entry = cache.lookup("a")
+
+        assert not entry.fresh
+        assert entry.conditional_headers() == {"If-None-Match": '"v1"'}
+        assert cache.stats()["misses"] == 1
+
+    def test_per_endpoint_ttl(self):
+        """Test that endpoint TTLs override the default."""
+        cache = PageCache(default_ttl=0.0, endpoint_ttls={"/slow": 60.0})
+        cache.store("a", "/slow", value=1, size=1)
+        cache.store("b", "/fast", value=2, size=1)
+
+        assert cache.lookup("a").fresh
+        assert not cache.lookup("b").fresh
+
+    def test_evicts_least_recently_used_by_size(self):
+        """Test that the byte budget evicts least recently used entries."""
+        cache = PageCache(max_bytes=25)
+        cache.store("a", "/x", value=1, size=10)
+        cache.store("b", "/x", value=2, size=10)
+        cache.lookup("a")
+        cache.store("c", "/x", value=3, size=10)
+
+        assert cache.lookup("b") is None
+        assert cache.lookup("a") is not None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] == 20
+
+    def test_skips_oversized_entries(self):
+        """Test that entries larger than the whole budget are not stored."""
+        cache = PageCache(max_bytes=5)
+        cache.store("a", "/x", value=1, size=10)
+        assert cache.stats()["entries"] == 0
+
+
+class TestFedditClientPageCache:
+    """Test cases for the FedditClient page cache integration."""
+
+    @pytest.fixture
+    def http_client(self):
+        """Create a mock httpx client."""
+        return MagicMock()
+
+    @pytest.fixture
+    def client(self, http_client):
+        """Create a FedditClient with a page cache."""
+        return FedditClient(
+            base_url="http://test.com",
+            http_client=http_client,
+            page_cache=PageCache()
+        )
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_request(self, client, http_client):
+        """Test that a cached page is served without a request."""
+        http_client.get = AsyncMock(return_value=make_response(json=COMMENTS_PAGE))
+
+        first = await client.get_comments(subfeddit_id=1)
+        second = await client.get_comments(subfeddit_id=1)
+
+        assert [c.id for c in first] == [c.id for c in second] == [1]
+        http_client.get.assert_awaited_once()
+        assert client.page_cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_revalidate_skips_fresh_page(self, client, http_client):
+        """Test that a forced revalidation asks the API even for a fresh cached page."""
+        page = {"subfeddits": [{"id": 1, "username": "user", "title": "Topic 1", "description": ""}]}
+        http_client.get = AsyncMock(side_effect=[
+            make_response(json=page, headers={"ETag": '"v1"'}),
+            make_response(status_code=304)
+        ])
+
+        await client.get_subfeddits()
+        subfeddits = await client.get_subfeddits(revalidate=True)
+
+        assert [s.title for s in subfeddits] == ["Topic 1"]
+        assert http_client.get.await_count == 2
+        assert http_client.get.await_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    @pytest.mark.asyncio
+    async def test_revalidates_with_etag(self, client, http_client):
+        """Test that expired pages are revalidated with If-None-Match."""
+        http_client.get = AsyncMock(side_effect=[
+            make_response(json=COMMENTS_PAGE, headers={"ETag": '"v1"'}),
+            make_response(status_code=304)
+        ])
+
+        with patch("sentiment_analysis.infrastructure.clients.page_cache.time.monotonic", return_value=0.0):
+            await client.get_comments(subfeddit_id=1)
+        comments = await client.get_comments(subfeddit_id=1)
+
+        assert [c.id for c in comments] == [1]
+        assert http_client.get.await_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert client.page_cache.stats()["revalidations"] == 1
@@ -0,0 +1,233 @@
+"""Tests for the Feddit resilience layer."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient
+from sentiment_analysis.infrastructure.clients.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ResilientExecutor
+)
+
+
+def make_response(status_code=200, json=None):
+    """Create a real httpx response bound to a request."""
+    return httpx.Response(
+        status_code=status_code,
+        json=json,
+        request=httpx.Request("GET", "http://test.com/api/v1/comments/")
+    )
+
+
+def executor(**kwargs):
+    """Create an executor with negligible backoff."""
+    return ResilientExecutor(**{"backoff_base": 0.001, "backoff_cap": 0.001, **kwargs})
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that the breaker opens at the threshold and rejects calls."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60.0)
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        assert breaker.rejections == 1
+
+    def test_success_resets_failure_count(self):
+        """Test that only consecutive failures count."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_single_probe(self):
+        """Test that one probe is let through after the reset timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_probe_reopens(self):
+        """Test that a failing half-open probe opens the breaker again."""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60.0)
+        for _ in range(3):
+            breaker.record_failure()
+        with patch("sentiment_analysis.infrastructure.clients.resilience.time.monotonic",
+                   return_value=breaker._opened_at + 61.0):
+            breaker.before_call()
+            breaker.record_failure()
+            assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.opens == 2
+
+
+class TestResilientExecutor:
+    """Test cases for ResilientExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_retries_transport_errors(self):
+        """Test that transport errors are retried until a response arrives."""
+        send = AsyncMock(side_effect=[httpx.ConnectError("refused"), make_response()])
+        resilience = executor(max_retries=2)
+
+        response = await resilience.call(send)
+
+        assert response.status_code == 200
+        assert send.await_count == 2
+        assert resilience.stats()["retries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_retryable_status(self):
+        """Test that retryable status codes are retried."""
+        send = AsyncMock(side_effect=[make_response(503), make_response(200)])
+        response = await executor().call(send)
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(self):
+        """Test that non-retryable responses are returned as is."""
+        send = AsyncMock(return_value=make_response(404))
+        response = await executor().call(send)
+        assert response.status_code == 404
+        send.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        """Test that the last error is raised once retries are exhausted."""
+        send = AsyncMock(side_effect=httpx.ConnectError("refused"))
+        resilience = executor(max_retries=2)
+
+        with pytest.raises(httpx.ConnectError):
+            await resilience.call(send)
+
+        assert send.await_count == 3
+        assert resilience.stats()["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """Test that slow attempts time out and are retried."""
+        async def slow():
+            await asyncio.sleep(1)
+
+        resilience = executor(timeout=0.01, max_retries=1)
+
+        with pytest.raises(httpx.TimeoutException):
+            await resilience.call(slow)
+
+        assert resilience.stats()["timeouts"] == 2
+
+    @pytest.mark.asyncio
+    async def test_hedged_request_wins(self):
+        """Test that a hedged duplicate answers when the first attempt is slow."""
+        calls = 0
+
+        async def send():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(1 if calls == 1 else 0)
+            return make_response()
+
+        resilience = executor(hedge=True, hedge_delay=0.01)
+
+        response = await resilience.call(send)
+
+        assert response.status_code == 200
+        assert resilience.stats()["hedges"] == 1
+        assert resilience.stats()["hedge_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_losing_attempt_is_awaited(self):
+        """Test that the losing attempt has finished unwinding when the call returns."""
+        calls = 0
+        released = False
+
+        async def send():
+            nonlocal calls, released
+            calls += 1
+            if calls == 1:
+                try:
+                    await asyncio.sleep(1)
+                finally:
+                    released = True
+            return make_response()
+
+        resilience = executor(hedge=True, hedge_delay=0.01)
+
+        await resilience.call(send)
+
+        assert released
+
+    @pytest.mark.asyncio
+    async def test_fast_attempt_is_not_hedged(self):
+        """Test that no duplicate is sent when the first attempt is fast."""
+        send = AsyncMock(return_value=make_response())
+        resilience = executor(hedge=True, hedge_delay=1.0)
+
+        await resilience.call(send)
+
+        send.assert_awaited_once()
+        assert resilience.stats()["hedges"] == 0
+
+    def test_hedge_delay_uses_latency_quantile(self):
+        """Test that the hedge delay follows the observed p95 latency."""
+        resilience = executor(hedge_delay=0.5, min_latency_samples=20)
+        assert resilience.current_hedge_delay() == 0.5
+
+        resilience._latencies.extend(i / 100 for i in range(1, 101))
+
+        assert resilience.current_hedge_delay() == pytest.approx(0.96)
+
+    @pytest.mark.asyncio
+    async def test_breaker_fails_fast(self):
+        """Test that an open breaker rejects calls without sending them."""
+        send = AsyncMock(side_effect=httpx.ConnectError("refused"))
+        resilience = executor(max_retries=0, breaker=CircuitBreaker(failure_threshold=2))
+
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError):
+                await resilience.call(send)
+        with pytest.raises(CircuitOpenError):
+            await resilience.call(send)
+
+        assert send.await_count == 2
+        assert resilience.stats()["breaker_state"] == CircuitBreaker.OPEN
+        assert resilience.stats()["breaker_rejections"] == 1
+
+
+@pytest.mark.asyncio
+async def test_feddit_client_retries_through_resilience_layer():
+    """Test that FedditClient GETs go through the resilience layer."""
+    http_client = MagicMock()
+    http_client.get = AsyncMock(side_effect=[
+        httpx.ConnectError("refused"),
+        make_response(json={"comments": [{
+            "id": 1, "username": "test_user", "text": "Test comment", "created_at": 1609459200
+        }]})
+    ])
+    client = FedditClient(
+        base_url="http://test.com",
+        http_client=http_client,
+        resilience=executor()
+    )
+
+    comments = await client.get_comments(subfeddit_id=1)
+
+    assert [c.id for c in comments] == [1]
+    assert http_client.get.await_count == 2
+    assert client.stats()["resilience"]["retries"] == 1
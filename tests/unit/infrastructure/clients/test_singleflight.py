@@ -0,0 +1,150 @@
+"""Tests for SingleFlight request coalescing."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient
+from sentiment_analysis.infrastructure.clients.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test that identical concurrent calls run once."""
+        group = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(group.do("key", work) for _ in range(5)))
+
+        assert results == ["result"] * 5
+        assert calls == 1
+        assert group.stats() == {"issued": 1, "coalesced": 4, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        """Test that calls with different keys are not coalesced."""
+        group = SingleFlight()
+
+        async def work(value):
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(
+            group.do("a", lambda: work(1)),
+            group.do("b", lambda: work(2))
+        )
+
+        assert results == [1, 2]
+        assert group.issued == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_coalesced(self):
+        """Test that a finished call is not reused."""
+        group = SingleFlight()
+        work = AsyncMock(return_value="result")
+
+        await group.do("key", work)
+        await group.do("key", work)
+
+        assert work.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_waiter(self):
+        """Test that a failing call raises in every waiter."""
+        group = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *(group.do("key", work) for _ in range(3)),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(self):
+        """Test that cancelling one waiter leaves the shared call running."""
+        group = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "result"
+
+        first = asyncio.create_task(group.do("key", work))
+        second = asyncio.create_task(group.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second == "result"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    @pytest.mark.asyncio
+    async def test_last_cancelled_waiter_cancels_call(self):
+        """Test that the shared call is cancelled once nobody waits for it."""
+        group = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def work():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        waiter = asyncio.create_task(group.do("key", work))
+        await started.wait()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(0)
+
+        assert cancelled.is_set()
+        assert group.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_feddit_client_coalesces_identical_requests():
+    """Test that identical concurrent get_comments calls issue one HTTP request."""
+    async def get(path, params):
+        await asyncio.sleep(0.01)
+        response = MagicMock()
+        response.json.return_value = {"comments": [{
+            "id": 1,
+            "username": "test_user",
+            "text": "Test comment",
+            "created_at": int(datetime(2024, 1, 1).timestamp())
+        }]}
+        return response
+
+    http_client = MagicMock()
+    http_client.get = AsyncMock(side_effect=get)
+    client = FedditClient(base_url="http://test.com", http_client=http_client)
+
+    results = await asyncio.gather(
+        *(client.get_comments(subfeddit_id=1, limit=10) for _ in range(4))
+    )
+
+    assert all(len(r) == 1 for r in results)
+    assert results[0] is not results[1]
+    http_client.get.assert_awaited_once()
+    assert client.singleflight.stats()["coalesced"] == 3
@@ -0,0 +1,120 @@
+"""Tests for SubfedditCatalog."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from sentiment_analysis.domain.entities.subfeddit import Subfeddit
+from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient
+from sentiment_analysis.infrastructure.clients.subfeddit_catalog import SubfedditCatalog
+
+
+def make_subfeddits(count: int):
+    """Create `count` subfeddits with distinct titles."""
+    return [
+        Subfeddit(id=i, username="user", title=f"Topic {i}", description="")
+        for i in range(1, count + 1)
+    ]
+
+
+@pytest.fixture
+def mock_feddit_client():
+    """Create a mock FedditClient serving 25 subfeddits."""
+    subfeddits = make_subfeddits(25)
+    client = AsyncMock(spec=FedditClient)
+    client.get_subfeddits.side_effect = lambda limit, skip, revalidate=False: subfeddits[skip:skip + limit]
+    return client
+
+
+class TestSubfedditCatalog:
+    """Test cases for SubfedditCatalog."""
+
+    @pytest.mark.asyncio
+    async def test_pages_through_all_subfeddits(self, mock_feddit_client):
+        """Test that subfeddits beyond the first page are indexed."""
+        catalog = SubfedditCatalog(mock_feddit_client, page_size=10)
+
+        subfeddit = await catalog.get_by_title("Topic 23")
+
+        assert subfeddit.id == 23
+        assert mock_feddit_client.get_subfeddits.await_count == 3
+        mock_feddit_client.get_subfeddits.assert_awaited_with(limit=10, skip=20, revalidate=True)
+
+    @pytest.mark.asyncio
+    async def test_lookups_hit_memory(self, mock_feddit_client):
+        """Test that lookups after the first load do not call the API."""
+        catalog = SubfedditCatalog(mock_feddit_client)
+
+        await catalog.get_by_title("Topic 1")
+        assert await catalog.get_by_title("Topic 2") is not None
+        assert await catalog.get_by_id(3) is not None
+        assert await catalog.get_by_title("Missing") is None
+
+        assert mock_feddit_client.get_subfeddits.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_miss_refreshes_catalog_once(self, mock_feddit_client):
+        """Test that an unknown title refreshes an old enough catalog before giving up."""
+        subfeddits = make_subfeddits(25)
+        mock_feddit_client.get_subfeddits.side_effect = lambda limit, skip, revalidate=False: subfeddits[skip:skip + limit]
+        catalog = SubfedditCatalog(mock_feddit_client, miss_refresh_interval=0.0)
+        await catalog.refresh()
+        subfeddits.append(Subfeddit(id=26, username="user", title="New Topic", description=""))
+
+        assert (await asyncio.gather(*(catalog.get_by_title("New Topic") for _ in range(3))))[0].id == 26
+        assert mock_feddit_client.get_subfeddits.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_miss_refresh_is_rate_limited(self, mock_feddit_client):
+        """Test that misses on a recently refreshed catalog do not refresh it again."""
+        catalog = SubfedditCatalog(mock_feddit_client, miss_refresh_interval=60.0)
+
+        assert await catalog.get_by_title("Missing") is None
+        assert await catalog.get_by_title("Missing") is None
+
+        assert mock_feddit_client.get_subfeddits.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_case_insensitive_keys(self, mock_feddit_client):
+        """Test case-insensitive title lookups."""
+        catalog = SubfedditCatalog(mock_feddit_client, case_insensitive=True)
+
+        assert (await catalog.get_by_title("topic 5")).id == 5
+        assert await SubfedditCatalog(mock_feddit_client).get_by_title("topic 5") is None
+
+    @pytest.mark.asyncio
+    async def test_stale_catalog_refreshes_in_background(self, mock_feddit_client):
+        """Test that a stale catalog is served while it refreshes."""
+        catalog = SubfedditCatalog(mock_feddit_client, ttl=0.0)
+        await catalog.refresh()
+
+        assert (await catalog.get_by_title("Topic 1")).id == 1
+        await asyncio.sleep(0)
+
+        assert mock_feddit_client.get_subfeddits.await_count == 2
+        await catalog.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_previous_data(self, mock_feddit_client):
+        """Test that a failing refresh does not drop the cached catalog."""
+        catalog = SubfedditCatalog(mock_feddit_client)
+        await catalog.refresh()
+        mock_feddit_client.get_subfeddits.side_effect = httpx.HTTPError("API Error")
+
+        with pytest.raises(httpx.HTTPError):
+            await catalog.refresh()
+
+        assert (await catalog.get_by_title("Topic 1")).id == 1
+
+    @pytest.mark.asyncio
+    async def test_start_and_close(self, mock_feddit_client):
+        """Test that start loads the catalog and close stops the refresh task."""
+        catalog = SubfedditCatalog(mock_feddit_client)
+
+        await catalog.start()
+        assert (await catalog.get_by_id(1)).title == "Topic 1"
+        await catalog.close()
+
+        assert mock_feddit_client.get_subfeddits.await_count == 1
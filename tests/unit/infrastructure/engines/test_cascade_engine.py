@@ -0,0 +1,181 @@
+"""Tests for the confidence-based analyzer cascade."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sentiment_analysis.domain.entities.analysis_outcome import (
+    AnalysisFailure,
+    AnalysisOutcome,
+    PartialAnalysisError,
+)
+from sentiment_analysis.domain.entities.comment import Comment
+from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
+from sentiment_analysis.domain.services.analyzer_engine import AnalyzerEngine
+from sentiment_analysis.infrastructure.engines.cascade_engine import CascadeSentimentEngine
+from sentiment_analysis.infrastructure.deadline import DeadlineExceeded
+from sentiment_analysis.infrastructure.engines.lexicon_engine import LexiconSentimentEngine
+
+
+def make_comment(comment_id, text):
+    """Create a comment with the given text."""
+    return Comment(
+        id=comment_id,
+        subfeddit_id=1,
+        username="user",
+        text=text,
+        created_at=datetime(2024, 1, 1)
+    )
+
+
+def accurate_analysis(comment):
+    """Analysis the accurate engine returns for a comment."""
+    return SentimentAnalysis(
+        id=comment.id,
+        comment_id=comment.id,
+        comment_text=comment.text,
+        subfeddit_id=comment.subfeddit_id,
+        sentiment_score=-0.3,
+        sentiment_label="negative",
+        created_at=comment.created_at,
+        engine="openai"
+    )
+
+
+@pytest.fixture
+def accurate():
+    """Create a mocked accurate engine."""
+    engine = AsyncMock(spec=AnalyzerEngine)
+    engine.analyze.side_effect = lambda comments: [accurate_analysis(c) for c in comments]
+    return engine
+
+
+class TestCascadeSentimentEngine:
+    """Test cases for CascadeSentimentEngine."""
+
+    @pytest.mark.asyncio
+    async def test_escalates_only_uncertain_comments(self, accurate):
+        """Test that confident comments stay with the fast engine."""
+        cascade = CascadeSentimentEngine(LexiconSentimentEngine(), accurate, threshold=0.5)
+        comments = [
+            make_comment(1, "excellent work, I love it"),
+            make_comment(2, "the config field"),
+            make_comment(3, "terrible and broken"),
+            make_comment(4, "upgrade today"),
+        ]
+
+        analyses = await cascade.analyze(comments)
+
+        assert [a.comment_id for a in analyses] == [1, 2, 3, 4]
+        assert [a.engine for a in analyses] == ["lexicon", "openai", "lexicon", "openai"]
+        escalated = accurate.analyze.await_args.args[0]
+        assert [c.id for c in escalated] == [2, 4]
+        assert cascade.stats()["escalation_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_skips_accurate_engine_when_all_confident(self, accurate):
+        """Test that no LLM call is made when every comment is confident."""
+        cascade = CascadeSentimentEngine(LexiconSentimentEngine(), accurate, threshold=0.5)
+
+        analyses = await cascade.analyze([make_comment(1, "awesome, brilliant, great")])
+
+        assert analyses[0].sentiment_label == "positive"
+        accurate.analyze.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_threshold_bounds(self, accurate):
+        """Test that threshold 0 never escalates and threshold 1 always does."""
+        comments = [make_comment(1, "excellent"), make_comment(2, "meh")]
+
+        never = CascadeSentimentEngine(LexiconSentimentEngine(), accurate, threshold=0.0)
+        always = CascadeSentimentEngine(LexiconSentimentEngine(), accurate, threshold=1.0)
+
+        assert {a.engine for a in await never.analyze(comments)} == {"lexicon"}
+        assert {a.engine for a in await always.analyze(comments)} == {"openai"}
+
+    @pytest.mark.asyncio
+    async def test_keeps_answers_when_escalations_fail(self, accurate):
+        """Test that comments the accurate engine failed do not discard the others."""
+        def partial(comments):
+            raise PartialAnalysisError(AnalysisOutcome(
+                analyses=[accurate_analysis(comments[1])],
+                failures=[AnalysisFailure(
+                    comment_id=comments[0].id,
+                    error_type="RateLimitError",
+                    message="Rate limit reached",
+                    attempts=3,
+                    retryable=True
+                )]
+            ))
+        accurate.analyze.side_effect = partial
+        cascade = CascadeSentimentEngine(LexiconSentimentEngine(), accurate, threshold=0.5)
+        comments = [
+            make_comment(1, "excellent work, I love it"),
+            make_comment(2, "the config field"),
+            make_comment(3, "upgrade today"),
+        ]
+
+        outcome = await cascade.analyze_outcome(comments)
+
+        assert [(a.comment_id, a.engine) for a in outcome.analyses] == [(1, "lexicon"), (3, "openai")]
+        assert [f.comment_id for f in outcome.failures] == [2]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error", [DeadlineExceeded("late"), RuntimeError("LLM unavailable")])
+    async def test_keeps_fast_answers_when_accurate_engine_fails(self, accurate, error):
+        """Test that an outright failure or timeout of the accurate engine fails only the escalated comments."""
+        accurate.analyze.side_effect = error
+        cascade = CascadeSentimentEngine(LexiconSentimentEngine(), accurate, threshold=0.5)
+        comments = [
+            make_comment(1, "excellent work, I love it"),
+            make_comment(2, "the config field"),
+        ]
+
+        outcome = await cascade.analyze_outcome(comments)
+
+        assert [(a.comment_id, a.engine) for a in outcome.analyses] == [(1, "lexicon")]
+        assert [(f.comment_id, f.error_type) for f in outcome.failures] == [(2, type(error).__name__)]
+        assert outcome.failures[0].retryable == isinstance(error, DeadlineExceeded)
+
+    @pytest.mark.asyncio
+    async def test_raises_when_accurate_engine_fails_every_comment(self, accurate):
+        """Test that the error propagates when no fast answer was kept."""
+        accurate.analyze.side_effect = DeadlineExceeded("late")
+        cascade = CascadeSentimentEngine(LexiconSentimentEngine(), accurate, threshold=0.5)
+
+        with pytest.raises(DeadlineExceeded):
+            await cascade.analyze([make_comment(1, "the config field")])
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_confident_answers_first(self, accurate):
+        """Test that fast answers are streamed before the escalated ones."""
+        async def analyze_stream(comments):
+            for comment in comments:
+                yield accurate_analysis(comment)
+        accurate.analyze_stream = analyze_stream
+        cascade = CascadeSentimentEngine(LexiconSentimentEngine(), accurate, threshold=0.5)
+        comments = [
+            make_comment(1, "the config field"),
+            make_comment(2, "excellent work, I love it"),
+        ]
+
+        results = [result async for result in cascade.analyze_stream(comments)]
+
+        assert [(r.comment_id, r.engine) for r in results] == [(2, "lexicon"), (1, "openai")]
+
+    def test_rejects_invalid_threshold(self, accurate):
+        """Test threshold validation."""
+        with pytest.raises(ValueError):
+            CascadeSentimentEngine(LexiconSentimentEngine(), accurate, threshold=1.5)
+
+    def test_reuses_accurate_and_confident_fast_answers(self, accurate):
+        """Test that stored answers are reused only if the cascade would have kept them."""
+        accurate.reuses = MagicMock(side_effect=lambda analysis: analysis.engine == "openai")
+        cascade = CascadeSentimentEngine(LexiconSentimentEngine(), accurate, threshold=0.5)
+        stored = accurate_analysis(make_comment(1, "meh"))
+
+        assert cascade.reuses(stored)
+        assert cascade.reuses(stored.model_copy(update={"engine": "lexicon", "sentiment_score": -0.8}))
+        assert not cascade.reuses(stored.model_copy(update={"engine": "lexicon"}))
+        assert not cascade.reuses(stored.model_copy(update={"engine": "embedding"}))
@@ -0,0 +1,172 @@
+"""Tests for the embedding sentiment engine and its classification head."""
+
+from datetime import datetime
+
+import httpx
+import numpy as np
+import pytest
+from openai import AsyncOpenAI
+
+from sentiment_analysis.domain.entities.comment import Comment
+from sentiment_analysis.domain.entities.sentiment_analysis import SentimentAnalysis
+from sentiment_analysis.fakes.feddit_data import FedditDataset
+from sentiment_analysis.fakes.openai_server import create_app, score_text
+from sentiment_analysis.infrastructure.engines.embedding_engine import EmbeddingCache, EmbeddingSentimentEngine
+from sentiment_analysis.infrastructure.engines.embedding_head import EmbeddingHead, fit_head_from_repository
+from sentiment_analysis.infrastructure.repositories.sentiment_analysis_repository import SentimentAnalysisRepository
+
+
+def make_comments(count, subfeddit_id=1):
+    """Create synthetic Feddit comments."""
+    dataset = FedditDataset(subfeddits=1, comments_per_subfeddit=count)
+    return [
+        Comment(
+            id=item["id"],
+            subfeddit_id=subfeddit_id,
+            username=item["username"],
+            text=item["text"],
+            created_at=datetime.fromtimestamp(item["created_at"])
+        )
+        for item in dataset.list_comments(1, limit=count, skip=0)
+    ]
+
+
+def label(comment, engine="openai"):
+    """Label a comment with the stand-in scorer, as the LLM engine would."""
+    score = score_text(comment.text)
+    return SentimentAnalysis(
+        id=comment.id,
+        comment_id=comment.id,
+        comment_text=comment.text,
+        subfeddit_id=comment.subfeddit_id,
+        sentiment_score=score,
+        sentiment_label="positive" if score > 0 else "negative",
+        created_at=comment.created_at,
+        engine=engine
+    )
+
+
+@pytest.fixture
+def app():
+    """Create the OpenAI stand-in app."""
+    return create_app()
+
+
+@pytest.fixture
+def engine(app):
+    """Create an embedding engine without a head, routed to the stand-in."""
+    client = AsyncOpenAI(
+        api_key="test-key",
+        base_url="http://openai/v1",
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+    )
+    return EmbeddingSentimentEngine(client=client, model="text-embedding-3-small", dimensions=128, batch_size=100)
+
+
+class TestEmbeddingHead:
+    """Test cases for EmbeddingHead."""
+
+    def test_fit_separates_classes(self):
+        """Test that the fitted head recovers a linearly separable labelling."""
+        rng = np.random.default_rng(0)
+        embeddings = rng.standard_normal((400, 16)).astype(np.float32)
+        positive = embeddings[:, 0] + 0.5 * embeddings[:, 1] > 0
+
+        head = EmbeddingHead.fit(embeddings, positive, model="m")
+        scores = head.predict(embeddings)
+
+        assert np.mean((scores > 0) == positive) > 0.97
+        assert np.all(np.abs(scores) <= 1) and np.all(scores != 0)
+
+    def test_fit_needs_both_classes(self):
+        """Test that a single-class training set is rejected."""
+        with pytest.raises(ValueError, match="positive and negative"):
+            EmbeddingHead.fit(np.ones((3, 4)), np.array([True, True, True]), model="m")
+
+    def test_save_and_load(self, tmp_path):
+        """Test that a saved head loads back identically."""
+        head = EmbeddingHead(np.array([0.5, -1.0, 2.0]), 0.25, model="m", dimensions=3)
+        path = tmp_path / "heads" / "head.npz"
+
+        head.save(str(path))
+        loaded = EmbeddingHead.load(str(path))
+
+        np.testing.assert_array_equal(loaded.weights, head.weights)
+        assert (loaded.bias, loaded.model, loaded.dimensions) == (0.25, "m", 3)
+        assert loaded.version == head.version
+
+    def test_predict_checks_dimensions(self):
+        """Test that embeddings of another size are rejected."""
+        head = EmbeddingHead(np.ones(3), 0.0, model="m")
+
+        with pytest.raises(ValueError, match="dimensions"):
+            head.predict(np.ones((2, 4), dtype=np.float32))
+
+
+class TestEmbeddingCache:
+    """Test cases for EmbeddingCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that the cache keeps at most max_entries embeddings."""
+        cache = EmbeddingCache(max_entries=2)
+        cache.put("a", np.ones(2))
+        cache.put("b", np.ones(2))
+        cache.get("a")
+        cache.put("c", np.ones(2))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["evictions"] == 1
+
+
+class TestEmbeddingSentimentEngine:
+    """Test cases for EmbeddingSentimentEngine."""
+
+    @pytest.mark.asyncio
+    async def test_embeds_in_batches_and_caches(self, engine, app):
+        """Test that texts are deduplicated, batched and embedded only once."""
+        texts = [f"comment number {i}" for i in range(250)] + ["comment number 0"]
+
+        first = await engine.embed(texts)
+        second = await engine.embed(texts[:10])
+
+        assert first.shape == (251, 128) and first.dtype == np.float32
+        np.testing.assert_array_equal(first[0], first[-1])
+        np.testing.assert_array_equal(second, first[:10])
+        assert app.state.stats["embedding_requests"] == 3
+        assert app.state.stats["embedded_inputs"] == 250
+        assert engine.cache.stats()["hits"] == 10
+
+    @pytest.mark.asyncio
+    async def test_analyze_requires_head(self, engine):
+        """Test that analyzing without a head fails clearly."""
+        with pytest.raises(RuntimeError, match="head"):
+            await engine.analyze(make_comments(1))
+
+    def test_rejects_head_of_other_model(self, engine):
+        """Test that a head fitted on other embeddings is not installed."""
+        with pytest.raises(ValueError, match="fitted on"):
+            engine.set_head(EmbeddingHead(np.ones(128), 0.0, model="other", dimensions=128))
+
+    @pytest.mark.asyncio
+    async def test_fit_from_repository_and_analyze(self, engine):
+        """Test that a head fitted on stored LLM labels reproduces them."""
+        comments = make_comments(600)
+        repository = SentimentAnalysisRepository()
+        await repository.save_many([label(comment) for comment in comments[:500]])
+        # Results of the engine itself and of untrusted engines are not training data
+        await repository.save_many([
+            label(comment, engine="embedding") for comment in comments[500:550]
+        ] + [label(comment, engine="lexicon") for comment in comments[550:]])
+
+        head = await fit_head_from_repository(engine, repository, [1], page_size=128)
+        engine.set_head(head)
+        analyses = await engine.analyze(comments[500:])
+
+        assert engine.stats()["embedded"] == 600
+        assert [a.comment_id for a in analyses] == [c.id for c in comments[500:]]
+        assert all(a.engine == "embedding" for a in analyses)
+        agreement = np.mean([
+            a.sentiment_label == label(c).sentiment_label for a, c in zip(analyses, comments[500:])
+        ])
+        assert agreement > 0.85
@@ -0,0 +1,105 @@
+"""Tests for the local lexicon sentiment engine."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from sentiment_analysis.domain.entities.comment import Comment
+from sentiment_analysis.domain.services.analyzer_engine import AnalyzerEngine
+from sentiment_analysis.infrastructure.engines.lexicon_engine import MIN_SCORE, LexiconSentimentEngine
+
+
+def make_comment(comment_id, text):
+    """Create a comment with the given text."""
+    return Comment(
+        id=comment_id,
+        subfeddit_id=1,
+        username="user",
+        text=text,
+        created_at=datetime(2024, 1, 1)
+    )
+
+
+@pytest.fixture
+def engine():
+    """Create an engine with the bundled lexicon."""
+    return LexiconSentimentEngine()
+
+
+class TestLexiconSentimentEngine:
+    """Test cases for LexiconSentimentEngine."""
+
+    def test_is_an_analyzer_engine(self, engine):
+        """Test that the engine implements the analyzer interface."""
+        assert isinstance(engine, AnalyzerEngine)
+        assert engine.name == "lexicon"
+
+    def test_scores_follow_lexicon(self, engine):
+        """Test the sign and range of scores."""
+        scores = engine.score([
+            "I love this release, it is excellent",
+            "Terrible regression, everything is broken",
+            "great",
+        ])
+
+        assert scores[0] > 0.5
+        assert scores[1] < -0.5
+        assert 0 < scores[2] < scores[0]
+        assert all(-1.0 <= score <= 1.0 for score in scores)
+
+    def test_negation_flips_sign(self, engine):
+        """Test that words following a negator count with the opposite sign."""
+        good, not_good, far_away = engine.score([
+            "this is good",
+            "this is not good",
+            "not that it matters but the docs are good",
+        ])
+
+        assert good > 0
+        assert not_good < 0
+        assert far_away > 0
+
+    def test_unknown_words_get_a_non_zero_score(self, engine):
+        """Test that texts without lexicon words keep a small positive score."""
+        assert engine.score(["pydantic version upgrade"])[0] == MIN_SCORE
+
+    def test_empty_batch(self, engine):
+        """Test that an empty batch produces no scores."""
+        assert len(engine.score([])) == 0
+
+    def test_custom_weights_file(self, tmp_path):
+        """Test loading weights and bias from a file."""
+        path = tmp_path / "weights.json"
+        path.write_text(json.dumps({"weights": {"meh": -1.0}, "bias": -0.5, "alpha": 1.0}))
+        engine = LexiconSentimentEngine(weights_path=str(path))
+
+        neutral, meh = engine.score(["hello", "meh"])
+
+        assert neutral < 0
+        assert meh < neutral
+
+    def test_rejects_empty_weights(self, tmp_path):
+        """Test that a weights file without weights is rejected."""
+        path = tmp_path / "weights.json"
+        path.write_text(json.dumps({"weights": {}}))
+
+        with pytest.raises(ValueError):
+            LexiconSentimentEngine(weights_path=str(path))
+
+    @pytest.mark.asyncio
+    async def test_analyze_keeps_output_contract(self, engine):
+        """Test that analyze returns valid analyses in the order of the comments."""
+        comments = [
+            make_comment(1, "awesome work, thanks"),
+            make_comment(2, "slow and buggy"),
+            make_comment(3, "the config field"),
+        ]
+
+        analyses = await engine.analyze(comments)
+
+        assert [a.comment_id for a in analyses] == [1, 2, 3]
+        assert [a.sentiment_label for a in analyses] == ["positive", "negative", "positive"]
+        assert all(a.sentiment_score != 0 for a in analyses)
+        assert analyses[0].created_at == comments[0].created_at
+        assert engine.stats()["comments"] == 3
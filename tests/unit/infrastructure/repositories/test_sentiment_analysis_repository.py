@@ -52,3 +52,57 @@ class TestSentimentAnalysisRepository:
         saved_analysis = await repository.get_by_comment_id(1)
         assert saved_analysis is not None
         assert saved_analysis.comment_text == "Valid comment text"
+
+    @pytest.mark.asyncio
+    async def test_save_many(self):
+        """Test that save_many stores every analysis."""
+        # Arrange
+        repository = SentimentAnalysisRepository()
+        analyses = [
+            SentimentAnalysis(
+                id=i,
+                comment_id=i,
+                comment_text=f"Comment {i}",
+                subfeddit_id=1,
+                sentiment_score=0.5,
+                sentiment_label="positive",
+                created_at=datetime.now()
+            )
+            for i in range(1, 4)
+        ]
+
+        # Act
+        await repository.save_many(analyses)
+
+        # Assert
+        assert len(await repository.get_by_subfeddit(1)) == 3
+        assert (await repository.get_by_comment_id(2)).comment_text == "Comment 2"
+
+    @pytest.mark.asyncio
+    async def test_get_many_by_comment_ids(self):
+        """Test that bulk lookups return the latest analysis of stored comments only."""
+        # Arrange
+        repository = SentimentAnalysisRepository()
+        first, second, rescored = (
+            SentimentAnalysis(
+                id=analysis_id,
+                comment_id=comment_id,
+                comment_text=f"Comment {comment_id}",
+                subfeddit_id=1,
+                sentiment_score=score,
+                sentiment_label="positive" if score > 0 else "negative",
+                created_at=datetime.now()
+            )
+            for analysis_id, comment_id, score in ((1, 1, 0.5), (2, 2, 0.5), (3, 1, -0.4))
+        )
+        await repository.save_many([first, second])
+        await repository.save(rescored)
+
+        # Act
+        found = await repository.get_many_by_comment_ids([1, 3, 2, 1])
+
+        # Assert
+        assert found == {1: rescored, 2: second}
+        assert await repository.get_by_comment_id(1) == rescored
+        stats = repository.stats()
+        assert (stats["lookups"], stats["hits"]) == (3, 2)
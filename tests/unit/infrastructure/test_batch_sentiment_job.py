@@ -0,0 +1,130 @@
+"""Tests for the Batch API bulk scoring job."""
+
+from datetime import datetime
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+from sentiment_analysis.domain.entities.comment import Comment
+from sentiment_analysis.fakes.feddit_data import FedditDataset
+from sentiment_analysis.fakes.openai_server import create_app, score_text
+from sentiment_analysis.infrastructure.batch_sentiment_job import BatchJobError, BatchSentimentJob
+from sentiment_analysis.infrastructure.repositories.sentiment_analysis_repository import (
+    SentimentAnalysisRepository,
+)
+
+
+def make_comments(count):
+    """Create synthetic comments of subfeddit 1."""
+    dataset = FedditDataset(subfeddits=1, comments_per_subfeddit=count)
+    return [
+        Comment(
+            id=item["id"],
+            subfeddit_id=1,
+            username=item["username"],
+            text=item["text"],
+            created_at=datetime.fromtimestamp(item["created_at"])
+        )
+        for item in dataset.list_comments(1, limit=count, skip=0)
+    ]
+
+
+def make_client(app):
+    """Create an OpenAI client routed to the stand-in app."""
+    return AsyncOpenAI(
+        api_key="test-key",
+        base_url="http://openai/v1",
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+    )
+
+
+class CrashingRepository(SentimentAnalysisRepository):
+    """Repository whose bulk write fails once after a number of writes."""
+
+    def __init__(self, crash_on_write):
+        super().__init__()
+        self.writes = 0
+        self.crash_on_write = crash_on_write
+
+    async def save_many(self, analyses):
+        self.writes += 1
+        if self.writes == self.crash_on_write:
+            raise RuntimeError("Simulated crash")
+        await super().save_many(analyses)
+
+
+class TestBatchSentimentJob:
+    """Test cases for BatchSentimentJob."""
+
+    @pytest.mark.asyncio
+    async def test_scores_and_saves_all_comments(self, tmp_path):
+        """Test the full submit, poll and ingest flow across several batches."""
+        app = create_app(batch_polls=2)
+        repository = SentimentAnalysisRepository()
+        comments = make_comments(100)
+        job = BatchSentimentJob(
+            make_client(app), repository, work_dir=str(tmp_path), poll_interval=0, max_requests=40
+        )
+
+        result = await job.run(comments)
+
+        assert len(result.batch_ids) == 3
+        assert result.saved == 100
+        assert result.failed_comment_ids == []
+        saved = await repository.get_by_subfeddit(1, limit=1000)
+        assert len(saved) == 100
+        analysis = await repository.get_by_comment_id(comments[7].id)
+        assert analysis.sentiment_score == score_text(comments[7].text)
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_reports_failed_requests(self, tmp_path):
+        """Test that requests in the error file are reported as failed."""
+        app = create_app(batch_error_rate=0.3, seed=1)
+        repository = SentimentAnalysisRepository()
+        comments = make_comments(50)
+        job = BatchSentimentJob(make_client(app), repository, work_dir=str(tmp_path), poll_interval=0)
+
+        result = await job.run(comments)
+
+        assert result.failed_comment_ids
+        assert result.saved + len(result.failed_comment_ids) == 50
+        for comment_id in result.failed_comment_ids:
+            assert await repository.get_by_comment_id(comment_id) is None
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_crash(self, tmp_path):
+        """Test that a rerun reuses the submitted batch and skips written results."""
+        app = create_app()
+        repository = CrashingRepository(crash_on_write=3)
+        comments = make_comments(50)
+        job = BatchSentimentJob(
+            make_client(app), repository, work_dir=str(tmp_path), poll_interval=0, write_batch_size=10
+        )
+
+        with pytest.raises(RuntimeError):
+            await job.run(comments)
+        assert len(await repository.get_by_subfeddit(1, limit=1000)) == 20
+
+        result = await job.run(comments)
+
+        assert app.state.stats["batches"] == 1
+        assert result.saved == 30
+        saved = await repository.get_by_subfeddit(1, limit=1000)
+        assert sorted(a.comment_id for a in saved) == [c.id for c in comments]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_raises(self, tmp_path):
+        """Test that a batch rejected as a whole raises and clears its checkpoint."""
+        app = create_app(batch_polls=5)
+        comments = make_comments(5)
+        job = BatchSentimentJob(
+            make_client(app), SentimentAnalysisRepository(), work_dir=str(tmp_path), poll_interval=0
+        )
+        state = await job._submit(comments, job._chunk_key(comments))
+        app.state.batches[state["batch_id"]]["status"] = "failed"
+
+        with pytest.raises(BatchJobError):
+            await job.run(comments)
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,68 @@
+"""Tests for request-scoped deadlines."""
+
+import asyncio
+
+import pytest
+
+from sentiment_analysis.infrastructure.deadline import (
+    DeadlineExceeded,
+    deadline,
+    expired,
+    remaining,
+    within_deadline,
+)
+
+
+class TestDeadline:
+    """Test cases for the deadline helpers."""
+
+    @pytest.mark.asyncio
+    async def test_cancels_call_when_budget_expires(self):
+        """Test that a call still running at the deadline is cancelled."""
+        cancelled = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with deadline(0.05):
+            with pytest.raises(DeadlineExceeded):
+                await within_deadline(slow())
+            assert expired()
+
+        assert cancelled.is_set()
+        assert remaining() is None
+
+    @pytest.mark.asyncio
+    async def test_without_deadline_calls_are_unbounded(self):
+        """Test that calls run as is outside of a deadline."""
+        assert await within_deadline(asyncio.sleep(0, result="done")) == "done"
+
+    @pytest.mark.asyncio
+    async def test_nested_deadline_only_shortens(self):
+        """Test that an inner deadline cannot extend the outer budget."""
+        with deadline(0.5):
+            with deadline(60):
+                assert remaining() <= 0.5
+            with deadline(0.01):
+                assert remaining() <= 0.01
+
+    @pytest.mark.asyncio
+    async def test_tasks_inherit_deadline(self):
+        """Test that tasks created within the block share its deadline."""
+        async def budget():
+            return remaining()
+
+        with deadline(5):
+            task = asyncio.ensure_future(budget())
+        assert remaining() is None
+        assert 0 < await task <= 5
+
+    def test_rejects_non_positive_budget(self):
+        """Test budget validation."""
+        with pytest.raises(ValueError):
+            with deadline(0):
+                pass
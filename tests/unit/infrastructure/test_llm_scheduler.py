@@ -0,0 +1,102 @@
+"""Tests for the sliding-window LLM call scheduler."""
+
+import asyncio
+
+import pytest
+
+from sentiment_analysis.infrastructure.llm_scheduler import SlidingWindowScheduler
+
+
+class TestSlidingWindowScheduler:
+    """Test cases for SlidingWindowScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self):
+        """Test that results come back in input order regardless of completion order."""
+        scheduler = SlidingWindowScheduler(concurrency=3)
+
+        async def work(delay):
+            await asyncio.sleep(delay)
+            return delay
+
+        delays = [0.03, 0.01, 0.02, 0.0, 0.01]
+        assert await scheduler.map(work, delays) == delays
+
+    @pytest.mark.asyncio
+    async def test_keeps_window_full(self):
+        """Test that a slow call does not stall the others."""
+        scheduler = SlidingWindowScheduler(concurrency=2)
+        finished = []
+        release_slow = asyncio.Event()
+
+        async def work(item):
+            if item == "slow":
+                await release_slow.wait()
+            else:
+                await asyncio.sleep(0)
+            finished.append(item)
+            if len(finished) == 3:
+                release_slow.set()
+            return item
+
+        await scheduler.map(work, ["slow", "a", "b", "c"])
+
+        # In lockstep batches of 2, "b" and "c" could only start after "slow"
+        assert finished == ["a", "b", "c", "slow"]
+        assert scheduler.stats()["peak_in_flight"] == 2
+
+    @pytest.mark.asyncio
+    async def test_never_exceeds_concurrency(self):
+        """Test that the window bounds the calls in flight across callers."""
+        scheduler = SlidingWindowScheduler(concurrency=3)
+
+        async def work(_):
+            await asyncio.sleep(0.001)
+
+        await asyncio.gather(scheduler.map(work, range(10)), scheduler.map(work, range(10)))
+
+        stats = scheduler.stats()
+        assert stats["peak_in_flight"] == 3
+        assert stats["completed"] == 20
+        assert stats["mean_queue_wait"] > 0
+        assert stats["mean_service_time"] > 0
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_remaining_calls(self):
+        """Test that the first failure is raised and pending calls are cancelled."""
+        scheduler = SlidingWindowScheduler(concurrency=1)
+        started = []
+
+        async def work(item):
+            started.append(item)
+            if item == 1:
+                raise ValueError("boom")
+            await asyncio.sleep(0.01)
+            return item
+
+        with pytest.raises(ValueError, match="boom"):
+            await scheduler.map(work, [0, 1, 2, 3])
+
+        assert 3 not in started
+        assert scheduler.stats()["completed"] == 1
+        assert scheduler.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_return_exceptions(self):
+        """Test that failures can be returned in place of results."""
+        scheduler = SlidingWindowScheduler(concurrency=2)
+
+        async def work(item):
+            if item == 1:
+                raise ValueError("boom")
+            return item
+
+        results = await scheduler.map(work, [0, 1, 2], return_exceptions=True)
+
+        assert results[0] == 0 and results[2] == 2
+        assert isinstance(results[1], ValueError)
+
+    def test_invalid_concurrency(self):
+        """Test that a window below 1 is rejected."""
+        with pytest.raises(ValueError):
+            SlidingWindowScheduler(concurrency=0)
@@ -0,0 +1,84 @@
+"""Tests for the SimHash near-duplicate index."""
+
+import pytest
+
+from sentiment_analysis.infrastructure.near_duplicate_index import (
+    NearDuplicateIndex,
+    fingerprint,
+    normalize_for_fingerprint,
+)
+
+
+def distance(a, b):
+    """Hamming distance of the fingerprints of two texts."""
+    return (fingerprint(a) ^ fingerprint(b)).bit_count()
+
+
+class TestFingerprint:
+    """Test cases for the SimHash fingerprint."""
+
+    def test_ignores_case_punctuation_and_emoji(self):
+        """Test that trivially different copies share a fingerprint."""
+        assert normalize_for_fingerprint("Great release, LOVE it!!! 🎉") == "great release love it"
+        assert distance("Great release, love it!", "great release love it 🎉") == 0
+
+    def test_small_edits_stay_close(self):
+        """Test that a small edit moves the fingerprint by a few bits."""
+        assert distance("Thanks for the quick fix", "Thanks for the quick fixes") <= 6
+
+    def test_different_texts_are_far(self):
+        """Test that different texts are far apart."""
+        assert distance("the new version is awesome and fast", "the new version is awful and slow") > 8
+
+    def test_text_without_words(self):
+        """Test that texts without words have no fingerprint."""
+        assert fingerprint("🎉 !!!") is None
+
+
+class TestNearDuplicateIndex:
+    """Test cases for NearDuplicateIndex."""
+
+    def test_reuses_near_duplicate_result(self):
+        """Test that a near-duplicate gets the indexed result."""
+        index = NearDuplicateIndex(max_distance=3)
+        index.add("Great release, love it!", (0.9, "positive"))
+
+        assert index.lookup("great release love it 🎉") == (0.9, "positive")
+        assert index.lookup("the docs are confusing") is None
+        assert index.stats()["hits"] == 1
+        assert index.stats()["hit_rate"] == 0.5
+
+    def test_negation_is_never_a_near_duplicate(self):
+        """Test that a negated copy of a text does not reuse its result."""
+        index = NearDuplicateIndex(max_distance=15)
+        index.add("this release is really good", (0.8, "positive"))
+
+        assert index.lookup("this release is not really good") is None
+
+    def test_exact_threshold(self):
+        """Test that distance 0 only matches identical fingerprints."""
+        index = NearDuplicateIndex(max_distance=0)
+        index.add("Thanks for the quick fix", (0.7, "positive"))
+
+        assert index.lookup("thanks for the quick fix!") == (0.7, "positive")
+        assert index.lookup("Thanks for the quick fixes") is None
+
+    def test_bounded_with_lru_eviction(self):
+        """Test that the least recently used fingerprints are evicted."""
+        index = NearDuplicateIndex(max_entries=2)
+        index.add("first comment about the release", (0.5, "positive"))
+        index.add("second comment about a regression", (-0.5, "negative"))
+        index.lookup("first comment about the release")
+        index.add("third comment on performance", (0.2, "positive"))
+
+        assert index.lookup("second comment about a regression") is None
+        assert index.lookup("first comment about the release") == (0.5, "positive")
+        stats = index.stats()
+        assert (stats["entries"], stats["evictions"]) == (2, 1)
+
+    def test_rejects_invalid_settings(self):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(max_distance=16)
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(max_entries=0)
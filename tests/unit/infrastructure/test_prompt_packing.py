@@ -0,0 +1,46 @@
+"""Tests for prompt token estimation and bin packing."""
+
+import pytest
+
+from sentiment_analysis.infrastructure.prompt_packing import estimate_tokens, pack
+
+
+def test_estimate_tokens():
+    """Test the character based token estimate."""
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+
+
+class TestPack:
+    """Test cases for pack."""
+
+    def test_respects_budget(self):
+        """Test that no bin exceeds the budget."""
+        items = [7, 5, 4, 3, 2, 2, 1]
+        bins = pack(items, cost=lambda x: x, budget=8, max_items=10)
+
+        assert all(sum(b) <= 8 for b in bins)
+        assert sorted(x for b in bins for x in b) == sorted(items)
+        # First-fit decreasing reaches the optimum of ceil(24 / 8) bins here
+        assert len(bins) == 3
+
+    def test_respects_max_items(self):
+        """Test that bins hold at most max_items items."""
+        bins = pack(list(range(10)), cost=lambda x: 1, budget=100, max_items=4)
+        assert [len(b) for b in bins] == [4, 4, 2]
+
+    def test_keeps_order_within_bins(self):
+        """Test that items keep their relative order inside a bin."""
+        bins = pack(["a", "bbb", "cc"], cost=len, budget=10, max_items=10)
+        assert bins == [["a", "bbb", "cc"]]
+
+    def test_oversized_item_gets_own_bin(self):
+        """Test that items larger than the budget are still packed."""
+        bins = pack([20, 1], cost=lambda x: x, budget=10, max_items=10)
+        assert sorted(bins) == [[1], [20]]
+
+    def test_invalid_budget(self):
+        """Test that a budget below 1 is rejected."""
+        with pytest.raises(ValueError):
+            pack([1], cost=lambda x: x, budget=0, max_items=1)
@@ -0,0 +1,146 @@
+"""Tests for the OpenAI rate limiter."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from sentiment_analysis.infrastructure.rate_limiter import (
+    OpenAIRateLimiter,
+    TokenBucket,
+    parse_reset,
+)
+
+
+class TestParseReset:
+    """Test cases for parse_reset."""
+
+    @pytest.mark.parametrize("value,expected", [
+        ("1s", 1.0),
+        ("20ms", 0.02),
+        ("1m30.5s", 90.5),
+        ("2h", 7200.0),
+    ])
+    def test_parses_durations(self, value, expected):
+        """Test parsing of the duration formats used by OpenAI."""
+        assert parse_reset(value) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("value", [None, "", "soon", "1x", "1s later"])
+    def test_rejects_malformed_values(self, value):
+        """Test that malformed values are ignored."""
+        assert parse_reset(value) is None
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+
+    def test_wait_time_for_missing_amount(self):
+        """Test that the wait covers only the missing amount at the refill rate."""
+        bucket = TokenBucket(per_minute=60)
+        bucket.level = 0
+
+        assert bucket.wait_time(3) == pytest.approx(3.0, abs=0.01)
+        assert bucket.wait_time(1000) == pytest.approx(60.0, abs=0.01)
+
+    def test_sync_lowers_level_and_replaces_limit(self):
+        """Test that the server state can lower but not raise the local estimate."""
+        bucket = TokenBucket(per_minute=100)
+        bucket.level = 50
+
+        bucket.sync(limit=200, remaining=10)
+        assert bucket.capacity == 200
+        assert bucket.level == pytest.approx(10, abs=0.1)
+
+        bucket.sync(limit=None, remaining=150)
+        assert bucket.level == pytest.approx(10, abs=0.1)
+
+    def test_rejects_non_positive_limit(self):
+        """Test validation of the limit."""
+        with pytest.raises(ValueError):
+            TokenBucket(per_minute=0)
+
+
+class TestOpenAIRateLimiter:
+    """Test cases for OpenAIRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_within_budget_does_not_wait(self):
+        """Test that requests within the budget pass immediately."""
+        limiter = OpenAIRateLimiter(requests_per_minute=10, tokens_per_minute=1000)
+
+        await limiter.acquire(100)
+        await limiter.acquire(100)
+
+        stats = limiter.stats()
+        assert stats["acquired"] == 2
+        assert stats["waits"] == 0
+        assert stats["tokens_available"] == pytest.approx(800, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_tokens(self):
+        """Test that a request waits until the token bucket refills."""
+        limiter = OpenAIRateLimiter(requests_per_minute=100, tokens_per_minute=6000)
+        limiter.tokens.level = 0
+
+        started = time.monotonic()
+        await limiter.acquire(5)
+
+        # 6000 tokens per minute refill 100 tokens per second
+        assert time.monotonic() - started >= 0.04
+        assert limiter.stats()["waits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_in_order(self):
+        """Test that a large request is not starved by later small ones."""
+        limiter = OpenAIRateLimiter(requests_per_minute=1000, tokens_per_minute=6000)
+        limiter.tokens.level = 0
+        order = []
+
+        async def request(name, tokens):
+            await limiter.acquire(tokens)
+            order.append(name)
+
+        await asyncio.gather(request("large", 5), request("small", 1))
+
+        assert order == ["large", "small"]
+
+    @pytest.mark.asyncio
+    async def test_headers_resync_buckets(self):
+        """Test that response headers replace the limits and lower the levels."""
+        limiter = OpenAIRateLimiter(requests_per_minute=500, tokens_per_minute=200_000)
+
+        await limiter.on_response(httpx.Response(200, headers={
+            "x-ratelimit-limit-requests": "60",
+            "x-ratelimit-remaining-requests": "5",
+            "x-ratelimit-limit-tokens": "1000",
+            "x-ratelimit-remaining-tokens": "100",
+        }))
+
+        stats = limiter.stats()
+        assert stats["resyncs"] == 1
+        assert stats["requests_per_minute"] == 60
+        assert stats["tokens_per_minute"] == 1000
+        assert stats["requests_available"] == pytest.approx(5, abs=0.1)
+        assert stats["tokens_available"] == pytest.approx(100, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_429_pauses_callers_until_reset(self):
+        """Test that a rejection blocks new requests for the reported reset."""
+        limiter = OpenAIRateLimiter()
+
+        limiter.update(429, {"x-ratelimit-reset-requests": "50ms"})
+        started = time.monotonic()
+        await limiter.acquire(1)
+
+        assert time.monotonic() - started >= 0.04
+        assert limiter.stats()["rejections"] == 1
+
+    def test_responses_without_headers_are_ignored(self):
+        """Test that responses without rate-limit headers leave the buckets alone."""
+        limiter = OpenAIRateLimiter(requests_per_minute=10, tokens_per_minute=100)
+
+        limiter.update(200, {})
+
+        assert limiter.stats()["resyncs"] == 0
+        assert limiter.stats()["requests_per_minute"] == 10
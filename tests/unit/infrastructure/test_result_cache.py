@@ -0,0 +1,68 @@
+"""Tests for the sentiment result cache."""
+
+import pytest
+
+from sentiment_analysis.infrastructure.result_cache import (
+    SentimentResultCache,
+    normalize_text,
+    result_key
+)
+
+
+def test_normalize_text():
+    """Test that whitespace and Unicode variants are normalized."""
+    assert normalize_text("  Great  product!\n") == "Great product!"
+    assert normalize_text("ﬁne") == "fine"
+
+
+def test_result_key():
+    """Test that keys depend on the normalized text, model and prompt version."""
+    key = result_key("Great product", "gpt-4o-mini", "1")
+
+    assert key == result_key(" Great  product ", "gpt-4o-mini", "1")
+    assert key != result_key("great product", "gpt-4o-mini", "1")
+    assert key != result_key("Great product", "gpt-4o", "1")
+    assert key != result_key("Great product", "gpt-4o-mini", "2")
+
+
+class TestSentimentResultCache:
+    """Test cases for SentimentResultCache."""
+
+    @pytest.mark.asyncio
+    async def test_memory_tier(self):
+        """Test hits, misses and the hit rate of the memory tier."""
+        cache = SentimentResultCache()
+        await cache.put_many({"a": (0.5, "positive")})
+
+        found = await cache.get_many(["a", "b"])
+
+        assert found == {"a": (0.5, "positive")}
+        stats = cache.stats()
+        assert (stats["memory_hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Test that the byte budget evicts the least recently used entries."""
+        cache = SentimentResultCache(max_bytes=500)
+        await cache.put_many({"a": (0.5, "positive"), "b": (-0.5, "negative")})
+        await cache.get_many(["a"])
+        await cache.put_many({"c": (0.1, "positive")})
+
+        assert set(await cache.get_many(["a", "b", "c"])) == {"a", "c"}
+        assert cache.stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_restart(self, tmp_path):
+        """Test that results persist on disk and are promoted to memory."""
+        path = str(tmp_path / "cache" / "results.sqlite3")
+        cache = SentimentResultCache(path=path)
+        await cache.put_many({"a": (0.5, "positive")})
+        cache.close()
+
+        restarted = SentimentResultCache(path=path)
+        assert await restarted.get_many(["a"]) == {"a": (0.5, "positive")}
+        assert await restarted.get_many(["a"]) == {"a": (0.5, "positive")}
+        restarted.close()
+
+        assert restarted.stats()["disk_hits"] == 1
+        assert restarted.stats()["memory_hits"] == 1
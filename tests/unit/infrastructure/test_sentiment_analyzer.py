@@ -1,11 +1,28 @@
 """Tests for SentimentAnalyzer."""
 
+import asyncio
+import json
+import math
+from types import SimpleNamespace
+
+import httpx
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock, ANY
 from datetime import datetime
-from openai import OpenAIError
+from openai import OpenAIError, RateLimitError
 
-from sentiment_analysis.infrastructure.sentiment_analyzer import SentimentAnalyzer, OutputFormat
+from sentiment_analysis.infrastructure.deadline import deadline
+from sentiment_analysis.infrastructure.near_duplicate_index import NearDuplicateIndex
+from sentiment_analysis.infrastructure.rate_limiter import OpenAIRateLimiter
+from sentiment_analysis.infrastructure.result_cache import SentimentResultCache
+from sentiment_analysis.infrastructure.sentiment_analyzer import (
+    PACKED_SYSTEM_PROMPT,
+    OutputFormat,
+    PackedOutputFormat,
+    PackedOutputItem,
+    SentimentAnalyzer
+)
+from sentiment_analysis.domain.entities.analysis_outcome import PartialAnalysisError
 from sentiment_analysis.domain.entities.comment import Comment
 
 
@@ -33,7 +50,7 @@ def mock_openai_client():
 def analyzer(mock_openai_client):
     """Create a SentimentAnalyzer instance with mock client."""
     with patch('sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI', return_value=mock_openai_client):
-        analyzer = SentimentAnalyzer(api_key="test-key")
+        analyzer = SentimentAnalyzer(api_key="test-key", retry_backoff_base=0.0)
         return analyzer
 
 
@@ -171,3 +188,460 @@ class TestSentimentAnalyzer:
         assert len(analyses) == 2
         assert analyses[0].comment_text == "First comment"
         assert analyses[1].comment_text == "Second comment"
+
+
+def make_comments(count):
+    """Create comments with distinct ids."""
+    return [
+        Comment(
+            id=i,
+            subfeddit_id=1,
+            username="test_user",
+            text=f"Comment number {i}",
+            created_at=datetime.now()
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def packed_reply(skip_ids=()):
+    """Create a parse mock answering packed and single requests."""
+    async def parse(model, input, text_format):
+        if text_format is PackedOutputFormat:
+            items = json.loads(input[1]["content"])
+            return MockResponse(PackedOutputFormat(results=[
+                PackedOutputItem(comment_id=item["comment_id"], sentiment_score=0.5, sentiment_label="positive")
+                for item in reversed(items)
+                if item["comment_id"] not in skip_ids
+            ]))
+        return MockResponse(OutputFormat(sentiment_score=-0.5, sentiment_label="negative"))
+    return AsyncMock(side_effect=parse)
+
+
+@pytest.fixture
+def packed_analyzer(mock_openai_client):
+    """Create a SentimentAnalyzer in packed mode."""
+    with patch('sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI', return_value=mock_openai_client):
+        return SentimentAnalyzer(api_key="test-key", mode="packed", pack_token_budget=200, pack_max_items=10)
+
+
+class TestPackedMode:
+    """Test cases for the packed multi-comment mode."""
+
+    @pytest.mark.asyncio
+    async def test_packs_comments_into_few_requests(self, packed_analyzer):
+        """Test that comments are grouped and results keep the input order."""
+        packed_analyzer.client.responses.parse = packed_reply()
+        comments = make_comments(25)
+
+        analyses = await packed_analyzer.analyze(comments)
+
+        assert [a.comment_id for a in analyses] == [c.id for c in comments]
+        assert all(a.sentiment_label == "positive" for a in analyses)
+        assert packed_analyzer.client.responses.parse.await_count == 3
+        stats = packed_analyzer.stats()
+        assert (stats["requests"], stats["packed_requests"], stats["fallbacks"]) == (3, 3, 0)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_for_missing_ids(self, packed_analyzer):
+        """Test that only comments missing from the response are re-analyzed."""
+        packed_analyzer.client.responses.parse = packed_reply(skip_ids={2})
+
+        analyses = await packed_analyzer.analyze(make_comments(3))
+
+        assert [a.sentiment_label for a in analyses] == ["positive", "negative", "positive"]
+        assert packed_analyzer.stats()["fallbacks"] == 1
+        assert packed_analyzer.client.responses.parse.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_falls_back_for_invalid_results(self, packed_analyzer):
+        """Test that results with a score-label mismatch are re-analyzed."""
+        async def parse(model, input, text_format):
+            if text_format is PackedOutputFormat:
+                return MockResponse(PackedOutputFormat(results=[
+                    PackedOutputItem(comment_id=1, sentiment_score=0.5, sentiment_label="negative"),
+                    PackedOutputItem(comment_id=2, sentiment_score=0.5, sentiment_label="positive"),
+                    PackedOutputItem(comment_id=99, sentiment_score=0.5, sentiment_label="positive")
+                ]))
+            return MockResponse(OutputFormat(sentiment_score=-0.5, sentiment_label="negative"))
+        packed_analyzer.client.responses.parse = AsyncMock(side_effect=parse)
+
+        analyses = await packed_analyzer.analyze(make_comments(2))
+
+        assert [a.sentiment_label for a in analyses] == ["negative", "positive"]
+        assert packed_analyzer.stats()["fallbacks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sends_system_prompt_once_per_pack(self, packed_analyzer):
+        """Test that a packed request carries all comments in one user message."""
+        packed_analyzer.client.responses.parse = packed_reply()
+
+        await packed_analyzer.analyze(make_comments(3))
+
+        kwargs = packed_analyzer.client.responses.parse.await_args.kwargs
+        assert kwargs["input"][0] == {"role": "system", "content": PACKED_SYSTEM_PROMPT}
+        assert [item["comment_id"] for item in json.loads(kwargs["input"][1]["content"])] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_pack_error_is_raised(self, packed_analyzer):
+        """Test that a failing packed request raises."""
+        packed_analyzer.client.responses.parse = AsyncMock(side_effect=Exception("Test error"))
+
+        with pytest.raises(Exception, match="Test error"):
+            await packed_analyzer.analyze(make_comments(3))
+
+    def test_unknown_mode(self):
+        """Test that an unknown mode is rejected."""
+        with patch('sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI'):
+            with pytest.raises(ValueError):
+                SentimentAnalyzer(api_key="test-key", mode="bulk")
+
+
+class TestResultCache:
+    """Test cases for the sentiment result cache integration."""
+
+    @pytest.fixture
+    def cached_analyzer(self, mock_openai_client):
+        """Create a SentimentAnalyzer with a memory result cache."""
+        with patch('sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI', return_value=mock_openai_client):
+            return SentimentAnalyzer(api_key="test-key", result_cache=SentimentResultCache())
+
+    @pytest.mark.asyncio
+    async def test_duplicate_texts_are_scored_once(self, cached_analyzer):
+        """Test in-batch deduplication of identical texts."""
+        comments = make_comments(3)
+        comments[2] = comments[2].model_copy(update={"text": comments[0].text})
+
+        analyses = await cached_analyzer.analyze(comments)
+
+        assert [a.comment_id for a in analyses] == [1, 2, 3]
+        assert analyses[2].comment_text == comments[0].text
+        assert cached_analyzer.client.responses.parse.await_count == 2
+        assert cached_analyzer.stats()["result_cache"]["deduplicated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_repeat_comments_cost_no_calls(self, cached_analyzer):
+        """Test that previously scored texts are served from the cache."""
+        await cached_analyzer.analyze(make_comments(2))
+        analyses = await cached_analyzer.analyze(make_comments(2))
+
+        assert [a.sentiment_score for a in analyses] == [0.5, 0.5]
+        assert cached_analyzer.client.responses.parse.await_count == 2
+        assert cached_analyzer.stats()["result_cache"]["hit_rate"] == 0.5
+
+
+class TestRateLimiting:
+    """Test cases for the rate limiter integration."""
+
+    @pytest.mark.asyncio
+    async def test_every_request_acquires_from_the_limiter(self, mock_openai_client):
+        """Test that single and packed requests reserve their estimated cost."""
+        limiter = OpenAIRateLimiter(requests_per_minute=100, tokens_per_minute=100_000)
+        with patch('sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI', return_value=mock_openai_client):
+            analyzer = SentimentAnalyzer(api_key="test-key", rate_limiter=limiter)
+
+        await analyzer.analyze(make_comments(3))
+
+        stats = analyzer.stats()["rate_limiter"]
+        assert stats["acquired"] == 3
+        assert stats["tokens_available"] < 100_000 - 3 * 25
+
+
+class TestNearDuplicates:
+    """Test cases for the near-duplicate index integration."""
+
+    @pytest.mark.asyncio
+    async def test_near_duplicates_reuse_scores(self, mock_openai_client):
+        """Test that near-identical comments are answered without API calls."""
+        with patch('sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI', return_value=mock_openai_client):
+            analyzer = SentimentAnalyzer(api_key="test-key", near_duplicates=NearDuplicateIndex())
+        first = make_comments(2)
+        first[0] = first[0].model_copy(update={"text": "Great release, love it!"})
+        first[1] = first[1].model_copy(update={"text": "The migration guide is confusing"})
+        second = [
+            first[0].model_copy(update={"id": 3, "text": "great release love it 🎉"}),
+            first[1].model_copy(update={"id": 4, "text": "Pagination is broken again"}),
+        ]
+
+        await analyzer.analyze(first)
+        analyses = await analyzer.analyze(second)
+
+        assert [a.comment_id for a in analyses] == [3, 4]
+        assert analyses[0].comment_text == "great release love it 🎉"
+        assert mock_openai_client.responses.parse.await_count == 3
+        assert analyzer.stats()["near_duplicates"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_reuses_are_not_cached(self, mock_openai_client):
+        """Test that only texts that were actually scored enter the exact-text cache."""
+        cache = SentimentResultCache()
+        with patch('sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI', return_value=mock_openai_client):
+            analyzer = SentimentAnalyzer(
+                api_key="test-key", result_cache=cache, near_duplicates=NearDuplicateIndex()
+            )
+        original = make_comments(1)[0].model_copy(update={"text": "Great release, love it!"})
+        near_duplicate = original.model_copy(update={"id": 2, "text": "great release love it 🎉"})
+
+        await analyzer.analyze([original])
+        await analyzer.analyze([near_duplicate])
+
+        assert mock_openai_client.responses.parse.await_count == 1
+        assert analyzer.stats()["near_duplicates"]["hits"] == 1
+        assert cache.stats()["entries"] == 1
+
+
+def logprob_reply(**probabilities):
+    """Build a one-token chat completion with the given token probabilities."""
+    alternatives = [
+        SimpleNamespace(token=token, logprob=math.log(p)) for token, p in probabilities.items()
+    ]
+    return SimpleNamespace(choices=[SimpleNamespace(
+        logprobs=SimpleNamespace(content=[SimpleNamespace(top_logprobs=alternatives)])
+    )])
+
+
+@pytest.fixture
+def logprob_analyzer(mock_openai_client):
+    """Create a SentimentAnalyzer in logprob mode."""
+    mock_openai_client.chat.completions.create = AsyncMock()
+    with patch('sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI', return_value=mock_openai_client):
+        return SentimentAnalyzer(api_key="test-key", mode="logprob")
+
+
+class TestLogprobMode:
+    """Test cases for the logprob single-token scoring mode."""
+
+    @pytest.mark.asyncio
+    async def test_score_is_probability_difference(self, logprob_analyzer):
+        """Test that the score is P(positive) - P(negative) of the token."""
+        logprob_analyzer.client.chat.completions.create.return_value = logprob_reply(
+            positive=0.7, Negative=0.2, neutral=0.1
+        )
+
+        analyses = await logprob_analyzer.analyze(make_comments(1))
+
+        assert analyses[0].sentiment_score == pytest.approx(0.5)
+        assert analyses[0].sentiment_label == "positive"
+        call = logprob_analyzer.client.chat.completions.create.await_args.kwargs
+        assert (call["max_completion_tokens"], call["logprobs"]) == (1, True)
+        logprob_analyzer.client.responses.parse.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_negative_comment(self, logprob_analyzer):
+        """Test that a likelier negative token gives a negative score."""
+        logprob_analyzer.client.chat.completions.create.return_value = logprob_reply(
+            negative=0.9, positive=0.05
+        )
+
+        analyses = await logprob_analyzer.analyze(make_comments(1))
+
+        assert analyses[0].sentiment_score == pytest.approx(-0.85)
+        assert analyses[0].sentiment_label == "negative"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_without_usable_logprobs(self, logprob_analyzer):
+        """Test that an undecided or unrelated token falls back to a structured request."""
+        logprob_analyzer.client.chat.completions.create.return_value = logprob_reply(
+            maybe=0.6, neutral=0.4
+        )
+
+        analyses = await logprob_analyzer.analyze(make_comments(1))
+
+        assert analyses[0].sentiment_score == 0.5
+        assert logprob_analyzer.client.responses.parse.await_count == 1
+        assert logprob_analyzer.stats()["fallbacks"] == 1
+
+    def test_uses_own_cache_namespace(self, logprob_analyzer, analyzer):
+        """Test that logprob scores never share cache entries with structured ones."""
+        assert logprob_analyzer.prompt_version != analyzer.prompt_version
+
+
+def rate_limit_error():
+    """Create the error the OpenAI client raises on HTTP 429."""
+    request = httpx.Request("POST", "https://api.openai.com/v1/responses")
+    return RateLimitError("Rate limit reached", response=httpx.Response(429, request=request), body=None)
+
+
+def flaky_reply(errors):
+    """Create a parse mock failing per comment text with queued errors, then succeeding."""
+    async def parse(model, input, text_format):
+        queued = errors.get(input[1]["content"])
+        if queued:
+            raise queued.pop(0)
+        return MockResponse(OutputFormat(sentiment_score=0.5, sentiment_label="positive"))
+    return AsyncMock(side_effect=parse)
+
+
+class TestPartialFailures:
+    """Test cases for per-comment retries and partial results."""
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(self, analyzer):
+        """Test that a comment failing transiently is retried until it succeeds."""
+        comments = make_comments(3)
+        analyzer.client.responses.parse = flaky_reply({
+            comments[1].text: [rate_limit_error(), ValueError("Invalid sentiment label")]
+        })
+
+        analyses = await analyzer.analyze(comments)
+
+        assert [a.comment_id for a in analyses] == [1, 2, 3]
+        assert analyzer.stats()["retries"] == 2
+        assert analyzer.stats()["failed_comments"] == 0
+
+    @pytest.mark.asyncio
+    async def test_outcome_keeps_successes(self, analyzer):
+        """Test that failed comments are reported next to the analyses that succeeded."""
+        comments = make_comments(3)
+        analyzer.client.responses.parse = flaky_reply({
+            comments[0].text: [OpenAIError("Invalid request")],
+            comments[2].text: [rate_limit_error() for _ in range(3)]
+        })
+
+        outcome = await analyzer.analyze_outcome(comments)
+
+        assert [a.comment_id for a in outcome.analyses] == [2]
+        assert [(f.comment_id, f.error_type, f.attempts, f.retryable) for f in outcome.failures] == [
+            (1, "OpenAIError", 1, False),
+            (3, "RateLimitError", 3, True)
+        ]
+        assert analyzer.stats()["failed_comments"] == 2
+
+    @pytest.mark.asyncio
+    async def test_analyze_raises_partial_error(self, analyzer):
+        """Test that analyze carries the salvaged analyses in its error."""
+        comments = make_comments(2)
+        analyzer.client.responses.parse = flaky_reply({comments[0].text: [OpenAIError("Invalid request")]})
+
+        with pytest.raises(PartialAnalysisError) as exc_info:
+            await analyzer.analyze(comments)
+
+        assert [a.comment_id for a in exc_info.value.outcome.analyses] == [2]
+        assert [f.comment_id for f in exc_info.value.outcome.failures] == [1]
+
+    @pytest.mark.asyncio
+    async def test_zero_score_is_nudged(self, analyzer):
+        """Test that a score of exactly 0.0 takes the direction of its label."""
+        analyzer.client.responses.parse = AsyncMock(return_value=MockResponse(
+            OutputFormat(sentiment_score=0.0, sentiment_label="negative")
+        ))
+
+        analyses = await analyzer.analyze(make_comments(1))
+
+        assert analyses[0].sentiment_score == -0.001
+        assert analyses[0].sentiment_label == "negative"
+
+    @pytest.mark.asyncio
+    async def test_failed_pack_is_retried(self, mock_openai_client):
+        """Test that a pack failing transiently is sent again as a whole."""
+        with patch('sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI', return_value=mock_openai_client):
+            analyzer = SentimentAnalyzer(api_key="test-key", mode="packed", retry_backoff_base=0.0)
+        reply = packed_reply()
+        failures = [rate_limit_error()]
+
+        async def parse(**kwargs):
+            if failures:
+                raise failures.pop()
+            return await reply(**kwargs)
+        analyzer.client.responses.parse = AsyncMock(side_effect=parse)
+
+        analyses = await analyzer.analyze(make_comments(3))
+
+        assert [a.sentiment_score for a in analyses] == [0.5, 0.5, 0.5]
+        assert analyzer.client.responses.parse.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_deadline_cancels_slow_comments(self, analyzer):
+        """Test that comments still pending at the deadline fail without a retry."""
+        comments = make_comments(3)
+
+        async def parse(model, input, text_format):
+            if input[1]["content"] == comments[1].text:
+                await asyncio.sleep(10)
+            return MockResponse(OutputFormat(sentiment_score=0.5, sentiment_label="positive"))
+        analyzer.client.responses.parse = AsyncMock(side_effect=parse)
+
+        with deadline(0.1):
+            outcome = await analyzer.analyze_outcome(comments)
+
+        assert [a.comment_id for a in outcome.analyses] == [1, 3]
+        assert [(f.comment_id, f.error_type, f.retryable) for f in outcome.failures] == [
+            (2, "DeadlineExceeded", True)
+        ]
+        assert analyzer.stats()["retries"] == 0
+        assert analyzer.scheduler.stats()["in_flight"] == 0
+
+    def test_rejects_negative_retries(self):
+        """Test that a negative retry budget is rejected."""
+        with patch('sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI'):
+            with pytest.raises(ValueError):
+                SentimentAnalyzer(api_key="test-key", max_retries=-1)
+
+
+class TestStreaming:
+    """Test cases for streaming analyses as they complete."""
+
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order(self, analyzer):
+        """Test that a slow comment does not hold back the others."""
+        comments = make_comments(3)
+
+        async def parse(model, input, text_format):
+            if input[1]["content"] == comments[0].text:
+                await asyncio.sleep(0.05)
+            if input[1]["content"] == comments[2].text:
+                raise OpenAIError("Invalid request")
+            return MockResponse(OutputFormat(sentiment_score=0.5, sentiment_label="positive"))
+        analyzer.client.responses.parse = AsyncMock(side_effect=parse)
+
+        results = [result async for result in analyzer.analyze_stream(comments)]
+
+        assert [(type(r).__name__, r.comment_id) for r in results] == [
+            ("SentimentAnalysis", 2), ("AnalysisFailure", 3), ("SentimentAnalysis", 1)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_keeps_packing(self, packed_analyzer):
+        """Test that streamed comments are still sent in packs."""
+        packed_analyzer.client.responses.parse = packed_reply()
+
+        results = [result async for result in packed_analyzer.analyze_stream(make_comments(4))]
+
+        assert sorted(r.comment_id for r in results) == [1, 2, 3, 4]
+        assert packed_analyzer.client.responses.parse.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_identical_texts_are_scored_once(self, mock_openai_client):
+        """Test that comments sharing a text are streamed from one analysis."""
+        with patch('sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI', return_value=mock_openai_client):
+            analyzer = SentimentAnalyzer(api_key="test-key", mode="single", result_cache=SentimentResultCache())
+        comments = make_comments(3)
+        comments[2] = comments[2].model_copy(update={"text": comments[0].text})
+
+        results = [result async for result in analyzer.analyze_stream(comments)]
+
+        assert sorted(r.comment_id for r in results) == [1, 2, 3]
+        assert analyzer.client.responses.parse.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_closing_cancels_pending_analyses(self, analyzer):
+        """Test that analyses still running are cancelled when the stream is closed."""
+        comments = make_comments(2)
+        cancelled = asyncio.Event()
+
+        async def parse(model, input, text_format):
+            if input[1]["content"] == comments[1].text:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return MockResponse(OutputFormat(sentiment_score=0.5, sentiment_label="positive"))
+        analyzer.client.responses.parse = AsyncMock(side_effect=parse)
+
+        stream = analyzer.analyze_stream(comments)
+        first = await stream.__anext__()
+        await stream.aclose()
+
+        assert first.comment_id == 1
+        assert cancelled.is_set()
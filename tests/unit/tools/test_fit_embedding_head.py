@@ -0,0 +1,39 @@
+"""Tests for the embedding head fitting tool."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from sentiment_analysis.domain.entities.analysis_outcome import AnalysisOutcome
+from sentiment_analysis.domain.entities.comment import Comment
+from sentiment_analysis.domain.entities.subfeddit import Subfeddit
+from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient
+from sentiment_analysis.infrastructure.clients.subfeddit_catalog import SubfedditCatalog
+from sentiment_analysis.infrastructure.engines.embedding_head import EmbeddingHead
+from sentiment_analysis.infrastructure.sentiment_analyzer import SentimentAnalyzer
+from sentiment_analysis.tools.fit_embedding_head import fit
+
+
+@pytest.mark.asyncio
+async def test_fit_runs_with_embedding_engine_and_missing_head(tmp_path):
+    """Test that the tool can create the head the configured embedding engine is missing."""
+    missing = tmp_path / "missing.npz"
+    output = tmp_path / "head.npz"
+    comment = Comment(id=1, subfeddit_id=1, username="user", text="great", created_at=datetime(2024, 1, 1))
+    head = EmbeddingHead(np.ones(8), 0.0, model="text-embedding-3-small", dimensions=8)
+    with patch("sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI", return_value=AsyncMock()), \
+            patch("sentiment_analysis.infrastructure.engines.embedding_engine.AsyncOpenAI", return_value=AsyncMock()), \
+            patch("sentiment_analysis.api.container.SENTIMENT_ENGINE", "embedding"), \
+            patch("sentiment_analysis.api.container.SENTIMENT_EMBEDDING_HEAD_PATH", str(missing)), \
+            patch.object(SubfedditCatalog, "get_by_title", AsyncMock(
+                return_value=Subfeddit(id=1, username="user", title="Dummy Topic 1", description="Test")
+            )), \
+            patch.object(FedditClient, "fetch_comments_range", AsyncMock(return_value=[comment])), \
+            patch.object(SentimentAnalyzer, "analyze_outcome", AsyncMock(return_value=AnalysisOutcome())) as label, \
+            patch("sentiment_analysis.tools.fit_embedding_head.fit_head_from_repository", AsyncMock(return_value=head)):
+        await fit(["Dummy Topic 1"], label=1, output=str(output), l2=1.0)
+
+    label.assert_awaited_once_with([comment])
+    assert EmbeddingHead.load(str(output)).version == head.version
@@ -0,0 +1,67 @@
+"""Tests for the Batch API re-scoring tool."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+from sentiment_analysis.domain.entities.comment import Comment
+from sentiment_analysis.domain.entities.subfeddit import Subfeddit
+from sentiment_analysis.fakes.feddit_data import FedditDataset
+from sentiment_analysis.fakes.openai_server import create_app
+from sentiment_analysis.infrastructure.clients.feddit_client import FedditClient
+from sentiment_analysis.infrastructure.clients.subfeddit_catalog import SubfedditCatalog
+from sentiment_analysis.infrastructure.repositories.sentiment_analysis_repository import (
+    SentimentAnalysisRepository,
+)
+from sentiment_analysis.tools.rescore_batch import rescore
+
+
+def make_comments(count):
+    """Create synthetic comments of subfeddit 1."""
+    dataset = FedditDataset(subfeddits=1, comments_per_subfeddit=count)
+    return [
+        Comment(
+            id=item["id"],
+            subfeddit_id=1,
+            username=item["username"],
+            text=item["text"],
+            created_at=datetime.fromtimestamp(item["created_at"])
+        )
+        for item in dataset.list_comments(1, limit=count, skip=0)
+    ]
+
+
+def make_client(app):
+    """Create an OpenAI client routed to the stand-in app."""
+    return AsyncOpenAI(
+        api_key="test-key",
+        base_url="http://openai/v1",
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+    )
+
+
+@pytest.mark.asyncio
+async def test_rescore_resumes_after_crash(tmp_path):
+    """Test that a rerun of the tool resumes the batch submitted by a crashed run."""
+    app = create_app()
+    comments = make_comments(30)
+    # Every run builds its own client, like a fresh process would
+    with patch("sentiment_analysis.infrastructure.sentiment_analyzer.AsyncOpenAI", side_effect=lambda **kwargs: make_client(app)), \
+            patch.object(SubfedditCatalog, "get_by_title", AsyncMock(
+                return_value=Subfeddit(id=1, username="user", title="Dummy Topic 1", description="Test")
+            )), \
+            patch.object(FedditClient, "fetch_comments_range", AsyncMock(return_value=comments)) as fetch:
+        with patch.object(SentimentAnalysisRepository, "save_many", AsyncMock(side_effect=RuntimeError("Simulated crash"))):
+            with pytest.raises(RuntimeError):
+                await rescore(["Dummy Topic 1"], comments=30, work_dir=str(tmp_path), poll_interval=0)
+
+        result = await rescore(["Dummy Topic 1"], comments=30, work_dir=str(tmp_path), poll_interval=0)
+
+    fetch.assert_awaited_with(1, total=30)
+    assert app.state.stats["batches"] == 1
+    assert result.saved == 30
+    assert result.failed_comment_ids == []
+    assert list(tmp_path.iterdir()) == []